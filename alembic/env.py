@@ -28,6 +28,7 @@ from luxtj.contexts.marketing.infrastructure.persistence.sqlalchemy_models impor
     MarketingBase,
 )
 from luxtj.contexts.payment.infrastructure.persistence.sqlalchemy_models import PaymentBase
+from luxtj.contexts.reports.infrastructure.persistence.sqlalchemy_models import ReportsBase
 from luxtj.shared_kernel.infrastructure.persistence.outbox_model import (
     SharedKernelBase,
 )
@@ -50,6 +51,7 @@ target_metadata = [
     HotelBase.metadata,
     FlightBase.metadata,
     PaymentBase.metadata,
+    ReportsBase.metadata,
 ]
 
 
@@ -0,0 +1,43 @@
+"""add (created_at, id) indexes for keyset booking report exports
+
+Revision ID: 20261018_booking_keyset_idx
+Revises: 20260816_account_profile
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20261018_booking_keyset_idx"
+down_revision: str | None = "20260816_account_profile"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_hotel_booking_details_created_at_id",
+        "hotel_booking_details",
+        ["created_at", "id"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_flight_booking_details_created_at_id",
+        "flight_booking_details",
+        ["created_at", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_flight_booking_details_created_at_id",
+        table_name="flight_booking_details",
+        if_exists=True,
+    )
+    op.drop_index(
+        "ix_hotel_booking_details_created_at_id",
+        table_name="hotel_booking_details",
+        if_exists=True,
+    )
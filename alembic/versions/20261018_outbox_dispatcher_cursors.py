@@ -0,0 +1,60 @@
+"""move outbox cursors to a shared per-subscriber table and index outbox by type
+
+Revision ID: 20261018_outbox_cursors
+Revises: 20261018_report_sales_rollups
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_outbox_cursors"
+down_revision: str | None = "20261018_report_sales_rollups"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "domain_event_outbox_cursors",
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("last_processed_outbox_id", sa.String(36), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.execute(
+        """
+        INSERT INTO domain_event_outbox_cursors (name, last_processed_outbox_id, updated_at)
+        SELECT name, last_processed_outbox_id, updated_at FROM action_centre_outbox_cursor
+        """
+    )
+    op.drop_table("action_centre_outbox_cursor")
+    op.create_index(
+        "ix_domain_event_outbox_type_id",
+        "domain_event_outbox",
+        ["type", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_domain_event_outbox_type_id", table_name="domain_event_outbox")
+    op.create_table(
+        "action_centre_outbox_cursor",
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("last_processed_outbox_id", sa.String(36), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.execute(
+        """
+        INSERT INTO action_centre_outbox_cursor (name, last_processed_outbox_id, updated_at)
+        SELECT name, last_processed_outbox_id, updated_at FROM domain_event_outbox_cursors
+        WHERE name = 'action_centre_projector'
+        """
+    )
+    op.drop_table("domain_event_outbox_cursors")
@@ -0,0 +1,95 @@
+"""add sales daily rollups, rollup cursors and change-detection / ledger-day indexes
+
+Revision ID: 20261018_report_sales_rollups
+Revises: 20261018_booking_keyset_idx
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_report_sales_rollups"
+down_revision: str | None = "20261018_booking_keyset_idx"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_UPDATED_AT_INDEXES = (
+    ("ix_hotel_booking_details_updated_at", "hotel_booking_details"),
+    ("ix_hotel_booking_transaction_details_updated_at", "hotel_booking_transaction_details"),
+    ("ix_flight_booking_details_updated_at", "flight_booking_details"),
+    ("ix_flight_booking_txn_updated_at", "flight_booking_transaction_details"),
+    ("ix_payment_gateway_transactions_updated_at", "payment_gateway_transactions"),
+)
+# Payments and refunds are rolled up by their own day.
+_LEDGER_DAY_INDEXES = (
+    ("ix_payment_gateway_transactions_created_at", "created_at"),
+    ("ix_payment_gateway_transactions_refunded_at", "refunded_at"),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "report_sales_daily_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("product", sa.String(16), nullable=False),
+        sa.Column("booking_source", sa.String(50), nullable=False),
+        sa.Column("destination_id", sa.String(255), nullable=False),
+        sa.Column("property_id", sa.String(100), nullable=False),
+        sa.Column("currency", sa.String(3), nullable=False),
+        sa.Column("destination_name", sa.String(255), nullable=False),
+        sa.Column("property_name", sa.String(255), nullable=False),
+        sa.Column("booking_count", sa.Integer(), nullable=False),
+        sa.Column("units_sold", sa.Integer(), nullable=False),
+        sa.Column("sales_amount", sa.Numeric(16, 2), nullable=False),
+        sa.Column("margin_amount", sa.Numeric(16, 2), nullable=False),
+        sa.Column("payment_count", sa.Integer(), nullable=False),
+        sa.Column("payments_amount", sa.Numeric(16, 2), nullable=False),
+        sa.Column("refund_count", sa.Integer(), nullable=False),
+        sa.Column("refunds_amount", sa.Numeric(16, 2), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "day", "product", "booking_source", "destination_id", "property_id", "currency"
+        ),
+    )
+    op.create_index(
+        "ix_report_sales_daily_rollups_destination_day",
+        "report_sales_daily_rollups",
+        ["destination_id", "day"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_report_sales_daily_rollups_property_day",
+        "report_sales_daily_rollups",
+        ["property_id", "day"],
+        unique=False,
+    )
+    op.create_table(
+        "report_rollup_cursors",
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("watermark", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    for name, table in _UPDATED_AT_INDEXES:
+        op.create_index(name, table, ["updated_at"], if_not_exists=True)
+    for name, column in _LEDGER_DAY_INDEXES:
+        op.create_index(name, "payment_gateway_transactions", [column], if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(_LEDGER_DAY_INDEXES):
+        op.drop_index(name, table_name="payment_gateway_transactions", if_exists=True)
+    for name, table in reversed(_UPDATED_AT_INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
+    op.drop_table("report_rollup_cursors")
+    op.drop_index(
+        "ix_report_sales_daily_rollups_property_day", table_name="report_sales_daily_rollups"
+    )
+    op.drop_index(
+        "ix_report_sales_daily_rollups_destination_day", table_name="report_sales_daily_rollups"
+    )
+    op.drop_table("report_sales_daily_rollups")
@@ -0,0 +1,37 @@
+"""Per-hotel content fingerprints on supplier maps + staging.
+
+Revision ID: 20261018_crs_content_hashes
+Revises: 20261018_crs_hotel_search_text
+Create Date: 2026-10-18
+
+``content_hashes`` holds one fingerprint per content section (hotel, images, amenities,
+rooms) as computed by the RateHawk dump parser. Re-mapping compares them to skip staging
+unchanged hotels and to rewrite only the changed children of the rest.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from helpers import add_column_if_missing, drop_column_if_exists
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20261018_crs_content_hashes"
+down_revision: str | None = "20261018_crs_hotel_search_text"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    add_column_if_missing(
+        "hotel_crs_supplier_hotel_map",
+        sa.Column("content_hashes", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    add_column_if_missing(
+        "staging_hotels",
+        sa.Column("content_hashes", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    drop_column_if_exists("staging_hotels", "content_hashes")
+    drop_column_if_exists("hotel_crs_supplier_hotel_map", "content_hashes")
@@ -0,0 +1,64 @@
+"""Hotel room_count + generated search_text with trigram index for the inventory list.
+
+Revision ID: 20261018_crs_hotel_search_text
+Revises: 20260809_drop_hotel_crs_city_id
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20261018_crs_hotel_search_text"
+down_revision: str | None = "20260809_drop_hotel_crs_city_id"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Maintained by crs_promote / CrsService room sync; replaces a per-row COUNT subquery.
+    op.execute(
+        "ALTER TABLE hotel_crs_hotels "
+        "ADD COLUMN IF NOT EXISTS room_count integer NOT NULL DEFAULT 0"
+    )
+    op.execute(
+        """
+        UPDATE hotel_crs_hotels h
+        SET room_count = rg.n
+        FROM (
+            SELECT hotel_id, COUNT(*)::integer AS n
+            FROM hotel_crs_room_groups
+            GROUP BY hotel_id
+        ) rg
+        WHERE rg.hotel_id = h.id
+        """
+    )
+
+    # One lowercased column for the admin search instead of five ILIKE clauses.
+    op.execute(
+        """
+        ALTER TABLE hotel_crs_hotels
+        ADD COLUMN IF NOT EXISTS search_text text GENERATED ALWAYS AS (
+            lower(
+                coalesce(code, '') || ' ' || coalesce(name, '') || ' ' ||
+                coalesce(name_normalized, '') || ' ' || coalesce(address_line1, '') || ' ' ||
+                coalesce(address_line2, '') || ' ' || coalesce(location, '')
+            )
+        ) STORED
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_hotel_crs_hotels_search_text_trgm
+        ON hotel_crs_hotels
+        USING gin (search_text gin_trgm_ops)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_hotel_crs_hotels_search_text_trgm")
+    op.execute("ALTER TABLE hotel_crs_hotels DROP COLUMN IF EXISTS search_text")
+    op.execute("ALTER TABLE hotel_crs_hotels DROP COLUMN IF EXISTS room_count")
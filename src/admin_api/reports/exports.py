@@ -0,0 +1,243 @@
+"""Streaming CSV exports for admin reports, served inline or as background jobs.
+
+Report services yield CSV rows from keyset batches, so an export holds one batch in memory
+however many rows it covers. :func:`csv_stream` encodes the rows into ~64 KiB byte chunks
+(optionally gzip) for a ``StreamingResponse``.
+
+Very large ranges can run as a background job instead: :class:`ReportExportJobs` writes the
+same byte stream to a file under ``REPORT_EXPORT_DIR`` and mirrors job status to Redis, so
+any worker can answer status polls. Downloads read the file, so the directory must be shared
+between workers that serve them. Finished files are removed after
+``REPORT_EXPORT_JOB_TTL_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import logging
+import time
+import zlib
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from fastapi import HTTPException
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import Field
+
+from luxtj.bootstrap import config
+from luxtj.shared_kernel.infrastructure.redis_cache import redis_cache_get, redis_cache_put
+from luxtj.shared_kernel.presentation.http.schemas import ApiSerializerBaseModel
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_CHARS = 64 * 1024
+_NAMESPACE = "report_exports"
+
+type CsvRows = AsyncIterator[Sequence[Any]]
+
+
+async def csv_stream(
+    header: Sequence[str], rows: CsvRows, *, gzip: bool = False
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    compressor = zlib.compressobj(wbits=31) if gzip else None
+    writer.writerow(header)
+    async for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= _FLUSH_CHARS:
+            chunk = _drain(buffer, compressor)
+            if chunk:
+                yield chunk
+    tail = _drain(buffer, compressor)
+    if compressor is not None:
+        tail += compressor.flush()
+    if tail:
+        yield tail
+
+
+def _drain(buffer: io.StringIO, compressor: Any | None) -> bytes:
+    data = buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate(0)
+    return compressor.compress(data) if compressor is not None else data
+
+
+def export_filename(stem: str, *, gzip: bool) -> str:
+    return f"{stem}.csv.gz" if gzip else f"{stem}.csv"
+
+
+def csv_response(stream: AsyncIterator[bytes], stem: str, *, gzip: bool) -> StreamingResponse:
+    return StreamingResponse(
+        stream,
+        media_type="application/gzip" if gzip else "text/csv; charset=utf-8",
+        headers={
+            "Content-Disposition": f'attachment; filename="{export_filename(stem, gzip=gzip)}"',
+        },
+    )
+
+
+class ReportExportJobBody(ApiSerializerBaseModel):
+    job_id: str = Field(..., alias="jobId", min_length=1)
+
+
+class ReportExportJobSerializer(ApiSerializerBaseModel):
+    id: str
+    kind: str
+    filename: str
+    status: str
+    bytes_written: int = 0
+    error: str | None = None
+    created_at: float
+    finished_at: float | None = None
+
+
+@dataclass(slots=True)
+class ExportJob:
+    id: str
+    kind: str
+    filename: str
+    status: str = "running"
+    bytes_written: int = 0
+    error: str | None = None
+    created_at: float = 0.0
+    finished_at: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class ReportExportJobs:
+    def __init__(self, directory: str, *, ttl_seconds: int) -> None:
+        self._directory = Path(directory)
+        self._ttl_seconds = max(60, ttl_seconds)
+        self._jobs: dict[str, ExportJob] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    def start(
+        self,
+        kind: str,
+        stem: str,
+        produce: Callable[[], AsyncIterator[bytes]],
+        *,
+        gzip: bool,
+    ) -> ExportJob:
+        """Run ``produce()`` in the background, writing its bytes to the job's file."""
+        self._purge_expired()
+        job = ExportJob(
+            id=uuid4().hex,
+            kind=kind,
+            filename=export_filename(stem, gzip=gzip),
+            created_at=time.time(),
+        )
+        self._jobs[job.id] = job
+        task = asyncio.create_task(self._run(job, produce))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        return job
+
+    async def status(self, job_id: str) -> dict[str, Any] | None:
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job.to_dict()
+        cached = await redis_cache_get(_NAMESPACE, job_id)
+        return cached if isinstance(cached, dict) else None
+
+    def file_path(self, job_id: str) -> Path | None:
+        """The finished file of ``job_id`` if it is on this worker's export directory."""
+        if not job_id.isalnum():
+            return None
+        path = self._directory / job_id
+        return path if path.is_file() else None
+
+    async def close(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: ExportJob, produce: Callable[[], AsyncIterator[bytes]]) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        partial = self._directory / f"{job.id}.part"
+        await self._publish(job)
+        try:
+            with partial.open("wb") as fh:
+                async for chunk in produce():
+                    # Off the event loop: a slow export volume must not stall other requests.
+                    await asyncio.to_thread(fh.write, chunk)
+                    job.bytes_written += len(chunk)
+            partial.replace(self._directory / job.id)
+            job.status = "completed"
+        except asyncio.CancelledError:
+            job.status = "failed"
+            job.error = "Export was interrupted"
+            raise
+        except Exception as ex:
+            logger.exception("Report export %s (%s) failed: %s", job.id, job.kind, ex)
+            job.status = "failed"
+            job.error = "Export failed"
+        finally:
+            job.finished_at = time.time()
+            partial.unlink(missing_ok=True)
+            await asyncio.shield(self._publish(job))
+
+    async def _publish(self, job: ExportJob) -> None:
+        await redis_cache_put(_NAMESPACE, job.id, job.to_dict(), self._ttl_seconds)
+
+    def _purge_expired(self) -> None:
+        cutoff = time.time() - self._ttl_seconds
+        for job_id, job in list(self._jobs.items()):
+            if job.finished_at is not None and job.finished_at < cutoff:
+                del self._jobs[job_id]
+        if not self._directory.is_dir():
+            return
+        for entry in self._directory.iterdir():
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    entry.unlink(missing_ok=True)
+            except OSError:
+                continue
+
+
+_JOBS: ReportExportJobs | None = None
+
+
+def get_report_export_jobs() -> ReportExportJobs:
+    global _JOBS
+    if _JOBS is None:
+        _JOBS = ReportExportJobs(
+            config.REPORT_EXPORT_DIR, ttl_seconds=config.REPORT_EXPORT_JOB_TTL_SECONDS
+        )
+    return _JOBS
+
+
+def set_report_export_jobs(jobs: ReportExportJobs | None) -> None:
+    global _JOBS
+    _JOBS = jobs
+
+
+async def export_job_status(kind: str, job_id: str) -> ReportExportJobSerializer:
+    status = await get_report_export_jobs().status(job_id)
+    if status is None or status.get("kind") != kind:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return ReportExportJobSerializer.model_validate(status)
+
+
+async def export_job_file(kind: str, job_id: str) -> FileResponse:
+    job = await export_job_status(kind, job_id)
+    if job.status != "completed":
+        raise HTTPException(status_code=409, detail=f"Export job is {job.status}")
+    path = get_report_export_jobs().file_path(job.id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Export file is no longer available")
+    gzip = job.filename.endswith(".gz")
+    return FileResponse(
+        path,
+        media_type="application/gzip" if gzip else "text/csv; charset=utf-8",
+        filename=job.filename,
+    )
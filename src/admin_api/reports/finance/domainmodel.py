@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from enum import StrEnum
 
-from luxtj.utils import mockutils, timeutils
+from luxtj.utils import timeutils
 
 
 class FinanceMetricTypeEnum(StrEnum):
@@ -62,16 +62,15 @@ def default_finance_date_range(
     return start_date, end_date
 
 
-def finance_trend_dates(*, from_date: date, to_date: date, max_points: int) -> list[date]:
-    total_days = (to_date - from_date).days + 1
-    if total_days <= max_points:
-        return [from_date + timedelta(days=day_index) for day_index in range(total_days)]
+def finance_trend_months(*, from_date: date, to_date: date) -> list[date]:
+    months: list[date] = []
+    current = date(from_date.year, from_date.month, 1)
 
-    step_days = max(1, total_days // max_points)
-    trend_dates = [
-        from_date + timedelta(days=day_index) for day_index in range(0, total_days, step_days)
-    ]
-    return [*trend_dates[: max_points - 1], to_date]
+    while current <= to_date:
+        months.append(current)
+        current = date(current.year + current.month // 12, current.month % 12 + 1, 1)
+
+    return months
 
 
 def finance_trend_weeks(*, from_date: date, to_date: date) -> list[date]:
@@ -97,21 +96,6 @@ def finance_trend_years(*, from_date: date, to_date: date) -> list[date]:
     return years
 
 
-def mock_finance_trend_point(*, timestamp: date, currency: str) -> FinanceTrendPointDomainModel:
-    revenue_amount = mockutils.random_booking_amount(100_000.0, 1_500_000.0)
-    payments_amount = mockutils.random_booking_amount(revenue_amount * 0.75, revenue_amount)
-    refunds_amount = mockutils.random_booking_amount(0.0, revenue_amount * 0.12)
-    operating_cost = mockutils.random_booking_amount(revenue_amount * 0.35, revenue_amount * 0.65)
-    return FinanceTrendPointDomainModel(
-        timestamp=timestamp,
-        revenue_amount=revenue_amount,
-        payments_amount=payments_amount,
-        refunds_amount=refunds_amount,
-        profit_amount=round(revenue_amount - refunds_amount - operating_cost, 2),
-        currency=currency,
-    )
-
-
 def finance_metric_from_amount(
     *,
     metric_type: FinanceMetricTypeEnum,
@@ -119,13 +103,13 @@ def finance_metric_from_amount(
     amount: float,
     currency: str,
     transaction_count: int,
+    previous_amount: float,
 ) -> FinanceMetricDomainModel:
-    previous_amount = round(amount * mockutils.random.uniform(0.8, 1.2), 2)
     return FinanceMetricDomainModel(
         metric_type=metric_type,
         title=title,
         amount=round(amount, 2),
         currency=currency,
         transaction_count=transaction_count,
-        previous_amount=previous_amount,
+        previous_amount=round(previous_amount, 2),
     )
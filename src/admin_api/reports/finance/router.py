@@ -1,9 +1,12 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from admin_api.reports.finance.serializers import FinanceReport, FinanceReportQuery
 from admin_api.reports.finance.service import FinanceReportService
+from luxtj.contexts.currency.domain.admin_currency import FxRateUnavailableError
+from luxtj.shared_kernel.presentation.http.dependencies import database_session_handle
 from luxtj.shared_kernel.presentation.http.schemas import (
     ApiSuccessResponse,
     CurrencyQuery,
@@ -13,6 +16,12 @@ from luxtj.shared_kernel.presentation.http.schemas import (
 finance_router = APIRouter(prefix="/finance")
 
 
+def _finance_report_service(
+    session: Annotated[AsyncSession, Depends(database_session_handle)],
+) -> FinanceReportService:
+    return FinanceReportService(session)
+
+
 @finance_router.post(
     "/data",
     response_model=ApiSuccessResponse[FinanceReport],
@@ -21,7 +30,7 @@ finance_router = APIRouter(prefix="/finance")
     name="Finance Report Data",
 )
 async def finance_report_data(
-    finance_report_service: Annotated[FinanceReportService, Depends(FinanceReportService)],
+    finance_report_service: Annotated[FinanceReportService, Depends(_finance_report_service)],
     report_query: Annotated[FinanceReportQuery, Depends()],
     iso_currency_str: CurrencyQuery = "INR",
 ) -> ApiSuccessResponse[FinanceReport]:
@@ -29,12 +38,15 @@ async def finance_report_data(
     Get finance dashboard data for the overview page.
     """
     # TODO: access control: restrict this endpoint to satff usersonly
-    report = await finance_report_service.get_report(
-        from_date=report_query.from_date,
-        to_date=report_query.to_date,
-        time_scale=report_query.time_scale,
-        iso_currency_str=iso_currency_str,
-    )
+    try:
+        report = await finance_report_service.get_report(
+            from_date=report_query.from_date,
+            to_date=report_query.to_date,
+            time_scale=report_query.time_scale,
+            iso_currency_str=iso_currency_str,
+        )
+    except FxRateUnavailableError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
 
     return ApiSuccessResponse(
         status=RequestProcessStatus.OK,
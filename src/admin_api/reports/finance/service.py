@@ -1,20 +1,72 @@
-from datetime import date
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from admin_api.reports.enums import TimeScaleEnum
 from admin_api.reports.finance.domainmodel import (
     FinanceMetricTypeEnum,
     FinanceReportDomainModel,
+    FinanceTrendPointDomainModel,
     default_finance_date_range,
     finance_metric_from_amount,
-    finance_trend_dates,
+    finance_trend_months,
     finance_trend_weeks,
     finance_trend_years,
-    mock_finance_trend_point,
+)
+from luxtj.contexts.currency.domain.admin_currency import FxRateUnavailableError
+from luxtj.contexts.currency.infrastructure.currency_conversion import get_currency_conversion
+from luxtj.contexts.reports.infrastructure.persistence.sqlalchemy_models import (
+    SalesDailyRollupRow,
 )
 from luxtj.utils import timeutils
 
+Rollup = SalesDailyRollupRow
+
+# Amount columns summed per bucket, in FinanceTotals order.
+_AMOUNTS = (
+    Rollup.sales_amount,
+    Rollup.payments_amount,
+    Rollup.refunds_amount,
+    Rollup.margin_amount,
+)
+_COUNTS = (Rollup.booking_count, Rollup.payment_count, Rollup.refund_count)
+
+
+class FinanceTotals:
+    """Revenue / payments / refunds / profit (admin margin) and their transaction counts."""
+
+    __slots__ = ("amounts", "counts")
+
+    def __init__(self) -> None:
+        self.amounts = [Decimal(0)] * len(_AMOUNTS)
+        self.counts = [0] * len(_COUNTS)
+
+    def add(self, amounts: tuple, counts: tuple, rate: float) -> None:
+        for i, amount in enumerate(amounts):
+            self.amounts[i] += Decimal(str(amount or 0)) * Decimal(str(rate))
+        for i, count in enumerate(counts):
+            self.counts[i] += int(count or 0)
+
+    def merge(self, other: FinanceTotals) -> None:
+        self.amounts = [a + b for a, b in zip(self.amounts, other.amounts, strict=True)]
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+
+    def amount(self, index: int) -> float:
+        return round(float(self.amounts[index]), 2)
+
 
 class FinanceReportService:
+    """Finance overview served from ``report_sales_daily_rollups`` (see ``SalesReportService``).
+    Metric ``previous_amount`` is the same total over the equally long period just before."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._rates: dict[tuple[str, str], float] = {}
+
     async def get_report(
         self,
         *,
@@ -30,32 +82,62 @@ class FinanceReportService:
         )
 
         if time_scale == TimeScaleEnum.MONTHLY:
-            trend_range = finance_trend_dates(
+            unit = "month"
+            trend_range = finance_trend_months(
                 from_date=resolved_from_date,
                 to_date=resolved_to_date,
-                max_points=12,
             )
         elif time_scale == TimeScaleEnum.YEARLY:
+            unit = "year"
             trend_range = finance_trend_years(
                 from_date=resolved_from_date,
                 to_date=resolved_to_date,
             )
         else:
+            unit = "week"
             trend_range = finance_trend_weeks(
                 from_date=resolved_from_date,
                 to_date=resolved_to_date,
             )
 
-        trend = [
-            mock_finance_trend_point(timestamp=trend_date, currency=iso_currency_str)
-            for trend_date in trend_range
-        ]
+        buckets = await self._bucket_totals(
+            unit,
+            from_date=resolved_from_date,
+            to_date=resolved_to_date,
+            iso_currency_str=iso_currency_str,
+        )
+        span = resolved_to_date - resolved_from_date + timedelta(days=1)
+        previous = (
+            await self._bucket_totals(
+                None,
+                from_date=resolved_from_date - span,
+                to_date=resolved_from_date - timedelta(days=1),
+                iso_currency_str=iso_currency_str,
+            )
+        ).get(None, FinanceTotals())
 
-        revenue_amount = sum(point.revenue_amount for point in trend)
-        payments_amount = sum(point.payments_amount for point in trend)
-        refunds_amount = sum(point.refunds_amount for point in trend)
-        profit_amount = sum(point.profit_amount for point in trend)
+        current = FinanceTotals()
+        trend = []
+        for trend_date in trend_range:
+            point = buckets.get(trend_date, FinanceTotals())
+            current.merge(point)
+            trend.append(
+                FinanceTrendPointDomainModel(
+                    timestamp=trend_date,
+                    revenue_amount=point.amount(0),
+                    payments_amount=point.amount(1),
+                    refunds_amount=point.amount(2),
+                    profit_amount=point.amount(3),
+                    currency=iso_currency_str,
+                )
+            )
 
+        metric_specs = (
+            (FinanceMetricTypeEnum.REVENUE, "Revenue", 0, 0),
+            (FinanceMetricTypeEnum.PAYMENTS, "Payments", 1, 1),
+            (FinanceMetricTypeEnum.REFUNDS, "Refunds", 2, 2),
+            (FinanceMetricTypeEnum.PROFIT, "Profit", 3, 0),
+        )
         return FinanceReportDomainModel(
             title="Finance Overview",
             generated_at=timeutils.datetime_now(),
@@ -64,36 +146,60 @@ class FinanceReportService:
             to_date=resolved_to_date,
             metrics=[
                 finance_metric_from_amount(
-                    metric_type=FinanceMetricTypeEnum.REVENUE,
-                    title="Revenue",
-                    amount=revenue_amount,
+                    metric_type=metric_type,
+                    title=title,
+                    amount=current.amount(amount_index),
                     currency=iso_currency_str,
-                    transaction_count=self._mock_transaction_count(revenue_amount),
-                ),
-                finance_metric_from_amount(
-                    metric_type=FinanceMetricTypeEnum.PAYMENTS,
-                    title="Payments",
-                    amount=payments_amount,
-                    currency=iso_currency_str,
-                    transaction_count=self._mock_transaction_count(payments_amount),
-                ),
-                finance_metric_from_amount(
-                    metric_type=FinanceMetricTypeEnum.REFUNDS,
-                    title="Refunds",
-                    amount=refunds_amount,
-                    currency=iso_currency_str,
-                    transaction_count=self._mock_transaction_count(refunds_amount, minimum=1),
-                ),
-                finance_metric_from_amount(
-                    metric_type=FinanceMetricTypeEnum.PROFIT,
-                    title="Profit",
-                    amount=profit_amount,
-                    currency=iso_currency_str,
-                    transaction_count=self._mock_transaction_count(revenue_amount),
-                ),
+                    transaction_count=current.counts[count_index],
+                    previous_amount=previous.amount(amount_index),
+                )
+                for metric_type, title, amount_index, count_index in metric_specs
             ],
             trend=trend,
         )
 
-    def _mock_transaction_count(self, amount: float, *, minimum: int = 10) -> int:
-        return max(minimum, int(amount // 25_000))
+    async def _bucket_totals(
+        self,
+        unit: str | None,
+        *,
+        from_date: date,
+        to_date: date,
+        iso_currency_str: str,
+    ) -> dict[date | None, FinanceTotals]:
+        """Totals per ``date_trunc(unit, day)`` bucket (one ``None`` bucket if no unit)."""
+        keys = [func.date_trunc(unit, Rollup.day).label("bucket")] if unit else []
+        stmt = (
+            select(
+                *keys,
+                Rollup.currency,
+                *(func.sum(column) for column in _AMOUNTS),
+                *(func.sum(column) for column in _COUNTS),
+            )
+            .where(Rollup.day.between(from_date, to_date))
+            .group_by(*keys, Rollup.currency)
+        )
+        totals: dict[date | None, FinanceTotals] = {}
+        for row in (await self._session.execute(stmt)).all():
+            values = tuple(row)
+            bucket = None
+            if unit:
+                bucket, values = values[0], values[1:]
+                if isinstance(bucket, datetime):
+                    bucket = bucket.date()
+            currency, values = values[0], values[1:]
+            totals.setdefault(bucket, FinanceTotals()).add(
+                values[: len(_AMOUNTS)],
+                values[len(_AMOUNTS) :],
+                self._rate(currency, iso_currency_str),
+            )
+        return totals
+
+    def _rate(self, from_currency: str, to_currency: str) -> float:
+        key = (from_currency.upper(), to_currency.upper())
+        if key not in self._rates:
+            rate = get_currency_conversion().get_rate(*key)
+            if rate is None or rate <= 0:
+                # Summing another currency 1:1 would silently skew the totals.
+                raise FxRateUnavailableError(*key)
+            self._rates[key] = rate
+        return self._rates[key]
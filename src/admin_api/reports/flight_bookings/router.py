@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Body, Depends, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from admin_api.reports.exports import (
+    ReportExportJobBody,
+    ReportExportJobSerializer,
+    csv_response,
+    export_job_file,
+    export_job_status,
+    get_report_export_jobs,
+)
 from admin_api.reports.flight_bookings.serializers import (
     FlightBookingDetailsBody,
     FlightBookingDetailSerializer,
+    FlightBookingExportBody,
     FlightBookingListFilters,
     FlightBookingListResultSerializer,
     FlightBookingRefreshBody,
@@ -19,7 +29,12 @@ from admin_api.reports.flight_bookings.serializers import (
 from admin_api.reports.flight_bookings.service import FlightBookingReportsService
 from luxtj.contexts.flight.application.blender import FlightBlender
 from luxtj.contexts.identity.presentation.http.dependencies import require_permission
+from luxtj.shared_kernel.infrastructure.persistence.sqlalchemy import (
+    AsyncSessionFactory,
+    session_scope,
+)
 from luxtj.shared_kernel.presentation.http.dependencies import (
+    database_session_factory_handle,
     database_session_handle,
     http_client_handle,
 )
@@ -140,21 +155,61 @@ async def cancel_flight_booking(
     )
 
 
+_EXPORT_KIND = "flight_bookings"
+
+
+async def _export_stream(
+    session_factory: AsyncSessionFactory, body: FlightBookingExportBody
+) -> AsyncIterator[bytes]:
+    # Own session: the export outlives the request-scoped one (and runs in background jobs).
+    async with session_scope(session_factory) as session:
+        async for chunk in FlightBookingReportsService(session).export_csv(body, gzip=body.gzip):
+            yield chunk
+
+
 @flight_bookings_router.post(
     "/export",
-    summary="Export flight bookings as CSV",
+    response_model=None,
+    summary="Export flight bookings as CSV (streamed, or as a background job)",
 )
 async def export_flight_bookings(
-    body: Annotated[FlightBookingListFilters, Body(...)],
-    service: Annotated[FlightBookingReportsService, Depends(_reports_service)],
-) -> Response:
+    body: Annotated[FlightBookingExportBody, Body(...)],
+    session_factory: Annotated[AsyncSessionFactory, Depends(database_session_factory_handle)],
+) -> StreamingResponse | ApiSuccessResponse[ReportExportJobSerializer]:
     if body.from_date and body.to_date and body.from_date > body.to_date:
         raise HTTPException(status_code=422, detail="from_date must be before or equal to to_date")
-    csv_text = await service.export_csv(body)
-    return Response(
-        content=csv_text,
-        media_type="text/csv; charset=utf-8",
-        headers={
-            "Content-Disposition": 'attachment; filename="flight-bookings.csv"',
-        },
-    )
+    if body.background:
+        job = get_report_export_jobs().start(
+            _EXPORT_KIND,
+            "flight-bookings",
+            lambda: _export_stream(session_factory, body),
+            gzip=body.gzip,
+        )
+        return ApiSuccessResponse(
+            status=RequestProcessStatus.OK,
+            output=ReportExportJobSerializer.model_validate(job.to_dict()),
+        )
+    return csv_response(_export_stream(session_factory, body), "flight-bookings", gzip=body.gzip)
+
+
+@flight_bookings_router.post(
+    "/export/status",
+    response_model=ApiSuccessResponse[ReportExportJobSerializer],
+    summary="Status of a background flight bookings export",
+)
+async def flight_bookings_export_status(
+    body: Annotated[ReportExportJobBody, Body(...)],
+) -> ApiSuccessResponse[ReportExportJobSerializer]:
+    job = await export_job_status(_EXPORT_KIND, body.job_id)
+    return ApiSuccessResponse(status=RequestProcessStatus.OK, output=job)
+
+
+@flight_bookings_router.post(
+    "/export/download",
+    response_model=None,
+    summary="Download a finished background flight bookings export",
+)
+async def download_flight_bookings_export(
+    body: Annotated[ReportExportJobBody, Body(...)],
+) -> FileResponse:
+    return await export_job_file(_EXPORT_KIND, body.job_id)
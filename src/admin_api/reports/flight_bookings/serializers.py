@@ -24,6 +24,14 @@ class FlightBookingListFilters(ApiSerializerBaseModel):
     to_date: date | None = Field(None, alias="toDate")
 
 
+class FlightBookingExportBody(FlightBookingListFilters):
+    gzip: bool = False
+    background: bool = Field(
+        False,
+        description="Run as a background job; poll /export/status, then /export/download",
+    )
+
+
 class JourneySummarySerializer(ApiSerializerBaseModel):
     airline_code: str | None = None
     origin: str | None = None
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import csv
-import io
+from collections.abc import AsyncIterator
 from datetime import UTC, date, datetime, time
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import Select, func, or_, select
+from sqlalchemy import Select, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from admin_api.reports.exports import csv_stream
 from admin_api.reports.flight_bookings.serializers import (
     ExtraServiceLineSerializer,
     FlightBookingDetailSerializer,
@@ -24,6 +24,7 @@ from admin_api.reports.flight_bookings.serializers import (
     PricingLineSerializer,
     SegmentDetailSerializer,
 )
+from luxtj.bootstrap import config
 from luxtj.contexts.flight.infrastructure.persistence.sqlalchemy_models import (
     FlightBookingDetailsRow,
     FlightBookingItineraryDetailsRow,
@@ -549,63 +550,85 @@ class FlightBookingReportsService:
             ),
         )
 
-    async def export_csv(self, filters: FlightBookingListFilters) -> str:
-        """Export filtered bookings (capped) as CSV text."""
-        export_filters = filters.model_copy(update={"page": 1, "page_size": 100})
-        # Pull up to 5 pages (500 rows) for admin export without streaming infra.
-        all_items: list[FlightBookingListItemSerializer] = []
-        for page in range(1, 6):
-            page_filters = export_filters.model_copy(update={"page": page})
-            result = await self.list_bookings(page_filters)
-            all_items.extend(result.items)
-            if page * export_filters.page_size >= result.total:
-                break
-
-        buf = io.StringIO()
-        writer = csv.writer(buf)
-        writer.writerow(
-            [
-                "app_reference",
-                "status",
-                "payment_status",
-                "booking_source",
-                "gdspnr",
-                "email",
-                "phone",
-                "lead_passenger",
-                "passenger_count",
-                "trip_type",
-                "cabin_class",
-                "origin",
-                "destination",
-                "departure_date",
-                "total_fare",
-                "currency",
-                "payment_mode",
-                "created_at",
-            ]
+    async def iter_bookings(
+        self, filters: FlightBookingListFilters, *, batch_size: int
+    ) -> AsyncIterator[list[FlightBookingListItemSerializer]]:
+        """Filtered bookings newest first, in keyset batches (no COUNT, no OFFSET)."""
+        order = (FlightBookingDetailsRow.created_at, FlightBookingDetailsRow.id)
+        base = (
+            self._filtered_select(filters)
+            .order_by(*(column.desc() for column in order))
+            .limit(batch_size)
         )
-        for item in all_items:
-            writer.writerow(
-                [
-                    item.app_reference,
-                    item.status,
-                    item.payment_status,
-                    item.booking_source,
-                    item.gdspnr or "",
-                    item.email or "",
-                    item.phone or "",
-                    item.lead_passenger_name or "",
-                    item.passenger_count,
-                    item.trip_type,
-                    item.cabin_class or "",
-                    item.origin or "",
-                    item.destination or "",
-                    item.departure_date or "",
-                    item.total_fare if item.total_fare is not None else "",
-                    item.currency or "",
-                    item.payment_mode or "",
-                    item.created_at.isoformat() if item.created_at else "",
-                ]
-            )
-        return buf.getvalue()
+        after: tuple[datetime, str] | None = None
+        while True:
+            stmt = base if after is None else base.where(tuple_(*order) < tuple_(*after))
+            rows = list((await self._session.execute(stmt)).scalars().all())
+            if not rows:
+                return
+            yield await self._hydrate_list_items(rows)
+            if len(rows) < batch_size:
+                return
+            after = (rows[-1].created_at, rows[-1].id)
+            # Only the current batch stays referenced; keep the identity map from growing.
+            self._session.expunge_all()
+
+    async def export_csv(
+        self, filters: FlightBookingListFilters, *, gzip: bool = False
+    ) -> AsyncIterator[bytes]:
+        """Every filtered booking as CSV bytes, streamed batch by batch."""
+
+        async def rows() -> AsyncIterator[list[Any]]:
+            async for items in self.iter_bookings(
+                filters, batch_size=config.REPORT_EXPORT_BATCH_SIZE
+            ):
+                for item in items:
+                    yield _export_row(item)
+
+        async for chunk in csv_stream(EXPORT_HEADER, rows(), gzip=gzip):
+            yield chunk
+
+
+EXPORT_HEADER = (
+    "app_reference",
+    "status",
+    "payment_status",
+    "booking_source",
+    "gdspnr",
+    "email",
+    "phone",
+    "lead_passenger",
+    "passenger_count",
+    "trip_type",
+    "cabin_class",
+    "origin",
+    "destination",
+    "departure_date",
+    "total_fare",
+    "currency",
+    "payment_mode",
+    "created_at",
+)
+
+
+def _export_row(item: FlightBookingListItemSerializer) -> list[Any]:
+    return [
+        item.app_reference,
+        item.status,
+        item.payment_status,
+        item.booking_source,
+        item.gdspnr or "",
+        item.email or "",
+        item.phone or "",
+        item.lead_passenger_name or "",
+        item.passenger_count,
+        item.trip_type,
+        item.cabin_class or "",
+        item.origin or "",
+        item.destination or "",
+        item.departure_date or "",
+        item.total_fare if item.total_fare is not None else "",
+        item.currency or "",
+        item.payment_mode or "",
+        item.created_at.isoformat() if item.created_at else "",
+    ]
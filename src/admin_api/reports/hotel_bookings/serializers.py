@@ -24,6 +24,14 @@ class HotelBookingListFilters(ApiSerializerBaseModel):
     to_date: date | None = Field(None, alias="toDate")
 
 
+class HotelBookingExportBody(HotelBookingListFilters):
+    gzip: bool = False
+    background: bool = Field(
+        False,
+        description="Run as a background job; poll /export/status, then /export/download",
+    )
+
+
 class HotelBookingListItemSerializer(ApiSerializerBaseModel):
     app_reference: str
     status: str
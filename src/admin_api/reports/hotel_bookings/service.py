@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import csv
-import io
+from collections.abc import AsyncIterator
 from datetime import UTC, date, datetime, time
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import Select, func, or_, select
+from sqlalchemy import Select, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from admin_api.reports.exports import csv_stream
 from admin_api.reports.hotel_bookings.serializers import (
     GuestDetailSerializer,
     HotelBookingDetailSerializer,
@@ -22,6 +22,7 @@ from admin_api.reports.hotel_bookings.serializers import (
     PricingLineSerializer,
     RoomDetailSerializer,
 )
+from luxtj.bootstrap import config
 from luxtj.contexts.crs.infrastructure.persistence.sqlalchemy_models import (
     HotelCrsHotelImageRow,
     HotelCrsHotelRow,
@@ -553,53 +554,77 @@ class HotelBookingReportsService:
             attributes=booking.attributes if isinstance(booking.attributes, dict) else None,
         )
 
-    async def export_csv(self, filters: HotelBookingListFilters) -> str:
-        export_filters = filters.model_copy(update={"page": 1, "page_size": 100})
-        all_items: list[HotelBookingListItemSerializer] = []
-        for page in range(1, 6):
-            page_filters = export_filters.model_copy(update={"page": page})
-            result = await self.list_bookings(page_filters)
-            all_items.extend(result.items)
-            if page * export_filters.page_size >= result.total:
-                break
-
-        buf = io.StringIO()
-        writer = csv.writer(buf)
-        writer.writerow(
-            [
-                "app_reference",
-                "status",
-                "payment_status",
-                "booking_source",
-                "hotel_name",
-                "hotel_code",
-                "check_in",
-                "check_out",
-                "rooms",
-                "lead_guest",
-                "email",
-                "total_fare",
-                "currency",
-                "created_at",
-            ]
+    async def iter_bookings(
+        self, filters: HotelBookingListFilters, *, batch_size: int
+    ) -> AsyncIterator[list[HotelBookingListItemSerializer]]:
+        """Filtered bookings newest first, in keyset batches (no COUNT, no OFFSET)."""
+        order = (HotelBookingDetailsRow.created_at, HotelBookingDetailsRow.id)
+        base = (
+            self._filtered_select(filters)
+            .order_by(*(column.desc() for column in order))
+            .limit(batch_size)
         )
-        for item in all_items:
-            writer.writerow(
-                [
-                    item.app_reference,
-                    item.status,
-                    item.payment_status,
-                    item.booking_source,
-                    item.hotel_name,
-                    item.hotel_code or "",
-                    item.check_in or "",
-                    item.check_out or "",
-                    item.rooms,
-                    item.lead_guest_name or "",
-                    item.email or "",
-                    item.total_fare if item.total_fare is not None else "",
-                    item.currency or "",
-                    item.created_at.isoformat() if item.created_at else "",
-                ]
-            )
-        return buf.getvalue()
+        after: tuple[datetime, str] | None = None
+        while True:
+            stmt = base if after is None else base.where(tuple_(*order) < tuple_(*after))
+            rows = list((await self._session.execute(stmt)).scalars().all())
+            if not rows:
+                return
+            yield await self._hydrate_list_items(rows)
+            if len(rows) < batch_size:
+                return
+            after = (rows[-1].created_at, rows[-1].id)
+            # Only the current batch stays referenced; keep the identity map from growing.
+            self._session.expunge_all()
+
+    async def export_csv(
+        self, filters: HotelBookingListFilters, *, gzip: bool = False
+    ) -> AsyncIterator[bytes]:
+        """Every filtered booking as CSV bytes, streamed batch by batch."""
+
+        async def rows() -> AsyncIterator[list[Any]]:
+            async for items in self.iter_bookings(
+                filters, batch_size=config.REPORT_EXPORT_BATCH_SIZE
+            ):
+                for item in items:
+                    yield _export_row(item)
+
+        async for chunk in csv_stream(EXPORT_HEADER, rows(), gzip=gzip):
+            yield chunk
+
+
+EXPORT_HEADER = (
+    "app_reference",
+    "status",
+    "payment_status",
+    "booking_source",
+    "hotel_name",
+    "hotel_code",
+    "check_in",
+    "check_out",
+    "rooms",
+    "lead_guest",
+    "email",
+    "total_fare",
+    "currency",
+    "created_at",
+)
+
+
+def _export_row(item: HotelBookingListItemSerializer) -> list[Any]:
+    return [
+        item.app_reference,
+        item.status,
+        item.payment_status,
+        item.booking_source,
+        item.hotel_name,
+        item.hotel_code or "",
+        item.check_in or "",
+        item.check_out or "",
+        item.rooms,
+        item.lead_guest_name or "",
+        item.email or "",
+        item.total_fare if item.total_fare is not None else "",
+        item.currency or "",
+        item.created_at.isoformat() if item.created_at else "",
+    ]
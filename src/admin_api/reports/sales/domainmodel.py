@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from enum import StrEnum
 
-from luxtj.utils import mockutils, timeutils
+from luxtj.utils import timeutils
 
 
 class SalesReportTypeEnum(StrEnum):
@@ -97,40 +97,6 @@ class SalesReportDomainModel:
         )
 
 
-def mock_sales_report_row(
-    *,
-    timestamp: date,
-    period_type: SalesPeriodTypeEnum,
-    dimension_type: SalesDimensionTypeEnum,
-    dimension_id: str,
-    dimension_name: str,
-    currency: str,
-) -> SalesReportRowDomainModel:
-    booking_count = mockutils.random.randint(12, 420)
-    return SalesReportRowDomainModel(
-        timestamp=timestamp,
-        period_type=period_type,
-        dimension_type=dimension_type,
-        dimension_id=dimension_id,
-        dimension_name=dimension_name,
-        sales_amount=mockutils.random_booking_amount(10_000.0, 250_000.0),
-        currency=currency,
-        booking_count=booking_count,
-        units_sold=booking_count + mockutils.random.randint(0, 180),
-    )
-
-
-def date_range_days(
-    *, from_date: date | None, to_date: date | None, fallback_days: int
-) -> list[date]:
-    end_date = to_date or timeutils.datetime_now().date()
-    start_date = from_date or (end_date - timedelta(days=fallback_days - 1))
-    if start_date > end_date:
-        start_date, end_date = end_date, start_date
-    total_days = (end_date - start_date).days + 1
-    return [start_date + timedelta(days=day_index) for day_index in range(total_days)]
-
-
 def month_range(
     *, from_date: date | None, to_date: date | None, fallback_months: int
 ) -> list[date]:
@@ -1,6 +1,7 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from admin_api.reports.sales.serializers import (
     SalesDimensionOption,
@@ -9,6 +10,8 @@ from admin_api.reports.sales.serializers import (
     SalesReportQuery,
 )
 from admin_api.reports.sales.service import SalesReportService
+from luxtj.contexts.currency.domain.admin_currency import FxRateUnavailableError
+from luxtj.shared_kernel.presentation.http.dependencies import database_session_handle
 from luxtj.shared_kernel.presentation.http.schemas import (
     ApiSuccessResponse,
     CurrencyQuery,
@@ -18,6 +21,12 @@ from luxtj.shared_kernel.presentation.http.schemas import (
 sales_router = APIRouter(prefix="/sales")
 
 
+def _sales_report_service(
+    session: Annotated[AsyncSession, Depends(database_session_handle)],
+) -> SalesReportService:
+    return SalesReportService(session)
+
+
 @sales_router.post(
     "/data",
     response_model=ApiSuccessResponse[SalesReport],
@@ -26,7 +35,7 @@ sales_router = APIRouter(prefix="/sales")
     name="Sales Report Data",
 )
 async def sales_report_data(
-    sales_report_service: Annotated[SalesReportService, Depends(SalesReportService)],
+    sales_report_service: Annotated[SalesReportService, Depends(_sales_report_service)],
     report_query: Annotated[SalesReportQuery, Depends()],
     destination_ids: Annotated[
         list[str] | None,
@@ -48,15 +57,18 @@ async def sales_report_data(
     Get sales dashboard data using one common response shape for all sales report tabs.
     """
     # TODO: access control: restrict this endpoint to satff usersonly
-    report = await sales_report_service.get_report(
-        report_type=report_query.report_type,
-        from_date=report_query.from_date,
-        to_date=report_query.to_date,
-        time_scale=report_query.time_scale,
-        destination_ids=destination_ids,
-        property_ids=property_ids,
-        iso_currency_str=iso_currency_str,
-    )
+    try:
+        report = await sales_report_service.get_report(
+            report_type=report_query.report_type,
+            from_date=report_query.from_date,
+            to_date=report_query.to_date,
+            time_scale=report_query.time_scale,
+            destination_ids=destination_ids,
+            property_ids=property_ids,
+            iso_currency_str=iso_currency_str,
+        )
+    except FxRateUnavailableError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
 
     return ApiSuccessResponse(
         status=RequestProcessStatus.OK,
@@ -72,7 +84,7 @@ async def sales_report_data(
     name="Search Sales Report Dimensions",
 )
 async def search_sales_report_dimensions(
-    sales_report_service: Annotated[SalesReportService, Depends(SalesReportService)],
+    sales_report_service: Annotated[SalesReportService, Depends(_sales_report_service)],
     dimension_query: Annotated[SalesDimensionSearchQuery, Depends()],
 ) -> ApiSuccessResponse[list[SalesDimensionOption]]:
     """
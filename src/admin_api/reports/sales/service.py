@@ -1,4 +1,8 @@
-from datetime import date
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Select, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from admin_api.reports.enums import TimeScaleEnum
 from admin_api.reports.sales.domainmodel import (
@@ -6,32 +10,33 @@ from admin_api.reports.sales.domainmodel import (
     SalesDimensionTypeEnum,
     SalesPeriodTypeEnum,
     SalesReportDomainModel,
+    SalesReportRowDomainModel,
     SalesReportTypeEnum,
-    date_range_days,
-    mock_sales_report_row,
     month_range,
 )
 from admin_api.reports.timeranges import weekly_range, yearly_range
+from luxtj.contexts.currency.domain.admin_currency import FxRateUnavailableError
+from luxtj.contexts.currency.infrastructure.currency_conversion import get_currency_conversion
+from luxtj.contexts.reports.infrastructure.persistence.sqlalchemy_models import (
+    SalesDailyRollupRow,
+)
+from luxtj.utils import timeutils
 
-DESTINATION_OPTIONS = [
-    ("DXB", "Dubai"),
-    ("MLE", "Maldives"),
-    ("BKK", "Bangkok"),
-    ("SIN", "Singapore"),
-    ("LHR", "London"),
-    ("NYC", "New York"),
-]
+DIMENSION_ROW_LIMIT = 50
+DIMENSION_SEARCH_LIMIT = 20
 
-PROPERTY_OPTIONS = [
-    ("PROP-001", "Luxury Apartment"),
-    ("PROP-002", "Cozy Villa"),
-    ("PROP-003", "Spacious Cottage"),
-    ("PROP-004", "Modern Studio"),
-    ("PROP-005", "Beachfront Bungalow"),
-]
+Rollup = SalesDailyRollupRow
 
 
 class SalesReportService:
+    """Sales dashboard served from ``report_sales_daily_rollups``: each query is one
+    ``GROUP BY`` over (bucket or dimension) x currency, so its cost follows the number of
+    buckets rather than the number of bookings."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._rates: dict[tuple[str, str], float] = {}
+
     async def get_report(
         self,
         *,
@@ -43,37 +48,46 @@ class SalesReportService:
         property_ids: list[str] | None = None,
         iso_currency_str: str,
     ) -> SalesReportDomainModel:
-        if report_type == SalesReportTypeEnum.MONTHLY:
-            return self._monthly_sales(
+        if report_type == SalesReportTypeEnum.DESTINATION:
+            return await self._dimension_sales(
+                dimension_type=SalesDimensionTypeEnum.DESTINATION,
+                selected_ids=destination_ids,
                 from_date=from_date,
                 to_date=to_date,
                 iso_currency_str=iso_currency_str,
             )
-        if report_type == SalesReportTypeEnum.DESTINATION:
-            return self._destination_sales(
-                destination_ids=destination_ids,
-                iso_currency_str=iso_currency_str,
-            )
         if report_type == SalesReportTypeEnum.PROPERTY:
-            return self._property_sales(
-                property_ids=property_ids,
+            return await self._dimension_sales(
+                dimension_type=SalesDimensionTypeEnum.PROPERTY,
+                selected_ids=property_ids,
+                from_date=from_date,
+                to_date=to_date,
                 iso_currency_str=iso_currency_str,
             )
-        if time_scale == TimeScaleEnum.MONTHLY:
-            return self._monthly_sales(
-                from_date=from_date,
+        if report_type == SalesReportTypeEnum.MONTHLY or time_scale == TimeScaleEnum.MONTHLY:
+            return await self._series_sales(
+                unit="month",
+                buckets=month_range(from_date=from_date, to_date=to_date, fallback_months=12),
                 to_date=to_date,
+                report_type=SalesReportTypeEnum.MONTHLY,
+                title="Monthly Sales",
                 iso_currency_str=iso_currency_str,
             )
         if time_scale == TimeScaleEnum.YEARLY:
-            return self._yearly_sales(
-                from_date=from_date,
+            return await self._series_sales(
+                unit="year",
+                buckets=yearly_range(from_date=from_date, to_date=to_date, fallback_years=3),
                 to_date=to_date,
+                report_type=SalesReportTypeEnum.DAILY,
+                title="Yearly Sales",
                 iso_currency_str=iso_currency_str,
             )
-        return self._weekly_sales(
-            from_date=from_date,
+        return await self._series_sales(
+            unit="week",
+            buckets=weekly_range(from_date=from_date, to_date=to_date, fallback_weeks=12),
             to_date=to_date,
+            report_type=SalesReportTypeEnum.DAILY,
+            title="Weekly Sales",
             iso_currency_str=iso_currency_str,
         )
 
@@ -83,207 +97,166 @@ class SalesReportService:
         dimension_type: SalesDimensionTypeEnum,
         search_query: str | None = None,
     ) -> list[SalesDimensionOptionDomainModel]:
-        if dimension_type == SalesDimensionTypeEnum.DESTINATION:
-            options = DESTINATION_OPTIONS
-        elif dimension_type == SalesDimensionTypeEnum.PROPERTY:
-            options = PROPERTY_OPTIONS
-        else:
+        columns = _dimension_columns(dimension_type)
+        if columns is None:
             return []
+        id_col, name_col = columns
 
-        normalized_query = (search_query or "").strip().lower()
+        stmt = (
+            select(id_col, func.max(name_col))
+            .where(id_col != "")
+            .group_by(id_col)
+            .order_by(func.sum(Rollup.booking_count).desc(), id_col)
+            .limit(DIMENSION_SEARCH_LIMIT)
+        )
+        normalized_query = (search_query or "").strip()
         if normalized_query:
-            options = [
-                (option_id, option_name)
-                for option_id, option_name in options
-                if normalized_query in option_id.lower() or normalized_query in option_name.lower()
-            ]
+            like = f"%{normalized_query}%"
+            stmt = stmt.where(or_(id_col.ilike(like), name_col.ilike(like)))
 
+        rows = (await self._session.execute(stmt)).all()
         return [
             SalesDimensionOptionDomainModel(
                 dimension_type=dimension_type,
                 dimension_id=option_id,
-                dimension_name=option_name,
+                dimension_name=option_name or option_id,
             )
-            for option_id, option_name in options
+            for option_id, option_name in rows
         ]
 
-    def _daily_sales(
+    async def _series_sales(
         self,
         *,
-        from_date: date | None,
+        unit: str,
+        buckets: list[date],
         to_date: date | None,
+        report_type: SalesReportTypeEnum,
+        title: str,
         iso_currency_str: str,
     ) -> SalesReportDomainModel:
-        rows = [
-            mock_sales_report_row(
-                timestamp=report_date,
-                period_type=SalesPeriodTypeEnum.DAILY,
-                dimension_type=SalesDimensionTypeEnum.OVERALL,
-                dimension_id="ALL",
-                dimension_name="All Sales",
-                currency=iso_currency_str,
-            )
-            for report_date in date_range_days(
-                from_date=from_date,
-                to_date=to_date,
-                fallback_days=14,
-            )
-        ]
-        return SalesReportDomainModel.from_rows(
-            report_type=SalesReportTypeEnum.DAILY,
-            title="Daily Sales",
-            currency=iso_currency_str,
-            rows=rows,
-        )
+        end_date = max(to_date or timeutils.datetime_now().date(), buckets[-1])
+        bucket = func.date_trunc(unit, Rollup.day).label("bucket")
+        stmt = _totals_select([bucket]).where(Rollup.day.between(buckets[0], end_date))
 
-    def _monthly_sales(
-        self,
-        *,
-        from_date: date | None,
-        to_date: date | None,
-        iso_currency_str: str,
-    ) -> SalesReportDomainModel:
-        rows = [
-            mock_sales_report_row(
-                timestamp=report_month,
-                period_type=SalesPeriodTypeEnum.MONTHLY,
-                dimension_type=SalesDimensionTypeEnum.OVERALL,
-                dimension_id="ALL",
-                dimension_name="All Sales",
-                currency=iso_currency_str,
-            )
-            for report_month in month_range(
-                from_date=from_date,
-                to_date=to_date,
-                fallback_months=12,
-            )
-        ]
-        return SalesReportDomainModel.from_rows(
-            report_type=SalesReportTypeEnum.MONTHLY,
-            title="Monthly Sales",
-            currency=iso_currency_str,
-            rows=rows,
-        )
+        totals: dict[date, list[Decimal | int]] = {}
+        for bucket_start, currency, sales, booking_count, units_sold in (
+            await self._session.execute(stmt)
+        ).all():
+            key = bucket_start.date() if isinstance(bucket_start, datetime) else bucket_start
+            acc = totals.setdefault(key, [Decimal(0), 0, 0])
+            acc[0] += Decimal(str(sales)) * Decimal(str(self._rate(currency, iso_currency_str)))
+            acc[1] += booking_count
+            acc[2] += units_sold
 
-    def _weekly_sales(
-        self,
-        *,
-        from_date: date | None,
-        to_date: date | None,
-        iso_currency_str: str,
-    ) -> SalesReportDomainModel:
-        rows = [
-            mock_sales_report_row(
-                timestamp=report_week,
-                period_type=SalesPeriodTypeEnum.MONTHLY,
-                dimension_type=SalesDimensionTypeEnum.OVERALL,
-                dimension_id="ALL",
-                dimension_name="All Sales",
-                currency=iso_currency_str,
-            )
-            for report_week in weekly_range(
-                from_date=from_date,
-                to_date=to_date,
-                fallback_weeks=12,
+        rows = []
+        for bucket_start in buckets:
+            sales, booking_count, units_sold = totals.get(bucket_start, (Decimal(0), 0, 0))
+            rows.append(
+                SalesReportRowDomainModel(
+                    timestamp=bucket_start,
+                    period_type=SalesPeriodTypeEnum.MONTHLY,
+                    dimension_type=SalesDimensionTypeEnum.OVERALL,
+                    dimension_id="ALL",
+                    dimension_name="All Sales",
+                    sales_amount=round(float(sales), 2),
+                    currency=iso_currency_str,
+                    booking_count=int(booking_count),
+                    units_sold=int(units_sold),
+                )
             )
-        ]
         return SalesReportDomainModel.from_rows(
-            report_type=SalesReportTypeEnum.DAILY,
-            title="Weekly Sales",
+            report_type=report_type,
+            title=title,
             currency=iso_currency_str,
             rows=rows,
         )
 
-    def _yearly_sales(
+    async def _dimension_sales(
         self,
         *,
+        dimension_type: SalesDimensionTypeEnum,
+        selected_ids: list[str] | None,
         from_date: date | None,
         to_date: date | None,
         iso_currency_str: str,
     ) -> SalesReportDomainModel:
-        rows = [
-            mock_sales_report_row(
-                timestamp=report_year,
-                period_type=SalesPeriodTypeEnum.MONTHLY,
-                dimension_type=SalesDimensionTypeEnum.OVERALL,
-                dimension_id="ALL",
-                dimension_name="All Sales",
-                currency=iso_currency_str,
-            )
-            for report_year in yearly_range(
-                from_date=from_date,
-                to_date=to_date,
-                fallback_years=3,
-            )
-        ]
-        return SalesReportDomainModel.from_rows(
-            report_type=SalesReportTypeEnum.DAILY,
-            title="Yearly Sales",
-            currency=iso_currency_str,
-            rows=rows,
+        id_col, name_col = _dimension_columns(dimension_type)  # type: ignore[misc]
+        stmt = (
+            _totals_select([id_col], func.max(name_col))
+            .where(id_col != "")
+            .having(func.sum(Rollup.booking_count) > 0)
         )
+        if from_date is not None or to_date is not None:
+            start, end = sorted((from_date or date.min, to_date or date.max))
+            stmt = stmt.where(Rollup.day.between(start, end))
+        normalized_ids = {v.strip().lower() for v in selected_ids or [] if v.strip()}
+        if normalized_ids:
+            stmt = stmt.where(func.lower(id_col).in_(normalized_ids))
 
-    def _destination_sales(
-        self,
-        *,
-        destination_ids: list[str] | None,
-        iso_currency_str: str,
-    ) -> SalesReportDomainModel:
-        destinations = self._filter_options_by_id(DESTINATION_OPTIONS, destination_ids)
-        rows = [
-            mock_sales_report_row(
-                timestamp=date.today(),
-                period_type=SalesPeriodTypeEnum.RANGE,
-                dimension_type=SalesDimensionTypeEnum.DESTINATION,
-                dimension_id=destination_id,
-                dimension_name=destination_name,
-                currency=iso_currency_str,
-            )
-            for destination_id, destination_name in destinations
-        ]
-        return SalesReportDomainModel.from_rows(
-            report_type=SalesReportTypeEnum.DESTINATION,
-            title="Destination Sales",
-            currency=iso_currency_str,
-            rows=rows,
-        )
+        totals: dict[str, list] = {}
+        for dimension_id, name, currency, sales, booking_count, units_sold in (
+            await self._session.execute(stmt)
+        ).all():
+            acc = totals.setdefault(dimension_id, [name or dimension_id, Decimal(0), 0, 0])
+            acc[1] += Decimal(str(sales)) * Decimal(str(self._rate(currency, iso_currency_str)))
+            acc[2] += booking_count
+            acc[3] += units_sold
 
-    def _property_sales(
-        self,
-        *,
-        property_ids: list[str] | None,
-        iso_currency_str: str,
-    ) -> SalesReportDomainModel:
-        properties = self._filter_options_by_id(PROPERTY_OPTIONS, property_ids)
+        ranked = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+        if not normalized_ids:
+            ranked = ranked[:DIMENSION_ROW_LIMIT]
+        timestamp = to_date or timeutils.datetime_now().date()
         rows = [
-            mock_sales_report_row(
-                timestamp=date.today(),
+            SalesReportRowDomainModel(
+                timestamp=timestamp,
                 period_type=SalesPeriodTypeEnum.RANGE,
-                dimension_type=SalesDimensionTypeEnum.PROPERTY,
-                dimension_id=property_id,
-                dimension_name=property_name,
+                dimension_type=dimension_type,
+                dimension_id=dimension_id,
+                dimension_name=name,
+                sales_amount=round(float(sales), 2),
                 currency=iso_currency_str,
+                booking_count=int(booking_count),
+                units_sold=int(units_sold),
             )
-            for property_id, property_name in properties
+            for dimension_id, (name, sales, booking_count, units_sold) in ranked
         ]
+        if dimension_type == SalesDimensionTypeEnum.DESTINATION:
+            report_type, title = SalesReportTypeEnum.DESTINATION, "Destination Sales"
+        else:
+            report_type, title = SalesReportTypeEnum.PROPERTY, "Property Sales"
         return SalesReportDomainModel.from_rows(
-            report_type=SalesReportTypeEnum.PROPERTY,
-            title="Property Sales",
+            report_type=report_type,
+            title=title,
             currency=iso_currency_str,
             rows=rows,
         )
 
-    def _filter_options_by_id(
-        self,
-        options: list[tuple[str, str]],
-        selected_ids: list[str] | None,
-    ) -> list[tuple[str, str]]:
-        if not selected_ids:
-            return options
+    def _rate(self, from_currency: str, to_currency: str) -> float:
+        key = (from_currency.upper(), to_currency.upper())
+        if key not in self._rates:
+            rate = get_currency_conversion().get_rate(*key)
+            if rate is None or rate <= 0:
+                # Summing another currency 1:1 would silently skew the totals.
+                raise FxRateUnavailableError(*key)
+            self._rates[key] = rate
+        return self._rates[key]
 
-        normalized_ids = {selected_id.lower() for selected_id in selected_ids}
-        return [
-            (option_id, option_name)
-            for option_id, option_name in options
-            if option_id.lower() in normalized_ids
-        ]
+
+def _dimension_columns(dimension_type: SalesDimensionTypeEnum) -> tuple | None:
+    if dimension_type == SalesDimensionTypeEnum.DESTINATION:
+        return Rollup.destination_id, Rollup.destination_name
+    if dimension_type == SalesDimensionTypeEnum.PROPERTY:
+        return Rollup.property_id, Rollup.property_name
+    return None
+
+
+def _totals_select(keys: list, *extra) -> Select:
+    """Sales totals per ``keys`` x currency; amounts stay in each rollup's currency."""
+    return select(
+        *keys,
+        *extra,
+        Rollup.currency,
+        func.sum(Rollup.sales_amount),
+        func.sum(Rollup.booking_count),
+        func.sum(Rollup.units_sold),
+    ).group_by(*keys, Rollup.currency)
@@ -3,7 +3,8 @@ import signal
 
 from luxtj.bootstrap import config
 from luxtj.bootstrap.persistence import database_resources
-from luxtj.contexts.action_centre.infrastructure.projector import ActionCentreOutboxProjector
+from luxtj.contexts.action_centre.infrastructure.projector import ActionCentreOutboxSubscriber
+from luxtj.shared_kernel.infrastructure.events.outbox_dispatcher import OutboxDispatcher
 from luxtj.shared_kernel.infrastructure.logging import get_logger_handle
 
 logger = get_logger_handle(__name__)
@@ -16,7 +17,14 @@ async def run_action_centre_outbox_projector() -> None:
         config.DATABASE_URL,
         echo=config.DATABASE_ECHO,
     ) as resources:
-        projector = ActionCentreOutboxProjector(resources.session_factory)
+        dispatcher = OutboxDispatcher(
+            resources.session_factory,
+            [ActionCentreOutboxSubscriber()],
+            engine=resources.engine,
+            partitions=config.OUTBOX_DISPATCH_PARTITIONS,
+            batch_size=config.OUTBOX_DISPATCH_BATCH_SIZE,
+            fallback_poll_seconds=config.OUTBOX_FALLBACK_POLL_SECONDS,
+        )
         stop_event = asyncio.Event()
         loop = asyncio.get_running_loop()
 
@@ -30,13 +38,15 @@ async def run_action_centre_outbox_projector() -> None:
                 # add_signal_handler is not available on every runtime.
                 pass
 
-        await projector.start()
+        await dispatcher.start()
         logger.info("Action centre outbox projector started")
 
         try:
             await stop_event.wait()
         finally:
-            await projector.stop()
+            await dispatcher.stop()
+            for stats in dispatcher.stats():
+                logger.info("Outbox subscriber stats: %s", stats)
             for sig in (signal.SIGINT, signal.SIGTERM):
                 try:
                     loop.remove_signal_handler(sig)
@@ -1,9 +1,10 @@
 import asyncio
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, FastAPI
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
 from httpx import AsyncClient
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
@@ -17,6 +18,7 @@ from admin_api.customer.router import customer_router
 from admin_api.partner.router import partner_router
 from admin_api.promo_codes.router import promo_codes_router
 from admin_api.refund_queues.router import refund_queues_router
+from admin_api.reports.exports import ReportExportJobs, set_report_export_jobs
 from admin_api.reports.router import reports_router
 from luxtj.bootstrap import config
 from luxtj.contexts.account.infrastructure.persistence.sqlalchemy_models import AccountAuthBase
@@ -39,16 +41,22 @@ from luxtj.contexts.crs.presentation.http.inventory_router import crs_inventory_
 from luxtj.contexts.crs.presentation.http.mapping_router import crs_mapping_router
 from luxtj.contexts.currency.application.use_cases import CurrencyActivationService
 from luxtj.contexts.currency.bootstrap import init_currency_conversion
+from luxtj.contexts.currency.domain.admin_currency import FxRateUnavailableError
 from luxtj.contexts.currency.infrastructure.active_currencies_cache import (
     get_active_currencies_cache,
 )
 from luxtj.contexts.currency.infrastructure.currency_conversion import get_currency_conversion
+from luxtj.contexts.currency.infrastructure.fx_rate_refresher import (
+    FxRateRefresher,
+    set_fx_rate_refresher,
+)
 from luxtj.contexts.currency.infrastructure.persistence.sqlalchemy_models import CurrencyBase
 from luxtj.contexts.currency.infrastructure.persistence.sqlalchemy_repository import (
     SqlAlchemyActiveCurrencyRepository,
 )
 from luxtj.contexts.currency.presentation.http.router import (
     admin_currencies_router,
+    fx_rate_unavailable_handler,
     public_currencies_router,
 )
 from luxtj.contexts.customer.infrastructure.persistence.sqlalchemy_models import CustomerBase
@@ -59,6 +67,16 @@ from luxtj.contexts.customer.presentation.http.router import (
 from luxtj.contexts.flight.infrastructure.persistence.sqlalchemy_models import FlightBase
 from luxtj.contexts.flight.presentation.http.flight_router import flight_router
 from luxtj.contexts.flight.presentation.http.markup_router import flight_markup_router
+from luxtj.contexts.hotel.infrastructure.crs_geo_index import (
+    CrsGeoIndexRegistry,
+    CrsGeoIndexSettings,
+    set_crs_geo_index,
+)
+from luxtj.contexts.hotel.infrastructure.crs_static_cache import (
+    CrsStaticCacheSettings,
+    CrsStaticDetailsCache,
+    set_crs_static_cache,
+)
 from luxtj.contexts.hotel.infrastructure.persistence.sqlalchemy_models import HotelBase
 from luxtj.contexts.hotel.presentation.http.hotel_router import hotel_router
 from luxtj.contexts.hotel.presentation.http.markup_router import hotel_markup_router
@@ -75,15 +93,26 @@ from luxtj.contexts.integration.infrastructure.persistence.sqlalchemy_repository
 )
 from luxtj.contexts.integration.infrastructure.registry_cache import get_integration_registry
 from luxtj.contexts.integration.presentation.http.router import integrations_router
+from luxtj.contexts.maps.application.places import close_places_http_client
 from luxtj.contexts.maps.presentation.http.router import maps_router
 from luxtj.contexts.marketing.infrastructure.persistence.sqlalchemy_models import MarketingBase
 from luxtj.contexts.marketing.presentation.http.router import marketing_router
 from luxtj.contexts.payment.infrastructure.persistence.sqlalchemy_models import PaymentBase
 from luxtj.contexts.payment.presentation.http.router import payment_gateway_router
+from luxtj.contexts.reports.infrastructure.persistence.sqlalchemy_models import ReportsBase
 from luxtj.shared_kernel.infrastructure.events.in_process import (
     InProcessEventPublisher,
     PrintInProcessEventSubscriber,
 )
+from luxtj.shared_kernel.infrastructure.http import (
+    AuditOverflowPolicy,
+    AuditSinkSettings,
+    BatchedAuditSink,
+    HttpClientPool,
+    HttpPoolSettings,
+    set_audit_sink,
+    set_http_client_pool,
+)
 from luxtj.shared_kernel.infrastructure.logging import get_logger_handle
 from luxtj.shared_kernel.infrastructure.persistence.outbox_model import SharedKernelBase
 from luxtj.shared_kernel.infrastructure.persistence.sqlalchemy import (
@@ -92,12 +121,19 @@ from luxtj.shared_kernel.infrastructure.persistence.sqlalchemy import (
     dispose_async_engine,
     session_scope,
 )
+from luxtj.shared_kernel.infrastructure.redis_cache import close_redis_client
 from luxtj.shared_kernel.presentation.http.dependencies import fastapi_app_handle
 from luxtj.shared_kernel.presentation.http.middleware import (
     EndpointExceptionHandler,
     EnforcePostMethodOnly,
 )
-from luxtj.shared_kernel.presentation.http.schemas import ApiSuccessResponse, HealthStatusResult
+from luxtj.shared_kernel.presentation.http.schemas import (
+    ApiSuccessResponse,
+    HealthStatusResult,
+    HttpAuditSinkStatusResult,
+    HttpPoolStatusItem,
+    HttpPoolStatusResult,
+)
 from luxtj.utils import timeutils
 
 logger = get_logger_handle(__name__)
@@ -117,6 +153,7 @@ def get_registered_metadata() -> tuple[MetaData, ...]:
         HotelBase.metadata,
         FlightBase.metadata,
         PaymentBase.metadata,
+        ReportsBase.metadata,
     )
 
 
@@ -173,7 +210,6 @@ async def seed_currencies(session_factory) -> None:
             conversion=get_currency_conversion(),
         )
         await service.bootstrap()
-        get_currency_conversion().refresh_all_rates()
 
 
 @asynccontextmanager
@@ -183,6 +219,20 @@ async def init_app_state(fastapi_app: FastAPI):
     fastapi_app.state.database_session_factory = None
     fastapi_app.state.crs_database_engine = None
     fastapi_app.state.crs_database_session_factory = None
+    fastapi_app.state.supplier_audit_sink = None
+
+    supplier_http_pool = HttpClientPool(
+        HttpPoolSettings(
+            max_connections=config.HTTP_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=config.HTTP_POOL_KEEPALIVE_EXPIRY,
+            http2=config.HTTP_POOL_HTTP2,
+            per_host_concurrency=config.HTTP_POOL_PER_HOST_CONCURRENCY,
+            default_timeout=config.HTTP_DEFAULT_TIMEOUT,
+        )
+    )
+    fastapi_app.state.supplier_http_pool = supplier_http_pool
+    set_http_client_pool(supplier_http_pool)
 
     event_publisher = InProcessEventPublisher()
     print_subscriber = PrintInProcessEventSubscriber(event_publisher=event_publisher)
@@ -203,6 +253,20 @@ async def init_app_state(fastapi_app: FastAPI):
         session_factory = build_async_session_factory(database_engine)
         fastapi_app.state.database_session_factory = session_factory
 
+        supplier_audit_sink = BatchedAuditSink(
+            session_factory,
+            AuditSinkSettings(
+                max_queue_size=config.HTTP_AUDIT_QUEUE_SIZE,
+                batch_size=config.HTTP_AUDIT_BATCH_SIZE,
+                flush_interval=config.HTTP_AUDIT_FLUSH_INTERVAL,
+                overflow_policy=AuditOverflowPolicy(config.HTTP_AUDIT_OVERFLOW_POLICY),
+                block_timeout=config.HTTP_AUDIT_BLOCK_TIMEOUT,
+            ),
+        )
+        await supplier_audit_sink.start()
+        fastapi_app.state.supplier_audit_sink = supplier_audit_sink
+        set_audit_sink(supplier_audit_sink)
+
         same_crs_url = config.CRS_DATABASE_URL == config.DATABASE_URL
         if same_crs_url:
             crs_engine = database_engine
@@ -222,6 +286,47 @@ async def init_app_state(fastapi_app: FastAPI):
         await seed_integrations(session_factory)
         await seed_currencies(session_factory)
 
+        conversion = get_currency_conversion()
+        # Supplier → admin pairs are warm before the first search instead of cold-fetched.
+        conversion.track_pairs(
+            (api.currency, conversion.get_base_currency())
+            for api in get_integration_registry().list_active_booking_apis()
+            if api.currency
+        )
+        fx_rate_refresher = FxRateRefresher(
+            conversion,
+            refresh_interval_seconds=config.FX_REFRESH_INTERVAL_SECONDS,
+            snapshot_ttl_seconds=config.FX_SNAPSHOT_TTL_SECONDS,
+        )
+        await fx_rate_refresher.start()
+        set_fx_rate_refresher(fx_rate_refresher)
+
+        crs_static_cache = CrsStaticDetailsCache(
+            crs_session_factory,
+            CrsStaticCacheSettings(
+                max_entries=config.CRS_STATIC_CACHE_MAX_ENTRIES,
+                ttl_seconds=config.CRS_STATIC_CACHE_TTL_SECONDS,
+                generation_check_seconds=config.CRS_STATIC_GENERATION_CHECK_SECONDS,
+                preload_max_hotels=config.CRS_STATIC_PRELOAD_MAX_HOTELS,
+            ),
+        )
+        set_crs_static_cache(crs_static_cache)
+
+        crs_geo_index = CrsGeoIndexRegistry(
+            crs_session_factory,
+            CrsGeoIndexSettings(
+                refresh_check_seconds=config.CRS_GEO_INDEX_REFRESH_SECONDS,
+                min_rebuild_seconds=config.CRS_GEO_INDEX_MIN_REBUILD_SECONDS,
+            ),
+        )
+        await crs_geo_index.start()
+        set_crs_geo_index(crs_geo_index)
+
+        report_export_jobs = ReportExportJobs(
+            config.REPORT_EXPORT_DIR, ttl_seconds=config.REPORT_EXPORT_JOB_TTL_SECONDS
+        )
+        set_report_export_jobs(report_export_jobs)
+
         refresh_cleanup_task = asyncio.create_task(
             refresh_session_cleanup_loop(
                 session_factory,
@@ -248,6 +353,30 @@ async def init_app_state(fastapi_app: FastAPI):
             refresh_cleanup_task.cancel()
             await asyncio.gather(refresh_cleanup_task, return_exceptions=True)
         await print_subscriber.stop()
+        fx_rate_refresher = locals().get("fx_rate_refresher")
+        if fx_rate_refresher is not None:
+            set_fx_rate_refresher(None)
+            await fx_rate_refresher.stop()
+        crs_static_cache = locals().get("crs_static_cache")
+        if crs_static_cache is not None:
+            set_crs_static_cache(None)
+            await crs_static_cache.close()
+        crs_geo_index = locals().get("crs_geo_index")
+        if crs_geo_index is not None:
+            set_crs_geo_index(None)
+            await crs_geo_index.stop()
+        report_export_jobs = locals().get("report_export_jobs")
+        if report_export_jobs is not None:
+            set_report_export_jobs(None)
+            await report_export_jobs.close()
+        supplier_audit_sink = fastapi_app.state.supplier_audit_sink
+        if supplier_audit_sink is not None:
+            set_audit_sink(None)
+            await supplier_audit_sink.stop()
+        set_http_client_pool(None)
+        await supplier_http_pool.aclose()
+        await close_places_http_client()
+        await close_redis_client()
         crs_engine = fastapi_app.state.crs_database_engine
         main_engine = fastapi_app.state.database_engine
         if crs_engine is not None and crs_engine is not main_engine:
@@ -298,6 +427,7 @@ def server_factory() -> FastAPI:
         version=config.VERSION,
         lifespan=api_application_lifespan,
     )
+    api_application.add_exception_handler(FxRateUnavailableError, fx_rate_unavailable_handler)
 
     admin_router = APIRouter(prefix="/v1/admin")
     admin_router.include_router(admin_identity_router)
@@ -349,6 +479,28 @@ def server_factory() -> FastAPI:
             output=await health_check(app_core),
         )
 
+    @api_application.post("/ops/http-pools", tags=["ops"])
+    async def _(
+        app_core: Annotated[FastAPI, Depends(fastapi_app_handle)],
+    ) -> ApiSuccessResponse[HttpPoolStatusResult]:
+        pool: HttpClientPool = app_core.state.supplier_http_pool
+        return ApiSuccessResponse(
+            output=HttpPoolStatusResult(
+                pools=[HttpPoolStatusItem.model_validate(asdict(item)) for item in pool.stats()]
+            ),
+        )
+
+    @api_application.post("/ops/http-audit", tags=["ops"])
+    async def _(
+        app_core: Annotated[FastAPI, Depends(fastapi_app_handle)],
+    ) -> ApiSuccessResponse[HttpAuditSinkStatusResult]:
+        sink: BatchedAuditSink | None = app_core.state.supplier_audit_sink
+        if sink is None:
+            raise HTTPException(status_code=503, detail="Supplier audit sink is not running")
+        return ApiSuccessResponse(
+            output=HttpAuditSinkStatusResult.model_validate(asdict(sink.stats())),
+        )
+
     api_application.add_middleware(EndpointExceptionHandler)
     api_application.add_middleware(EnforcePostMethodOnly)
 
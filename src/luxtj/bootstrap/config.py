@@ -1,6 +1,8 @@
 import base64
 import json
 import os
+import tempfile
+from pathlib import Path
 
 from luxtj._version import __version__
 
@@ -18,6 +20,83 @@ PUBLIC_BASE_URL: str = os.getenv("LTJBE_PUBLIC_BASE_URL", "http://localhost:9001
 BYPASS_PAYMENT: bool = os.getenv("LTJBE_BYPASS_PAYMENT", "false").lower() == "true"
 HTTP_MAX_RETRIES: int = int(os.getenv("LTJBE_HTTP_MAX_RETRIES", "2"))
 HTTP_DEFAULT_TIMEOUT: float = float(os.getenv("LTJBE_HTTP_DEFAULT_TIMEOUT", "60"))
+# App-lifetime supplier connection pools (one keep-alive client per supplier host).
+HTTP_POOL_MAX_CONNECTIONS: int = int(os.getenv("LTJBE_HTTP_POOL_MAX_CONNECTIONS", "100"))
+HTTP_POOL_MAX_KEEPALIVE: int = int(os.getenv("LTJBE_HTTP_POOL_MAX_KEEPALIVE", "20"))
+HTTP_POOL_KEEPALIVE_EXPIRY: float = float(os.getenv("LTJBE_HTTP_POOL_KEEPALIVE_EXPIRY", "30"))
+HTTP_POOL_HTTP2: bool = os.getenv("LTJBE_HTTP_POOL_HTTP2", "false").lower() == "true"
+# Max concurrent requests per supplier host (0 = no cap).
+HTTP_POOL_PER_HOST_CONCURRENCY: int = int(os.getenv("LTJBE_HTTP_POOL_PER_HOST_CONCURRENCY", "0"))
+# Batched supplier audit writer (booking_api_request_responses), off the request path.
+HTTP_AUDIT_QUEUE_SIZE: int = int(os.getenv("LTJBE_HTTP_AUDIT_QUEUE_SIZE", "10000"))
+HTTP_AUDIT_BATCH_SIZE: int = int(os.getenv("LTJBE_HTTP_AUDIT_BATCH_SIZE", "200"))
+HTTP_AUDIT_FLUSH_INTERVAL: float = float(os.getenv("LTJBE_HTTP_AUDIT_FLUSH_INTERVAL", "1.0"))
+# drop_newest | drop_oldest | block (waits LTJBE_HTTP_AUDIT_BLOCK_TIMEOUT seconds, then drops).
+HTTP_AUDIT_OVERFLOW_POLICY: str = os.getenv(
+    "LTJBE_HTTP_AUDIT_OVERFLOW_POLICY", "drop_newest"
+).lower()
+HTTP_AUDIT_BLOCK_TIMEOUT: float = float(os.getenv("LTJBE_HTTP_AUDIT_BLOCK_TIMEOUT", "0.5"))
+
+# Background FX refresh: interval for keeping active pairs warm, shared Redis snapshot TTL.
+FX_REFRESH_INTERVAL_SECONDS: float = float(os.getenv("LTJBE_FX_REFRESH_INTERVAL_SECONDS", "300"))
+FX_SNAPSHOT_TTL_SECONDS: int = int(os.getenv("LTJBE_FX_SNAPSHOT_TTL_SECONDS", "86400"))
+FX_COLD_FETCH_TIMEOUT_SECONDS: float = float(os.getenv("LTJBE_FX_COLD_FETCH_TIMEOUT_SECONDS", "3"))
+
+# Compiled markup rule indexes: how often workers compare the shared rule version, and the
+# longest a compiled index is served when Redis is down.
+MARKUP_RULES_VERSION_CHECK_SECONDS: float = float(
+    os.getenv("LTJBE_MARKUP_RULES_VERSION_CHECK_SECONDS", "5")
+)
+MARKUP_RULES_MAX_AGE_SECONDS: float = float(os.getenv("LTJBE_MARKUP_RULES_MAX_AGE_SECONDS", "300"))
+
+# CRS static hotel details for search enrichment: in-process LRU + Redis, keyed by a
+# per-booking-source generation that crs_promote / CRS wipes bump.
+CRS_STATIC_CACHE_MAX_ENTRIES: int = int(os.getenv("LTJBE_CRS_STATIC_CACHE_MAX_ENTRIES", "50000"))
+CRS_STATIC_CACHE_TTL_SECONDS: int = int(os.getenv("LTJBE_CRS_STATIC_CACHE_TTL_SECONDS", "21600"))
+CRS_STATIC_GENERATION_CHECK_SECONDS: float = float(
+    os.getenv("LTJBE_CRS_STATIC_GENERATION_CHECK_SECONDS", "5")
+)
+CRS_STATIC_PRELOAD_MAX_HOTELS: int = int(os.getenv("LTJBE_CRS_STATIC_PRELOAD_MAX_HOTELS", "5000"))
+
+# Resident per-booking-source index of CRS hotel coordinates; rebuilt when the CRS static
+# generation changes, checked this often.
+CRS_GEO_INDEX_REFRESH_SECONDS: float = float(os.getenv("LTJBE_CRS_GEO_INDEX_REFRESH_SECONDS", "30"))
+# Minimum time between two rebuilds of one source, however often its generation moves.
+CRS_GEO_INDEX_MIN_REBUILD_SECONDS: float = float(
+    os.getenv("LTJBE_CRS_GEO_INDEX_MIN_REBUILD_SECONDS", "300")
+)
+
+# Geo hotel searches are snapped to grid tiles so nearby searches share supplier SERP calls;
+# up to HOTEL_GEO_TILE_CANDIDATES covering tiles are checked for a cached response.
+HOTEL_GEO_TILE_CACHE_ENABLED: bool = (
+    os.getenv("LTJBE_HOTEL_GEO_TILE_CACHE_ENABLED", "true").lower() == "true"
+)
+HOTEL_GEO_TILE_CANDIDATES: int = int(os.getenv("LTJBE_HOTEL_GEO_TILE_CANDIDATES", "3"))
+
+# Streamed hotel / flight search cards kept per search_id for SearchResults filter/sort/page:
+# Redis TTL, and how many searches each worker keeps decoded in memory.
+SEARCH_RESULTS_TTL_SECONDS: int = int(os.getenv("LTJBE_SEARCH_RESULTS_TTL_SECONDS", "1800"))
+SEARCH_RESULTS_LOCAL_MAX_SEARCHES: int = int(
+    os.getenv("LTJBE_SEARCH_RESULTS_LOCAL_MAX_SEARCHES", "200")
+)
+
+# Google Places proxy answers cached per worker (LRU size) and in Redis; place details barely
+# change, so they are kept far longer than autocomplete predictions.
+PLACES_AUTOCOMPLETE_TTL_SECONDS: int = int(
+    os.getenv("LTJBE_PLACES_AUTOCOMPLETE_TTL_SECONDS", "86400")
+)
+PLACES_DETAILS_TTL_SECONDS: int = int(os.getenv("LTJBE_PLACES_DETAILS_TTL_SECONDS", "2592000"))
+PLACES_LOCAL_CACHE_MAX_ENTRIES: int = int(
+    os.getenv("LTJBE_PLACES_LOCAL_CACHE_MAX_ENTRIES", "20000")
+)
+
+# Admin report CSV exports: rows fetched per keyset batch, and where background export jobs
+# write their files (share it between workers that serve downloads) and for how long.
+REPORT_EXPORT_BATCH_SIZE: int = int(os.getenv("LTJBE_REPORT_EXPORT_BATCH_SIZE", "1000"))
+REPORT_EXPORT_DIR: str = os.getenv("LTJBE_REPORT_EXPORT_DIR", "").strip() or str(
+    Path(tempfile.gettempdir()) / "luxtj-report-exports"
+)
+REPORT_EXPORT_JOB_TTL_SECONDS: int = int(os.getenv("LTJBE_REPORT_EXPORT_JOB_TTL_SECONDS", "86400"))
 
 _JWT_DEV_SECRET = "insecure-dev-secret"
 _JWT_DEV_ACCOUNT_SECRET = "insecure-dev-account-secret"
@@ -137,6 +216,21 @@ SUPERADMIN_FULL_NAME: str = "Super Admin"
 ENABLE_OUTBOX_PROJECTOR: bool = (
     os.getenv("LTJBE_ENABLE_OUTBOX_PROJECTOR", "false").lower() == "true"
 )
+# Outbox dispatcher: wakes on NOTIFY; polls only as a fallback for a lost listener.
+# Batches are split into this many concurrently handled partitions (per entity).
+OUTBOX_DISPATCH_PARTITIONS: int = int(os.getenv("LTJBE_OUTBOX_DISPATCH_PARTITIONS", "4"))
+OUTBOX_DISPATCH_BATCH_SIZE: int = int(os.getenv("LTJBE_OUTBOX_DISPATCH_BATCH_SIZE", "500"))
+OUTBOX_FALLBACK_POLL_SECONDS: float = float(os.getenv("LTJBE_OUTBOX_FALLBACK_POLL_SECONDS", "30"))
+
+# Sales / finance dashboard rollups (``python -m luxtj.bootstrap.sales_rollup_projector``):
+# poll interval, how far behind the watermark changed rows are re-checked, and how many days
+# are rebuilt per transaction (the first run backfills every booking day).
+ENABLE_SALES_ROLLUP_PROJECTOR: bool = (
+    os.getenv("LTJBE_ENABLE_SALES_ROLLUP_PROJECTOR", "true").lower() == "true"
+)
+SALES_ROLLUP_INTERVAL_SECONDS: float = float(os.getenv("LTJBE_SALES_ROLLUP_INTERVAL_SECONDS", "60"))
+SALES_ROLLUP_LAG_SECONDS: float = float(os.getenv("LTJBE_SALES_ROLLUP_LAG_SECONDS", "300"))
+SALES_ROLLUP_DAYS_PER_BATCH: int = int(os.getenv("LTJBE_SALES_ROLLUP_DAYS_PER_BATCH", "31"))
 
 # Comma-separated browser origins allowed to call the API (admin + web).
 # Example: https://admin.example.com,https://www.example.com,https://example.com
@@ -0,0 +1,62 @@
+import asyncio
+import signal
+
+from luxtj.bootstrap import config
+from luxtj.bootstrap.persistence import database_resources
+from luxtj.contexts.reports.infrastructure.sales_rollups import SalesRollupProjector
+from luxtj.shared_kernel.infrastructure.logging import get_logger_handle
+
+logger = get_logger_handle(__name__)
+
+
+async def run_sales_rollup_projector() -> None:
+    logger.info("Sales rollup projector process starting")
+
+    async with database_resources(
+        config.DATABASE_URL,
+        echo=config.DATABASE_ECHO,
+    ) as resources:
+        projector = SalesRollupProjector(
+            resources.session_factory,
+            poll_interval_seconds=config.SALES_ROLLUP_INTERVAL_SECONDS,
+            lag_seconds=config.SALES_ROLLUP_LAG_SECONDS,
+            days_per_batch=config.SALES_ROLLUP_DAYS_PER_BATCH,
+        )
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def _request_stop() -> None:
+            stop_event.set()
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, _request_stop)
+            except NotImplementedError:
+                # add_signal_handler is not available on every runtime.
+                pass
+
+        await projector.start()
+        logger.info("Sales rollup projector started")
+
+        try:
+            await stop_event.wait()
+        finally:
+            await projector.stop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.remove_signal_handler(sig)
+                except NotImplementedError:
+                    pass
+
+    logger.info("Sales rollup projector process stopped")
+
+
+async def main() -> None:
+    if not config.ENABLE_SALES_ROLLUP_PROJECTOR:
+        logger.info("Sales rollup projector is disabled via LTJBE_ENABLE_SALES_ROLLUP_PROJECTOR")
+        return
+    await run_sales_rollup_projector()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -37,28 +37,3 @@ class ActionItemRepository(Protocol):
         status: str | None = None,
     ) -> list[ActionItem]:
         """Used in tests / debugging."""
-
-
-class ProcessedOutboxCursor(Protocol):
-    async def get_last_processed_id(self) -> str | None: ...
-
-    async def set_last_processed_id(self, outbox_id: str) -> None: ...
-
-
-class OutboxEventReader(Protocol):
-    async def fetch_after(
-        self,
-        *,
-        cursor_id: str | None,
-        types: list[str],
-        limit: int,
-    ) -> list[OutboxRecord]:
-        """Return outbox rows of given types with id > cursor_id, ordered by id ascending."""
-
-
-class OutboxRecord(Protocol):
-    id: str
-    type: str
-    subject: str | None
-    time: datetime | None
-    payload: dict[str, Any]
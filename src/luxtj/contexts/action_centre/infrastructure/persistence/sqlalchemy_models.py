@@ -20,11 +20,3 @@ class ActionCentreItemRow(ActionCentreBase):
     )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     resolved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-
-
-class ActionCentreOutboxCursorRow(ActionCentreBase):
-    __tablename__ = "action_centre_outbox_cursor"
-
-    name: Mapped[str] = mapped_column(String(64), primary_key=True)
-    last_processed_outbox_id: Mapped[str] = mapped_column(String(36), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
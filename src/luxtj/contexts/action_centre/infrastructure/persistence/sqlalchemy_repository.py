@@ -1,22 +1,38 @@
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from luxtj.contexts.action_centre.domain.enums import ActionItemStatus
 from luxtj.contexts.action_centre.domain.item import ActionItem
 from luxtj.contexts.action_centre.infrastructure.persistence.sqlalchemy_models import (
     ActionCentreItemRow,
-    ActionCentreOutboxCursorRow,
 )
-from luxtj.shared_kernel.infrastructure.persistence.outbox_model import DomainEventOutboxRow
-from luxtj.utils import timeutils
+
+type ItemKey = tuple[str, str]
 
 
 class SqlAlchemyActionItemRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
+        # (workflow, entity_id) -> row (None = known absent) for this session's batch.
+        self._rows: dict[ItemKey, ActionCentreItemRow | None] = {}
+
+    async def prefetch(self, keys: Iterable[ItemKey]) -> None:
+        """Load the rows of ``keys`` in one query so later upserts need no per-item reads."""
+        missing = list(dict.fromkeys(key for key in keys if key not in self._rows))
+        if not missing:
+            return
+        rows = await self._session.scalars(
+            select(ActionCentreItemRow).where(
+                tuple_(ActionCentreItemRow.workflow, ActionCentreItemRow.entity_id).in_(missing)
+            )
+        )
+        self._rows.update(dict.fromkeys(missing))
+        for row in rows:
+            self._rows[(row.workflow, row.entity_id)] = row
 
     async def upsert_pending(
         self,
@@ -28,7 +44,7 @@ class SqlAlchemyActionItemRepository:
     ) -> None:
         row = await self._get(workflow, entity_id)
         if row is None:
-            self._session.add(
+            self._add(
                 ActionCentreItemRow(
                     workflow=workflow,
                     entity_id=entity_id,
@@ -58,7 +74,7 @@ class SqlAlchemyActionItemRepository:
     ) -> None:
         row = await self._get(workflow, entity_id)
         if row is None:
-            self._session.add(
+            self._add(
                 ActionCentreItemRow(
                     workflow=workflow,
                     entity_id=entity_id,
@@ -113,49 +129,12 @@ class SqlAlchemyActionItemRepository:
         ]
 
     async def _get(self, workflow: str, entity_id: str) -> ActionCentreItemRow | None:
-        return await self._session.get(ActionCentreItemRow, (workflow, entity_id))
-
-
-_CURSOR_NAME = "action_centre_projector"
-
-
-class SqlAlchemyProcessedOutboxCursor:
-    def __init__(self, session: AsyncSession):
-        self._session = session
-
-    async def get_last_processed_id(self) -> str | None:
-        row = await self._session.get(ActionCentreOutboxCursorRow, _CURSOR_NAME)
-        return row.last_processed_outbox_id if row else None
-
-    async def set_last_processed_id(self, outbox_id: str) -> None:
-        row = await self._session.get(ActionCentreOutboxCursorRow, _CURSOR_NAME)
-        now = timeutils.datetime_now()
-        if row is None:
-            self._session.add(
-                ActionCentreOutboxCursorRow(
-                    name=_CURSOR_NAME,
-                    last_processed_outbox_id=outbox_id,
-                    updated_at=now,
-                )
-            )
-            return
-        row.last_processed_outbox_id = outbox_id
-        row.updated_at = now
-
-
-class SqlAlchemyOutboxEventReader:
-    def __init__(self, session: AsyncSession):
-        self._session = session
-
-    async def fetch_after(
-        self,
-        *,
-        cursor_id: str | None,
-        types: list[str],
-        limit: int,
-    ) -> list[DomainEventOutboxRow]:
-        query = select(DomainEventOutboxRow).where(DomainEventOutboxRow.type.in_(types))
-        if cursor_id is not None:
-            query = query.where(DomainEventOutboxRow.id > cursor_id)
-        rows = await self._session.scalars(query.order_by(DomainEventOutboxRow.id).limit(limit))
-        return list(rows)
+        key = (workflow, entity_id)
+        if key in self._rows:
+            return self._rows[key]
+        return await self._session.get(ActionCentreItemRow, key)
+
+    def _add(self, row: ActionCentreItemRow) -> None:
+        # Not flushed yet (autoflush is off): remember it so a later event finds it.
+        self._session.add(row)
+        self._rows[(row.workflow, row.entity_id)] = row
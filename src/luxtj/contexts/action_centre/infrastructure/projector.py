@@ -1,20 +1,20 @@
-import asyncio
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from luxtj.contexts.action_centre.domain.events import (
     PENDING_EVENT_TYPE,
     RESOLVED_EVENT_TYPE,
 )
 from luxtj.contexts.action_centre.infrastructure.persistence.sqlalchemy_repository import (
     SqlAlchemyActionItemRepository,
-    SqlAlchemyOutboxEventReader,
-    SqlAlchemyProcessedOutboxCursor,
 )
-from luxtj.shared_kernel.infrastructure.persistence.sqlalchemy import (
-    AsyncSessionFactory,
-    session_scope,
+from luxtj.shared_kernel.infrastructure.events.outbox_dispatcher import (
+    OutboxEvent,
+    OutboxSubscriber,
 )
 from luxtj.utils import timeutils
 
@@ -23,76 +23,32 @@ logger = logging.getLogger(__name__)
 PROJECTED_TYPES: list[str] = [PENDING_EVENT_TYPE, RESOLVED_EVENT_TYPE]
 
 
-class ActionCentreOutboxProjector:
-    """Polls the shared domain_event_outbox table for action_centre.* events and projects
-    them into action_centre_items. Tracks its own cursor so other subscribers are unaffected."""
-
-    def __init__(
-        self,
-        session_factory: AsyncSessionFactory,
-        *,
-        poll_interval_seconds: float = 1.0,
-        batch_size: int = 100,
-    ):
-        self._session_factory = session_factory
-        self._poll_interval_seconds = poll_interval_seconds
-        self._batch_size = batch_size
-        self._stop_event = asyncio.Event()
-        self._task: asyncio.Task[None] | None = None
-
-    async def start(self) -> None:
-        if self._task is not None:
-            return
-        self._stop_event.clear()
-        self._task = asyncio.create_task(self._run())
+class ActionCentreOutboxSubscriber(OutboxSubscriber):
+    """Projects action_centre.* outbox events into action_centre_items. Partitioned by
+    (workflow, entity_id) so each item's pending/resolved events apply in order."""
 
-    async def stop(self) -> None:
-        if self._task is None:
-            return
-        self._stop_event.set()
-        await self._task
-        self._task = None
+    name = "action_centre_projector"
+    event_types = PROJECTED_TYPES
 
-    async def _run(self) -> None:
-        while not self._stop_event.is_set():
-            try:
-                processed = await self.tick()
-                if processed == 0:
-                    await asyncio.wait_for(
-                        self._stop_event.wait(),
-                        timeout=self._poll_interval_seconds,
-                    )
-            except TimeoutError:
-                continue
-            except Exception as ex:
-                logger.exception("ActionCentreOutboxProjector tick failed: %s", ex)
-                await asyncio.sleep(self._poll_interval_seconds)
+    def partition_key(self, event: OutboxEvent) -> str:
+        data = event.payload.get("data") or {}
+        return f"{data.get('workflow')}:{data.get('entity_id')}"
 
-    async def tick(self) -> int:
-        """Process one batch. Returns the number of events handled."""
-        async with session_scope(self._session_factory) as session:
-            reader = SqlAlchemyOutboxEventReader(session)
-            cursor = SqlAlchemyProcessedOutboxCursor(session)
-            repository = SqlAlchemyActionItemRepository(session)
-
-            last_id = await cursor.get_last_processed_id()
-            rows = await reader.fetch_after(
-                cursor_id=last_id,
-                types=PROJECTED_TYPES,
-                limit=self._batch_size,
+    async def handle_batch(self, session: AsyncSession, events: Sequence[OutboxEvent]) -> None:
+        repository = SqlAlchemyActionItemRepository(session)
+        # One query loads every item the batch touches; the writes flush together on commit.
+        await repository.prefetch(
+            (data["workflow"], data["entity_id"])
+            for data in (event.payload.get("data") or {} for event in events)
+            if data.get("workflow") and data.get("entity_id")
+        )
+        for event in events:
+            await _project_event(
+                repository=repository,
+                event_type=event.type,
+                payload=event.payload,
+                event_time=event.time,
             )
-            if not rows:
-                return 0
-
-            for row in rows:
-                await _project_event(
-                    repository=repository,
-                    event_type=row.type,
-                    payload=row.payload,
-                    event_time=row.time,
-                )
-            await cursor.set_last_processed_id(rows[-1].id)
-            return len(rows)
 
 
 async def _project_event(
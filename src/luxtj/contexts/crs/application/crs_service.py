@@ -9,7 +9,7 @@ import uuid
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from luxtj.contexts.crs.domain.enums import CrsSupplierTypeEnum
@@ -537,6 +537,7 @@ class HotelCrsService:
 
         room_groups = hotel.get("room_groups") if isinstance(hotel.get("room_groups"), list) else []
         if not room_groups:
+            await self._set_room_count(hotel_id, 0)
             return stats
 
         now = timeutils.datetime_now()
@@ -614,8 +615,17 @@ class HotelCrsService:
                     )
                 )
                 stats["roomAmenitiesMapped"] += 1
+        await self._set_room_count(hotel_id, stats["roomGroupsSynced"])
         return stats
 
+    async def _set_room_count(self, hotel_id: str, room_count: int) -> None:
+        """Keep the denormalized ``hotel_crs_hotels.room_count`` used by the inventory list."""
+        await self._session.execute(
+            update(HotelCrsHotelRow)
+            .where(HotelCrsHotelRow.id == hotel_id)
+            .values(room_count=room_count)
+        )
+
     def _extract_hotel_amenity_items(self, hotel: dict[str, Any]) -> list[dict[str, Any]]:
         items: list[dict[str, Any]] = []
         for group in hotel.get("amenity_groups") or []:
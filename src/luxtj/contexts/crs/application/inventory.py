@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import base64
+import json
 import re
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Select, func, or_, select, text
+from sqlalchemy import Select, func, or_, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from luxtj.contexts.crs.infrastructure.persistence.sqlalchemy_models import (
@@ -83,28 +86,53 @@ def _hotel_list_item(
     }
 
 
-def _search_filters(q: str) -> list[Any]:
-    raw = (q or "").strip()
+def _encode_cursor(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str | None) -> dict[str, Any] | None:
+    """Opaque ``nextCursor`` payload; ``None`` for missing or malformed cursors."""
+    if not cursor:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _search_terms(q: str) -> tuple[str, str] | None:
+    raw = (q or "").strip().lower()
     if not raw:
+        return None
+    return raw, _normalize_name_token(raw)
+
+
+def _search_filters(q: str) -> list[Any]:
+    """Match against ``search_text`` (lowercased code / names / address, GIN trigram)."""
+    terms = _search_terms(q)
+    if terms is None:
         return []
-    like = f"%{raw}%"
-    clauses: list[Any] = [
-        HotelCrsHotelRow.code.ilike(like),
-        HotelCrsHotelRow.name.ilike(like),
-        HotelCrsHotelRow.address_line1.ilike(like),
-        HotelCrsHotelRow.address_line2.ilike(like),
-        HotelCrsHotelRow.location.ilike(like),
-    ]
-    norm = _normalize_name_token(raw)
-    if len(norm) >= 2:
-        # name_normalized stores alnum-only lowercase — prefix/contains via trigram.
-        clauses.append(HotelCrsHotelRow.name_normalized.ilike(f"%{norm}%"))
-        # Prefer prefix when the token is reasonably long (btree-friendly path too).
-        if len(norm) >= 3:
-            clauses.append(HotelCrsHotelRow.name_normalized.like(f"{norm}%"))
+    raw, norm = terms
+    clauses: list[Any] = [HotelCrsHotelRow.search_text.like(f"%{raw}%")]
+    if len(norm) >= 2 and norm != raw:
+        # "grand-hotel" still finds "Grand Hotel" via name_normalized inside search_text.
+        clauses.append(HotelCrsHotelRow.search_text.like(f"%{norm}%"))
     return [or_(*clauses)]
 
 
+def _search_order(q: str) -> list[Any]:
+    """Name-prefix hits first, then trigram word similarity, then newest."""
+    raw, norm = _search_terms(q) or ("", "")
+    order: list[Any] = []
+    if len(norm) >= 2:
+        order.append(HotelCrsHotelRow.name_normalized.like(f"{norm}%").desc().nulls_last())
+    order.append(func.word_similarity(raw, HotelCrsHotelRow.search_text).desc())
+    order.extend((HotelCrsHotelRow.created_at.desc(), HotelCrsHotelRow.id.desc()))
+    return order
+
+
 async def _estimated_hotel_count(crs: AsyncSession) -> int:
     """Planner estimate — O(1). Exact COUNT(*) is too expensive at multi-million scale."""
     result = await crs.execute(
@@ -129,18 +157,9 @@ def _hotel_filter_stmt(*, q: str, status: bool | None) -> Select[Any]:
 
 
 def _list_base_query(*, q: str, status: bool | None) -> Select[Any]:
-    room_count = (
-        select(func.count())
-        .select_from(HotelCrsRoomGroupRow)
-        .where(HotelCrsRoomGroupRow.hotel_id == HotelCrsHotelRow.id)
-        .correlate(HotelCrsHotelRow)
-        .scalar_subquery()
-        .label("room_count")
-    )
     stmt = select(
         HotelCrsHotelRow,
         NewCitiesNRegionRow.name.label("region_name"),
-        room_count,
     ).outerjoin(
         NewCitiesNRegionRow,
         NewCitiesNRegionRow.id == HotelCrsHotelRow.region_id,
@@ -152,6 +171,18 @@ def _list_base_query(*, q: str, status: bool | None) -> Select[Any]:
     return stmt
 
 
+def _browse_after(cursor: dict[str, Any] | None) -> Any | None:
+    """Keyset predicate for the ``(created_at DESC, id DESC)`` browse order."""
+    if cursor is None:
+        return None
+    try:
+        created_at = datetime.fromisoformat(str(cursor["c"]))
+        hotel_id = str(cursor["i"])
+    except KeyError, TypeError, ValueError:
+        return None
+    return tuple_(HotelCrsHotelRow.created_at, HotelCrsHotelRow.id) < tuple_(created_at, hotel_id)
+
+
 async def list_hotels(
     crs: AsyncSession,
     *,
@@ -159,20 +190,39 @@ async def list_hotels(
     page: int = 1,
     page_size: int = _DEFAULT_PAGE_SIZE,
     status: bool | None = True,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
+    """One page of hotels; pass the returned ``nextCursor`` back for the next one.
+
+    Browsing seeks on ``(created_at, id)`` so every page costs the same however deep it is.
+    Searches are ranked, so their cursor carries the position in the (trigram-narrowed)
+    match set. ``page`` is only used when no cursor is given.
+    """
     page_n, size = _clip_page(page, page_size)
-    offset = (page_n - 1) * size
-    has_search = bool((q or "").strip())
+    has_search = _search_terms(q) is not None
+    position = _decode_cursor(cursor)
 
     base = _list_base_query(q=q, status=status)
-    rows_stmt = (
-        base.order_by(HotelCrsHotelRow.created_at.desc(), HotelCrsHotelRow.id.desc())
-        .offset(offset)
-        .limit(size)
-    )
-    rows = (await crs.execute(rows_stmt)).all()
-
-    hotel_ids = [hotel.id for hotel, _, _ in rows]
+    offset = (page_n - 1) * size
+    if has_search:
+        seek = position.get("o") if position is not None else None
+        if isinstance(seek, int):
+            offset = max(0, seek)
+        rows_stmt = base.order_by(*_search_order(q)).offset(offset)
+    else:
+        after = _browse_after(position)
+        if after is not None:
+            base = base.where(after)
+            offset = 0
+        rows_stmt = base.order_by(
+            HotelCrsHotelRow.created_at.desc(), HotelCrsHotelRow.id.desc()
+        ).offset(offset)
+    # One extra row tells whether another page exists without counting.
+    rows = (await crs.execute(rows_stmt.limit(size + 1))).all()
+    has_more = len(rows) > size
+    rows = rows[:size]
+
+    hotel_ids = [hotel.id for hotel, _ in rows]
     amenities_by_hotel: dict[str, list[str]] = {hid: [] for hid in hotel_ids}
     if hotel_ids:
         amenity_rows = (
@@ -215,18 +265,26 @@ async def list_hotels(
         _hotel_list_item(
             hotel,
             region_name=region_name,
-            room_count=room_count,
+            room_count=hotel.room_count,
             amenity_names=amenities_by_hotel.get(hotel.id) or [],
         )
-        for hotel, region_name, room_count in rows
+        for hotel, region_name in rows
     ]
+    next_cursor: str | None = None
+    if has_more and rows:
+        if has_search:
+            next_cursor = _encode_cursor({"o": offset + len(rows)})
+        else:
+            last = rows[-1][0]
+            next_cursor = _encode_cursor({"c": last.created_at.isoformat(), "i": last.id})
     return {
         "items": items,
         "page": page_n,
         "pageSize": size,
         "total": total,
         "totalIsEstimate": total_is_estimate,
-        "hasMore": offset + len(items) < total if not total_is_estimate else len(items) == size,
+        "hasMore": has_more,
+        "nextCursor": next_cursor,
     }
 
 
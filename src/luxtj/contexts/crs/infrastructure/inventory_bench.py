@@ -0,0 +1,234 @@
+"""Synthetic benchmark for the admin CRS inventory list queries.
+
+Builds a scratch copy of ``hotel_crs_hotels`` (same indexes as production, including the
+``search_text`` trigram index) in its own schema, fills it with ``generate_series`` rows and
+times the old and new query shapes side by side:
+
+* deep page: ``OFFSET`` vs ``(created_at, id)`` keyset seek;
+* free-text search: five ``ILIKE '%q%'`` clauses + per-row room COUNT vs ``search_text``
+  match ranked by name prefix / ``word_similarity`` with the stored ``room_count``.
+
+Nothing outside the scratch schema is touched; it is dropped afterwards unless ``--keep``.
+
+Usage::
+
+    python -m luxtj.contexts.crs.infrastructure.inventory_bench --rows 3000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Any
+
+from luxtj.contexts.crs.infrastructure.persistence.sqlalchemy_models import (
+    HOTEL_SEARCH_TEXT_SQL,
+)
+from luxtj.contexts.crs.mapping.ratehawk import config
+
+_SCHEMA = "crs_inventory_bench"
+_PAGE_SIZE = 25
+
+_WORDS = (
+    "grand royal palace garden plaza ocean river park city central sunset harbour lake "
+    "mountain villa resort inn suites"
+).split()
+
+
+def _setup(cur: Any, rows: int) -> None:
+    words = "ARRAY[" + ",".join(f"'{w}'" for w in _WORDS) + "]"
+    cur.execute(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE")
+    cur.execute(f"CREATE SCHEMA {_SCHEMA}")
+    cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    cur.execute(
+        f"""
+        CREATE UNLOGGED TABLE {_SCHEMA}.hotels (
+            id text PRIMARY KEY,
+            code text,
+            name text,
+            name_normalized text,
+            address_line1 text,
+            address_line2 text,
+            location text,
+            status boolean NOT NULL DEFAULT true,
+            room_count integer NOT NULL DEFAULT 0,
+            created_at timestamptz NOT NULL,
+            search_text text GENERATED ALWAYS AS ({HOTEL_SEARCH_TEXT_SQL}) STORED
+        )
+        """
+    )
+    cur.execute(
+        f"""
+        INSERT INTO {_SCHEMA}.hotels (
+            id, code, name, name_normalized, address_line1, address_line2, location,
+            room_count, created_at
+        )
+        SELECT
+            md5(g::text),
+            upper(substr(md5('c' || g), 1, 12)),
+            initcap(w1 || ' ' || w2) || ' ' || g,
+            w1 || w2 || g,
+            mod(g, 997) || ' ' || initcap(w2) || ' Street',
+            'Block ' || mod(g, 53),
+            initcap(w1) || ' District ' || mod(g, 211),
+            mod(g, 12),
+            now() - (g || ' seconds')::interval
+        FROM (
+            SELECT g,
+                   ({words})[1 + mod(g, {len(_WORDS)})] AS w1,
+                   ({words})[1 + mod(g / {len(_WORDS)}, {len(_WORDS)})] AS w2
+            FROM generate_series(1, %s) AS g
+        ) s
+        """,
+        (rows,),
+    )
+    cur.execute(
+        f"""
+        CREATE UNLOGGED TABLE {_SCHEMA}.room_groups AS
+        SELECT md5(h.id || r) AS id, h.id AS hotel_id
+        FROM {_SCHEMA}.hotels h, generate_series(1, h.room_count) AS r
+        """
+    )
+    for ddl in (
+        "CREATE INDEX ON {s}.room_groups (hotel_id)",
+        "CREATE INDEX ON {s}.hotels (status, created_at DESC, id DESC)",
+        "CREATE INDEX ON {s}.hotels USING gin (name_normalized gin_trgm_ops)",
+        "CREATE INDEX ON {s}.hotels USING gin (name gin_trgm_ops)",
+        "CREATE INDEX ON {s}.hotels USING gin (address_line1 gin_trgm_ops)",
+        "CREATE INDEX ON {s}.hotels USING gin (location gin_trgm_ops)",
+        "CREATE INDEX ON {s}.hotels USING gin (search_text gin_trgm_ops)",
+    ):
+        cur.execute(ddl.format(s=_SCHEMA))
+    cur.execute(f"ANALYZE {_SCHEMA}.hotels")
+    cur.execute(f"ANALYZE {_SCHEMA}.room_groups")
+
+
+def _timed(cur: Any, sql: str, params: tuple[Any, ...], repeat: int) -> tuple[float, list[Any]]:
+    best = float("inf")
+    rows: list[Any] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, rows
+
+
+def _report(label: str, old_ms: float, new_ms: float) -> None:
+    speedup = old_ms / new_ms if new_ms > 0 else float("inf")
+    print(f"{label:<28} old={old_ms:10.1f}ms  new={new_ms:8.1f}ms  x{speedup:,.1f}", flush=True)
+
+
+def _bench_deep_page(cur: Any, rows: int, repeat: int) -> None:
+    offset = max(0, rows - _PAGE_SIZE * 2)
+    old_ms, _ = _timed(
+        cur,
+        f"""
+        SELECT id FROM {_SCHEMA}.hotels WHERE status
+        ORDER BY created_at DESC, id DESC OFFSET %s LIMIT %s
+        """,
+        (offset, _PAGE_SIZE),
+        repeat,
+    )
+    cur.execute(
+        f"""
+        SELECT created_at, id FROM {_SCHEMA}.hotels WHERE status
+        ORDER BY created_at DESC, id DESC OFFSET %s LIMIT 1
+        """,
+        (offset - 1,),
+    )
+    created_at, last_id = cur.fetchone()
+    new_ms, _ = _timed(
+        cur,
+        f"""
+        SELECT id FROM {_SCHEMA}.hotels
+        WHERE status AND (created_at, id) < (%s, %s)
+        ORDER BY created_at DESC, id DESC LIMIT %s
+        """,
+        (created_at, last_id, _PAGE_SIZE + 1),
+        repeat,
+    )
+    _report(f"page at offset {offset:,}", old_ms, new_ms)
+
+
+def _bench_search(cur: Any, q: str, repeat: int) -> None:
+    like = f"%{q}%"
+    norm = "".join(ch for ch in q.lower() if ch.isalnum())
+    old_ms, _ = _timed(
+        cur,
+        f"""
+        SELECT h.id,
+               (SELECT count(*) FROM {_SCHEMA}.room_groups r WHERE r.hotel_id = h.id)
+        FROM {_SCHEMA}.hotels h
+        WHERE h.status AND (
+            h.code ILIKE %s OR h.name ILIKE %s OR h.address_line1 ILIKE %s
+            OR h.address_line2 ILIKE %s OR h.location ILIKE %s
+            OR h.name_normalized ILIKE %s
+        )
+        ORDER BY h.created_at DESC, h.id DESC LIMIT %s
+        """,
+        (like, like, like, like, like, f"%{norm}%", _PAGE_SIZE),
+        repeat,
+    )
+    new_ms, _ = _timed(
+        cur,
+        f"""
+        SELECT id, room_count
+        FROM {_SCHEMA}.hotels
+        WHERE status AND search_text LIKE %s
+        ORDER BY name_normalized LIKE %s DESC NULLS LAST,
+                 word_similarity(%s, search_text) DESC,
+                 created_at DESC, id DESC
+        LIMIT %s
+        """,
+        (f"%{q.lower()}%", f"{norm}%", q.lower(), _PAGE_SIZE + 1),
+        repeat,
+    )
+    _report(f"search {q!r}", old_ms, new_ms)
+
+
+def run(rows: int, queries: list[str], *, repeat: int, keep: bool) -> None:
+    import psycopg
+
+    with psycopg.connect(config.database_url(), autocommit=True) as conn:
+        cur = conn.cursor()
+        started = time.perf_counter()
+        print(f"building {rows:,} synthetic hotels in schema {_SCHEMA} ...", flush=True)
+        _setup(cur, rows)
+        print(f"built in {time.perf_counter() - started:.1f}s", flush=True)
+        try:
+            _bench_deep_page(cur, rows, repeat)
+            for q in queries:
+                _bench_search(cur, q, repeat)
+        finally:
+            if not keep:
+                cur.execute(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="CRS inventory list benchmark")
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--query",
+        action="append",
+        dest="queries",
+        help="search term to time (repeatable); defaults to a few synthetic names",
+    )
+    parser.add_argument("--keep", action="store_true", help="keep the scratch schema")
+    args = parser.parse_args()
+    if args.rows < _PAGE_SIZE * 4:
+        print("--rows is too small to page through", file=sys.stderr)
+        return 1
+    run(
+        args.rows,
+        args.queries or ["grand palace", "harbour street", "district 17", "resortinn"],
+        repeat=max(1, args.repeat),
+        keep=args.keep,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
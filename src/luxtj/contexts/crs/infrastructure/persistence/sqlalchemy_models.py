@@ -9,6 +9,7 @@ from decimal import Decimal
 from sqlalchemy import (
     JSON,
     Boolean,
+    Computed,
     DateTime,
     ForeignKey,
     Index,
@@ -26,6 +27,13 @@ class CrsBase(DeclarativeBase):
     pass
 
 
+HOTEL_SEARCH_TEXT_SQL = (
+    "lower(coalesce(code, '') || ' ' || coalesce(name, '') || ' ' || "
+    "coalesce(name_normalized, '') || ' ' || coalesce(address_line1, '') || ' ' || "
+    "coalesce(address_line2, '') || ' ' || coalesce(location, ''))"
+)
+
+
 class NewCitiesNRegionRow(CrsBase):
     __tablename__ = "new_cities_n_regions"
     __table_args__ = (
@@ -195,6 +203,7 @@ class StagingHotelRow(CrsBase):
     front_desk_time_start: Mapped[str | None] = mapped_column(String(20), nullable=True)
     front_desk_time_end: Mapped[str | None] = mapped_column(String(20), nullable=True)
     content_payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    content_hashes: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     hotel_promoted_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -343,6 +352,12 @@ class HotelCrsHotelRow(CrsBase):
     supplier_slug: Mapped[str | None] = mapped_column(String(255), nullable=True)
     external_code: Mapped[str | None] = mapped_column(String(255), nullable=True)
     status: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    # Room groups currently synced for the hotel (maintained by crs_promote / CrsService).
+    room_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Lowercased code / names / address for the inventory search (GIN trigram index).
+    search_text: Mapped[str | None] = mapped_column(
+        Text, Computed(HOTEL_SEARCH_TEXT_SQL, persisted=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
@@ -377,6 +392,8 @@ class HotelCrsSupplierHotelMapRow(CrsBase):
         nullable=False,
     )
     meta: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # Section fingerprints of the last promoted supplier content (RateHawk re-mapping).
+    content_hashes: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
@@ -0,0 +1,39 @@
+"""Per-booking-source generation of CRS static hotel content.
+
+Search-side caches of CRS hotel details key their entries by this generation. Anything
+that rewrites CRS hotels for a booking source (a mapping run once its promote phase ends,
+CRS wipes, admin edits) bumps it, which orphans every cached entry for that source across
+all workers at once.
+Mapping workers are sync processes, so they bump through :func:`bump_crs_static_generation_sync`.
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from luxtj.shared_kernel.infrastructure.redis_cache import (
+    redis_cache_get,
+    redis_cache_put,
+    redis_cache_put_sync,
+)
+
+GENERATION_NAMESPACE = "crs_static_generation"
+_GENERATION_TTL_SECONDS = 30 * 24 * 60 * 60
+
+
+async def get_crs_static_generation(booking_source_id: str) -> str:
+    """Current generation token; ``"0"`` until the first bump (or while Redis is down)."""
+    token = await redis_cache_get(GENERATION_NAMESPACE, booking_source_id)
+    return str(token) if token else "0"
+
+
+async def bump_crs_static_generation(booking_source_id: str) -> None:
+    await redis_cache_put(
+        GENERATION_NAMESPACE, booking_source_id, uuid4().hex[:12], _GENERATION_TTL_SECONDS
+    )
+
+
+def bump_crs_static_generation_sync(booking_source_id: str) -> None:
+    redis_cache_put_sync(
+        GENERATION_NAMESPACE, booking_source_id, uuid4().hex[:12], _GENERATION_TTL_SECONDS
+    )
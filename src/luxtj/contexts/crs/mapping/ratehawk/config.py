@@ -59,8 +59,23 @@ def stream_extract_lines() -> int:
     return 20000
 
 
-def stream_stage_batch() -> int:
-    return 1500
+def stream_parse_workers() -> int:
+    """Processes parsing dump lines; 1 parses in the mapper process itself."""
+    raw = os.getenv("LTJBE_RATEHAWK_STREAM_PARSE_WORKERS", "").strip()
+    if raw:
+        return max(1, int(raw))
+    return max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+def stream_queue_depth() -> int:
+    """Parsed batches buffered between the extractor and the stager."""
+    return int(os.getenv("LTJBE_RATEHAWK_STREAM_QUEUE_DEPTH", "2"))
+
+
+def stream_max_staged_backlog() -> int:
+    """Staged-but-unpromoted hotels at which staging pauses for promotion to catch up."""
+    raw = os.getenv("LTJBE_RATEHAWK_STREAM_MAX_STAGED_BACKLOG", "").strip()
+    return int(raw) if raw else 3 * stream_extract_lines()
 
 
 def promote_batch_size() -> int:
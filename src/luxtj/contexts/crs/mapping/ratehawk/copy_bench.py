@@ -0,0 +1,459 @@
+"""Synthetic benchmark for the COPY write paths of the RateHawk stream mapper.
+
+Builds the staging and CRS room tables (same columns, constraints and indexes as the CRS
+models; only foreign keys between the benchmarked tables are kept) in a scratch schema and
+parses ``--hotels`` synthetic dump lines exactly as the mapper does. Two write paths are
+timed, each into freshly truncated tables:
+
+* staging rooms, flushed in mapper-sized batches: the previous ``executemany``
+  ``INSERT … ON CONFLICT DO NOTHING`` against
+  :func:`~luxtj.contexts.crs.mapping.ratehawk.db.copy_merge`; then every batch again on top
+  of the loaded rows (a resumed flush, all conflicts). Staging hotels keep ``executemany``;
+* room promotion of the first ``--promote-hotels`` hotels: the previous per-hotel
+  transaction (row-by-row amenity upserts and room group / image / amenity map inserts)
+  against :func:`~luxtj.contexts.crs.mapping.ratehawk.crs_promote._ensure_amenities` +
+  :func:`~luxtj.contexts.crs.mapping.ratehawk.crs_promote._replace_rooms_bulk` per
+  ``promote_batch_size`` claim; then a second pass replacing every hotel's rooms, as a
+  re-map does. The supplier map / staging reads and marks around both are not timed.
+
+Nothing outside the scratch schema is touched; it is dropped afterwards unless ``--keep``.
+
+Usage::
+
+    python -m luxtj.contexts.crs.mapping.ratehawk.copy_bench --hotels 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from luxtj.contexts.crs.infrastructure.persistence.sqlalchemy_models import (
+    HotelCrsAmenityRow,
+    HotelCrsHotelRow,
+    HotelCrsRoomAmenityMapRow,
+    HotelCrsRoomGroupRow,
+    HotelCrsRoomImageRow,
+    StagingHotelRow,
+    StagingRoomRow,
+)
+
+from . import config
+from .crs_normalize import flatten_room_group
+from .crs_promote import (
+    _AMENITY_MASTER_LOCK_KEY,
+    _ROOM_GROUP_FLAT_COLUMNS,
+    _clip,
+    _ensure_amenities,
+    _merge_staged_rooms,
+    _replace_rooms_bulk,
+    _room_amenity_labels,
+    _slugify,
+)
+from .db import _STAGING_ROOM_COLUMNS, _utc_now, copy_merge
+from .parse_pool import ParsedLines, parse_lines
+from .parser import resolve_ratehawk_image_url
+from .zstd_lines_bench import synthetic_hotel_line
+
+_SCHEMA = "ratehawk_copy_bench"
+_REGIONS = 5000
+_TABLES: tuple[Table, ...] = tuple(
+    row.__table__
+    for row in (
+        StagingHotelRow,
+        StagingRoomRow,
+        HotelCrsHotelRow,
+        HotelCrsAmenityRow,
+        HotelCrsRoomGroupRow,
+        HotelCrsRoomImageRow,
+        HotelCrsRoomAmenityMapRow,
+    )
+)
+# staging_hotel_values() columns, as promote_rooms_batch reads them back.
+_HOTEL_VALUE_COLUMNS = (
+    "supplier_hotel_code",
+    "dedupe_key",
+    "region_id",
+    "code",
+    "name",
+    "star_rating",
+    "description",
+    "address_line1",
+    "address_line2",
+    "postal_code",
+    "location",
+    "latitude",
+    "longitude",
+    "phone",
+    "email",
+    "image",
+    "amenity_names",
+    "image_urls",
+    "room_payload",
+    "policy_payload",
+    "accommodation_type",
+    "hotel_chain",
+    "check_in_time",
+    "check_in_time_end",
+    "check_out_time",
+    "front_desk_time_start",
+    "front_desk_time_end",
+    "content_payload",
+    "content_hashes",
+)
+
+# The statement flush_staging_values ran for rooms before it switched to COPY.
+_LEGACY_ROOMS_SQL = """
+    INSERT INTO staging_rooms (
+        id, mapping_run_id, shard_index, supplier_hotel_code, room_group_id,
+        name, main_name, description, amenity_slugs, image_urls,
+        rg_ext, name_struct, images_ext, created_at, updated_at
+    ) VALUES (
+        %s,%s,%s,%s,%s,%s,%s,%s,%s::jsonb,%s::jsonb,
+        %s::jsonb,%s::jsonb,%s::jsonb,%s,%s
+    )
+    ON CONFLICT (mapping_run_id, supplier_hotel_code, room_group_id) DO NOTHING
+"""
+_ROOMS_CONFLICT = "(mapping_run_id, supplier_hotel_code, room_group_id) DO NOTHING"
+
+type Rows = list[tuple[Any, ...]]
+type RoomGroups = dict[str, list[Any]]
+
+
+def _setup(cur: Any) -> None:
+    cur.execute(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE")
+    cur.execute(f"CREATE SCHEMA {_SCHEMA}")
+    cur.execute(f"SET search_path TO {_SCHEMA}")
+    dialect = postgresql.dialect()
+    for table in _TABLES:
+        foreign_keys = [fk for fk in table.foreign_key_constraints if fk.referred_table in _TABLES]
+        cur.execute(
+            str(
+                CreateTable(table, include_foreign_key_constraints=foreign_keys).compile(
+                    dialect=dialect
+                )
+            )
+        )
+        for index in table.indexes:
+            cur.execute(str(CreateIndex(index).compile(dialect=dialect)))
+
+
+def _parse(hotels: int, batch_lines: int) -> list[ParsedLines]:
+    rng = random.Random(20261018)
+    region_map = {str(n): str(uuid4()) for n in range(_REGIONS)}
+    batches: list[ParsedLines] = []
+    for start in range(0, hotels, batch_lines):
+        lines = [
+            synthetic_hotel_line(rng, n).replace(b"{id}", str(n).encode(), 1)
+            for n in range(start, min(hotels, start + batch_lines))
+        ]
+        batches.append(parse_lines(lines, region_map))
+    return batches
+
+
+def _staging_room_batches(parsed: list[ParsedLines]) -> list[Rows]:
+    """``staging_rooms`` rows per flush, built as ``flush_staging_values`` builds them."""
+    run_id, now = str(uuid4()), _utc_now()
+    return [[(str(uuid4()), run_id, 0, *v, now, now) for v in p.room_values] for p in parsed]
+
+
+def _room_groups(parsed: list[ParsedLines], limit: int) -> RoomGroups:
+    """CRS hotel id → room groups, merged from staging values as ``promote_rooms_batch`` does."""
+    staged: dict[str, list[tuple[Any, ...]]] = {}
+    for p in parsed:
+        for code, *room in p.room_values:
+            staged.setdefault(str(code), []).append(tuple(room))
+    out: RoomGroups = {}
+    for values in (v for p in parsed for v in p.hotel_values):
+        if len(out) >= limit:
+            break
+        row = dict(zip(_HOTEL_VALUE_COLUMNS, values, strict=True))
+        out[str(uuid4())] = _merge_staged_rooms(row, staged.get(row["supplier_hotel_code"], []))
+    return out
+
+
+def _legacy_ensure_amenities(cur: Any, names: list[str]) -> dict[str, str]:
+    """``_ensure_amenities`` before it went set-based: one lookup (+ insert) per label."""
+    result: dict[str, str] = {}
+    if not names:
+        return result
+    cur.execute("SELECT pg_advisory_xact_lock(%s)", (_AMENITY_MASTER_LOCK_KEY,))
+    now = _utc_now()
+    for name in names:
+        label = str(name).strip()
+        if not label:
+            continue
+        slug = _slugify(label)
+        cur.execute("SELECT id FROM hotel_crs_amenities WHERE slug = %s LIMIT 1", (slug,))
+        found = cur.fetchone()
+        if found:
+            result[label] = str(found[0])
+            continue
+        cur.execute(
+            """
+            INSERT INTO hotel_crs_amenities (id, slug, name, category, scope, created_at, updated_at)
+            VALUES (%s, %s, %s, NULL, 'both', %s, %s)
+            ON CONFLICT (slug) DO NOTHING
+            """,
+            (str(uuid4()), slug, _clip(label, 255), now, now),
+        )
+        cur.execute("SELECT id FROM hotel_crs_amenities WHERE slug = %s LIMIT 1", (slug,))
+        found = cur.fetchone()
+        if found:
+            result[label] = str(found[0])
+    return result
+
+
+def _legacy_replace_rooms(cur: Any, hotel_id: str, room_groups: list[Any], now: Any) -> None:
+    """The per-hotel ``_replace_rooms`` that ``_replace_rooms_bulk`` replaced."""
+    cur.execute("SELECT id FROM hotel_crs_room_groups WHERE hotel_id = %s", (hotel_id,))
+    old_ids = [str(r[0]) for r in cur.fetchall()]
+    if old_ids:
+        ph = ",".join(["%s"] * len(old_ids))
+        cur.execute(
+            f"DELETE FROM hotel_crs_room_amenity_map WHERE room_group_id IN ({ph})",
+            tuple(old_ids),
+        )
+        cur.execute(
+            f"DELETE FROM hotel_crs_room_images WHERE room_group_id IN ({ph})", tuple(old_ids)
+        )
+        cur.execute("DELETE FROM hotel_crs_room_groups WHERE hotel_id = %s", (hotel_id,))
+    amenity_map = _legacy_ensure_amenities(cur, _room_amenity_labels([room_groups]))
+    synced = 0
+    seen: set[str] = set()
+    for rg in room_groups:
+        if not isinstance(rg, dict):
+            continue
+        code = str(rg.get("room_group_id") or "")
+        if not code or code in seen:
+            continue
+        seen.add(code)
+        room_id = str(uuid4())
+        name = _clip(rg.get("name") or code, 255)
+        flat = flatten_room_group(rg)
+        cur.execute(
+            """
+            INSERT INTO hotel_crs_room_groups (
+                id, hotel_id, supplier_room_code, name, main_name, description,
+                bedding_type, bathroom_type, size, capacity, bedrooms, balcony,
+                view_code, view_type, room_class, class_label, quality, quality_label,
+                gender, is_family, is_club, floor_type,
+                created_at, updated_at
+            ) VALUES (
+                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                %s, %s, %s, %s, %s, %s
+            )
+            ON CONFLICT (hotel_id, supplier_room_code) DO NOTHING
+            """,
+            (
+                room_id,
+                hotel_id,
+                _clip(code, 100),
+                name,
+                _clip(flat.get("main_name") or name, 255) or None,
+                *(flat.get(column) for column in _ROOM_GROUP_FLAT_COLUMNS),
+                now,
+                now,
+            ),
+        )
+        if not cur.rowcount:
+            continue
+        synced += 1
+        images = rg.get("images_ext") if isinstance(rg.get("images_ext"), list) else None
+        if not images:
+            images = rg.get("images") if isinstance(rg.get("images"), list) else []
+        for idx, item in enumerate(images[:30]):
+            category = None
+            if isinstance(item, dict):
+                resolved = resolve_ratehawk_image_url(str(item.get("url") or ""))
+                category = _clip(item.get("category_slug"), 100) or None
+            else:
+                resolved = resolve_ratehawk_image_url(str(item or ""))
+            if not resolved:
+                continue
+            cur.execute(
+                """
+                INSERT INTO hotel_crs_room_images (
+                    id, room_group_id, url, category_slug, sort_order, created_at, updated_at
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+                """,
+                (str(uuid4()), room_id, _clip(resolved, 2048), category, idx, now, now),
+            )
+        for a in rg.get("room_amenities") or []:
+            label = a.strip() if isinstance(a, str) else str((a or {}).get("name") or "")
+            amenity_id = amenity_map.get(label)
+            if not amenity_id:
+                continue
+            cur.execute(
+                """
+                INSERT INTO hotel_crs_room_amenity_map (
+                    id, room_group_id, amenity_id, created_at, updated_at
+                ) VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (room_group_id, amenity_id) DO NOTHING
+                """,
+                (str(uuid4()), room_id, amenity_id, now, now),
+            )
+    cur.execute("UPDATE hotel_crs_hotels SET room_count = %s WHERE id = %s", (synced, hotel_id))
+
+
+def _legacy_flush_rooms(cur: Any, room_rows: Rows) -> None:
+    cur.executemany(_LEGACY_ROOMS_SQL, room_rows)
+
+
+def _copy_flush_rooms(cur: Any, room_rows: Rows) -> None:
+    copy_merge(cur, "staging_rooms", _STAGING_ROOM_COLUMNS, room_rows, on_conflict=_ROOMS_CONFLICT)
+
+
+def _timed_staging(
+    conn: Any, batches: list[Rows], flush: Callable[[Any, Rows], None]
+) -> tuple[float, float]:
+    """Seconds to flush all room batches, then all of them again, one commit each."""
+    timings: list[float] = []
+    with conn.cursor() as cur:
+        cur.execute("TRUNCATE staging_hotels, staging_rooms")
+        conn.commit()
+        for _ in range(2):
+            started = time.perf_counter()
+            for room_rows in batches:
+                if room_rows:
+                    flush(cur, room_rows)
+                conn.commit()
+            timings.append(time.perf_counter() - started)
+    return timings[0], timings[1]
+
+
+def _legacy_promote(conn: Any, room_groups: RoomGroups) -> None:
+    with conn.cursor() as cur:
+        for hotel_id, groups in room_groups.items():
+            _legacy_replace_rooms(cur, hotel_id, groups, _utc_now())
+            conn.commit()
+
+
+def _bulk_promote(conn: Any, room_groups: RoomGroups) -> None:
+    hotel_ids = list(room_groups)
+    batch_size = config.promote_batch_size()
+    with conn.cursor() as cur:
+        for start in range(0, len(hotel_ids), batch_size):
+            batch = {hid: room_groups[hid] for hid in hotel_ids[start : start + batch_size]}
+            amenity_map = _ensure_amenities(cur, _room_amenity_labels(batch.values()))
+            conn.commit()
+            _replace_rooms_bulk(cur, batch, amenity_map, _utc_now())
+            conn.commit()
+
+
+def _timed_promotes(
+    conn: Any, room_groups: RoomGroups, promote: Callable[[Any, RoomGroups], None]
+) -> tuple[float, float]:
+    """Seconds to promote every hotel's rooms into empty tables, then to replace them all."""
+    now = _utc_now()
+    with conn.cursor() as cur:
+        cur.execute(
+            "TRUNCATE hotel_crs_room_amenity_map, hotel_crs_room_images, hotel_crs_room_groups, "
+            "hotel_crs_amenities, hotel_crs_hotels"
+        )
+        cur.executemany(
+            """
+            INSERT INTO hotel_crs_hotels (
+                id, code, name, name_normalized, star_rating, unique_key, status,
+                created_at, updated_at
+            ) VALUES (%s, %s, %s, %s, 0, %s, TRUE, %s, %s)
+            """,
+            [
+                (hotel_id, uuid4().hex[:12], hotel_id, hotel_id, uuid4().hex, now, now)
+                for hotel_id in room_groups
+            ],
+        )
+        conn.commit()
+    timings: list[float] = []
+    for _ in range(2):
+        started = time.perf_counter()
+        promote(conn, room_groups)
+        timings.append(time.perf_counter() - started)
+    return timings[0], timings[1]
+
+
+def _report(label: str, rows: int, old_s: float, new_s: float) -> None:
+    speedup = old_s / new_s if new_s > 0 else float("inf")
+    print(
+        f"{label:<24} rows={rows:>10,}  old={old_s:8.2f}s ({rows / old_s:>9,.0f}/s)  "
+        f"new={new_s:7.2f}s ({rows / new_s:>9,.0f}/s)  x{speedup:,.1f}",
+        flush=True,
+    )
+
+
+def run(hotels: int, *, batch_lines: int, promote_hotels: int, keep: bool) -> None:
+    import psycopg
+
+    started = time.perf_counter()
+    parsed = _parse(hotels, batch_lines)
+    room_batches = _staging_room_batches(parsed)
+    room_groups = _room_groups(parsed, promote_hotels)
+    hotel_count = sum(len(p.hotel_values) for p in parsed)
+    room_count = sum(len(rows) for rows in room_batches)
+    group_count = sum(len(groups) for groups in room_groups.values())
+    print(
+        f"parsed {hotel_count:,} hotels / {room_count:,} rooms in {len(parsed)} batches "
+        f"in {time.perf_counter() - started:.1f}s; promoting {len(room_groups):,} hotels",
+        flush=True,
+    )
+    with psycopg.connect(config.database_url()) as conn:
+        with conn.cursor() as cur:
+            _setup(cur)
+        conn.commit()
+        try:
+            old = _timed_staging(conn, room_batches, _legacy_flush_rooms)
+            new = _timed_staging(conn, room_batches, _copy_flush_rooms)
+            _report("staging_rooms", room_count, old[0], new[0])
+            _report("staging_rooms re-staged", room_count, old[1], new[1])
+            old = _timed_promotes(conn, room_groups, _legacy_promote)
+            new = _timed_promotes(conn, room_groups, _bulk_promote)
+            _report("rooms promoted", group_count, old[0], new[0])
+            _report("rooms re-promoted", group_count, old[1], new[1])
+        finally:
+            if not keep:
+                conn.rollback()
+                with conn.cursor() as cur:
+                    cur.execute(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE")
+                conn.commit()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="RateHawk staging / room promote COPY benchmark")
+    parser.add_argument("--hotels", type=int, default=100_000)
+    parser.add_argument(
+        "--batch-lines",
+        type=int,
+        default=config.stream_extract_lines(),
+        help="dump lines per staging flush (the mapper's batch size by default)",
+    )
+    parser.add_argument(
+        "--promote-hotels",
+        type=int,
+        default=20_000,
+        help="hotels whose rooms are promoted (the per-hotel path is slow)",
+    )
+    parser.add_argument("--keep", action="store_true", help="keep the scratch schema")
+    args = parser.parse_args()
+    if args.hotels <= 0 or args.batch_lines <= 0 or args.promote_hotels <= 0:
+        print("--hotels, --batch-lines and --promote-hotels must be positive", file=sys.stderr)
+        return 1
+    run(
+        args.hotels,
+        batch_lines=args.batch_lines,
+        promote_hotels=args.promote_hotels,
+        keep=args.keep,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
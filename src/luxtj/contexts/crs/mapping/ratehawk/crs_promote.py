@@ -7,6 +7,7 @@ import random
 import re
 import secrets
 import time
+from collections.abc import Iterable
 from typing import Any
 from uuid import uuid4
 
@@ -26,6 +27,65 @@ _AMENITY_MASTER_LOCK_KEY = 87201401
 _DEADLOCK_RETRY_ATTEMPTS = 6
 _STALE_CLAIM_SECONDS = 120
 
+_HOTEL_IMAGE_COLUMNS = (
+    "id",
+    "hotel_id",
+    "url",
+    "caption",
+    "category_slug",
+    "sort_order",
+    "created_at",
+    "updated_at",
+)
+_HOTEL_AMENITY_COLUMNS = (
+    "id",
+    "hotel_id",
+    "amenity_id",
+    "group_name",
+    "is_paid",
+    "created_at",
+    "updated_at",
+)
+# flatten_room_group() keys written to hotel_crs_room_groups as-is.
+_ROOM_GROUP_FLAT_COLUMNS = (
+    "description",
+    "bedding_type",
+    "bathroom_type",
+    "size",
+    "capacity",
+    "bedrooms",
+    "balcony",
+    "view_code",
+    "view_type",
+    "room_class",
+    "class_label",
+    "quality",
+    "quality_label",
+    "gender",
+    "is_family",
+    "is_club",
+    "floor_type",
+)
+_ROOM_GROUP_COLUMNS = (
+    "id",
+    "hotel_id",
+    "supplier_room_code",
+    "name",
+    "main_name",
+    *_ROOM_GROUP_FLAT_COLUMNS,
+    "created_at",
+    "updated_at",
+)
+_ROOM_IMAGE_COLUMNS = (
+    "id",
+    "room_group_id",
+    "url",
+    "category_slug",
+    "sort_order",
+    "created_at",
+    "updated_at",
+)
+
 
 def _clip(value: Any, limit: int) -> str:
     text = str(value or "")
@@ -101,7 +161,15 @@ def staging_row_to_blender(row: dict[str, Any]) -> dict[str, Any]:
         "front_desk_time_end": row.get("front_desk_time_end"),
         "content_payload": content_payload if isinstance(content_payload, dict) else {},
     }
-    return staging_to_blender(staging)
+    blender = staging_to_blender(staging)
+    blender["_content_hashes"] = _json_dict(row.get("content_hashes"))
+    return blender
+
+
+def _json_dict(value: Any) -> dict[str, Any]:
+    if isinstance(value, str):
+        value = json.loads(value)
+    return value if isinstance(value, dict) else {}
 
 
 def _hotel_scalar_content(hotel: dict[str, Any]) -> dict[str, Any]:
@@ -325,44 +393,44 @@ def _get_or_create_supplier(cur: Any, booking_source_id: str) -> str:
 
 
 def _ensure_amenities(cur: Any, names: list[str]) -> dict[str, str]:
-    """Upsert amenity master rows.
+    """Upsert amenity master rows; returns label → amenity id.
 
     Uses a transaction-scoped advisory lock so a killed worker cannot leak a
     session lock and block all later room/hotel promotes.
     """
-    result: dict[str, str] = {}
-    if not names:
-        return result
-    # Held only until the surrounding transaction commits/rollbacks.
-    cur.execute("SELECT pg_advisory_xact_lock(%s)", (_AMENITY_MASTER_LOCK_KEY,))
-    now = db._utc_now()
+    slugs: dict[str, str] = {}
     for name in names:
         label = str(name).strip()
-        if not label:
-            continue
-        slug = _slugify(label)
-        cur.execute(
-            "SELECT id FROM hotel_crs_amenities WHERE slug = %s LIMIT 1",
-            (slug,),
-        )
-        found = cur.fetchone()
-        if found:
-            result[label] = str(found[0])
-            continue
-        amenity_id = str(uuid4())
-        cur.execute(
-            """
-            INSERT INTO hotel_crs_amenities (id, slug, name, category, scope, created_at, updated_at)
-            VALUES (%s, %s, %s, NULL, 'both', %s, %s)
-            ON CONFLICT (slug) DO NOTHING
-            """,
-            (amenity_id, slug, _clip(label, 255), now, now),
+        if label and label not in slugs:
+            slugs[label] = _slugify(label)
+    if not slugs:
+        return {}
+    # Held only until the surrounding transaction commits/rollbacks.
+    cur.execute("SELECT pg_advisory_xact_lock(%s)", (_AMENITY_MASTER_LOCK_KEY,))
+    by_slug = _amenity_ids_by_slug(cur, list(set(slugs.values())))
+    missing: dict[str, str] = {}
+    for label, slug in slugs.items():
+        if slug not in by_slug:
+            missing.setdefault(slug, label)
+    if missing:
+        now = db._utc_now()
+        db.copy_merge(
+            cur,
+            "hotel_crs_amenities",
+            ("id", "slug", "name", "category", "scope", "created_at", "updated_at"),
+            [
+                (str(uuid4()), slug, _clip(label, 255), None, "both", now, now)
+                for slug, label in missing.items()
+            ],
+            on_conflict="(slug) DO NOTHING",
         )
-        cur.execute("SELECT id FROM hotel_crs_amenities WHERE slug = %s LIMIT 1", (slug,))
-        found = cur.fetchone()
-        if found:
-            result[label] = str(found[0])
-    return result
+        by_slug.update(_amenity_ids_by_slug(cur, list(missing)))
+    return {label: by_slug[slug] for label, slug in slugs.items() if slug in by_slug}
+
+
+def _amenity_ids_by_slug(cur: Any, slugs: list[str]) -> dict[str, str]:
+    cur.execute("SELECT slug, id FROM hotel_crs_amenities WHERE slug = ANY(%s)", (slugs,))
+    return {str(slug): str(amenity_id) for slug, amenity_id in cur.fetchall()}
 
 
 def deduplicate_and_insert(
@@ -375,6 +443,8 @@ def deduplicate_and_insert(
     stats = {
         "inserted": 0,
         "existing": 0,
+        "changed": 0,
+        "unchanged": 0,
         "errors": 0,
         "hotelImagesSynced": 0,
         "hotelAmenitiesMapped": 0,
@@ -396,8 +466,12 @@ def deduplicate_and_insert(
                 stats["errors"] += 1
                 continue
             unique_key = compute_unique_key(name, star, region_id)
+            hashes = hotel.get("_content_hashes") or {}
             hotel_data_map[unique_key] = {
                 "hotel": hotel,
+                # Fingerprints recorded on the supplier map once these sections are written.
+                "hashes": {k: v for k, v in hashes.items() if sync_rooms or k != "rooms"},
+                "unchanged": frozenset(),
                 "supplier_id": supplier_id,
                 "hotel_code": str(hotel.get("HotelCode") or ""),
                 "name": name,
@@ -421,6 +495,11 @@ def deduplicate_and_insert(
             )
             for hid, uk in cur.fetchall():
                 existing_key_map[str(uk)] = str(hid)
+        stored_hashes = _stored_content_hashes(
+            cur,
+            supplier_id,
+            [data["hotel_code"] for data in hotel_data_map.values() if data["hotel_code"]],
+        )
 
         now = db._utc_now()
         unique_key_to_id: dict[str, str] = {}
@@ -470,6 +549,17 @@ def deduplicate_and_insert(
                 hotel_id = existing_key_map[uk]
                 unique_key_to_id[uk] = hotel_id
                 stats["existing"] += 1
+                new_hashes = hotel.get("_content_hashes") or {}
+                unchanged = _unchanged_sections(
+                    new_hashes, stored_hashes.get((data["hotel_code"], hotel_id))
+                )
+                data["unchanged"] = unchanged
+                if new_hashes and len(unchanged) == len(new_hashes):
+                    stats["unchanged"] += 1
+                else:
+                    stats["changed"] += 1
+                if "hotel" in unchanged:
+                    continue
                 image = resolve_ratehawk_image_url(str(hotel.get("image") or ""))
                 cur.execute(
                     """
@@ -618,6 +708,9 @@ def deduplicate_and_insert(
                 if found:
                     unique_key_to_id[uk] = str(found[0])
                     stats["existing"] += 1
+                    stats["changed"] += 1
+                    # Inserted concurrently by another worker; its row was not updated here.
+                    data["hashes"].pop("hotel", None)
 
         # Supplier maps
         for uk, data in hotel_data_map.items():
@@ -628,211 +721,290 @@ def deduplicate_and_insert(
             cur.execute(
                 """
                 INSERT INTO hotel_crs_supplier_hotel_map (
-                    id, supplier_id, supplier_hotel_code, hotel_id, meta, created_at, updated_at
-                ) VALUES (%s, %s, %s, %s, NULL, %s, %s)
-                ON CONFLICT (supplier_id, supplier_hotel_code, hotel_id) DO NOTHING
+                    id, supplier_id, supplier_hotel_code, hotel_id, meta, content_hashes,
+                    created_at, updated_at
+                ) VALUES (%s, %s, %s, %s, NULL, %s::jsonb, %s, %s)
+                ON CONFLICT (supplier_id, supplier_hotel_code, hotel_id) DO UPDATE SET
+                    content_hashes = COALESCE(
+                        hotel_crs_supplier_hotel_map.content_hashes, '{}'::jsonb
+                    ) || EXCLUDED.content_hashes,
+                    updated_at = EXCLUDED.updated_at
+                WHERE hotel_crs_supplier_hotel_map.content_hashes IS DISTINCT FROM COALESCE(
+                    hotel_crs_supplier_hotel_map.content_hashes, '{}'::jsonb
+                ) || EXCLUDED.content_hashes
                 """,
-                (str(uuid4()), data["supplier_id"], code, hotel_id, now, now),
+                (
+                    str(uuid4()),
+                    data["supplier_id"],
+                    code,
+                    hotel_id,
+                    json.dumps(data["hashes"]),
+                    now,
+                    now,
+                ),
             )
 
-        # Extended content
+        # Extended content: only sections whose fingerprint changed are rewritten.
         all_amenity_names: list[str] = []
         for data in hotel_data_map.values():
+            if "amenities" in data["unchanged"]:
+                continue
             for a in data["hotel"].get("allamenities") or []:
                 if isinstance(a, dict) and a.get("name"):
                     all_amenity_names.append(str(a["name"]))
         amenity_map = _ensure_amenities(cur, all_amenity_names)
 
+        image_hotel_ids: list[str] = []
+        image_rows: list[tuple[Any, ...]] = []
+        amenity_hotel_ids: list[str] = []
+        amenity_rows: list[tuple[Any, ...]] = []
+        rooms_by_hotel: dict[str, list[Any]] = {}
         for uk, data in hotel_data_map.items():
             hotel_id = unique_key_to_id.get(uk)
             if not hotel_id:
                 continue
             hotel = data["hotel"]
-            # Replace hotel images/amenities so re-promote stays idempotent.
-            cur.execute("DELETE FROM hotel_crs_hotel_images WHERE hotel_id = %s", (hotel_id,))
+            unchanged = data["unchanged"]
+            if "hotel" not in unchanged:
+                _sync_hotel_content_children(cur, hotel_id, hotel, now)
+
+            if "images" not in unchanged:
+                image_hotel_ids.append(hotel_id)
+                images = hotel.get("images") if isinstance(hotel.get("images"), list) else []
+                for idx, img in enumerate(images[:50]):
+                    url = ""
+                    category = None
+                    if isinstance(img, dict):
+                        url = resolve_ratehawk_image_url(str(img.get("url") or ""))
+                        category = _clip(img.get("category_slug"), 100) or None
+                    elif isinstance(img, str):
+                        url = resolve_ratehawk_image_url(img)
+                    if not url:
+                        continue
+                    image_rows.append(
+                        (str(uuid4()), hotel_id, _clip(url, 2048), None, category, idx, now, now)
+                    )
+
+            if "amenities" not in unchanged:
+                amenity_hotel_ids.append(hotel_id)
+                for a in hotel.get("allamenities") or []:
+                    if not isinstance(a, dict):
+                        continue
+                    amenity_id = amenity_map.get(str(a.get("name") or ""))
+                    if not amenity_id:
+                        continue
+                    amenity_rows.append(
+                        (
+                            str(uuid4()),
+                            hotel_id,
+                            amenity_id,
+                            _clip(a.get("category") or "General", 100),
+                            bool(a.get("is_paid")),
+                            now,
+                            now,
+                        )
+                    )
+
+            if sync_rooms and "rooms" not in unchanged:
+                rooms_by_hotel[hotel_id] = hotel.get("room_groups") or []
+
+        # Replace hotel images/amenities so re-promote stays idempotent.
+        if image_hotel_ids:
+            cur.execute(
+                "DELETE FROM hotel_crs_hotel_images WHERE hotel_id = ANY(%s)",
+                (image_hotel_ids,),
+            )
+            db.copy_rows(cur, "hotel_crs_hotel_images", _HOTEL_IMAGE_COLUMNS, image_rows)
+            stats["hotelImagesSynced"] += len(image_rows)
+        if amenity_hotel_ids:
             cur.execute(
-                "DELETE FROM hotel_crs_hotel_amenity_map WHERE hotel_id = %s",
-                (hotel_id,),
+                "DELETE FROM hotel_crs_hotel_amenity_map WHERE hotel_id = ANY(%s)",
+                (amenity_hotel_ids,),
+            )
+            stats["hotelAmenitiesMapped"] += db.copy_merge(
+                cur,
+                "hotel_crs_hotel_amenity_map",
+                _HOTEL_AMENITY_COLUMNS,
+                amenity_rows,
+                on_conflict="(hotel_id, amenity_id, group_name) DO NOTHING",
             )
-            _sync_hotel_content_children(cur, hotel_id, hotel, now)
+        if rooms_by_hotel:
+            room_stats = _replace_rooms_bulk(
+                cur,
+                rooms_by_hotel,
+                _ensure_amenities(cur, _room_amenity_labels(rooms_by_hotel.values())),
+                now,
+            )
+            for k, v in room_stats.items():
+                stats[k] = stats.get(k, 0) + v
 
-            images = hotel.get("images") if isinstance(hotel.get("images"), list) else []
-            for idx, img in enumerate(images[:50]):
-                url = ""
-                category = None
-                if isinstance(img, dict):
-                    url = resolve_ratehawk_image_url(str(img.get("url") or ""))
-                    category = _clip(img.get("category_slug"), 100) or None
-                elif isinstance(img, str):
-                    url = resolve_ratehawk_image_url(img)
-                if not url:
-                    continue
-                cur.execute(
-                    """
-                    INSERT INTO hotel_crs_hotel_images (
-                        id, hotel_id, url, caption, category_slug, sort_order, created_at, updated_at
-                    ) VALUES (%s, %s, %s, NULL, %s, %s, %s, %s)
-                    """,
-                    (str(uuid4()), hotel_id, _clip(url, 2048), category, idx, now, now),
-                )
-                stats["hotelImagesSynced"] += 1
+    return stats
 
-            for a in hotel.get("allamenities") or []:
-                if not isinstance(a, dict):
-                    continue
-                label = str(a.get("name") or "")
-                amenity_id = amenity_map.get(label)
-                if not amenity_id:
-                    continue
-                cur.execute(
-                    """
-                    INSERT INTO hotel_crs_hotel_amenity_map (
-                        id, hotel_id, amenity_id, group_name, is_paid, created_at, updated_at
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (hotel_id, amenity_id, group_name) DO NOTHING
-                    """,
-                    (
-                        str(uuid4()),
-                        hotel_id,
-                        amenity_id,
-                        _clip(a.get("category") or "General", 100),
-                        bool(a.get("is_paid")),
-                        now,
-                        now,
-                    ),
-                )
-                stats["hotelAmenitiesMapped"] += 1
 
-            if sync_rooms:
-                room_stats = _replace_rooms(cur, hotel_id, hotel.get("room_groups") or [], now)
-                for k, v in room_stats.items():
-                    stats[k] = stats.get(k, 0) + v
+def _stored_content_hashes(
+    cur: Any, supplier_id: str, codes: list[str]
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """``(supplier_hotel_code, hotel_id)`` → fingerprints recorded at the last promote."""
+    stored: dict[tuple[str, str], dict[str, Any]] = {}
+    for i in range(0, len(codes), 500):
+        cur.execute(
+            """
+            SELECT supplier_hotel_code, hotel_id, content_hashes
+            FROM hotel_crs_supplier_hotel_map
+            WHERE supplier_id = %s AND supplier_hotel_code = ANY(%s)
+              AND content_hashes IS NOT NULL
+            """,
+            (supplier_id, codes[i : i + 500]),
+        )
+        for code, hotel_id, hashes in cur.fetchall():
+            stored[(str(code), str(hotel_id))] = _json_dict(hashes)
+    return stored
 
-    return stats
+
+def _unchanged_sections(new: dict[str, Any], old: dict[str, Any] | None) -> frozenset[str]:
+    if not new or not old:
+        return frozenset()
+    return frozenset(k for k, v in new.items() if v and old.get(k) == v)
+
+
+def _room_amenity_labels(room_group_lists: Iterable[list[Any]]) -> list[str]:
+    labels: list[str] = []
+    for room_groups in room_group_lists:
+        for rg in room_groups:
+            if not isinstance(rg, dict):
+                continue
+            for a in rg.get("room_amenities") or []:
+                if isinstance(a, str) and a.strip():
+                    labels.append(a.strip())
+                elif isinstance(a, dict) and a.get("name"):
+                    labels.append(str(a["name"]))
+    return labels
 
 
-def _replace_rooms(cur: Any, hotel_id: str, room_groups: list[Any], now) -> dict[str, int]:
+def _replace_rooms_bulk(
+    cur: Any,
+    room_groups_by_hotel: dict[str, list[Any]],
+    amenity_map: dict[str, str],
+    now,
+) -> dict[str, int]:
+    """Replace room groups, room images and room amenity maps of many hotels at once.
+
+    One ``DELETE`` per table for the whole batch, then ``COPY`` + ``INSERT … SELECT`` merges;
+    ``amenity_map`` (label → amenity id) must already cover the batch's room amenities.
+    """
     stats = {"roomGroupsSynced": 0, "roomImagesSynced": 0, "roomAmenitiesMapped": 0}
-    cur.execute("SELECT id FROM hotel_crs_room_groups WHERE hotel_id = %s", (hotel_id,))
-    old_ids = [str(r[0]) for r in cur.fetchall()]
-    if old_ids:
-        ph = ",".join(["%s"] * len(old_ids))
-        cur.execute(
-            f"DELETE FROM hotel_crs_room_amenity_map WHERE room_group_id IN ({ph})",
-            tuple(old_ids),
+    hotel_ids = sorted(room_groups_by_hotel)
+    if not hotel_ids:
+        return stats
+    cur.execute(
+        """
+        DELETE FROM hotel_crs_room_amenity_map
+        WHERE room_group_id IN (
+            SELECT id FROM hotel_crs_room_groups WHERE hotel_id = ANY(%s)
         )
-        cur.execute(
-            f"DELETE FROM hotel_crs_room_images WHERE room_group_id IN ({ph})",
-            tuple(old_ids),
+        """,
+        (hotel_ids,),
+    )
+    cur.execute(
+        """
+        DELETE FROM hotel_crs_room_images
+        WHERE room_group_id IN (
+            SELECT id FROM hotel_crs_room_groups WHERE hotel_id = ANY(%s)
         )
-        cur.execute("DELETE FROM hotel_crs_room_groups WHERE hotel_id = %s", (hotel_id,))
+        """,
+        (hotel_ids,),
+    )
+    cur.execute("DELETE FROM hotel_crs_room_groups WHERE hotel_id = ANY(%s)", (hotel_ids,))
+
+    group_rows: list[tuple[Any, ...]] = []
+    image_rows: list[tuple[Any, ...]] = []
+    amenity_rows: list[tuple[Any, ...]] = []
+    for hotel_id in hotel_ids:
+        seen: set[str] = set()
+        for rg in room_groups_by_hotel[hotel_id]:
+            if not isinstance(rg, dict):
+                continue
+            code = _clip(rg.get("room_group_id") or "", 100)
+            if not code or code in seen:
+                continue
+            seen.add(code)
+            room_id = str(uuid4())
+            name = _clip(rg.get("name") or code, 255)
+            flat = flatten_room_group(rg)
+            group_rows.append(
+                (
+                    room_id,
+                    hotel_id,
+                    code,
+                    name,
+                    _clip(flat.get("main_name") or name, 255) or None,
+                    *(flat.get(column) for column in _ROOM_GROUP_FLAT_COLUMNS),
+                    now,
+                    now,
+                )
+            )
 
-    seen: set[str] = set()
-    amenity_labels: list[str] = []
-    for rg in room_groups:
-        if not isinstance(rg, dict):
-            continue
-        for a in rg.get("room_amenities") or []:
-            if isinstance(a, str) and a.strip():
-                amenity_labels.append(a.strip())
-            elif isinstance(a, dict) and a.get("name"):
-                amenity_labels.append(str(a["name"]))
-    amenity_map = _ensure_amenities(cur, amenity_labels)
+            # Prefer merged images_ext entries (url + category); fall back to images[].
+            images = rg.get("images_ext") if isinstance(rg.get("images_ext"), list) else None
+            if not images:
+                images = rg.get("images") if isinstance(rg.get("images"), list) else []
+            for idx, item in enumerate(images[:30]):
+                category = None
+                if isinstance(item, dict):
+                    resolved = resolve_ratehawk_image_url(str(item.get("url") or ""))
+                    category = _clip(item.get("category_slug"), 100) or None
+                else:
+                    resolved = resolve_ratehawk_image_url(str(item or ""))
+                if not resolved:
+                    continue
+                image_rows.append(
+                    (str(uuid4()), room_id, _clip(resolved, 2048), category, idx, now, now)
+                )
 
-    for rg in room_groups:
-        if not isinstance(rg, dict):
-            continue
-        code = str(rg.get("room_group_id") or "")
-        if not code or code in seen:
-            continue
-        seen.add(code)
-        room_id = str(uuid4())
-        name = _clip(rg.get("name") or code, 255)
-        flat = flatten_room_group(rg)
-        main_name = _clip(flat.get("main_name") or name, 255) or None
+            for a in rg.get("room_amenities") or []:
+                label = a.strip() if isinstance(a, str) else str((a or {}).get("name") or "")
+                amenity_id = amenity_map.get(label)
+                if amenity_id:
+                    amenity_rows.append((str(uuid4()), room_id, amenity_id, now, now))
+
+    inserted = db.copy_merge(
+        cur,
+        "hotel_crs_room_groups",
+        _ROOM_GROUP_COLUMNS,
+        group_rows,
+        on_conflict="(hotel_id, supplier_room_code) DO NOTHING",
+    )
+    if inserted < len(group_rows):
+        # A concurrent writer kept some codes; drop children of the groups not inserted.
         cur.execute(
-            """
-            INSERT INTO hotel_crs_room_groups (
-                id, hotel_id, supplier_room_code, name, main_name, description,
-                bedding_type, bathroom_type, size, capacity, bedrooms, balcony,
-                view_code, view_type, room_class, class_label, quality, quality_label,
-                gender, is_family, is_club, floor_type,
-                created_at, updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s
-            )
-            ON CONFLICT (hotel_id, supplier_room_code) DO NOTHING
-            """,
-            (
-                room_id,
-                hotel_id,
-                _clip(code, 100),
-                name,
-                main_name,
-                flat.get("description"),
-                flat.get("bedding_type"),
-                flat.get("bathroom_type"),
-                flat.get("size"),
-                flat.get("capacity"),
-                flat.get("bedrooms"),
-                flat.get("balcony"),
-                flat.get("view_code"),
-                flat.get("view_type"),
-                flat.get("room_class"),
-                flat.get("class_label"),
-                flat.get("quality"),
-                flat.get("quality_label"),
-                flat.get("gender"),
-                flat.get("is_family"),
-                flat.get("is_club"),
-                flat.get("floor_type"),
-                now,
-                now,
-            ),
+            "SELECT id FROM hotel_crs_room_groups WHERE id = ANY(%s)",
+            ([row[0] for row in group_rows],),
         )
-        if not cur.rowcount:
-            continue
-        stats["roomGroupsSynced"] += 1
-
-        # Prefer merged images_ext entries (url + category); fall back to images[].
-        images = rg.get("images_ext") if isinstance(rg.get("images_ext"), list) else None
-        if not images:
-            images = rg.get("images") if isinstance(rg.get("images"), list) else []
-        for idx, item in enumerate(images[:30]):
-            category = None
-            if isinstance(item, dict):
-                resolved = resolve_ratehawk_image_url(str(item.get("url") or ""))
-                category = _clip(item.get("category_slug"), 100) or None
-            else:
-                resolved = resolve_ratehawk_image_url(str(item or ""))
-            if not resolved:
-                continue
-            cur.execute(
-                """
-                INSERT INTO hotel_crs_room_images (
-                    id, room_group_id, url, category_slug, sort_order, created_at, updated_at
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """,
-                (str(uuid4()), room_id, _clip(resolved, 2048), category, idx, now, now),
-            )
-            stats["roomImagesSynced"] += 1
-
-        for a in rg.get("room_amenities") or []:
-            label = a.strip() if isinstance(a, str) else str((a or {}).get("name") or "")
-            amenity_id = amenity_map.get(label)
-            if not amenity_id:
-                continue
-            cur.execute(
-                """
-                INSERT INTO hotel_crs_room_amenity_map (
-                    id, room_group_id, amenity_id, created_at, updated_at
-                ) VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (room_group_id, amenity_id) DO NOTHING
-                """,
-                (str(uuid4()), room_id, amenity_id, now, now),
-            )
-            stats["roomAmenitiesMapped"] += 1
+        kept = {str(row[0]) for row in cur.fetchall()}
+        image_rows = [row for row in image_rows if row[1] in kept]
+        amenity_rows = [row for row in amenity_rows if row[1] in kept]
+    stats["roomGroupsSynced"] = inserted
+    if image_rows:
+        db.copy_rows(cur, "hotel_crs_room_images", _ROOM_IMAGE_COLUMNS, image_rows)
+        stats["roomImagesSynced"] = len(image_rows)
+    stats["roomAmenitiesMapped"] = db.copy_merge(
+        cur,
+        "hotel_crs_room_amenity_map",
+        ("id", "room_group_id", "amenity_id", "created_at", "updated_at"),
+        amenity_rows,
+        on_conflict="(room_group_id, amenity_id) DO NOTHING",
+    )
+    # Denormalized for the admin inventory list (no per-row COUNT subquery).
+    cur.execute(
+        """
+        UPDATE hotel_crs_hotels h
+        SET room_count = (
+            SELECT COUNT(*) FROM hotel_crs_room_groups rg WHERE rg.hotel_id = h.id
+        )
+        WHERE h.id = ANY(%s)
+        """,
+        (hotel_ids,),
+    )
     return stats
 
 
@@ -845,7 +1017,8 @@ def _claim_staging_hotels(cur: Any, run_id: str, limit: int) -> list[dict[str, A
                amenity_names, image_urls, room_payload, policy_payload,
                accommodation_type, hotel_chain,
                check_in_time, check_in_time_end, check_out_time,
-               front_desk_time_start, front_desk_time_end, content_payload
+               front_desk_time_start, front_desk_time_end, content_payload,
+               content_hashes
         FROM staging_hotels
         WHERE mapping_run_id = %s
           AND hotel_promoted_at IS NULL
@@ -882,7 +1055,8 @@ def _claim_staging_for_rooms(cur: Any, run_id: str, limit: int) -> list[dict[str
                amenity_names, image_urls, room_payload, policy_payload,
                accommodation_type, hotel_chain,
                check_in_time, check_in_time_end, check_out_time,
-               front_desk_time_start, front_desk_time_end, content_payload
+               front_desk_time_start, front_desk_time_end, content_payload,
+               content_hashes
         FROM staging_hotels
         WHERE mapping_run_id = %s
           AND hotel_promoted_at IS NOT NULL
@@ -972,7 +1146,7 @@ def promote_hotels_batch(
 
     rows = _retry_on_deadlock(_claim, label="claim-hotels")
     if not rows:
-        return {"promoted": 0, "inserted": 0, "existing": 0}
+        return {"promoted": 0, "inserted": 0, "existing": 0, "changed": 0, "unchanged": 0}
 
     by_region: dict[str, list[dict[str, Any]]] = {}
     ids: list[str] = []
@@ -983,19 +1157,17 @@ def promote_hotels_batch(
         by_region.setdefault(region_id, []).append(blender)
         ids.append(str(row["id"]))
 
-    inserted = existing = 0
-
-    def _crs_write():
-        ins = ex = 0
+    def _crs_write() -> dict[str, int]:
+        totals = {"inserted": 0, "existing": 0, "changed": 0, "unchanged": 0}
         for region_id, hotels in by_region.items():
             if not region_id:
                 continue
             stats = deduplicate_and_insert(hotels, region_id, booking_source_id, sync_rooms=False)
-            ins += int(stats.get("inserted") or 0)
-            ex += int(stats.get("existing") or 0)
-        return ins, ex
+            for key in totals:
+                totals[key] += int(stats.get(key) or 0)
+        return totals
 
-    inserted, existing = _retry_on_deadlock(_crs_write, label=f"hotels run={run_id}")
+    written = _retry_on_deadlock(_crs_write, label=f"hotels run={run_id}")
 
     def _mark():
         with db.db_cursor() as (_, cur):
@@ -1010,28 +1182,15 @@ def promote_hotels_batch(
             )
 
     _retry_on_deadlock(_mark, label="mark-hotels")
-    return {"promoted": len(ids), "inserted": inserted, "existing": existing}
+    return {"promoted": len(ids), **written}
 
 
-def _room_groups_for_staging_row(
-    cur: Any,
-    *,
-    run_id: str,
-    row: dict[str, Any],
+def _merge_staged_rooms(
+    row: dict[str, Any], staged_rooms: list[tuple[Any, ...]]
 ) -> list[dict[str, Any]]:
+    """Room groups of one staging hotel: its room payload overlaid with ``staging_rooms``."""
     blender = staging_row_to_blender(row)
     room_groups = blender.get("room_groups") if isinstance(blender.get("room_groups"), list) else []
-    supplier_code = str(row["supplier_hotel_code"])
-    cur.execute(
-        """
-        SELECT room_group_id, name, main_name, description, amenity_slugs, image_urls,
-               rg_ext, name_struct, images_ext
-        FROM staging_rooms
-        WHERE mapping_run_id = %s AND supplier_hotel_code = %s
-        """,
-        (run_id, supplier_code),
-    )
-    staged_rooms = cur.fetchall()
     if not staged_rooms:
         return [rg for rg in room_groups if isinstance(rg, dict)]
 
@@ -1082,12 +1241,32 @@ def _room_groups_for_staging_row(
     return list(by_code.values())
 
 
+def _staged_rooms_by_code(
+    cur: Any, run_id: str, codes: list[str]
+) -> dict[str, list[tuple[Any, ...]]]:
+    cur.execute(
+        """
+        SELECT supplier_hotel_code, room_group_id, name, main_name, description,
+               amenity_slugs, image_urls, rg_ext, name_struct, images_ext
+        FROM staging_rooms
+        WHERE mapping_run_id = %s AND supplier_hotel_code = ANY(%s)
+        """,
+        (run_id, codes),
+    )
+    by_code: dict[str, list[tuple[Any, ...]]] = {}
+    for code, *room in cur.fetchall():
+        by_code.setdefault(str(code), []).append(tuple(room))
+    return by_code
+
+
 def promote_rooms_batch(
     run_id: str, booking_source_id: str, limit: int | None = None
 ) -> dict[str, int]:
     """Promote rooms/images/amenities for hotels already inserted into CRS.
 
-    Commits one hotel at a time so amenity locks and deletes stay short-lived.
+    The whole claimed batch is written set-based in one transaction
+    (:func:`_replace_rooms_bulk`). Amenity masters are upserted beforehand in their own
+    short transaction, so the amenity advisory lock is not held across the bulk write.
     """
     batch_size = limit or config.promote_batch_size()
 
@@ -1097,10 +1276,7 @@ def promote_rooms_batch(
 
     rows = _retry_on_deadlock(_claim, label="claim-rooms")
     if not rows:
-        return {"promoted": 0, "rooms_synced": 0}
-
-    rooms_synced = 0
-    promoted = 0
+        return {"promoted": 0, "rooms_synced": 0, "rooms_unchanged": 0}
 
     # Resolve supplier once (short txn).
     def _supplier() -> str:
@@ -1108,52 +1284,89 @@ def promote_rooms_batch(
             return _get_or_create_supplier(cur, booking_source_id)
 
     supplier_id = _retry_on_deadlock(_supplier, label="rooms-supplier")
+    staging_ids = [str(row["id"]) for row in rows]
+    codes = sorted({str(row["supplier_hotel_code"]) for row in rows})
 
-    for row in rows:
-        staging_id = str(row["id"])
-        supplier_code = str(row["supplier_hotel_code"])
-
-        def _one_hotel(
-            staging_id: str = staging_id,
-            supplier_code: str = supplier_code,
-            row: dict[str, Any] = row,
-        ) -> int:
-            with db.db_cursor() as (_, cur):
-                cur.execute(
-                    """
-                    SELECT hotel_id FROM hotel_crs_supplier_hotel_map
-                    WHERE supplier_id = %s AND supplier_hotel_code = %s
-                    LIMIT 1
-                    """,
-                    (supplier_id, supplier_code),
-                )
-                map_row = cur.fetchone()
-                synced = 0
-                if map_row:
-                    crs_hotel_id = str(map_row[0])
-                    room_groups = _room_groups_for_staging_row(cur, run_id=run_id, row=row)
-                    stats = _replace_rooms(cur, crs_hotel_id, room_groups, db._utc_now())
-                    synced = int(stats.get("roomGroupsSynced") or 0)
+    def _write() -> tuple[int, int]:
+        with db.db_cursor() as (_, cur):
+            cur.execute(
+                """
+                SELECT DISTINCT ON (supplier_hotel_code)
+                       supplier_hotel_code, hotel_id, content_hashes
+                FROM hotel_crs_supplier_hotel_map
+                WHERE supplier_id = %s AND supplier_hotel_code = ANY(%s)
+                ORDER BY supplier_hotel_code, updated_at DESC
+                """,
+                (supplier_id, codes),
+            )
+            maps = {str(code): (str(hid), _json_dict(h)) for code, hid, h in cur.fetchall()}
+            # hotel_id → (supplier code, staging row, rooms fingerprint)
+            pending: dict[str, tuple[str, dict[str, Any], str | None]] = {}
+            unchanged = 0
+            for row in rows:
+                code = str(row["supplier_hotel_code"])
+                if code not in maps:
+                    continue
+                hotel_id, stored = maps[code]
+                rooms_hash = _json_dict(row.get("content_hashes")).get("rooms")
+                if rooms_hash and stored.get("rooms") == rooms_hash:
+                    unchanged += 1
+                    continue
+                pending[hotel_id] = (code, row, rooms_hash)
+            staged = (
+                _staged_rooms_by_code(cur, run_id, sorted({v[0] for v in pending.values()}))
+                if pending
+                else {}
+            )
+        room_groups_by_hotel = {
+            hotel_id: _merge_staged_rooms(row, staged.get(code, []))
+            for hotel_id, (code, row, _) in pending.items()
+        }
+
+        with db.db_cursor() as (_, cur):
+            amenity_map = _ensure_amenities(
+                cur, _room_amenity_labels(room_groups_by_hotel.values())
+            )
+
+        with db.db_cursor() as (_, cur):
+            stats = _replace_rooms_bulk(cur, room_groups_by_hotel, amenity_map, db._utc_now())
+            hashed = [(code, hid, h) for hid, (code, _, h) in pending.items() if h]
+            if hashed:
                 cur.execute(
                     """
-                    UPDATE staging_hotels
-                    SET rooms_promoted_at = NOW(), updated_at = NOW()
-                    WHERE id = %s
+                    UPDATE hotel_crs_supplier_hotel_map m
+                    SET content_hashes = COALESCE(m.content_hashes, '{}'::jsonb)
+                            || jsonb_build_object('rooms', v.rooms_hash),
+                        updated_at = NOW()
+                    FROM unnest(%s::text[], %s::text[], %s::text[]) AS v(code, hotel_id, rooms_hash)
+                    WHERE m.supplier_id = %s
+                      AND m.supplier_hotel_code = v.code
+                      AND m.hotel_id = v.hotel_id
                     """,
-                    (staging_id,),
+                    (
+                        [h[0] for h in hashed],
+                        [h[1] for h in hashed],
+                        [h[2] for h in hashed],
+                        supplier_id,
+                    ),
                 )
-                return synced
-
-        try:
-            rooms_synced += int(
-                _retry_on_deadlock(_one_hotel, label=f"rooms hotel={supplier_code}")
+            cur.execute(
+                """
+                UPDATE staging_hotels
+                SET rooms_promoted_at = NOW(), updated_at = NOW()
+                WHERE id = ANY(%s)
+                """,
+                (staging_ids,),
             )
-            promoted += 1
-        except Exception:
-            # Leave rooms_promoted_at NULL so another worker can retry after claim TTL.
-            raise
+        return int(stats["roomGroupsSynced"]), unchanged
 
-    return {"promoted": promoted, "rooms_synced": rooms_synced}
+    # Left unmarked on failure, so another worker retries after the claim TTL.
+    rooms_synced, rooms_unchanged = _retry_on_deadlock(_write, label=f"rooms run={run_id}")
+    return {
+        "promoted": len(rows),
+        "rooms_synced": rooms_synced,
+        "rooms_unchanged": rooms_unchanged,
+    }
 
 
 def promote_hotels_once(run_id: str, booking_source_id: str) -> dict[str, Any]:
@@ -1162,12 +1375,61 @@ def promote_hotels_once(run_id: str, booking_source_id: str) -> dict[str, Any]:
         "promoted": stats["promoted"],
         "inserted": stats["inserted"],
         "existing": stats.get("existing", 0),
+        "changed": stats.get("changed", 0),
+        "unchanged": stats.get("unchanged", 0),
     }
 
 
 def promote_rooms_once(run_id: str, booking_source_id: str) -> dict[str, Any]:
     stats = promote_rooms_batch(run_id, booking_source_id)
-    return {"promoted": stats["promoted"], "rooms_synced": stats["rooms_synced"]}
+    return {
+        "promoted": stats["promoted"],
+        "rooms_synced": stats["rooms_synced"],
+        "rooms_unchanged": stats.get("rooms_unchanged", 0),
+    }
+
+
+def drop_unchanged_hotels(
+    booking_source_id: str,
+    hotel_values: list[tuple[Any, ...]],
+    room_values: list[tuple[Any, ...]],
+) -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]], int]:
+    """Drop parsed hotels (and their rooms) whose every fingerprint matches the supplier map.
+
+    Such hotels were promoted from identical content before, so they are neither staged nor
+    promoted again. Read-only: returns the remaining values and the number dropped.
+    """
+    if not hotel_values:
+        return hotel_values, room_values, 0
+    hashes_by_code = {
+        str(values[0]): db.staging_values_content_hashes(values) for values in hotel_values
+    }
+    codes = [code for code, hashes in hashes_by_code.items() if hashes]
+    if not codes:
+        return hotel_values, room_values, 0
+    with db.db_cursor() as (_, cur):
+        cur.execute(
+            """
+            SELECT id FROM hotel_crs_suppliers
+            WHERE booking_source_id = %s AND supplier_type = 'API'
+            LIMIT 1
+            """,
+            (booking_source_id,),
+        )
+        supplier = cur.fetchone()
+        if not supplier:
+            return hotel_values, room_values, 0
+        stored = _stored_content_hashes(cur, str(supplier[0]), codes)
+    unchanged = {
+        code
+        for (code, _hotel_id), hashes in stored.items()
+        if hashes and hashes == hashes_by_code.get(code)
+    }
+    if not unchanged:
+        return hotel_values, room_values, 0
+    hotels = [values for values in hotel_values if str(values[0]) not in unchanged]
+    rooms = [values for values in room_values if str(values[0]) not in unchanged]
+    return hotels, rooms, len(hotel_values) - len(hotels)
 
 
 def promote_until_empty(run_id: str, booking_source_id: str) -> dict[str, int]:
@@ -9,6 +9,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
+from luxtj.contexts.crs.infrastructure.static_content_version import bump_crs_static_generation_sync
+
 from . import db
 
 _MAPPING_BATCH = 2000
@@ -441,6 +443,8 @@ def reset_supplier_crs(
         if on_progress:
             on_progress("suppliers", stats)
 
+    bump_crs_static_generation_sync(booking_source_id)
+
     msg = "RateHawk hotel mapping data deleted successfully."
     if (
         stats["hotelsDeleted"] == 0
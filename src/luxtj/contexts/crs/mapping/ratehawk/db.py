@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import threading
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from typing import Any
@@ -525,83 +525,161 @@ def latest_region_run(booking_source_id: str) -> dict[str, Any] | None:
         return _row_to_dict(cur, cur.fetchone())
 
 
+def staging_hotel_values(hotel: dict[str, Any]) -> tuple[Any, ...]:
+    """``staging_hotels`` columns of one parsed hotel, JSON payloads already encoded.
+
+    Excludes the per-flush id / run / shard / timestamp columns so parse workers can build
+    it without knowing the run.
+    """
+    return (
+        hotel["supplier_hotel_code"],
+        hotel["dedupe_key"],
+        hotel.get("region_id"),
+        hotel.get("code"),
+        hotel["name"],
+        hotel.get("star_rating") or 0,
+        hotel.get("description") or "",
+        hotel.get("address_line1") or "",
+        hotel.get("address_line2") or "",
+        hotel.get("postal_code") or "",
+        hotel.get("location") or "",
+        hotel.get("latitude"),
+        hotel.get("longitude"),
+        hotel.get("phone") or "",
+        hotel.get("email") or "",
+        hotel.get("image") or "",
+        json_dumps(hotel.get("amenity_names") or []),
+        json_dumps(hotel.get("image_urls") or []),
+        json_dumps(hotel.get("room_payload") or []),
+        json_dumps(hotel.get("policy_payload") or {}),
+        hotel.get("accommodation_type"),
+        hotel.get("hotel_chain"),
+        hotel.get("check_in_time"),
+        hotel.get("check_in_time_end"),
+        hotel.get("check_out_time"),
+        hotel.get("front_desk_time_start"),
+        hotel.get("front_desk_time_end"),
+        json_dumps(hotel.get("content_payload") or {}),
+        json_dumps(hotel.get("content_hashes") or {}),
+    )
+
+
+def staging_values_content_hashes(values: tuple[Any, ...]) -> dict[str, str]:
+    """Section fingerprints of a :func:`staging_hotel_values` tuple (last column)."""
+    hashes = json.loads(values[-1]) if values[-1] else {}
+    return hashes if isinstance(hashes, dict) else {}
+
+
+def staging_room_values(room: dict[str, Any]) -> tuple[Any, ...]:
+    """``staging_rooms`` columns of one parsed room group (see :func:`staging_hotel_values`)."""
+    return (
+        room["supplier_hotel_code"],
+        room["room_group_id"],
+        room.get("name") or "",
+        room.get("main_name"),
+        room.get("description") or "",
+        json_dumps(room.get("amenity_slugs") or []),
+        json_dumps(room.get("image_urls") or []),
+        json_dumps(room.get("rg_ext") or {}),
+        json_dumps(room.get("name_struct") or {}),
+        json_dumps(room.get("images_ext") or []),
+    )
+
+
 def flush_staging(
     run_id: str,
     shard_index: int,
     hotel_batch: list[dict[str, Any]],
     room_batch: list[dict[str, Any]],
 ) -> None:
-    if not hotel_batch and not room_batch:
+    flush_staging_values(
+        run_id,
+        shard_index,
+        [staging_hotel_values(hotel) for hotel in hotel_batch],
+        [staging_room_values(room) for room in room_batch],
+    )
+
+
+_STAGING_ROOM_COLUMNS = (
+    "id",
+    "mapping_run_id",
+    "shard_index",
+    "supplier_hotel_code",
+    "room_group_id",
+    "name",
+    "main_name",
+    "description",
+    "amenity_slugs",
+    "image_urls",
+    "rg_ext",
+    "name_struct",
+    "images_ext",
+    "created_at",
+    "updated_at",
+)
+
+
+def copy_rows(cur: Any, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+    """Bulk load ``rows`` into ``table`` with one ``COPY … FROM STDIN``.
+
+    Text format: JSON columns arrive as already encoded strings and Postgres casts every
+    value to its column type, as with ``%s::jsonb`` parameters.
+    """
+    with cur.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+
+
+def copy_merge(
+    cur: Any,
+    table: str,
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    *,
+    on_conflict: str = "DO NOTHING",
+) -> int:
+    """``COPY`` rows into a session temp table shaped like ``table``, then merge them with
+    ``INSERT … SELECT … ON CONFLICT`` (``COPY`` itself cannot skip conflicting rows).
+
+    Returns the number of rows inserted or updated.
+    """
+    if not rows:
+        return 0
+    temp = f"_copy_{table}"
+    cur.execute(
+        f"CREATE TEMP TABLE IF NOT EXISTS {temp} "
+        f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+    )
+    cur.execute(f"TRUNCATE {temp}")
+    copy_rows(cur, temp, columns, rows)
+    cols = ", ".join(columns)
+    cur.execute(f"INSERT INTO {table} ({cols}) SELECT {cols} FROM {temp} ON CONFLICT {on_conflict}")
+    return int(cur.rowcount or 0)
+
+
+def flush_staging_values(
+    run_id: str,
+    shard_index: int,
+    hotel_values: list[tuple[Any, ...]],
+    room_values: list[tuple[Any, ...]],
+) -> None:
+    if not hotel_values and not room_values:
         return
     now = _utc_now()
-    hotel_rows = []
-    for hotel in hotel_batch:
-        hotel_rows.append(
-            (
-                str(uuid4()),
-                run_id,
-                shard_index,
-                hotel["supplier_hotel_code"],
-                hotel["dedupe_key"],
-                hotel.get("region_id"),
-                hotel.get("code"),
-                hotel["name"],
-                hotel.get("star_rating") or 0,
-                hotel.get("description") or "",
-                hotel.get("address_line1") or "",
-                hotel.get("address_line2") or "",
-                hotel.get("postal_code") or "",
-                hotel.get("location") or "",
-                hotel.get("latitude"),
-                hotel.get("longitude"),
-                hotel.get("phone") or "",
-                hotel.get("email") or "",
-                hotel.get("image") or "",
-                json_dumps(hotel.get("amenity_names") or []),
-                json_dumps(hotel.get("image_urls") or []),
-                json_dumps(hotel.get("room_payload") or []),
-                json_dumps(hotel.get("policy_payload") or {}),
-                hotel.get("accommodation_type"),
-                hotel.get("hotel_chain"),
-                hotel.get("check_in_time"),
-                hotel.get("check_in_time_end"),
-                hotel.get("check_out_time"),
-                hotel.get("front_desk_time_start"),
-                hotel.get("front_desk_time_end"),
-                json_dumps(hotel.get("content_payload") or {}),
-                now,
-                now,
-            )
-        )
-    seen_rooms: set[str] = set()
+    hotel_rows = [(str(uuid4()), run_id, shard_index, *values, now, now) for values in hotel_values]
+    seen_rooms: set[tuple[Any, Any]] = set()
     room_rows = []
-    for room in room_batch:
-        key = f"{room['supplier_hotel_code']}|{room['room_group_id']}"
+    for values in room_values:
+        key = (values[0], values[1])
         if key in seen_rooms:
             continue
         seen_rooms.add(key)
-        room_rows.append(
-            (
-                str(uuid4()),
-                run_id,
-                shard_index,
-                room["supplier_hotel_code"],
-                room["room_group_id"],
-                room.get("name") or "",
-                room.get("main_name"),
-                room.get("description") or "",
-                json_dumps(room.get("amenity_slugs") or []),
-                json_dumps(room.get("image_urls") or []),
-                json_dumps(room.get("rg_ext") or {}),
-                json_dumps(room.get("name_struct") or {}),
-                json_dumps(room.get("images_ext") or []),
-                now,
-                now,
-            )
-        )
+        room_rows.append((str(uuid4()), run_id, shard_index, *values, now, now))
 
     with db_cursor() as (_, cur):
         if hotel_rows:
+            # executemany, not COPY: these rows are mostly large JSON, and COPY measured
+            # no faster for them; rooms are where it pays off.
             cur.executemany(
                 """
                 INSERT INTO staging_hotels (
@@ -613,29 +691,23 @@ def flush_staging(
                     accommodation_type, hotel_chain,
                     check_in_time, check_in_time_end, check_out_time,
                     front_desk_time_start, front_desk_time_end, content_payload,
-                    created_at, updated_at
+                    content_hashes, created_at, updated_at
                 ) VALUES (
                     %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,
                     %s::jsonb,%s::jsonb,%s::jsonb,%s::jsonb,
-                    %s,%s,%s,%s,%s,%s,%s,%s::jsonb,%s,%s
+                    %s,%s,%s,%s,%s,%s,%s,%s::jsonb,%s::jsonb,%s,%s
                 )
                 """,
                 hotel_rows,
             )
         if room_rows:
-            cur.executemany(
-                """
-                INSERT INTO staging_rooms (
-                    id, mapping_run_id, shard_index, supplier_hotel_code, room_group_id,
-                    name, main_name, description, amenity_slugs, image_urls,
-                    rg_ext, name_struct, images_ext, created_at, updated_at
-                ) VALUES (
-                    %s,%s,%s,%s,%s,%s,%s,%s,%s::jsonb,%s::jsonb,
-                    %s::jsonb,%s::jsonb,%s::jsonb,%s,%s
-                )
-                ON CONFLICT (mapping_run_id, supplier_hotel_code, room_group_id) DO NOTHING
-                """,
+            # A resumed batch may re-stage rooms of its last flush; keep the first copy.
+            copy_merge(
+                cur,
+                "staging_rooms",
+                _STAGING_ROOM_COLUMNS,
                 room_rows,
+                on_conflict="(mapping_run_id, supplier_hotel_code, room_group_id) DO NOTHING",
             )
 
 
@@ -0,0 +1,158 @@
+"""Hotel dump line parsing, in-process or fanned out to a process pool.
+
+``json.loads`` + :func:`parse_for_staging` (image URLs, amenities, MD5 dedupe keys) is pure
+Python and bound to one core under the GIL. :class:`DumpLineParser` parses chunks of
+dump lines in ``workers`` processes and returns ready-to-insert
+staging values (:func:`db.staging_hotel_values`) in dump order, so line checkpoints keep
+their meaning. The reader thread decompresses the next chunk while workers parse.
+
+Lines may be raw ``bytes`` straight from :class:`~.zstd_lines.ZstLineReader`: they skip
+the UTF-8 decode in the reader and are smaller to pickle to the workers.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import threading
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from .db import staging_hotel_values, staging_room_values
+from .parser import parse_for_staging
+
+# Region map installed once per worker process by the pool initializer.
+_WORKER_REGION_MAP: dict[str, str] = {}
+
+
+def hotel_region_code(hotel: dict[str, Any]) -> str:
+    """RateHawk hotel dump nests the id under region.id (not top-level region_id)."""
+    region = hotel.get("region") if isinstance(hotel.get("region"), dict) else {}
+    raw = region.get("id")
+    if raw is None or raw == "":
+        raw = hotel.get("region_id") or hotel.get("regionId")
+    return str(raw).strip() if raw is not None and str(raw).strip() else ""
+
+
+def parse_dump_line(line: str | bytes, region_map: dict[str, str]) -> dict[str, Any] | None:
+    """One dump line → ``{"staging": …, "rooms": […]}``, or None when it is skipped."""
+    try:
+        obj = json.loads(line)
+    except UnicodeDecodeError:
+        # Invalid UTF-8 bytes: parse with replacement characters, as decoded lines were.
+        try:
+            obj = json.loads(line.decode("utf-8", errors="replace"))  # type: ignore[union-attr]
+        except json.JSONDecodeError:
+            return None
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(obj, dict):
+        return None
+    region_code = hotel_region_code(obj)
+    region_id = region_map.get(region_code) if region_code else None
+    if not region_id:
+        return None
+    return parse_for_staging(obj, region_id)
+
+
+@dataclass(slots=True)
+class ParsedLines:
+    lines: int = 0
+    skipped: int = 0
+    hotel_values: list[tuple[Any, ...]] = field(default_factory=list)
+    room_values: list[tuple[Any, ...]] = field(default_factory=list)
+
+    def extend(self, other: ParsedLines) -> None:
+        self.lines += other.lines
+        self.skipped += other.skipped
+        self.hotel_values.extend(other.hotel_values)
+        self.room_values.extend(other.room_values)
+
+
+def parse_lines(
+    lines: Sequence[str | bytes], region_map: dict[str, str] | None = None
+) -> ParsedLines:
+    region_map = _WORKER_REGION_MAP if region_map is None else region_map
+    out = ParsedLines(lines=len(lines))
+    for line in lines:
+        parsed = parse_dump_line(line, region_map)
+        if parsed is None:
+            out.skipped += 1
+            continue
+        out.hotel_values.append(staging_hotel_values(parsed["staging"]))
+        out.room_values.extend(staging_room_values(room) for room in parsed["rooms"])
+    return out
+
+
+def _init_worker(region_map: dict[str, str]) -> None:
+    global _WORKER_REGION_MAP
+    _WORKER_REGION_MAP = region_map
+
+
+class DumpLineParser:
+    """Parse dump lines with ``workers`` processes (``workers <= 1`` parses in-process)."""
+
+    def __init__(
+        self,
+        region_map: dict[str, str],
+        *,
+        workers: int,
+        chunk_lines: int = 500,
+    ) -> None:
+        self._region_map = region_map
+        self.workers = max(1, workers)
+        self.chunk_lines = max(1, chunk_lines)
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> DumpLineParser:
+        if self.workers > 1:
+            # spawn: the mapper process already runs DB threads, which must not be forked.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._region_map,),
+            )
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def parse_chunks(
+        self,
+        chunks: Iterable[Sequence[str | bytes]],
+        stop: threading.Event | None = None,
+    ) -> ParsedLines:
+        """Parse ready-made chunks (e.g. :meth:`ZstLineReader.iter_batches` with
+        ``batch_lines=chunk_lines``) in order; stops early once ``stop`` is set."""
+        if self._pool is not None:
+            return self._parse_in_pool(chunks, stop)
+        out = ParsedLines()
+        for chunk in chunks:
+            out.extend(parse_lines(chunk, self._region_map))
+            if stop is not None and stop.is_set():
+                break
+        return out
+
+    def _parse_in_pool(
+        self, chunks: Iterable[Sequence[str | bytes]], stop: threading.Event | None
+    ) -> ParsedLines:
+        assert self._pool is not None
+        out = ParsedLines()
+        pending: deque[Future[ParsedLines]] = deque()
+        max_pending = self.workers * 2
+        for chunk in chunks:
+            pending.append(self._pool.submit(parse_lines, chunk))
+            while len(pending) >= max_pending:
+                out.extend(pending.popleft().result())
+            if stop is not None and stop.is_set():
+                break
+        # Results are collected in submission order, so ``out`` stays in dump line order.
+        while pending:
+            out.extend(pending.popleft().result())
+        return out
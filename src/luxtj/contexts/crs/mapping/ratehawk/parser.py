@@ -445,9 +445,47 @@ def parse_for_staging(
         "front_desk_time_end": fd_end,
         "content_payload": content_payload,
     }
+    staging["content_hashes"] = content_fingerprints(staging, rooms)
     return {"staging": staging, "rooms": rooms}
 
 
+# Bump when promote starts writing parsed content differently, so every hotel re-promotes.
+CONTENT_HASH_VERSION = 1
+
+# Staging keys owned by a section other than "hotel".
+_NON_HOTEL_KEYS = frozenset(
+    {"supplier_hotel_code", "image_urls", "amenity_names", "room_payload", "content_payload"}
+)
+
+
+def _fingerprint(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{CONTENT_HASH_VERSION}:".encode())
+    digest.update(payload.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def content_fingerprints(staging: dict[str, Any], rooms: list[dict[str, Any]]) -> dict[str, str]:
+    """One fingerprint per promoted content section: hotel row + policies/content children,
+    hotel images, hotel amenities and room groups.
+
+    Equal fingerprints mean promote would write the same CRS rows again, so re-mapping can
+    skip the section (see ``crs_promote.deduplicate_and_insert``).
+    """
+    content = staging.get("content_payload") or {}
+    hotel = {k: v for k, v in staging.items() if k not in _NON_HOTEL_KEYS}
+    hotel["content_payload"] = {
+        k: v for k, v in content.items() if k not in ("images_ext", "amenity_entries")
+    }
+    return {
+        "hotel": _fingerprint(hotel),
+        "images": _fingerprint([staging.get("image_urls"), content.get("images_ext")]),
+        "amenities": _fingerprint([staging.get("amenity_names"), content.get("amenity_entries")]),
+        "rooms": _fingerprint([rooms, staging.get("room_payload")]),
+    }
+
+
 def staging_to_blender(staging: dict[str, Any]) -> dict[str, Any]:
     content = (
         staging.get("content_payload") if isinstance(staging.get("content_payload"), dict) else {}
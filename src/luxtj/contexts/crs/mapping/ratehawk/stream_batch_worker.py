@@ -10,7 +10,7 @@ from . import config, db, stream_mapper, streaming_state
 from .credentials import load_ratehawk_api
 
 
-def cmd_start(*, force_new: bool = False) -> int:
+def cmd_start(*, force_new: bool = False, parse_workers: int | None = None) -> int:
     creds = load_ratehawk_api()
     booking_source_id = str(creds["booking_source_id"])
 
@@ -18,7 +18,7 @@ def cmd_start(*, force_new: bool = False) -> int:
         resumable_id = db.find_resumable_full_stream_run(booking_source_id)
         if resumable_id:
             print(f"Resuming incomplete run #{resumable_id}", flush=True)
-            return cmd_resume(resumable_id)
+            return cmd_resume(resumable_id, parse_workers=parse_workers)
 
     if db.has_active_parent_run(booking_source_id):
         print("A full hotel mapping run is already active.", file=sys.stderr)
@@ -28,7 +28,7 @@ def cmd_start(*, force_new: bool = False) -> int:
     print(f"Created run #{run_id}", flush=True)
     db.update_run(run_id, status="running", started_at=db._utc_now())
 
-    mapper = stream_mapper.StreamMapper(run_id, booking_source_id)
+    mapper = stream_mapper.StreamMapper(run_id, booking_source_id, parse_workers=parse_workers)
     try:
         zst_path = mapper.prepare_download()
         mapper.init_streaming(zst_path)
@@ -42,7 +42,7 @@ def cmd_start(*, force_new: bool = False) -> int:
     return 0 if (run or {}).get("status") == "completed" else 1
 
 
-def cmd_resume(run_id: str) -> int:
+def cmd_resume(run_id: str, *, parse_workers: int | None = None) -> int:
     run = db.fetch_run(run_id)
     if not run or run.get("parent_run_id"):
         print(f"Parent run {run_id} not found.", file=sys.stderr)
@@ -66,7 +66,7 @@ def cmd_resume(run_id: str) -> int:
         },
     )
 
-    mapper = stream_mapper.StreamMapper(run_id, booking_source_id)
+    mapper = stream_mapper.StreamMapper(run_id, booking_source_id, parse_workers=parse_workers)
     try:
         zst_path = str(run.get("zst_path") or (config.storage_path() / "hotels.zst"))
         if not run.get("zst_path") or not __import__("pathlib").Path(zst_path).is_file():
@@ -88,13 +88,19 @@ def main() -> int:
     parser.add_argument("command", choices=["start", "resume"])
     parser.add_argument("run_id", nargs="?", default="")
     parser.add_argument("--force-new", action="store_true")
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="dump parsing processes (default: LTJBE_RATEHAWK_STREAM_PARSE_WORKERS)",
+    )
     args = parser.parse_args()
     if args.command == "start":
-        return cmd_start(force_new=args.force_new)
+        return cmd_start(force_new=args.force_new, parse_workers=args.parse_workers)
     if not args.run_id:
         print("resume requires run_id", file=sys.stderr)
         return 1
-    return cmd_resume(args.run_id)
+    return cmd_resume(args.run_id, parse_workers=args.parse_workers)
 
 
 if __name__ == "__main__":
@@ -1,92 +1,96 @@
-"""Full hotel dump stream: download → extract/stage → promote with DB checkpoints."""
+"""Full hotel dump stream: download → pipelined extract / stage / promote with DB checkpoints.
+
+Extraction, staging and promotion overlap: while batch N promotes, batch N+1 is decompressed,
+parsed and staged (see :meth:`StreamMapper._run_pipeline`).
+"""
 
 from __future__ import annotations
 
 import json
 import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from luxtj.contexts.crs.infrastructure.static_content_version import bump_crs_static_generation_sync
+
 from . import api_client, config, crs_promote, db, storage_cleanup, streaming_state
-from .parser import parse_for_staging
-from .zstd_lines import ZstLineReader, count_zst_lines, zst_compressed_size
+from .parse_pool import DumpLineParser
+from .zstd_lines import ZstLineReader, estimate_zst_lines, zst_compressed_size
 
 
 def _log(msg: str) -> None:
     print(f"[ratehawk-hotel] {msg}", flush=True)
 
 
-def _hotel_region_code(hotel: dict[str, Any]) -> str:
-    """RateHawk hotel dump nests the id under region.id (not top-level region_id)."""
-    region = hotel.get("region") if isinstance(hotel.get("region"), dict) else {}
-    raw = region.get("id")
-    if raw is None or raw == "":
-        raw = hotel.get("region_id") or hotel.get("regionId")
-    return str(raw).strip() if raw is not None and str(raw).strip() else ""
-
-
 def _lines_total_from_state(state: dict[str, Any]) -> int:
     return int(state.get("zst_lines_total") or 0)
 
 
-def _batch_target(*, remaining: int, batch_cap: int) -> int:
-    """Use remaining when smaller than cap; otherwise cap; last batch = remaining."""
-    if remaining <= 0:
-        return 0
-    return min(batch_cap, remaining)
+@dataclass(slots=True)
+class _ParsedBatch:
+    """Up to ``stream_extract_lines`` dump lines, parsed into staging row values."""
+
+    index: int
+    start_line: int
+    next_line: int = 0
+    lines_read: int = 0
+    skipped: int = 0
+    eof: bool = False
+    lines_per_second: float = 0.0
+    # Reader's extrapolated dump total after this batch (0 = unknown).
+    lines_total_estimate: int = 0
+    hotel_values: list[tuple[Any, ...]] = field(default_factory=list)
+    room_values: list[tuple[Any, ...]] = field(default_factory=list)
 
 
 class StreamMapper:
-    def __init__(self, run_id: str, booking_source_id: str) -> None:
+    def __init__(
+        self, run_id: str, booking_source_id: str, *, parse_workers: int | None = None
+    ) -> None:
         self.run_id = run_id
         self.booking_source_id = booking_source_id
+        self.parse_workers = max(1, parse_workers or config.stream_parse_workers())
         self.storage = config.storage_path()
         self.storage.mkdir(parents=True, exist_ok=True)
         self._zst_reader: ZstLineReader | None = None
         self._region_map: dict[str, str] | None = None
+        self._state_lock = threading.Lock()
 
     def batch_jsonl_path(self) -> Path:
+        # Written only by runs checkpointed before the pipelined mapper; staged on resume.
         return self.storage / f"run_{self.run_id}_current_batch.jsonl"
 
     def run_until_complete(self) -> None:
         _log(f"run #{self.run_id} starting pipeline loop")
-        while True:
-            run = db.fetch_run(self.run_id)
-            if not run or db.is_cancelled(run):
-                _log(f"run #{self.run_id} cancelled or missing — stop")
-                return
-
-            state = streaming_state.load(self.run_id)
-            batch = state.get("current_batch") or {}
-            phase = str(batch.get("phase") or "extract")
-            _log(
-                f"run #{self.run_id} phase={phase} "
-                f"batch=#{int(batch.get('index') or 0)} "
-                f"line={int(state.get('zst_next_line') or 1)}"
-            )
-
-            if phase == "complete":
-                self._finalize()
-                return
-
-            if phase == "extract":
-                if not self._extract_batch(state):
-                    return
-                continue
+        run = db.fetch_run(self.run_id)
+        if not run or db.is_cancelled(run):
+            _log(f"run #{self.run_id} cancelled or missing — stop")
+            return
 
+        state = streaming_state.load(self.run_id)
+        batch = state.get("current_batch") or {}
+        phase = str(batch.get("phase") or "extract")
+        _log(
+            f"run #{self.run_id} phase={phase} "
+            f"batch=#{int(batch.get('index') or 0)} "
+            f"line={int(state.get('zst_next_line') or 1)}"
+        )
+        if phase != "complete":
+            # Older checkpoints may stop mid-batch: "stage" still has its rows in the batch
+            # file; later phases already staged them, and the pipeline promotes leftovers.
             if phase == "stage":
-                self._stage_batch()
-                continue
-
-            if phase in ("hotels", "rooms", "promote"):
-                self._promote_pipeline(state)
-                continue
-
-            if phase == "cleanup":
-                self._cleanup_batch(state)
-                continue
-
-            streaming_state.save(self.run_id, {"current_batch": streaming_state.empty_batch(0)})
+                self._stage_legacy_batch_file()
+            self.batch_jsonl_path().unlink(missing_ok=True)
+            if not self._run_pipeline(state):
+                # Hotels promoted before the stop are live; search caches must re-read them.
+                bump_crs_static_generation_sync(self.booking_source_id)
+                return
+        self._finalize()
 
     def prepare_download(self) -> str:
         zst_path = str(self.storage / "hotels.zst")
@@ -172,13 +176,14 @@ class StreamMapper:
         if self._zst_reader is None:
 
             def on_progress(pos: int, total: int) -> None:
-                state = streaming_state.load(self.run_id)
-                prev = int(state.get("zst_bytes_read") or 0)
-                if pos >= prev:
-                    streaming_state.save(
-                        self.run_id,
-                        {"zst_bytes_read": pos, "zst_bytes_total": total},
-                    )
+                with self._state_lock:
+                    state = streaming_state.load(self.run_id)
+                    prev = int(state.get("zst_bytes_read") or 0)
+                    if pos >= prev:
+                        streaming_state.save(
+                            self.run_id,
+                            {"zst_bytes_read": pos, "zst_bytes_total": total},
+                        )
 
             self._zst_reader = ZstLineReader(zst_path, on_compressed_progress=on_progress)
         return self._zst_reader
@@ -203,217 +208,33 @@ class StreamMapper:
             _log(f"run #{self.run_id} using line estimate={estimate}")
             return estimate
 
-        _log(f"run #{self.run_id} counting dump lines (one-time)…")
-        db.merge_meta(
-            self.run_id,
-            "hotel_mapping_runs",
-            {"stream_phase": "counting", "phase": "streaming"},
-        )
-        total = count_zst_lines(zst_path)
+        # Extrapolated from a decompressed sample instead of a full counting pass; the stager
+        # refines it from the reader's compressed position and records the real total at EOF.
+        total = estimate_zst_lines(zst_path)
         streaming_state.save(
             self.run_id,
             {
                 "zst_lines_total": total,
-                "zst_lines_total_is_estimate": False,
+                "zst_lines_total_is_estimate": True,
             },
         )
-        db.merge_meta(self.run_id, "hotel_mapping_runs", {"stream_phase": "extract"})
-        _log(f"run #{self.run_id} dump lines total={total}")
+        _log(f"run #{self.run_id} estimated dump lines total≈{total}")
         return total
 
-    def _extract_batch(self, state: dict[str, Any]) -> bool:
-        zst_path = str(state.get("zst_path") or "")
-        if not zst_path or not Path(zst_path).is_file():
-            fail_run(self.run_id, "hotels.zst missing")
-            return False
-
-        lines_total = self._ensure_lines_total(state, zst_path)
-        # reload after possible count write
-        state = streaming_state.load(self.run_id)
-        start_line = int(state.get("zst_next_line") or 1)
-        remaining = max(0, lines_total - (start_line - 1))
-        batch_cap = config.stream_extract_lines()
-        target = _batch_target(remaining=remaining, batch_cap=batch_cap)
-        batch_index = int((state.get("current_batch") or {}).get("index") or 0)
-
-        if target <= 0:
-            streaming_state.save(
-                self.run_id,
-                {
-                    "current_batch": {
-                        "index": batch_index,
-                        "phase": "complete",
-                        "extract_done": 0,
-                        "extract_target": 0,
-                        "batch_lines_done": 0,
-                        "batch_size_cap": batch_cap,
-                    }
-                },
-            )
-            return True
-
-        region_map = self._region_lookup()
-        path = self.batch_jsonl_path()
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        streaming_state.save(
-            self.run_id,
-            {
-                "current_batch": {
-                    "index": batch_index,
-                    "phase": "extract",
-                    "zst_start_line": start_line,
-                    "extract_target": target,
-                    "extract_done": 0,
-                    "batch_lines_done": 0,
-                    "batch_size_cap": batch_cap,
-                }
-            },
-        )
-        _log(
-            f"run #{self.run_id} extract batch=#{batch_index} "
-            f"start={start_line} target={target} remaining={remaining} cap={batch_cap}"
-        )
-
-        extracted = 0
-        skipped = 0
-        lines_read = 0
-        reader = self._reader(zst_path)
-        with path.open("w", encoding="utf-8") as out:
-            for line in reader.read_lines(start_line, target):
-                lines_read += 1
-                if lines_read % 500 == 0:
-                    run = db.fetch_run(self.run_id)
-                    if db.is_cancelled(run):
-                        return False
-                    streaming_state.save(
-                        self.run_id,
-                        {
-                            "current_batch": {
-                                "index": batch_index,
-                                "phase": "extract",
-                                "extract_done": extracted,
-                                "extract_target": target,
-                                "batch_lines_done": lines_read,
-                                "batch_size_cap": batch_cap,
-                                "zst_start_line": start_line,
-                            }
-                        },
-                    )
-                try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
-                    skipped += 1
-                    continue
-                if not isinstance(obj, dict):
-                    skipped += 1
-                    continue
-                region_code = _hotel_region_code(obj)
-                region_id = region_map.get(region_code) if region_code else None
-                if not region_id:
-                    skipped += 1
-                    continue
-                parsed = parse_for_staging(obj, region_id)
-                if not parsed:
-                    skipped += 1
-                    continue
-                out.write(json.dumps(parsed, ensure_ascii=False) + "\n")
-                extracted += 1
-
-        next_line = reader.next_line
-        # If estimate was high and we hit EOF early, correct the total.
-        hit_eof = bool(getattr(reader, "_eof", False)) and lines_read < target
-        if hit_eof:
-            actual_total = start_line - 1 + lines_read
-            streaming_state.save(
-                self.run_id,
-                {
-                    "zst_lines_total": actual_total,
-                    "zst_lines_total_is_estimate": False,
-                },
-            )
-            lines_total = actual_total
-            target = max(lines_read, 1) if lines_read else 0
-
-        if lines_read == 0:
-            streaming_state.save(
-                self.run_id,
-                {
-                    "zst_next_line": next_line,
-                    "current_batch": {
-                        "index": batch_index,
-                        "phase": "complete",
-                        "extract_done": 0,
-                        "extract_target": 0,
-                        "batch_lines_done": 0,
-                        "batch_size_cap": batch_cap,
-                    },
-                },
-            )
-            return True
-
-        # Batch progress denominator = actual lines this batch (last batch shrinks)
-        batch_target = lines_read if lines_read < target or hit_eof else target
-
-        streaming_state.save(
-            self.run_id,
-            {
-                "zst_next_line": next_line,
-                "zst_lines_total": lines_total,
-                "current_batch": {
-                    "index": batch_index,
-                    "phase": "stage" if extracted > 0 else "cleanup",
-                    "extract_done": extracted,
-                    "extract_target": batch_target,
-                    "batch_lines_done": lines_read,
-                    "batch_size_cap": batch_cap,
-                    "zst_start_line": start_line,
-                    "hotels_staged": 0,
-                    "rooms_staged": 0,
-                },
-                "totals": {
-                    "processed_lines": int((state.get("totals") or {}).get("processed_lines") or 0)
-                    + lines_read,
-                    "skipped": int((state.get("totals") or {}).get("skipped") or 0) + skipped,
-                },
-            },
-        )
-        db.merge_meta(
-            self.run_id,
-            "hotel_mapping_runs",
-            {"stream_phase": "stage" if extracted > 0 else "cleanup"},
-        )
-        if extracted == 0 and next_line > start_line:
-            # progressed but nothing staged (all skipped) — continue extract
-            streaming_state.save(
-                self.run_id,
-                {
-                    "current_batch": {
-                        "index": batch_index + 1,
-                        "phase": "extract",
-                        "extract_done": 0,
-                        "extract_target": 0,
-                        "batch_lines_done": 0,
-                        "batch_size_cap": batch_cap,
-                    }
-                },
-            )
-        return True
+    def _save_state(self, patch: dict[str, Any]) -> dict[str, Any]:
+        # streaming_state.save is a read-modify-write of run meta; pipeline threads share it.
+        with self._state_lock:
+            return streaming_state.save(self.run_id, patch)
 
-    def _stage_batch(self) -> None:
+    def _stage_legacy_batch_file(self) -> None:
+        """Stage a batch JSONL left by a run checkpointed before the pipelined mapper."""
         path = self.batch_jsonl_path()
         if not path.is_file():
-            streaming_state.save(self.run_id, {"current_batch": {"phase": "extract"}})
             return
         hotel_batch: list[dict[str, Any]] = []
         room_batch: list[dict[str, Any]] = []
-        hotels_staged = rooms_staged = 0
-        flush_size = config.stream_stage_batch()
         with path.open("r", encoding="utf-8") as handle:
             for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
                 try:
                     parsed = json.loads(line)
                 except json.JSONDecodeError:
@@ -425,180 +246,283 @@ class StreamMapper:
                 hotel_batch.append(staging)
                 if isinstance(rooms, list):
                     room_batch.extend(rooms)
-                if len(hotel_batch) >= flush_size:
-                    db.flush_staging(self.run_id, 0, hotel_batch, room_batch)
-                    hotels_staged += len(hotel_batch)
-                    rooms_staged += len(room_batch)
-                    hotel_batch = []
-                    room_batch = []
-        if hotel_batch or room_batch:
-            db.flush_staging(self.run_id, 0, hotel_batch, room_batch)
-            hotels_staged += len(hotel_batch)
-            rooms_staged += len(room_batch)
-
-        streaming_state.save(
-            self.run_id,
-            {
-                "current_batch": {
-                    "phase": "promote",
-                    "hotels_staged": hotels_staged,
-                    "rooms_staged": rooms_staged,
-                    "hotels_promoted": 0,
-                    "rooms_promoted": 0,
-                }
-            },
-        )
-        db.merge_meta(self.run_id, "hotel_mapping_runs", {"stream_phase": "promote"})
-
-    def _promote_pipeline(self, state: dict[str, Any]) -> None:
-        """2 hotel + 2 room workers with SKIP LOCKED claims (Teenva parity)."""
-        import threading
-        import time
-        from concurrent.futures import ThreadPoolExecutor
-
-        staged = int(
-            (state.get("current_batch") or {}).get("hotels_staged")
-            or db.count_staging_hotels(self.run_id)
-        )
-        left_hotels = crs_promote.count_unpromoted_hotels(self.run_id)
-        left_rooms = crs_promote.count_pending_room_hotels(self.run_id)
-        if staged > 0 and left_hotels <= 0 and left_rooms <= 0:
-            _log(f"run #{self.run_id} promote already done → cleanup")
-            streaming_state.save(self.run_id, {"current_batch": {"phase": "cleanup"}})
-            db.merge_meta(self.run_id, "hotel_mapping_runs", {"stream_phase": "cleanup"})
-            return
+        db.flush_staging(self.run_id, 0, hotel_batch, room_batch)
+        path.unlink(missing_ok=True)
+        _log(f"run #{self.run_id} staged legacy batch file hotels={len(hotel_batch)}")
+
+    def _run_pipeline(self, state: dict[str, Any]) -> bool:
+        """Extract, stage and promote concurrently until the dump is exhausted.
+
+        The extractor thread parses ``stream_extract_lines`` lines per batch into a queue of
+        ``stream_queue_depth`` batches; the stager writes each batch to staging in one
+        transaction and only then advances ``zst_next_line``, so a resume never skips
+        unstaged lines. Promote workers claim staged rows the whole time (they are keyed by
+        run, not batch); the stager waits while more than ``stream_max_staged_backlog``
+        hotels are unpromoted so staging cannot outrun promotion without bound.
+        Returns False when the run was cancelled or failed before completion.
+        """
+        zst_path = str(state.get("zst_path") or "")
+        if not zst_path or not Path(zst_path).is_file():
+            fail_run(self.run_id, "hotels.zst missing")
+            return False
 
+        self._ensure_lines_total(state, zst_path)
+        state = streaming_state.load(self.run_id)
+        lines_total_is_estimate = bool(state.get("zst_lines_total_is_estimate"))
+        start_line = int(state.get("zst_next_line") or 1)
+        first_index = int((state.get("current_batch") or {}).get("index") or 0)
+        batch_cap = config.stream_extract_lines()
+        max_backlog = config.stream_max_staged_backlog()
         hotel_workers = max(1, int(config.promote_hotel_workers()))
         room_workers = max(1, int(config.promote_room_workers()))
-        state_lock = threading.Lock()
-        totals_box = {
-            "inserted": int((state.get("totals") or {}).get("inserted_hotels") or 0),
-            "rooms_synced": int((state.get("totals") or {}).get("rooms_synced") or 0),
-        }
-        stop_status = threading.Event()
+        region_map = self._region_lookup()
+        reader = self._reader(zst_path)
+
+        batches: queue.Queue[_ParsedBatch | None] = queue.Queue(
+            maxsize=max(1, config.stream_queue_depth())
+        )
+        stop = threading.Event()
+        staging_done = threading.Event()
+        cancelled = threading.Event()
         errors: list[BaseException] = []
+        totals = state.get("totals") or {}
+        counters = {
+            "staged": db.count_staging_hotels(self.run_id),
+            "processed_lines": int(totals.get("processed_lines") or 0),
+            "skipped": int(totals.get("skipped") or 0),
+            "inserted": int(totals.get("inserted_hotels") or 0),
+            "changed": int(totals.get("hotels_changed") or 0),
+            "unchanged": int(totals.get("hotels_unchanged") or 0),
+            "rooms_synced": int(totals.get("rooms_synced") or 0),
+            "rooms_unchanged": int(totals.get("rooms_unchanged") or 0),
+        }
+        counters_lock = threading.Lock()
+        lines_before = counters["processed_lines"]
+        pipeline_started = time.perf_counter()
 
-        def publish() -> None:
-            hotels_promoted = crs_promote.count_hotels_promoted(self.run_id)
-            rooms_promoted = crs_promote.count_rooms_promoted(self.run_id)
-            with state_lock:
-                streaming_state.save(
-                    self.run_id,
-                    {
-                        "totals": {
-                            "inserted_hotels": totals_box["inserted"],
-                            "rooms_synced": totals_box["rooms_synced"],
-                        },
-                        "current_batch": {
-                            "hotels_staged": staged,
-                            "hotels_promoted": hotels_promoted,
-                            "rooms_promoted": rooms_promoted,
-                            "phase": "promote",
-                        },
-                    },
-                )
-                db.merge_meta(
-                    self.run_id,
-                    "hotel_mapping_runs",
-                    {"stream_phase": "promote", "heartbeat_at": db._iso_now()},
-                )
-            _log(
-                f"run #{self.run_id} STATUS hotels={hotels_promoted}/{staged} "
-                f"rooms={rooms_promoted}/{staged} workers=H{hotel_workers}/R{room_workers}"
-            )
+        def fail(exc: BaseException) -> None:
+            errors.append(exc)
+            stop.set()
 
-        def status_worker() -> None:
-            while not stop_status.wait(5.0):
+        def put(item: _ParsedBatch | None) -> bool:
+            while not stop.is_set():
                 try:
-                    publish()
-                except Exception as exc:
-                    _log(f"run #{self.run_id} status publish error: {exc}")
+                    batches.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def extractor() -> None:
+            try:
+                with DumpLineParser(region_map, workers=self.parse_workers) as line_parser:
+                    index, line_no = first_index, start_line
+                    while not stop.is_set():
+                        started = time.perf_counter()
+                        parsed = line_parser.parse_chunks(
+                            reader.iter_batches(
+                                line_no, batch_cap, line_parser.chunk_lines, as_bytes=True
+                            ),
+                            stop,
+                        )
+                        if stop.is_set():
+                            return
+                        elapsed = time.perf_counter() - started
+                        batch = _ParsedBatch(
+                            index=index,
+                            start_line=line_no,
+                            next_line=reader.next_line,
+                            lines_read=parsed.lines,
+                            skipped=parsed.skipped,
+                            eof=parsed.lines < batch_cap,
+                            lines_per_second=parsed.lines / elapsed if elapsed > 0 else 0.0,
+                            lines_total_estimate=reader.estimated_lines_total(),
+                            hotel_values=parsed.hotel_values,
+                            room_values=parsed.room_values,
+                        )
+                        if not put(batch) or batch.eof:
+                            break
+                        index, line_no = index + 1, batch.next_line
+                    put(None)
+            except BaseException as exc:
+                fail(exc)
+
+        def wait_for_backlog() -> None:
+            while not stop.is_set():
+                if crs_promote.count_unpromoted_hotels(self.run_id) <= max_backlog:
+                    return
+                stop.wait(0.25)
+
+        def stager() -> None:
+            try:
+                while not stop.is_set():
+                    try:
+                        batch = batches.get(timeout=0.5)
+                    except queue.Empty:
+                        continue
+                    if batch is None:
+                        staging_done.set()
+                        return
+                    wait_for_backlog()
+                    if stop.is_set():
+                        return
+                    # Hotels fingerprinted identical to their last promote stay out of staging.
+                    hotel_values, room_values, unchanged = crs_promote.drop_unchanged_hotels(
+                        self.booking_source_id, batch.hotel_values, batch.room_values
+                    )
+                    db.flush_staging_values(self.run_id, 0, hotel_values, room_values)
+                    with counters_lock:
+                        counters["staged"] += len(hotel_values)
+                        counters["unchanged"] += unchanged
+                        counters["processed_lines"] += batch.lines_read
+                        counters["skipped"] += batch.skipped
+                        patch: dict[str, Any] = {
+                            "zst_next_line": batch.next_line,
+                            "parse_lines_per_second": round(batch.lines_per_second, 1),
+                            "current_batch": {
+                                **streaming_state.empty_batch(batch.index + 1),
+                                "zst_start_line": batch.next_line,
+                                "batch_size_cap": batch_cap,
+                                "hotels_staged": counters["staged"],
+                            },
+                            "totals": {
+                                "processed_lines": counters["processed_lines"],
+                                "skipped": counters["skipped"],
+                            },
+                        }
+                    if batch.eof:
+                        # Read to EOF rather than trusting an estimate; record the real total.
+                        patch["zst_lines_total"] = batch.next_line - 1
+                        patch["zst_lines_total_is_estimate"] = False
+                    elif lines_total_is_estimate and batch.lines_total_estimate > 0:
+                        patch["zst_lines_total"] = batch.lines_total_estimate
+                    self._save_state(patch)
+                    _log(
+                        f"run #{self.run_id} staged batch=#{batch.index} "
+                        f"lines={batch.start_line}-{batch.next_line - 1} "
+                        f"hotels={len(hotel_values)} unchanged={unchanged} "
+                        f"skipped={batch.skipped} "
+                        f"parse={batch.lines_per_second:.0f} lines/s"
+                    )
+            except BaseException as exc:
+                fail(exc)
 
         def hotel_worker(worker_id: int) -> None:
             try:
-                while True:
-                    run = db.fetch_run(self.run_id) or {}
-                    if db.is_cancelled(run):
-                        break
+                while not stop.is_set():
                     stats = crs_promote.promote_hotels_once(self.run_id, self.booking_source_id)
                     promoted_n = int(stats.get("promoted") or 0)
                     if promoted_n > 0:
-                        with state_lock:
-                            totals_box["inserted"] += int(stats.get("inserted") or 0)
+                        with counters_lock:
+                            counters["inserted"] += int(stats.get("inserted") or 0)
+                            counters["changed"] += int(stats.get("changed") or 0)
+                            counters["unchanged"] += int(stats.get("unchanged") or 0)
                         _log(f"run #{self.run_id} HOTEL w{worker_id} +{promoted_n}")
                         continue
-                    if crs_promote.count_unpromoted_hotels(self.run_id) <= 0:
-                        break
-                    time.sleep(0.1)
+                    done = staging_done.is_set()
+                    if done and crs_promote.count_unpromoted_hotels(self.run_id) <= 0:
+                        return
+                    stop.wait(0.1)
             except BaseException as exc:
-                errors.append(exc)
-                raise
+                fail(exc)
 
         def room_worker(worker_id: int) -> None:
             try:
-                while True:
-                    run = db.fetch_run(self.run_id) or {}
-                    if db.is_cancelled(run):
-                        break
+                while not stop.is_set():
                     stats = crs_promote.promote_rooms_once(self.run_id, self.booking_source_id)
                     promoted_n = int(stats.get("promoted") or 0)
                     if promoted_n > 0:
-                        with state_lock:
-                            totals_box["rooms_synced"] += int(stats.get("rooms_synced") or 0)
+                        with counters_lock:
+                            counters["rooms_synced"] += int(stats.get("rooms_synced") or 0)
+                            counters["rooms_unchanged"] += int(stats.get("rooms_unchanged") or 0)
                         _log(f"run #{self.run_id} ROOM w{worker_id} +{promoted_n}")
                         continue
-                    # Wait for hotels to finish promoting before exiting if rooms still pending
-                    left_h = crs_promote.count_unpromoted_hotels(self.run_id)
-                    left_r = crs_promote.count_pending_room_hotels(self.run_id)
-                    if left_h <= 0 and left_r <= 0:
-                        break
-                    time.sleep(0.15)
+                    done = staging_done.is_set()
+                    if (
+                        done
+                        and crs_promote.count_unpromoted_hotels(self.run_id) <= 0
+                        and crs_promote.count_pending_room_hotels(self.run_id) <= 0
+                    ):
+                        return
+                    stop.wait(0.15)
             except BaseException as exc:
-                errors.append(exc)
-                raise
+                fail(exc)
 
-        total_workers = hotel_workers + room_workers + 1
-        _log(f"run #{self.run_id} promote parallel hotels={hotel_workers} rooms={room_workers}")
-        with ThreadPoolExecutor(max_workers=total_workers, thread_name_prefix="rh-promote") as pool:
-            futures = [pool.submit(status_worker)]
+        def publish() -> None:
+            hotels_promoted = crs_promote.count_hotels_promoted(self.run_id)
+            rooms_promoted = crs_promote.count_rooms_promoted(self.run_id)
+            with counters_lock:
+                staged = counters["staged"]
+                patch = {
+                    "totals": {
+                        "inserted_hotels": counters["inserted"],
+                        "hotels_new": counters["inserted"],
+                        "hotels_changed": counters["changed"],
+                        "hotels_unchanged": counters["unchanged"],
+                        "rooms_synced": counters["rooms_synced"],
+                        "rooms_unchanged": counters["rooms_unchanged"],
+                    },
+                    "current_batch": {
+                        "hotels_staged": staged,
+                        "hotels_promoted": hotels_promoted,
+                        "rooms_promoted": rooms_promoted,
+                    },
+                }
+            self._save_state(patch)
+            _log(
+                f"run #{self.run_id} STATUS line={reader.next_line} queued={batches.qsize()} "
+                f"hotels={hotels_promoted}/{staged} rooms={rooms_promoted}/{staged} "
+                f"new={counters['inserted']} changed={counters['changed']} "
+                f"unchanged={counters['unchanged']} "
+                f"workers=H{hotel_workers}/R{room_workers}"
+            )
+
+        pipeline_done = threading.Event()
+
+        def status_worker() -> None:
+            # Cancellation is polled here once per tick instead of by every worker loop.
+            while not pipeline_done.wait(5.0):
+                try:
+                    if db.is_cancelled(db.fetch_run(self.run_id)):
+                        cancelled.set()
+                        stop.set()
+                        return
+                    publish()
+                except Exception as exc:
+                    _log(f"run #{self.run_id} status publish error: {exc}")
+
+        _log(
+            f"run #{self.run_id} pipeline start line={start_line} batch=#{first_index} "
+            f"cap={batch_cap} queue={batches.maxsize} backlog={max_backlog} "
+            f"workers=H{hotel_workers}/R{room_workers} parse_workers={self.parse_workers}"
+        )
+        db.merge_meta(self.run_id, "hotel_mapping_runs", {"stream_phase": "extract"})
+        total_workers = hotel_workers + room_workers + 3
+        with ThreadPoolExecutor(max_workers=total_workers, thread_name_prefix="rh-stream") as pool:
+            status = pool.submit(status_worker)
+            futures = [pool.submit(extractor), pool.submit(stager)]
             futures.extend(pool.submit(hotel_worker, i) for i in range(hotel_workers))
             futures.extend(pool.submit(room_worker, i) for i in range(room_workers))
-            # Wait for hotel+room workers (not status)
-            for fut in futures[1:]:
+            for fut in futures:
                 fut.result()
-            stop_status.set()
-            futures[0].result()
+            pipeline_done.set()
+            status.result()
 
         if errors:
             raise errors[0]
-
         publish()
-        streaming_state.save(self.run_id, {"current_batch": {"phase": "cleanup"}})
-        db.merge_meta(self.run_id, "hotel_mapping_runs", {"stream_phase": "cleanup"})
-
-    def _cleanup_batch(self, state: dict[str, Any]) -> None:
-        path = self.batch_jsonl_path()
-        path.unlink(missing_ok=True)
-        batch = state.get("current_batch") or {}
-        next_index = int(batch.get("index") or 0) + 1
-        # If extract returned nothing useful at EOF, phase already complete
-        zst_next = int(state.get("zst_next_line") or 1)
-        zst_path = str(state.get("zst_path") or "")
-        # Heuristic: if last extract_done was 0 and we already cleaned, check EOF via reader
-        if self._zst_reader and self._zst_reader._eof:
-            streaming_state.save(
-                self.run_id,
-                {"current_batch": {"index": next_index, "phase": "complete"}},
-            )
-            return
-        streaming_state.save(
-            self.run_id,
-            {
-                "current_batch": streaming_state.empty_batch(next_index),
-            },
+        elapsed = time.perf_counter() - pipeline_started
+        lines = counters["processed_lines"] - lines_before
+        _log(
+            f"run #{self.run_id} pipeline lines={lines} in {elapsed:.1f}s "
+            f"({lines / elapsed if elapsed > 0 else 0:.0f} lines/s, "
+            f"parse_workers={self.parse_workers})"
         )
-        db.merge_meta(self.run_id, "hotel_mapping_runs", {"stream_phase": "extract"})
-        del zst_next, zst_path
+        if cancelled.is_set() or not staging_done.is_set():
+            _log(f"run #{self.run_id} cancelled — pipeline stopped")
+            return False
+        self._save_state({"current_batch": {"phase": "complete"}})
+        return True
 
     def _finalize(self) -> None:
         if self._zst_reader:
@@ -606,6 +530,8 @@ class StreamMapper:
             self._zst_reader = None
         # Promote any remaining staging
         crs_promote.promote_until_empty(self.run_id, self.booking_source_id)
+        # Once per run: search caches key CRS static details by this generation.
+        bump_crs_static_generation_sync(self.booking_source_id)
         state = streaming_state.load(self.run_id)
         totals = state.get("totals") if isinstance(state.get("totals"), dict) else {}
         inserted = int(totals.get("inserted_hotels") or 0)
@@ -25,6 +25,11 @@ def default_state(
             "inserted_hotels": 0,
             "skipped": 0,
             "rooms_synced": 0,
+            # Re-mapping: hotels by content fingerprint against the last promote.
+            "hotels_new": 0,
+            "hotels_changed": 0,
+            "hotels_unchanged": 0,
+            "rooms_unchanged": 0,
         },
         "updated_at": db._iso_now(),
     }
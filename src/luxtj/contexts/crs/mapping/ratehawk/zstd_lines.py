@@ -1,3 +1,12 @@
+"""Line readers over ``.zst`` JSONL dumps.
+
+Each decompressed chunk (1 MiB) is split into lines with a single ``bytes.split`` and the
+resulting list is consumed by offset, so every byte is copied once per chunk instead of
+re-copying the rest of the buffer for each line. Lines are stripped and blank lines
+skipped; they can be returned as ``bytes`` (``json.loads`` accepts UTF-8 bytes directly)
+or decoded ``str``.
+"""
+
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
@@ -8,6 +17,19 @@ import zstandard as zstd
 
 ProgressCb = Callable[[int, int], None]
 
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _decode(line: bytes) -> str:
+    return line.decode("utf-8", errors="replace")
+
+
+def _split_chunk(carry: bytes, chunk: bytes) -> tuple[list[bytes], bytes]:
+    """Complete non-empty lines of ``carry + chunk`` and the trailing partial line."""
+    parts = (carry + chunk if carry else chunk).split(b"\n")
+    tail = parts.pop()
+    return [stripped for part in parts if (stripped := part.strip())], tail
+
 
 def iter_zst_lines(zst_path: str | Path) -> Iterator[str]:
     """Yield decompressed UTF-8 lines from a .zst JSONL dump without writing a full extract."""
@@ -20,65 +42,21 @@ def iter_zst_lines_range(
     max_lines: int | None = None,
     *,
     on_compressed_progress: ProgressCb | None = None,
-) -> Iterator[str]:
+    as_bytes: bool = False,
+) -> Iterator[Any]:
     """Yield up to max_lines decompressed lines, starting at start_line (1-based).
 
     ``on_compressed_progress(compressed_pos, compressed_total)`` is called as the
     underlying .zst file is read (best-effort byte offset into the compressed file).
     """
-    if start_line < 1:
-        start_line = 1
-    path = Path(zst_path)
-    if not path.is_file():
-        raise FileNotFoundError(f"zst file not found: {path}")
-
-    compressed_total = int(path.stat().st_size)
-    dctx = zstd.ZstdDecompressor()
-    line_no = 0
-    yielded = 0
-    with path.open("rb") as fh, dctx.stream_reader(fh) as reader:
-        buffer = b""
-
-        def _emit_progress() -> None:
-            if on_compressed_progress is None:
-                return
-            try:
-                pos = int(fh.tell())
-            except Exception:
-                return
-            on_compressed_progress(pos, compressed_total)
-
+    reader = ZstLineReader(zst_path, on_compressed_progress=on_compressed_progress)
+    try:
         if on_compressed_progress is not None:
-            on_compressed_progress(0, compressed_total)
-
-        while True:
-            if max_lines is not None and yielded >= max_lines:
-                break
-            chunk = reader.read(1024 * 1024)
-            if not chunk:
-                break
-            _emit_progress()
-            buffer += chunk
-            while b"\n" in buffer:
-                line, buffer = buffer.split(b"\n", 1)
-                text = line.decode("utf-8", errors="replace").strip()
-                if not text:
-                    continue
-                line_no += 1
-                if line_no < start_line:
-                    continue
-                yield text
-                yielded += 1
-                if max_lines is not None and yielded >= max_lines:
-                    _emit_progress()
-                    return
-        if buffer.strip() and (max_lines is None or yielded < max_lines):
-            line_no += 1
-            if line_no >= start_line:
-                text = buffer.decode("utf-8", errors="replace").strip()
-                if text:
-                    yield text
-        _emit_progress()
+            on_compressed_progress(0, reader.compressed_total)
+        for batch in reader.iter_batches(start_line, max_lines, as_bytes=as_bytes):
+            yield from batch
+    finally:
+        reader.close()
 
 
 class ZstLineReader:
@@ -102,15 +80,16 @@ class ZstLineReader:
         self.next_line = 1  # 1-based number of the next line to be returned
         self._fh: Any = None
         self._reader: Any = None
-        self._buffer = b""
+        # Lines of the current chunk; ``_pos`` is the next one to hand out.
+        self._lines: list[bytes] = []
+        self._pos = 0
+        self._carry = b""
         self._eof = False
 
     def _open(self) -> None:
         self.close()
         self._fh = self.path.open("rb")
         self._reader = zstd.ZstdDecompressor().stream_reader(self._fh)
-        self._buffer = b""
-        self._eof = False
         self.next_line = 1
 
     def close(self) -> None:
@@ -122,41 +101,63 @@ class ZstLineReader:
                     pass
         self._reader = None
         self._fh = None
-        self._buffer = b""
+        self._lines = []
+        self._pos = 0
+        self._carry = b""
         self._eof = False
 
-    def _emit_progress(self) -> None:
-        if self.on_compressed_progress is None or self._fh is None:
-            return
+    @property
+    def compressed_pos(self) -> int:
+        """Bytes of the .zst file consumed so far (includes the decompressor's read-ahead)."""
+        if self._fh is None:
+            return 0
         try:
-            pos = int(self._fh.tell())
+            return int(self._fh.tell())
         except Exception:
+            return 0
+
+    def estimated_lines_total(self) -> int:
+        """Total line count extrapolated from lines read per compressed byte so far."""
+        pos = self.compressed_pos
+        read = self.next_line - 1
+        if self._eof and self._pos >= len(self._lines):
+            return read
+        if pos <= 0 or read <= 0:
+            return 0
+        return max(read, round(read * self.compressed_total / pos))
+
+    def _emit_progress(self) -> None:
+        if self.on_compressed_progress is None or self._fh is None:
             return
-        self.on_compressed_progress(pos, self.compressed_total)
-
-    def _next_raw_line(self) -> str | None:
-        """Next non-empty decompressed line, or None at EOF."""
-        while True:
-            idx = self._buffer.find(b"\n")
-            if idx >= 0:
-                line, self._buffer = self._buffer[:idx], self._buffer[idx + 1 :]
-                text = line.decode("utf-8", errors="replace").strip()
-                if text:
-                    return text
-                continue
+        pos = self.compressed_pos
+        if pos:
+            self.on_compressed_progress(pos, self.compressed_total)
+
+    def _fill(self) -> bool:
+        """Load the next chunk's lines once the current ones are used up; False at EOF."""
+        while self._pos >= len(self._lines):
             if self._eof:
-                if self._buffer.strip():
-                    text = self._buffer.decode("utf-8", errors="replace").strip()
-                    self._buffer = b""
-                    if text:
-                        return text
-                return None
-            chunk = self._reader.read(1024 * 1024)
-            if not chunk:
+                return False
+            chunk = self._reader.read(_CHUNK_SIZE)
+            if chunk:
+                self._emit_progress()
+                self._lines, self._carry = _split_chunk(self._carry, chunk)
+            else:
                 self._eof = True
-                continue
-            self._emit_progress()
-            self._buffer += chunk
+                tail = self._carry.strip()
+                self._lines, self._carry = ([tail] if tail else []), b""
+            self._pos = 0
+        return True
+
+    def _take(self, limit: int | None) -> list[bytes]:
+        """Up to ``limit`` lines from the current chunk (empty only at EOF)."""
+        if not self._fill():
+            return []
+        end = len(self._lines) if limit is None else min(len(self._lines), self._pos + limit)
+        lines = self._lines[self._pos : end]
+        self._pos = end
+        self.next_line += len(lines)
+        return lines
 
     def seek_line(self, start_line: int) -> None:
         if start_line < 1:
@@ -164,28 +165,71 @@ class ZstLineReader:
         if self._fh is None or start_line < self.next_line:
             self._open()
         while self.next_line < start_line:
-            if self._next_raw_line() is None:
+            if not self._take(start_line - self.next_line):
                 break
-            self.next_line += 1
 
-    def read_lines(self, start_line: int, max_lines: int | None) -> Iterator[str]:
+    def iter_batches(
+        self,
+        start_line: int,
+        max_lines: int | None,
+        batch_lines: int | None = None,
+        *,
+        as_bytes: bool = False,
+    ) -> Iterator[list[Any]]:
+        """Yield lists of up to ``batch_lines`` lines (default: the rest of each chunk)."""
         self.seek_line(start_line)
-        yielded = 0
-        while max_lines is None or yielded < max_lines:
-            line = self._next_raw_line()
-            if line is None:
+        remaining = max_lines
+        while remaining is None or remaining > 0:
+            want = batch_lines
+            if remaining is not None:
+                want = remaining if want is None else min(want, remaining)
+            batch = self._take(want)
+            if not batch:
                 break
-            self.next_line += 1
-            yielded += 1
-            yield line
+            if batch_lines is not None:
+                # Fixed-size batches span chunk boundaries.
+                while want is not None and len(batch) < want:
+                    more = self._take(want - len(batch))
+                    if not more:
+                        break
+                    batch.extend(more)
+            if remaining is not None:
+                remaining -= len(batch)
+            yield batch if as_bytes else [_decode(line) for line in batch]
         self._emit_progress()
 
+    def read_lines(
+        self, start_line: int, max_lines: int | None, *, as_bytes: bool = False
+    ) -> Iterator[Any]:
+        for batch in self.iter_batches(start_line, max_lines, as_bytes=as_bytes):
+            yield from batch
+
 
 def count_zst_lines(zst_path: str | Path) -> int:
-    total = 0
-    for _ in iter_zst_lines(zst_path):
-        total += 1
-    return total
+    """Exact line count (decompresses the whole dump; prefer :func:`estimate_zst_lines`)."""
+    reader = ZstLineReader(zst_path)
+    try:
+        return sum(len(batch) for batch in reader.iter_batches(1, None, as_bytes=True))
+    finally:
+        reader.close()
+
+
+def estimate_zst_lines(zst_path: str | Path, *, sample_bytes: int = 64 * 1024 * 1024) -> int:
+    """Line count extrapolated from the first ``sample_bytes`` of decompressed output.
+
+    Exact when the dump is smaller than the sample. The compressed offset includes the
+    decompressor's read-ahead, so small samples slightly underestimate.
+    """
+    reader = ZstLineReader(zst_path)
+    try:
+        decompressed = 0
+        for batch in reader.iter_batches(1, None, as_bytes=True):
+            decompressed += sum(len(line) + 1 for line in batch)
+            if decompressed >= sample_bytes:
+                break
+        return reader.estimated_lines_total()
+    finally:
+        reader.close()
 
 
 def zst_compressed_size(zst_path: str | Path) -> int:
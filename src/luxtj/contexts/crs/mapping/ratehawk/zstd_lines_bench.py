@@ -0,0 +1,223 @@
+"""Synthetic benchmark for the ``.zst`` dump line readers.
+
+Writes a multi-GB ``.zst`` JSONL dump of hotel-shaped lines (or reuses ``--path``) and times:
+
+* the previous per-line ``find`` + buffer re-slice loop, on the first ``--legacy-mb`` of
+  decompressed output only (it re-copies the rest of the 1 MiB buffer for every line);
+* :func:`~luxtj.contexts.crs.mapping.ratehawk.zstd_lines.iter_zst_lines` (decoded ``str``);
+* :meth:`ZstLineReader.iter_batches` with ``as_bytes=True`` (what the stream mapper reads);
+* :func:`estimate_zst_lines` against the exact :func:`count_zst_lines` pass.
+
+The generated dump is removed afterwards unless ``--keep``.
+
+Usage::
+
+    python -m luxtj.contexts.crs.mapping.ratehawk.zstd_lines_bench --gb 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import zstandard as zstd
+
+from luxtj.contexts.crs.mapping.ratehawk.zstd_lines import (
+    ZstLineReader,
+    count_zst_lines,
+    estimate_zst_lines,
+    iter_zst_lines,
+)
+
+_MIB = 1024 * 1024
+# Distinct rendered hotels; the dump cycles through them with fresh ids.
+_TEMPLATES = 2048
+
+_WORDS = (
+    "grand royal palace garden plaza ocean river park city central sunset harbour lake "
+    "mountain villa resort inn suites"
+).split()
+
+
+def synthetic_hotel_line(rng: random.Random, n: int) -> bytes:
+    """One hotel-shaped dump line (``id`` left as a ``{id}`` placeholder)."""
+
+    def words(k: int) -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(k))
+
+    hotel = {
+        "id": "bench_hotel_{id}",
+        "hid": n,
+        "name": f"{words(2).title()} {n}",
+        "address": f"{n % 997} {words(2).title()} Street",
+        "latitude": round(rng.uniform(-80, 80), 6),
+        "longitude": round(rng.uniform(-180, 180), 6),
+        "star_rating": rng.randint(0, 5),
+        "region": {"id": n % 5000, "name": words(1).title(), "country_code": "TJ"},
+        "images": [
+            f"https://cdn.example.com/content/{n}/{i}/{{size}}.jpg"
+            for i in range(rng.randint(5, 40))
+        ],
+        "amenity_groups": [
+            {"group_name": words(1).title(), "amenities": words(rng.randint(3, 12)).split()}
+            for _ in range(rng.randint(2, 8))
+        ],
+        "description_struct": [
+            {"title": words(2).title(), "paragraphs": [words(40) for _ in range(3)]}
+            for _ in range(rng.randint(1, 4))
+        ],
+        "room_groups": [
+            {
+                "room_group_id": r,
+                "name": f"{words(3).title()} Room",
+                "images": [f"https://cdn.example.com/rooms/{n}/{r}/{i}.jpg" for i in range(6)],
+                "room_amenities": words(rng.randint(4, 15)).split(),
+            }
+            for r in range(rng.randint(1, 12))
+        ],
+    }
+    return json.dumps(hotel, ensure_ascii=False).encode() + b"\n"
+
+
+def _write_dump(path: Path, size_bytes: int) -> tuple[int, int]:
+    """Write ~``size_bytes`` of decompressed JSONL to ``path``; returns (lines, bytes)."""
+    rng = random.Random(20261018)
+    head, tails = b'{"id": "bench_hotel_', []
+    for n in range(_TEMPLATES):
+        rendered = synthetic_hotel_line(rng, n)
+        tails.append(rendered.removeprefix(head + b'{id}"'))
+    lines = written = 0
+    cctx = zstd.ZstdCompressor(level=3, threads=-1)
+    with path.open("wb") as fh, cctx.stream_writer(fh) as writer:
+        while written < size_bytes:
+            line = b'%s%d"%s' % (head, lines + 1, tails[lines % _TEMPLATES])
+            writer.write(line)
+            written += len(line)
+            lines += 1
+    return lines, written
+
+
+def _legacy_lines(path: Path, limit_bytes: int) -> Iterator[str]:
+    """The previous reader loop, stopped after ``limit_bytes`` of decompressed input."""
+    with path.open("rb") as fh, zstd.ZstdDecompressor().stream_reader(fh) as reader:
+        buffer = b""
+        consumed = 0
+        while consumed < limit_bytes:
+            idx = buffer.find(b"\n")
+            if idx >= 0:
+                line, buffer = buffer[:idx], buffer[idx + 1 :]
+                consumed += idx + 1
+                text = line.decode("utf-8", errors="replace").strip()
+                if text:
+                    yield text
+                continue
+            chunk = reader.read(_MIB)
+            if not chunk:
+                return
+            buffer += chunk
+
+
+def _report(label: str, lines: int, size_bytes: int, seconds: float) -> None:
+    rate = size_bytes / _MIB / seconds if seconds > 0 else float("inf")
+    per_sec = lines / seconds if seconds > 0 else float("inf")
+    print(
+        f"{label:<34} lines={lines:>11,}  {seconds:8.2f}s  {per_sec:>12,.0f} lines/s  "
+        f"{rate:8.1f} MiB/s",
+        flush=True,
+    )
+
+
+def run(path: Path, *, size_bytes: int, legacy_bytes: int) -> None:
+    started = time.perf_counter()
+    count = 0
+    for _ in _legacy_lines(path, legacy_bytes):
+        count += 1
+    label = f"legacy loop (first {legacy_bytes // _MIB} MiB)"
+    _report(label, count, legacy_bytes, _elapsed(started))
+
+    started = time.perf_counter()
+    count = 0
+    for _ in iter_zst_lines(path):
+        count += 1
+    _report("iter_zst_lines (str)", count, size_bytes, _elapsed(started))
+
+    reader = ZstLineReader(path)
+    try:
+        started = time.perf_counter()
+        count = sum(len(batch) for batch in reader.iter_batches(1, None, as_bytes=True))
+        _report("ZstLineReader.iter_batches (bytes)", count, size_bytes, _elapsed(started))
+    finally:
+        reader.close()
+
+    started = time.perf_counter()
+    estimate = estimate_zst_lines(path)
+    estimate_s = _elapsed(started)
+    started = time.perf_counter()
+    exact = count_zst_lines(path)
+    exact_s = _elapsed(started)
+    error = (estimate - exact) / exact * 100 if exact else 0.0
+    print(
+        f"{'lines total':<34} estimate={estimate:,} in {estimate_s:.2f}s  "
+        f"exact={exact:,} in {exact_s:.2f}s  error={error:+.2f}%",
+        flush=True,
+    )
+
+
+def _elapsed(started: float) -> float:
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="RateHawk .zst dump line reader benchmark")
+    parser.add_argument("--gb", type=float, default=2.0, help="decompressed size to generate")
+    parser.add_argument("--path", help="benchmark an existing .zst dump instead")
+    parser.add_argument(
+        "--legacy-mb",
+        type=int,
+        default=256,
+        help="decompressed MiB fed to the legacy loop (it is far slower than the rest)",
+    )
+    parser.add_argument("--keep", action="store_true", help="keep the generated dump")
+    args = parser.parse_args()
+    if args.gb <= 0 or args.legacy_mb <= 0:
+        print("--gb and --legacy-mb must be positive", file=sys.stderr)
+        return 1
+
+    if args.path:
+        path = Path(args.path)
+        if not path.is_file():
+            print(f"no such dump: {path}", file=sys.stderr)
+            return 1
+        with path.open("rb") as fh, zstd.ZstdDecompressor().stream_reader(fh) as reader:
+            size_bytes = sum(len(chunk) for chunk in iter(lambda: reader.read(16 * _MIB), b""))
+        run(path, size_bytes=size_bytes, legacy_bytes=min(size_bytes, args.legacy_mb * _MIB))
+        return 0
+
+    fd, name = tempfile.mkstemp(prefix="ratehawk_bench_", suffix=".jsonl.zst")
+    os.close(fd)
+    path = Path(name)
+    try:
+        started = time.perf_counter()
+        print(f"writing {args.gb:g} GiB synthetic dump to {path} ...", flush=True)
+        lines, size_bytes = _write_dump(path, int(args.gb * 1024 * _MIB))
+        print(
+            f"wrote {lines:,} lines ({path.stat().st_size / _MIB:,.0f} MiB compressed) "
+            f"in {_elapsed(started):.1f}s",
+            flush=True,
+        )
+        run(path, size_bytes=size_bytes, legacy_bytes=min(size_bytes, args.legacy_mb * _MIB))
+    finally:
+        if not args.keep:
+            path.unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -27,6 +27,7 @@ class HotelListBody(BaseModel):
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=25, ge=1, le=50, alias="pageSize")
     status: bool | None = True
+    cursor: str | None = None
 
     model_config = {"populate_by_name": True}
 
@@ -45,6 +46,7 @@ async def list_hotels(
         page=body.page,
         page_size=body.page_size,
         status=body.status,
+        cursor=body.cursor,
     )
     return ApiSuccessResponse(output=result)
 
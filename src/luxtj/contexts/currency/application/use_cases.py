@@ -147,13 +147,15 @@ class CurrencyActivationService:
                 return meta["currency_symbol"]
             return default_currency_symbol(code) or ""
 
-        self._conversion.refresh_all_rates(base)
+        if not self._conversion.has_background_refresh:
+            self._conversion.refresh_all_rates(base)
 
         conversion_rate: dict[str, dict[str, float | str | None]] = {}
         for code in self._conversion.get_active_currency_codes():
             if code == base:
                 continue
-            rate = self._conversion.get_cached_rate(base, code)
+            # Cached (possibly stale) rate; the background refresher keeps it warm.
+            rate = self._conversion.get_rate(base, code)
             conversion_rate[code] = {
                 "value": round(rate, 2) if rate is not None else None,
                 "symbol": symbol_for(code),
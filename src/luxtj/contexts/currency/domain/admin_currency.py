@@ -38,6 +38,15 @@ def _convenience_amount(
     return {"amount": round(raw, 2), "type": "flat", "raw": raw}
 
 
+class FxRateUnavailableError(RuntimeError):
+    """No usable FX rate for a pair; the amount must not be priced (never converted 1:1)."""
+
+    def __init__(self, from_currency: str, to_currency: str) -> None:
+        super().__init__(f"No FX rate from {from_currency} to {to_currency}")
+        self.from_currency = from_currency
+        self.to_currency = to_currency
+
+
 class AdminCurrency:
     @staticmethod
     def code() -> str:
@@ -58,21 +67,39 @@ class AdminCurrency:
         return AdminCurrency._conversion().get_rate(frm, admin)
 
     @staticmethod
-    def rate_to_admin_or_one(from_currency: str) -> float:
-        """Same as rate_to_admin but never null; logs and returns 1.0 if unavailable."""
-        rate = AdminCurrency.rate_to_admin(from_currency)
+    async def rate_to_admin_async(from_currency: str) -> float | None:
+        """Same as rate_to_admin, but a cold pair awaits one bounded fetch instead of None."""
+        frm = from_currency.upper().strip()
+        admin = AdminCurrency.code()
+        if frm == "" or frm == admin:
+            return 1.0
+        return await AdminCurrency._conversion().get_rate_async(frm, admin)
+
+    @staticmethod
+    def require_rate_to_admin(from_currency: str) -> float:
+        """Same as rate_to_admin but never null; raises FxRateUnavailableError instead."""
+        return AdminCurrency._required(from_currency, AdminCurrency.rate_to_admin(from_currency))
+
+    @staticmethod
+    async def require_rate_to_admin_async(from_currency: str) -> float:
+        """Same as rate_to_admin_async but never null; raises FxRateUnavailableError instead."""
+        rate = await AdminCurrency.rate_to_admin_async(from_currency)
+        return AdminCurrency._required(from_currency, rate)
+
+    @staticmethod
+    def _required(from_currency: str, rate: float | None) -> float:
         if rate is None or rate <= 0:
             logger.warning(
-                "AdminCurrency: missing FX rate, using 1:1 from=%s to=%s",
+                "AdminCurrency: missing FX rate, refusing to price from=%s to=%s",
                 from_currency,
                 AdminCurrency.code(),
             )
-            return 1.0
+            raise FxRateUnavailableError(from_currency.upper().strip(), AdminCurrency.code())
         return rate
 
     @staticmethod
     def convert_amount_to_admin(amount: float, from_currency: str) -> dict[str, float]:
-        rate = AdminCurrency.rate_to_admin_or_one(from_currency)
+        rate = AdminCurrency.require_rate_to_admin(from_currency)
         return {"amount": round(amount * rate, 2), "rate": rate}
 
     @staticmethod
@@ -87,7 +114,7 @@ class AdminCurrency:
         """
         supplier_cur = str(quote.get("currency") or "USD").upper()
         admin = AdminCurrency.code()
-        rate = AdminCurrency.rate_to_admin_or_one(supplier_cur)
+        rate = AdminCurrency.require_rate_to_admin(supplier_cur)
 
         def scale(x: float) -> float:
             return round(x * rate, 2)
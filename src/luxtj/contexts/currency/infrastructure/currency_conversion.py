@@ -1,8 +1,21 @@
-"""FX conversion service — cache-first rates with pluggable provider."""
+"""FX conversion service — cache-first rates with pluggable provider.
+
+With an :class:`~luxtj.contexts.currency.infrastructure.fx_rate_refresher.FxRateRefresher`
+attached (API lifespan), :meth:`CurrencyConversionService.get_rate` serves fresh or stale
+cached rates and hands the pair to the refresher; a pair with no cached rate at all is
+``None`` until the refresher fills it, so the event loop never waits on the provider.
+:meth:`CurrencyConversionService.get_rate_async` instead awaits one fetch of a cold pair,
+bounded by ``LTJBE_FX_COLD_FETCH_TIMEOUT_SECONDS`` (concurrent lookups of the same pair
+share it). Without a refresher (scripts, workers) a cache miss fetches synchronously.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from time import monotonic
 
 from luxtj.bootstrap import config
 from luxtj.contexts.currency.application.ports import FxRateProvider
@@ -16,6 +29,10 @@ from luxtj.shared_kernel.infrastructure.logging import get_logger_handle
 
 logger = get_logger_handle(__name__)
 
+_COLD_FETCH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fx-cold-fetch")
+# A pair the provider could not resolve is not fetched again on the request path this soon.
+_COLD_FETCH_RETRY_SECONDS = 30.0
+
 
 class CurrencyConversionService:
     """Mirrors TeenvaCurrencyConversion."""
@@ -35,6 +52,11 @@ class CurrencyConversionService:
         self._rate_cache = rate_cache or get_fx_rate_cache()
         self._active_cache = active_cache or get_active_currencies_cache()
         self._active_codes_provider = active_codes_provider
+        self._refresh_notify: Callable[[], None] | None = None
+        self._tracked_pairs: set[tuple[str, str]] = set()
+        self._cold_fetches: dict[tuple[str, str], Future[float | None]] = {}
+        self._cold_retry_at: dict[tuple[str, str], float] = {}
+        self._cold_fetches_lock = Lock()
 
     @staticmethod
     def cache_key(from_currency: str, to_currency: str) -> str:
@@ -61,8 +83,74 @@ class CurrencyConversionService:
     def get_cached_rate(self, from_currency: str, to_currency: str) -> float | None:
         return self._rate_cache.get(from_currency, to_currency)
 
-    def set_cached_rate(self, from_currency: str, to_currency: str, rate: float | None) -> None:
-        self._rate_cache.put(from_currency, to_currency, rate)
+    def set_cached_rate(
+        self,
+        from_currency: str,
+        to_currency: str,
+        rate: float | None,
+        *,
+        age_seconds: float = 0.0,
+    ) -> None:
+        self._rate_cache.put(from_currency, to_currency, rate, age_seconds=age_seconds)
+
+    def store_rates(
+        self,
+        scraped: list[dict[str, str | float | None]],
+        *,
+        age_seconds: float = 0.0,
+    ) -> None:
+        """Cache each scraped pair and its inverse (supplier → admin lookups hit base → X)."""
+        for item in scraped:
+            frm = str(item.get("from") or "")
+            to = str(item.get("to") or "")
+            rate = item.get("rate")
+            if not frm or not to or not isinstance(rate, (int, float)) or rate <= 0:
+                continue
+            self.set_cached_rate(frm, to, float(rate), age_seconds=age_seconds)
+            self.set_cached_rate(to, frm, 1.0 / float(rate), age_seconds=age_seconds)
+
+    def attach_refresher(self, notify: Callable[[], None] | None) -> None:
+        """``notify`` is called (thread-safe) when a lookup needs a pair nobody tracks yet."""
+        self._refresh_notify = notify
+
+    @property
+    def has_background_refresh(self) -> bool:
+        return self._refresh_notify is not None
+
+    def _track_pair(self, from_currency: str, to_currency: str) -> None:
+        pair = (from_currency, to_currency)
+        if pair in self._tracked_pairs:
+            return
+        self._tracked_pairs.add(pair)
+        notify = self._refresh_notify
+        if notify is not None:
+            notify()
+
+    def track_pairs(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Keep ``pairs`` warm from the next refresh on (e.g. supplier → admin at startup)."""
+        for frm, to in pairs:
+            frm_u, to_u = frm.upper().strip(), to.upper().strip()
+            if frm_u and to_u and frm_u != to_u:
+                self._tracked_pairs.add((frm_u, to_u))
+
+    def refresh_pairs(self, base: str | None = None) -> list[tuple[str, str]]:
+        """Pairs the refresher fetches: base → every active / looked-up currency.
+
+        Lookups into the base currency are answered from the inverse rate, so they
+        ride on the same provider call as the active pairs.
+        """
+        base_code = (base or self.get_base_currency()).upper()
+        targets = {to for _, to in self.get_pairs(base_code)}
+        direct: set[tuple[str, str]] = set()
+        for frm, to in list(self._tracked_pairs):
+            if to == base_code:
+                targets.add(frm)
+            elif frm == base_code:
+                targets.add(to)
+            else:
+                direct.add((frm, to))
+        targets.discard(base_code)
+        return [(base_code, to) for to in sorted(targets)] + sorted(direct)
 
     def scrape_rates_for_pairs(
         self, pairs: list[tuple[str, str]]
@@ -97,27 +185,81 @@ class CurrencyConversionService:
         to = to_currency.upper().strip()
         if frm == to:
             return 1.0
-        cached = self.get_cached_rate(frm, to)
+        cached, fresh = self._rate_cache.lookup(frm, to)
+        if cached is not None and fresh:
+            return cached
+        if self.has_background_refresh:
+            # Search hot path: stale-while-revalidate; a cold pair waits for the refresher.
+            self._track_pair(frm, to)
+            return cached
+        return self._fetch_rate(frm, to)
+
+    async def get_rate_async(self, from_currency: str, to_currency: str) -> float | None:
+        """Same as get_rate, but a cold pair awaits one bounded fetch instead of ``None``."""
+        frm = from_currency.upper().strip()
+        to = to_currency.upper().strip()
+        if frm == to:
+            return 1.0
+        cached, fresh = self._rate_cache.lookup(frm, to)
+        if cached is not None and fresh:
+            return cached
+        if not self.has_background_refresh:
+            return await asyncio.to_thread(self._fetch_rate, frm, to)
+        self._track_pair(frm, to)
         if cached is not None:
             return cached
+        return await self._cold_fetch(frm, to)
+
+    def _fetch_rate(self, frm: str, to: str) -> float | None:
         scraped = self.scrape_rates_for_pairs([(frm, to)])
         rate = scraped[0].get("rate") if scraped else None
-        rate_f = float(rate) if isinstance(rate, (int, float)) else None
+        rate_f = float(rate) if isinstance(rate, (int, float)) and rate > 0 else None
         self.set_cached_rate(frm, to, rate_f)
         return rate_f
 
+    async def _cold_fetch(self, frm: str, to: str) -> float | None:
+        pair = (frm, to)
+        with self._cold_fetches_lock:
+            if self._cold_retry_at.get(pair, 0.0) > monotonic():
+                return None
+            future = self._cold_fetches.get(pair)
+            started = future is None
+            if future is None:
+                future = _COLD_FETCH_POOL.submit(self._fetch_rate, frm, to)
+                self._cold_fetches[pair] = future
+        if started:
+            # Outside the lock: an already finished future runs the callback right here.
+            future.add_done_callback(lambda done: self._forget_cold_fetch(pair, done))
+        try:
+            # Shielded: a timed-out waiter must not cancel the fetch other lookups share.
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)),
+                timeout=config.FX_COLD_FETCH_TIMEOUT_SECONDS,
+            )
+        except TimeoutError:
+            logger.warning("FX cold fetch timed out from=%s to=%s", frm, to)
+        except Exception:
+            pass  # logged once by _forget_cold_fetch
+        return None
+
+    def _forget_cold_fetch(self, pair: tuple[str, str], future: Future[float | None]) -> None:
+        failed = future.exception() is not None or future.result() is None
+        if failed:
+            logger.warning("FX cold fetch found no rate from=%s to=%s", *pair)
+        with self._cold_fetches_lock:
+            self._cold_fetches.pop(pair, None)
+            if failed:
+                self._cold_retry_at[pair] = monotonic() + _COLD_FETCH_RETRY_SECONDS
+            else:
+                self._cold_retry_at.pop(pair, None)
+
     def refresh_all_rates(self, base: str | None = None) -> list[dict[str, str | float | None]]:
         base_code = (base or self.get_base_currency()).upper()
         pairs = self.get_pairs(base_code)
         if not pairs:
             return []
         scraped = self.scrape_rates_for_pairs(pairs)
-        for item in scraped:
-            frm = str(item.get("from") or "")
-            to = str(item.get("to") or "")
-            rate = item.get("rate")
-            rate_f = float(rate) if isinstance(rate, (int, float)) else None
-            self.set_cached_rate(frm, to, rate_f)
+        self.store_rates(scraped)
         return scraped
 
 
@@ -1,4 +1,4 @@
-"""In-memory TTL cache for FX pair rates."""
+"""In-memory TTL cache for FX pair rates (stale-while-revalidate)."""
 
 from __future__ import annotations
 
@@ -11,11 +11,14 @@ from time import monotonic
 class _CacheEntry:
     rate: float
     expires_at: float
+    stale_until: float
 
 
 @dataclass
 class FxRateCache:
     ttl_seconds: int = 15 * 60
+    # Expired rates stay servable this long while the background refresher catches up.
+    stale_ttl_seconds: int = 24 * 60 * 60
     _entries: dict[str, _CacheEntry] = field(default_factory=dict)
     _lock: Lock = field(default_factory=Lock)
 
@@ -24,24 +27,41 @@ class FxRateCache:
         return f"teenva_currency_rate_{from_currency.upper()}_{to_currency.upper()}"
 
     def get(self, from_currency: str, to_currency: str) -> float | None:
+        """Fresh rate only."""
+        rate, fresh = self.lookup(from_currency, to_currency)
+        return rate if fresh else None
+
+    def lookup(self, from_currency: str, to_currency: str) -> tuple[float | None, bool]:
+        """``(rate, is_fresh)`` — a stale rate is still returned until ``stale_until``."""
         key = self.cache_key(from_currency, to_currency)
+        now = monotonic()
         with self._lock:
             entry = self._entries.get(key)
             if entry is None:
-                return None
-            if monotonic() >= entry.expires_at:
+                return None, False
+            if now >= entry.stale_until:
                 del self._entries[key]
-                return None
-            return entry.rate
+                return None, False
+            return entry.rate, now < entry.expires_at
 
-    def put(self, from_currency: str, to_currency: str, rate: float | None) -> None:
+    def put(
+        self,
+        from_currency: str,
+        to_currency: str,
+        rate: float | None,
+        *,
+        age_seconds: float = 0.0,
+    ) -> None:
+        """Store ``rate``; ``age_seconds`` back-dates entries loaded from a shared snapshot."""
         if rate is None:
             return
         key = self.cache_key(from_currency, to_currency)
+        now = monotonic() - max(0.0, age_seconds)
         with self._lock:
             self._entries[key] = _CacheEntry(
                 rate=float(rate),
-                expires_at=monotonic() + self.ttl_seconds,
+                expires_at=now + self.ttl_seconds,
+                stale_until=now + max(self.ttl_seconds, self.stale_ttl_seconds),
             )
 
     def clear(self) -> None:
@@ -0,0 +1,216 @@
+"""Background FX refresher — keeps every active / looked-up pair warm off the request path.
+
+Workers share one rate snapshot in Redis (``luxtj:fx_rates:snapshot:{BASE}``): a
+refresh first loads a recent snapshot, and only the worker holding the short fetch
+lease calls the FX provider (in a thread — the provider uses a blocking client) and
+republishes. Without Redis every worker fetches for itself.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from time import time
+from typing import Any
+
+from luxtj.contexts.currency.infrastructure.currency_conversion import CurrencyConversionService
+from luxtj.shared_kernel.infrastructure.logging import get_logger_handle
+from luxtj.shared_kernel.infrastructure.redis_cache import (
+    get_redis_client,
+    redis_cache_add,
+    redis_cache_delete,
+    redis_cache_get,
+    redis_cache_put,
+)
+
+logger = get_logger_handle(__name__)
+
+SNAPSHOT_NAMESPACE = "fx_rates"
+_FETCH_LEASE_SECONDS = 30
+_LEASE_RETRY_SECONDS = 2.0
+
+type RateRows = list[dict[str, str | float | None]]
+
+
+class FxRateRefresher:
+    """Interval + on-demand FX refresh task; installs itself on the conversion service."""
+
+    def __init__(
+        self,
+        conversion: CurrencyConversionService,
+        *,
+        refresh_interval_seconds: float = 300.0,
+        snapshot_ttl_seconds: int = 24 * 60 * 60,
+    ) -> None:
+        self._conversion = conversion
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._snapshot_ttl_seconds = snapshot_ttl_seconds
+        self._refresh_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lease_owner = f"{os.getpid()}:{id(self)}"
+        self.last_refreshed_at: float | None = None
+        self.last_source: str | None = None
+
+    async def start(self) -> None:
+        """Warm the cache once, then refresh on an interval and on demand."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        try:
+            await self.refresh()
+        except Exception as ex:
+            logger.exception("Initial FX refresh failed: %s", ex)
+        self._conversion.attach_refresher(self.request_refresh)
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._conversion.attach_refresher(None)
+        self._stop_event.set()
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    def request_refresh(self) -> None:
+        """Wake the refresher; safe to call from sync code on any thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=self._refresh_interval_seconds,
+                )
+            except TimeoutError:
+                pass
+            if self._stop_event.is_set():
+                break
+            self._wakeup.clear()
+            try:
+                await self.refresh()
+            except Exception as ex:
+                logger.exception("FX refresh failed: %s", ex)
+
+    async def refresh(self, *, force: bool = False) -> RateRows:
+        """Load a recent shared snapshot or fetch + publish one. ``force`` always fetches."""
+        async with self._refresh_lock:
+            conversion = self._conversion
+            base = conversion.get_base_currency()
+            pairs = conversion.refresh_pairs(base)
+            if not pairs:
+                return []
+
+            snapshot = await redis_cache_get(SNAPSHOT_NAMESPACE, _snapshot_key(base))
+            if not force and _snapshot_covers(snapshot, pairs, self._refresh_interval_seconds):
+                return self._load_snapshot(snapshot)
+
+            leased = False
+            if not force:
+                leased = await self._acquire_fetch_lease(base)
+                if not leased:
+                    # Another worker is fetching; serve what is shared now, re-check shortly.
+                    if self._loop is not None:
+                        self._loop.call_later(_LEASE_RETRY_SECONDS, self._wakeup.set)
+                    return self._load_snapshot(snapshot) if snapshot else []
+
+            try:
+                scraped = await asyncio.to_thread(conversion.scrape_rates_for_pairs, pairs)
+                conversion.store_rates(scraped)
+                await self._publish_snapshot(base, scraped, snapshot)
+            finally:
+                if leased:
+                    await redis_cache_delete(SNAPSHOT_NAMESPACE, _lease_key(base))
+            self.last_refreshed_at = time()
+            self.last_source = "provider"
+            logger.info(
+                "FX rates refreshed base=%s pairs=%d resolved=%d",
+                base,
+                len(pairs),
+                sum(1 for item in scraped if isinstance(item.get("rate"), (int, float))),
+            )
+            return scraped
+
+    async def _acquire_fetch_lease(self, base: str) -> bool:
+        if await get_redis_client() is None:
+            return True
+        return await redis_cache_add(
+            SNAPSHOT_NAMESPACE,
+            _lease_key(base),
+            self._lease_owner,
+            _FETCH_LEASE_SECONDS,
+        )
+
+    def _load_snapshot(self, snapshot: Any) -> RateRows:
+        if not isinstance(snapshot, dict):
+            return []
+        rows = _snapshot_rows(snapshot)
+        age = max(0.0, time() - float(snapshot.get("fetched_at") or 0))
+        self._conversion.store_rates(rows, age_seconds=age)
+        self.last_refreshed_at = float(snapshot.get("fetched_at") or 0) or None
+        self.last_source = "snapshot"
+        return rows
+
+    async def _publish_snapshot(self, base: str, scraped: RateRows, previous: Any) -> None:
+        rates: dict[str, float] = {}
+        # Keep pairs other workers added that this fetch did not cover.
+        if isinstance(previous, dict) and isinstance(previous.get("rates"), dict):
+            rates.update(previous["rates"])
+        for item in scraped:
+            rate = item.get("rate")
+            if isinstance(rate, (int, float)) and rate > 0:
+                rates[f"{item.get('from')}:{item.get('to')}"] = float(rate)
+        await redis_cache_put(
+            SNAPSHOT_NAMESPACE,
+            _snapshot_key(base),
+            {"base": base, "fetched_at": time(), "rates": rates},
+            self._snapshot_ttl_seconds,
+        )
+
+
+def _snapshot_key(base: str) -> str:
+    return f"snapshot:{base}"
+
+
+def _lease_key(base: str) -> str:
+    return f"lease:{base}"
+
+
+def _snapshot_rows(snapshot: Any) -> RateRows:
+    if not isinstance(snapshot, dict) or not isinstance(snapshot.get("rates"), dict):
+        return []
+    rows: RateRows = []
+    for key, rate in snapshot["rates"].items():
+        frm, _, to = str(key).partition(":")
+        if frm and to:
+            rows.append({"from": frm, "to": to, "rate": rate})
+    return rows
+
+
+def _snapshot_covers(snapshot: Any, pairs: list[tuple[str, str]], max_age: float) -> bool:
+    if not isinstance(snapshot, dict) or not isinstance(snapshot.get("rates"), dict):
+        return False
+    if time() - float(snapshot.get("fetched_at") or 0) >= max_age:
+        return False
+    rates = snapshot["rates"]
+    return all(f"{frm}:{to}" in rates for frm, to in pairs)
+
+
+_REFRESHER: FxRateRefresher | None = None
+
+
+def get_fx_rate_refresher() -> FxRateRefresher | None:
+    return _REFRESHER
+
+
+def set_fx_rate_refresher(refresher: FxRateRefresher | None) -> None:
+    global _REFRESHER
+    _REFRESHER = refresher
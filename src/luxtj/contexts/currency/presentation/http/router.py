@@ -1,6 +1,8 @@
+import asyncio
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse
 
 from luxtj.bootstrap import config
 from luxtj.contexts.currency.application.commands import (
@@ -12,6 +14,7 @@ from luxtj.contexts.currency.application.use_cases import (
     CurrencyNotFoundError,
 )
 from luxtj.contexts.currency.bootstrap import build_currency_activation_service
+from luxtj.contexts.currency.domain.admin_currency import FxRateUnavailableError
 from luxtj.contexts.currency.presentation.http.schemas import (
     ConversionRateEntrySerializer,
     CurrencyCodeBody,
@@ -88,9 +91,13 @@ async def refresh_currency_rates(
     service: Annotated[CurrencyActivationService, Depends(build_currency_activation_service)],
 ) -> ApiSuccessResponse[dict]:
     from luxtj.contexts.currency.infrastructure.currency_conversion import get_currency_conversion
+    from luxtj.contexts.currency.infrastructure.fx_rate_refresher import get_fx_rate_refresher
 
-    conversion = get_currency_conversion()
-    scraped = conversion.refresh_all_rates()
+    refresher = get_fx_rate_refresher()
+    if refresher is not None:
+        scraped = await refresher.refresh(force=True)
+    else:
+        scraped = await asyncio.to_thread(get_currency_conversion().refresh_all_rates)
     return ApiSuccessResponse(
         output={
             "refreshed": len(scraped),
@@ -126,3 +133,19 @@ async def public_currency_rates(
             conversion_rate=rates,
         )
     )
+
+
+async def fx_rate_unavailable_handler(
+    _request: Request, exc: FxRateUnavailableError
+) -> JSONResponse:
+    """503 for any price that needs an FX rate nobody has fetched yet; the refresher is on it."""
+    return JSONResponse(
+        {
+            "success": False,
+            "message": "Currency rate temporarily unavailable, please retry",
+            "errors": [str(exc)],
+            "data": [],
+        },
+        status_code=503,
+        headers={"Retry-After": "5"},
+    )
@@ -17,6 +17,7 @@ from luxtj.contexts.currency.domain.booking_money_for_client import BookingMoney
 from luxtj.contexts.flight.application.markup import FlightMarkup
 from luxtj.contexts.flight.application.prebook_quote import FlightPreBookQuote
 from luxtj.contexts.flight.application.promo import FlightPromo
+from luxtj.contexts.flight.application.search_results import SEARCH_RESULT_KIND
 from luxtj.contexts.flight.domain.common import FlightCommon
 from luxtj.contexts.flight.domain.provider import FlightProvider
 from luxtj.contexts.flight.infrastructure.booking_persistence import persist_pre_book
@@ -34,7 +35,8 @@ from luxtj.contexts.payment.application.service import PaymentGatewayService
 from luxtj.contexts.payment.infrastructure.persistence.sqlalchemy_repository import (
     SqlAlchemyPaymentGatewayTransactionRepository,
 )
-from luxtj.shared_kernel.infrastructure.http import MultiHttpClient
+from luxtj.shared_kernel.infrastructure.http import MultiHttpClient, SupplierResponse
+from luxtj.shared_kernel.infrastructure.search_result_store import get_search_result_store
 from luxtj.utils import timeutils
 
 logger = logging.getLogger(__name__)
@@ -52,7 +54,7 @@ class FlightBlender:
     ) -> None:
         self._session = session
         self._http = http_client
-        self._curl = multi_http or MultiHttpClient(http_client, session=session)
+        self._curl = multi_http or MultiHttpClient(session=session)
         self._markup = flight_markup or FlightMarkup(session)
 
     @staticmethod
@@ -107,6 +109,20 @@ class FlightBlender:
         if not isinstance(price, dict):
             return 0.0
         # Avoid double-applying if the same Price dict is reused from cache.
+        existing = self._existing_admin_markup(price)
+        if existing is not None:
+            return existing
+
+        amount = float(price.get("TotalDisplayFare") or 0)
+        markup_data = await self._markup.get_markup_amount_for_flight(params, amount)
+        markup_amount = max(0.0, float(markup_data.get("amount") or 0))
+        if markup_amount <= 0:
+            return 0.0
+        self._fold_markup_into_price(price, markup_amount)
+        return markup_amount
+
+    @staticmethod
+    def _existing_admin_markup(price: dict[str, Any]) -> float | None:
         if (
             float(
                 price.get("AdminMarkup")
@@ -117,13 +133,9 @@ class FlightBlender:
         ):
             pb0 = price.get("PriceBreakup") if isinstance(price.get("PriceBreakup"), dict) else {}
             return float(pb0.get("AdminMarkup") or price.get("AdminMarkup") or 0)
+        return None
 
-        amount = float(price.get("TotalDisplayFare") or 0)
-        markup_data = await self._markup.get_markup_amount_for_flight(params, amount)
-        markup_amount = max(0.0, float(markup_data.get("amount") or 0))
-        if markup_amount <= 0:
-            return 0.0
-
+    def _fold_markup_into_price(self, price: dict[str, Any], markup_amount: float) -> None:
         pb = price.get("PriceBreakup")
         if not isinstance(pb, dict):
             pb = {"Tax": 0.0, "BasicFare": 0.0}
@@ -136,7 +148,7 @@ class FlightBlender:
             price["TotalDisplayFare"] = self._round_amount(
                 float(pb.get("BasicFare") or 0) + float(pb["Tax"])
             )
-            return markup_amount
+            return
 
         # PassengerBreakup amounts are per-passenger (City Travel / FE contract).
         pax_cnt = 0
@@ -160,22 +172,51 @@ class FlightBlender:
         price["TotalDisplayFare"] = self._round_amount(
             float(pb.get("BasicFare") or 0) + float(pb["Tax"])
         )
-        return markup_amount
+
+    @staticmethod
+    def _price_for_client(price: dict[str, Any]) -> dict[str, Any]:
+        """Copy-on-write Price: only the dicts markup / strip write to are copied.
+
+        Any other nested Price data stays shared with the provider row, which is never
+        mutated here — much cheaper than ``copy.deepcopy`` per flight.
+        """
+        out = dict(price)
+        if isinstance(out.get("PriceBreakup"), dict):
+            out["PriceBreakup"] = dict(out["PriceBreakup"])
+        if isinstance(out.get("PassengerBreakup"), dict):
+            out["PassengerBreakup"] = {
+                pax_type: dict(pax) if isinstance(pax, dict) else pax
+                for pax_type, pax in out["PassengerBreakup"].items()
+            }
+        return out
 
     async def _prepare_flight_for_client(self, flight: dict[str, Any]) -> dict[str, Any]:
-        """Deep-copy Price, apply markup, strip AdminMarkup for B2C."""
-        row = dict(flight)
-        if isinstance(row.get("Price"), dict):
-            row["Price"] = copy.deepcopy(row["Price"])
-        await self.set_flight_markup(row)
-        return BookingMoneyForClient.strip_admin_markup_from_flight_row(row)
+        """Copy Price, apply markup, strip AdminMarkup for B2C."""
+        return (await self._prepare_flights_for_client([flight]))[0]
 
     async def _prepare_flights_for_client(self, flights: list[Any]) -> list[dict[str, Any]]:
-        out: list[dict[str, Any]] = []
-        for flight in flights:
-            if isinstance(flight, dict):
-                out.append(await self._prepare_flight_for_client(flight))
-        return out
+        """Price a whole chunk: one batched markup lookup, then fold amounts into each row."""
+        rows = [dict(flight) for flight in flights if isinstance(flight, dict)]
+        prices: list[dict[str, Any]] = []
+        items: list[tuple[dict[str, Any], float]] = []
+        for row in rows:
+            if not isinstance(row.get("Price"), dict):
+                continue
+            price = row["Price"] = self._price_for_client(row["Price"])
+            if self._existing_admin_markup(price) is not None:
+                continue
+            params = self._markup_params_from_flight(row)
+            if params is None:
+                continue
+            prices.append(price)
+            items.append((params, float(price.get("TotalDisplayFare") or 0)))
+
+        markups = await self._markup.get_markup_amounts_for_flights(items)
+        for price, markup_data in zip(prices, markups, strict=True):
+            markup_amount = max(0.0, float(markup_data.get("amount") or 0))
+            if markup_amount > 0:
+                self._fold_markup_into_price(price, markup_amount)
+        return [BookingMoneyForClient.strip_admin_markup_from_flight_row(row) for row in rows]
 
     async def create_search_session(
         self, search_data: dict[str, Any], user_id: str | None = None
@@ -312,11 +353,21 @@ class FlightBlender:
             }
             return
 
-        raw_q: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue()
+        results = get_search_result_store(SEARCH_RESULT_KIND)
+        run = await results.reset(search_id)
+        raw_q: asyncio.Queue[SupplierResponse | None] = asyncio.Queue()
         out_q: asyncio.Queue[dict[str, Any] | object] = asyncio.Queue()
 
-        async def _on_response(provider_code: str, raw: str) -> None:
-            await raw_q.put((provider_code, raw))
+        async def _on_response(response: SupplierResponse) -> None:
+            logger.info(
+                "Flight search response search_id=%s provider=%s bytes=%d decode_ms=%.1f cached=%s",
+                search_id,
+                response.provider,
+                response.size,
+                response.decode_seconds * 1000,
+                response.from_cache,
+            )
+            await raw_q.put(response)
 
         async def _run_http() -> None:
             try:
@@ -332,7 +383,9 @@ class FlightBlender:
                     item = await raw_q.get()
                     if item is None:
                         break
-                    provider_code, raw = item
+                    provider_code = item.provider
+                    # Parsed JSON / XML dict when the transport could parse it, else text.
+                    raw = item.payload()
                     provider = provider_by_code.get(provider_code)
                     search_for_provider = search_by_code.get(provider_code) or search_data
                     if provider is None:
@@ -342,6 +395,7 @@ class FlightBlender:
                     if not isinstance(flights, list) or not flights:
                         continue
                     marked = await self._prepare_flights_for_client(flights)
+                    await results.append(search_id, run, marked)
                     await out_q.put(
                         {
                             "status": True,
@@ -367,6 +421,7 @@ class FlightBlender:
         finally:
             await asyncio.gather(http_task, proc_task, return_exceptions=True)
 
+        await results.complete(search_id, run)
         yield {
             "status": True,
             "message": "Completed",
@@ -541,7 +596,7 @@ class FlightBlender:
         if not provider:
             return {"status": False, "message": "Provider not found", "data": []}
 
-        quote = cache_get(str(decoded["token"]))
+        quote = await cache_get(str(decoded["token"]))
         quote = quote if isinstance(quote, dict) else {}
         search_data = quote.get("searchData") if isinstance(quote.get("searchData"), dict) else {}
         travel_start, travel_end = FlightCommon.journey_date_bounds_from_flight_details(
@@ -736,7 +791,7 @@ class FlightBlender:
         if not decoded:
             return {"status": False, "message": "Invalid ResultToken", "data": []}
 
-        token_data = cache_get(str(decoded["token"]))
+        token_data = await cache_get(str(decoded["token"]))
         token_data = token_data if isinstance(token_data, dict) else {}
         app_reference = str(token_data.get("app_reference") or "").strip()
         if not app_reference:
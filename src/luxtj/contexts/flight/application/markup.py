@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from luxtj.contexts.flight.application.markup_index import (
+    FlightMarkupRuleEntry,
+    FlightMarkupRuleIndex,
+    get_flight_markup_rule_index,
+)
 from luxtj.contexts.flight.application.markup_rule_resolver import FlightMarkupRuleResolver
-from luxtj.contexts.flight.infrastructure.persistence.sqlalchemy_models import FlightMarkupRuleRow
 
 
 class FlightMarkup:
@@ -19,15 +23,13 @@ class FlightMarkup:
     ) -> None:
         self._session = session
         self._resolver = resolver or FlightMarkupRuleResolver()
-        self._cached_rules: list[FlightMarkupRuleRow] | None = None
 
-    async def active_rules(self) -> list[FlightMarkupRuleRow]:
-        if self._cached_rules is None:
-            stmt = select(FlightMarkupRuleRow).where(
-                FlightMarkupRuleRow.status.in_(["active", "ACTIVE", "1"])
-            )
-            self._cached_rules = list((await self._session.execute(stmt)).scalars().all())
-        return self._cached_rules
+    async def rule_index(self) -> FlightMarkupRuleIndex:
+        """Process-wide compiled index (reloaded only after admin edits / max age)."""
+        return await get_flight_markup_rule_index(self._session)
+
+    async def active_rules(self) -> list[FlightMarkupRuleEntry]:
+        return (await self.rule_index()).rules
 
     def build_context(self, flight_params: dict[str, Any]) -> dict[str, Any]:
         cabin = flight_params.get("cabin_class") or flight_params.get("cabinClass")
@@ -59,13 +61,25 @@ class FlightMarkup:
     async def get_markup_amount_for_flight(
         self, flight_params: dict[str, Any], amount: float
     ) -> dict[str, Any]:
-        basis = max(0.0, round(float(amount), 2))
-        context = self.build_context(flight_params)
-        rules = await self.active_rules()
-        if not rules:
-            return {"amount": 0.0, "value": 0.0, "isPercentage": False, "rule_id": None}
-        matching = self._resolver.matching_rules(rules, context)
-        best = self._resolver.select_best(matching)
+        return (await self.get_markup_amounts_for_flights([(flight_params, amount)]))[0]
+
+    async def get_markup_amounts_for_flights(
+        self, items: Sequence[tuple[dict[str, Any], float]]
+    ) -> list[dict[str, Any]]:
+        """Price a whole search chunk with one index lookup per distinct route/date."""
+        if not items:
+            return []
+        index = await self.rule_index()
+        if not len(index):
+            return [self._markup_result(None, 0.0) for _ in items]
+        contexts = [self.build_context(params) for params, _ in items]
+        rules = index.best_rules(contexts)
+        return [
+            self._markup_result(best, max(0.0, round(float(amount), 2)))
+            for best, (_, amount) in zip(rules, items, strict=True)
+        ]
+
+    def _markup_result(self, best: FlightMarkupRuleEntry | None, basis: float) -> dict[str, Any]:
         markup_total = max(0.0, float(self._resolver.compute_markup_value(best, basis)))
         return {
             "amount": float(markup_total),
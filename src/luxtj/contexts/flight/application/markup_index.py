@@ -0,0 +1,174 @@
+"""Compiled, process-wide flight markup rule index.
+
+Active rules are bucketed by their exact-match filters (airline, origin, destination,
+cabin slug); an unset filter is stored under ``None``. A lookup probes only the buckets a
+context can hit (at most 16 wildcard combinations), and every bucket is pre-sorted by
+``(-priority_score, str(id))`` so its first rule inside the travel-date window is that
+bucket's best. The winner is the same rule ``FlightMarkupRuleResolver.matching_rules`` +
+``select_best`` would pick, without scanning every rule per flight.
+
+The index is shared through a :class:`VersionedSnapshot`; admin edits call
+:func:`invalidate_flight_markup_rules`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from itertools import product
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from luxtj.bootstrap import config
+from luxtj.contexts.flight.application.markup_rule_resolver import FlightMarkupRuleResolver
+from luxtj.contexts.flight.infrastructure.persistence.sqlalchemy_models import FlightMarkupRuleRow
+from luxtj.shared_kernel.infrastructure.versioned_snapshot import VersionedSnapshot
+
+type FlightRuleKey = tuple[str | None, str | None, str | None, str | None]
+
+
+@dataclass(frozen=True, slots=True)
+class FlightMarkupRuleEntry:
+    """Detached, normalized copy of an active ``FlightMarkupRuleRow``."""
+
+    id: str
+    airline: str | None
+    origin: str | None
+    destination: str | None
+    cabin_class: str | None
+    travel_date_from: date | None
+    travel_date_to: date | None
+    markup_amount: Decimal
+    is_percentage: bool
+    priority: int
+    status: str = "active"
+
+    @property
+    def sort_key(self) -> tuple[int, str]:
+        return -self.priority, self.id
+
+    @property
+    def key(self) -> FlightRuleKey:
+        return self.airline, self.origin, self.destination, self.cabin_class
+
+    def in_window(self, departure: date | None) -> bool:
+        if self.travel_date_from is None and self.travel_date_to is None:
+            return True
+        if departure is None:
+            return False
+        if self.travel_date_from and departure < self.travel_date_from:
+            return False
+        if self.travel_date_to and departure > self.travel_date_to:
+            return False
+        return True
+
+
+class FlightMarkupRuleIndex:
+    def __init__(
+        self,
+        rules: Iterable[Any],
+        resolver: FlightMarkupRuleResolver | None = None,
+    ) -> None:
+        self._resolver = resolver or FlightMarkupRuleResolver()
+        self.rules: list[FlightMarkupRuleEntry] = [
+            self._compile(r) for r in rules if self._resolver._is_active(r)
+        ]
+        buckets: dict[FlightRuleKey, list[FlightMarkupRuleEntry]] = {}
+        for entry in self.rules:
+            buckets.setdefault(entry.key, []).append(entry)
+        for bucket in buckets.values():
+            bucket.sort(key=lambda e: e.sort_key)
+        self._buckets = buckets
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _compile(self, rule: Any) -> FlightMarkupRuleEntry:
+        r = self._resolver
+        airline = r.normalize_filter(getattr(rule, "airline", None))
+        origin = r.normalize_filter(getattr(rule, "origin", None))
+        dest = r.normalize_filter(getattr(rule, "destination", None))
+        return FlightMarkupRuleEntry(
+            id=str(getattr(rule, "id", "")),
+            airline=airline.upper() if airline is not None else None,
+            origin=origin.upper() if origin is not None else None,
+            destination=dest.upper() if dest is not None else None,
+            cabin_class=r.normalize_cabin_slug(
+                r.normalize_filter(getattr(rule, "cabin_class", None))
+            ),
+            travel_date_from=getattr(rule, "travel_date_from", None),
+            travel_date_to=getattr(rule, "travel_date_to", None),
+            markup_amount=Decimal(str(getattr(rule, "markup_amount", 0) or 0)),
+            is_percentage=bool(getattr(rule, "is_percentage", False)),
+            priority=r.priority_score(rule),
+        )
+
+    def context_key(self, context: dict[str, Any]) -> FlightRuleKey:
+        r = self._resolver
+        return (
+            (r.normalize_filter(context.get("airline")) or "").upper() or None,
+            (r.normalize_filter(context.get("origin")) or "").upper() or None,
+            (r.normalize_filter(context.get("destination")) or "").upper() or None,
+            r.normalize_cabin_slug(r.normalize_filter(context.get("cabin_class"))),
+        )
+
+    def best_rule(self, context: dict[str, Any]) -> FlightMarkupRuleEntry | None:
+        return self._best_for(
+            self.context_key(context), self._resolver._context_departure_date(context)
+        )
+
+    def best_rules(self, contexts: Sequence[dict[str, Any]]) -> list[FlightMarkupRuleEntry | None]:
+        """One lookup per distinct (filters, departure) — a search chunk shares most routes."""
+        seen: dict[tuple[FlightRuleKey, date | None], FlightMarkupRuleEntry | None] = {}
+        out: list[FlightMarkupRuleEntry | None] = []
+        for context in contexts:
+            memo_key = (
+                self.context_key(context),
+                self._resolver._context_departure_date(context),
+            )
+            if memo_key not in seen:
+                seen[memo_key] = self._best_for(*memo_key)
+            out.append(seen[memo_key])
+        return out
+
+    def _best_for(self, key: FlightRuleKey, departure: date | None) -> FlightMarkupRuleEntry | None:
+        if not self._buckets:
+            return None
+        best: FlightMarkupRuleEntry | None = None
+        for probe in product(*((value, None) if value is not None else (None,) for value in key)):
+            for entry in self._buckets.get(probe, ()):
+                if entry.in_window(departure):
+                    if best is None or entry.sort_key < best.sort_key:
+                        best = entry
+                    break
+        return best
+
+
+async def load_active_flight_markup_rules(session: AsyncSession) -> list[FlightMarkupRuleRow]:
+    stmt = select(FlightMarkupRuleRow).where(
+        FlightMarkupRuleRow.status.in_(["active", "ACTIVE", "1"])
+    )
+    return list((await session.execute(stmt)).scalars().all())
+
+
+_SNAPSHOT: VersionedSnapshot[FlightMarkupRuleIndex] = VersionedSnapshot(
+    "flight_markup_rules",
+    check_interval=config.MARKUP_RULES_VERSION_CHECK_SECONDS,
+    max_age=config.MARKUP_RULES_MAX_AGE_SECONDS,
+)
+
+
+async def get_flight_markup_rule_index(session: AsyncSession) -> FlightMarkupRuleIndex:
+    async def load() -> FlightMarkupRuleIndex:
+        return FlightMarkupRuleIndex(await load_active_flight_markup_rules(session))
+
+    return await _SNAPSHOT.get(load)
+
+
+async def invalidate_flight_markup_rules() -> None:
+    """Call after committing an admin rule change."""
+    await _SNAPSHOT.invalidate()
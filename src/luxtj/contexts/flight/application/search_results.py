@@ -0,0 +1,159 @@
+"""Filter / sort / paginate stored flight search cards (``SearchResults`` service)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from luxtj.shared_kernel.application.search_results import (
+    DEFAULT_PAGE_SIZE,
+    SortKey,
+    body_bool,
+    body_float,
+    body_int,
+    body_list,
+    page_params,
+    paginate,
+    sorted_positions,
+)
+from luxtj.shared_kernel.infrastructure.search_result_store import (
+    StoredSearch,
+    get_search_result_store,
+)
+
+SEARCH_RESULT_KIND = "flight"
+
+
+def flight_price(card: dict[str, Any]) -> float:
+    price = card.get("Price") if isinstance(card.get("Price"), dict) else {}
+    try:
+        return float(price.get("TotalDisplayFare") or 0)
+    except TypeError, ValueError:
+        return 0.0
+
+
+def _legs(card: dict[str, Any]) -> list[list[dict[str, Any]]]:
+    details = card.get("FlightDetails")
+    if not isinstance(details, list):
+        return []
+    return [
+        [seg for seg in leg if isinstance(seg, dict)]
+        for leg in details
+        if isinstance(leg, list) and leg
+    ]
+
+
+def flight_stops(card: dict[str, Any]) -> int:
+    """Most connections on any leg (0 = every leg non-stop)."""
+    return max((len(leg) - 1 for leg in _legs(card)), default=0)
+
+
+def flight_duration_minutes(card: dict[str, Any]) -> int | None:
+    minutes = [int(seg.get("Duration") or 0) for leg in _legs(card) for seg in leg]
+    return sum(minutes) if minutes and all(minutes) else None
+
+
+def flight_airline(card: dict[str, Any]) -> str:
+    legs = _legs(card)
+    if not legs or not legs[0]:
+        return ""
+    seg = legs[0][0]
+    return str(
+        seg.get("OperatorCode")
+        or seg.get("MarketingAirlineCode")
+        or seg.get("OperatingAirlineCode")
+        or ""
+    ).upper()
+
+
+def flight_departure(card: dict[str, Any]) -> str | None:
+    legs = _legs(card)
+    if not legs or not legs[0]:
+        return None
+    origin = legs[0][0].get("Origin") if isinstance(legs[0][0].get("Origin"), dict) else {}
+    when = f"{origin.get('date') or ''} {origin.get('time') or ''}".strip()
+    return when or None
+
+
+_SORTS: dict[str, SortKey] = {
+    "price": flight_price,
+    "duration": flight_duration_minutes,
+    "departure": flight_departure,
+    "stops": flight_stops,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FlightResultQuery:
+    price_min: float | None = None
+    price_max: float | None = None
+    airlines: frozenset[str] = frozenset()
+    max_stops: int | None = None
+    refundable: bool | None = None
+    sort: str = "price"
+    descending: bool = False
+    page: int = 1
+    page_size: int = DEFAULT_PAGE_SIZE
+
+    @classmethod
+    def from_body(cls, body: dict[str, Any]) -> FlightResultQuery:
+        filters = body.get("filters") if isinstance(body.get("filters"), dict) else body
+        sort = str(body.get("sort") or "price").lower()
+        page, page_size = page_params(body)
+        return cls(
+            price_min=body_float(filters.get("priceMin")),
+            price_max=body_float(filters.get("priceMax")),
+            airlines=frozenset(
+                str(v).strip().upper() for v in body_list(filters.get("airlines")) if v
+            ),
+            max_stops=body_int(filters.get("maxStops")),
+            refundable=body_bool(filters.get("refundable")),
+            sort=sort if sort in _SORTS else "price",
+            descending=str(body.get("order") or "asc").lower() == "desc",
+            page=page,
+            page_size=page_size,
+        )
+
+    def matches(self, card: dict[str, Any]) -> bool:
+        price = flight_price(card)
+        if self.price_min is not None and price < self.price_min:
+            return False
+        if self.price_max is not None and price > self.price_max:
+            return False
+        if self.airlines and flight_airline(card) not in self.airlines:
+            return False
+        if self.max_stops is not None and flight_stops(card) > self.max_stops:
+            return False
+        if self.refundable is not None:
+            attributes = card.get("Attributes") if isinstance(card.get("Attributes"), dict) else {}
+            if bool(attributes.get("IsRefundable")) != self.refundable:
+                return False
+        return True
+
+
+async def query_flight_results(search_id: str, query: FlightResultQuery) -> dict[str, Any] | None:
+    """One page of stored cards, or ``None`` when the search has no stored results."""
+    stored = await get_search_result_store(SEARCH_RESULT_KIND).load(search_id)
+    if stored is None:
+        return None
+    order = sorted_positions(stored, query.sort, _SORTS[query.sort], query.descending)
+    positions = [i for i in order if query.matches(stored.cards[i])]
+    return {
+        "flights": paginate(stored, positions, page=query.page, page_size=query.page_size),
+        "total": len(positions),
+        "available": len(stored.cards),
+        "page": query.page,
+        "pageSize": query.page_size,
+        "complete": stored.complete,
+        "airlines": stored.memo("airlines", lambda: _airlines(stored)),
+        "priceRange": stored.memo("price_range", lambda: _price_range(stored)),
+    }
+
+
+def _airlines(stored: StoredSearch) -> list[str]:
+    return sorted({code for code in map(flight_airline, stored.cards) if code})
+
+
+def _price_range(stored: StoredSearch) -> dict[str, float] | None:
+    prices = [flight_price(c) for c in stored.cards]
+    return {"min": min(prices), "max": max(prices)} if prices else None
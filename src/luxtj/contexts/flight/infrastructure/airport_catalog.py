@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import csv
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
@@ -45,35 +47,98 @@ def load_airports() -> tuple[AirportRecord, ...]:
     return tuple(rows)
 
 
+_NGRAM = 3
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i : i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+
+
+class AirportSearchIndex:
+    """Autocomplete index over the catalog, built once per process.
+
+    Ranking: exact IATA, IATA prefix, city prefix, name prefix, then substring matches
+    anywhere in "iata name city country". Prefix groups come from sorted key arrays
+    (``bisect``); substrings from the rarest query trigram's posting list in a trigram
+    inverted index, verified against the text.
+    """
+
+    def __init__(self, airports: tuple[AirportRecord, ...]):
+        self._airports = airports
+        self._by_iata: dict[str, list[int]] = {}
+        self._texts: list[str] = []
+        self._postings: dict[str, list[int]] = {}
+        iata_keys: list[tuple[str, int]] = []
+        city_keys: list[tuple[str, int]] = []
+        name_keys: list[tuple[str, int]] = []
+        for pos, a in enumerate(airports):
+            iata = a.iata.lower()
+            self._by_iata.setdefault(iata, []).append(pos)
+            iata_keys.append((iata, pos))
+            if a.city:
+                city_keys.append((a.city.lower(), pos))
+            if a.name:
+                name_keys.append((a.name.lower(), pos))
+            text = f"{a.iata} {a.name} {a.city} {a.country}".lower()
+            self._texts.append(text)
+            for gram in _ngrams(text):
+                self._postings.setdefault(gram, []).append(pos)
+        self._prefix_arrays = [sorted(iata_keys), sorted(city_keys), sorted(name_keys)]
+
+    def search(self, q: str, limit: int) -> list[AirportRecord]:
+        picked: list[int] = []
+        seen_iata: set[str] = set()
+
+        def take(positions: Iterable[int]) -> bool:
+            for pos in positions:
+                iata = self._airports[pos].iata
+                if iata in seen_iata:
+                    continue
+                seen_iata.add(iata)
+                picked.append(pos)
+                if len(picked) >= limit:
+                    return True
+            return False
+
+        if take(self._by_iata.get(q, ())):
+            return self._records(picked)
+        for keys in self._prefix_arrays:
+            if take(_prefixed(keys, q)):
+                return self._records(picked)
+        take(self._containing(q))
+        return self._records(picked)
+
+    def _containing(self, q: str) -> Iterator[int]:
+        if len(q) < _NGRAM:
+            candidates: Iterable[int] = range(len(self._texts))
+        else:
+            # The rarest trigram's posting list (already in catalog order) bounds the scan;
+            # the caller stops pulling once it has enough hits.
+            candidates = min((self._postings.get(g, []) for g in _ngrams(q)), key=len)
+        texts = self._texts
+        for pos in candidates:
+            if q in texts[pos]:
+                yield pos
+
+    def _records(self, positions: list[int]) -> list[AirportRecord]:
+        return [self._airports[pos] for pos in positions]
+
+
+def _prefixed(keys: list[tuple[str, int]], q: str) -> Iterator[int]:
+    i = bisect_left(keys, (q, -1))
+    while i < len(keys) and keys[i][0].startswith(q):
+        yield keys[i][1]
+        i += 1
+
+
+@lru_cache(maxsize=1)
+def airport_search_index() -> AirportSearchIndex:
+    return AirportSearchIndex(load_airports())
+
+
 def search_airports(query: str, *, limit: int = 20) -> list[AirportRecord]:
     q = (query or "").strip().lower()
     if len(q) < 1:
         return []
     limit = max(1, min(int(limit or 20), 50))
-    airports = load_airports()
-    exact: list[AirportRecord] = []
-    prefix: list[AirportRecord] = []
-    contains: list[AirportRecord] = []
-    for a in airports:
-        iata_l = a.iata.lower()
-        blob = f"{a.iata} {a.name} {a.city} {a.country}".lower()
-        if iata_l == q:
-            exact.append(a)
-        elif iata_l.startswith(q) or a.city.lower().startswith(q):
-            prefix.append(a)
-        elif q in blob:
-            contains.append(a)
-        if len(exact) + len(prefix) >= limit:
-            break
-    out = exact + prefix + contains
-    # de-dupe by iata preserving order
-    seen: set[str] = set()
-    deduped: list[AirportRecord] = []
-    for a in out:
-        if a.iata in seen:
-            continue
-        seen.add(a.iata)
-        deduped.append(a)
-        if len(deduped) >= limit:
-            break
-    return deduped
+    return airport_search_index().search(q, limit)
@@ -13,7 +13,11 @@ from luxtj.contexts.currency.domain.admin_currency import AdminCurrency
 from luxtj.contexts.flight.domain.common import FlightCommon
 from luxtj.contexts.flight.infrastructure.citytravel import normalize as ct_norm
 from luxtj.contexts.flight.infrastructure.citytravel.soap import CityTravelSoap
-from luxtj.contexts.flight.infrastructure.token_cache import cache_get, cache_put
+from luxtj.contexts.flight.infrastructure.token_cache import (
+    TokenCacheBatch,
+    cache_get,
+    cache_put,
+)
 from luxtj.contexts.integration.domain.catalog import credential_value
 from luxtj.shared_kernel.infrastructure.http import HandleDescriptor, MultiHttpClient
 from luxtj.utils import timeutils
@@ -45,7 +49,7 @@ class CityTravelFlightProvider:
         self.booking_api_id = booking_api_id
         self._session = session
         self._http = http_client
-        self._curl = multi_http or MultiHttpClient(http_client, session=session)
+        self._curl = multi_http or MultiHttpClient(session=session)
 
         self.api_login = credential_value(self.config, "ApiLogin")
         self.api_password = credential_value(self.config, "ApiPassword")
@@ -214,7 +218,7 @@ class CityTravelFlightProvider:
 
         search_guid = str(result.get("SearchGuid") or "")
         supplier_ccy = str(result.get("Currency") or self.supplier_currency()).upper()[:3]
-        rate = AdminCurrency.rate_to_admin_or_one(supplier_ccy)
+        rate = await AdminCurrency.require_rate_to_admin_async(supplier_ccy)
         airports = ct_norm.index_airports(result)
         airlines = ct_norm.index_airlines(result)
 
@@ -225,13 +229,20 @@ class CityTravelFlightProvider:
                 continue
             groups.setdefault(fp, []).append(flight_data)
 
+        # Offer + group payloads are flushed together once every card is built.
+        # searchData is stored once per response; offers/groups reference it by key.
+        token_batch = TokenCacheBatch(CACHE_TTL_TOKEN)
+        search_data_key = f"citytravel_search_{FlightCommon.generate_uuid()}"
+        token_batch.put(search_data_key, search_data)
         cheapest_rows: list[dict[str, Any]] = []
         for fingerprint, variants in groups.items():
             tier_rows: list[dict[str, Any]] = []
             for flight_data in variants:
                 row = self._build_variant_row(
                     flight_data,
+                    token_batch=token_batch,
                     search_data=search_data,
+                    search_data_key=search_data_key,
                     search_guid=search_guid,
                     supplier_currency=supplier_ccy,
                     conversion_rate=rate,
@@ -244,15 +255,14 @@ class CityTravelFlightProvider:
                 continue
             tier_rows.sort(key=lambda r: float((r.get("Price") or {}).get("TotalDisplayFare") or 0))
             group_key = f"citytravel_group_{FlightCommon.generate_uuid()}"
-            cache_put(
+            token_batch.put(
                 group_key,
                 {
-                    "searchData": search_data,
+                    "searchDataKey": search_data_key,
                     "SearchGuid": search_guid,
                     "upsellRows": tier_rows,
                     "fingerprint": fingerprint,
                 },
-                CACHE_TTL_TOKEN,
             )
             cheapest = dict(tier_rows[0])
             # Search card ResultToken points at the group (UpSell loads all variants).
@@ -264,13 +274,22 @@ class CityTravelFlightProvider:
         if not cheapest_rows:
             return {"status": False, "data": [], "message": "No flights found"}
 
+        await token_batch.flush()
+        logger.info(
+            "City Travel search tokens cached search_id=%s tokens=%d bytes=%d",
+            search_data.get("search_id"),
+            token_batch.tokens_written,
+            token_batch.bytes_written,
+        )
         return {"status": True, "data": cheapest_rows}
 
     def _build_variant_row(
         self,
         flight_data: dict[str, Any],
         *,
+        token_batch: TokenCacheBatch,
         search_data: dict[str, Any],
+        search_data_key: str,
         search_guid: str,
         supplier_currency: str,
         conversion_rate: float,
@@ -292,12 +311,12 @@ class CityTravelFlightProvider:
         baggage_allowance = ct_norm.build_baggage_allowance(flight_data, search_data=search_data)
         validating = ct_norm.validating_airline(flight_data)
         offer_key = f"citytravel_offer_{FlightCommon.generate_uuid()}"
-        cache_put(
+        token_batch.put(
             offer_key,
             {
                 "SearchGuid": search_guid,
                 "OfferCode": offer_code,
-                "searchData": search_data,
+                "searchDataKey": search_data_key,
                 "flightDetails": details,
                 "price": price,
                 "baggageAllowance": baggage_allowance,
@@ -306,7 +325,6 @@ class CityTravelFlightProvider:
                 "rawFlightData": flight_data,
                 "ValidatingAirline": validating,
             },
-            CACHE_TTL_TOKEN,
         )
 
         return {
@@ -325,7 +343,7 @@ class CityTravelFlightProvider:
 
     async def get_upsell(self, token: str) -> dict[str, Any]:
         """Return all price variants for an itinerary group (Search ResultToken → group cache)."""
-        group = cache_get(token)
+        group = await cache_get(token)
         if not isinstance(group, dict):
             return {"status": False, "data": [], "message": "Invalid or expired token"}
         rows = group.get("upsellRows")
@@ -333,6 +351,17 @@ class CityTravelFlightProvider:
             return {"status": False, "data": [], "message": "Invalid or expired token"}
         return {"status": True, "data": rows}
 
+    async def _load_offer(self, token: str) -> dict[str, Any] | None:
+        """Offer token payload with its per-search ``searchData`` re-attached."""
+        offer = await cache_get(token)
+        if not isinstance(offer, dict):
+            return None
+        search_data_key = offer.get("searchDataKey")
+        if search_data_key and not isinstance(offer.get("searchData"), dict):
+            search_data = await cache_get(str(search_data_key))
+            offer = {**offer, "searchData": search_data if isinstance(search_data, dict) else {}}
+        return offer
+
     def get_aero_prebook_request(
         self, offer_code: str, search_guid: str
     ) -> HandleDescriptor | None:
@@ -370,7 +399,7 @@ class CityTravelFlightProvider:
         )
 
     async def get_update_fare_quote(self, token: str) -> dict[str, Any]:
-        offer = cache_get(token)
+        offer = await self._load_offer(token)
         if not isinstance(offer, dict):
             return {"status": False, "data": [], "message": "Invalid or expired token"}
         offer_code = str(offer.get("OfferCode") or "").strip()
@@ -395,12 +424,12 @@ class CityTravelFlightProvider:
         raw = results.get(self.booking_source) or ""
         if isinstance(raw, list):
             raw = raw[0] if raw else ""
-        formatted = self._format_aero_prebook_response(str(raw or ""), offer)
+        formatted = await self._format_aero_prebook_response(str(raw or ""), offer)
         if formatted is None:
             return {"status": False, "data": [], "message": "Revalidation failed"}
         return {"status": True, "data": formatted}
 
-    def _format_aero_prebook_response(
+    async def _format_aero_prebook_response(
         self,
         raw_xml: str,
         offer_cache: dict[str, Any],
@@ -423,7 +452,7 @@ class CityTravelFlightProvider:
             or offer_cache.get("supplier_currency")
             or self.supplier_currency()
         ).upper()[:3]
-        rate = AdminCurrency.rate_to_admin_or_one(supplier_ccy)
+        rate = await AdminCurrency.require_rate_to_admin_async(supplier_ccy)
         total_supplier = ct_norm.prebook_supplier_total(result)
         if total_supplier <= 0:
             # Fall back to cached search price (supplier amounts were already converted in cache)
@@ -474,7 +503,7 @@ class CityTravelFlightProvider:
         )
 
         quote_key = f"citytravel_fare_quote_{FlightCommon.generate_uuid()}"
-        cache_put(
+        await cache_put(
             quote_key,
             {
                 "SearchGuid": search_guid,
@@ -517,7 +546,7 @@ class CityTravelFlightProvider:
 
     async def get_extra_services(self, token: str) -> dict[str, Any]:
         """Format AeroPrebook ``Services`` from fare-quote cache (no SOAP)."""
-        quote = cache_get(token)
+        quote = await cache_get(token)
         if not isinstance(quote, dict):
             return {"status": False, "data": [], "message": "Invalid or expired token"}
         details = quote.get("flightDetails")
@@ -548,7 +577,7 @@ class CityTravelFlightProvider:
 
     async def get_flight_row_from_token_for_pricing(self, token: str) -> dict[str, Any]:
         """Build a FlightDetails/Price row from fare-quote (or offer) cache — no SOAP."""
-        cached = cache_get(token)
+        cached = await cache_get(token)
         if not isinstance(cached, dict):
             return {"status": False, "data": [], "message": "Invalid or expired token"}
 
@@ -605,7 +634,7 @@ class CityTravelFlightProvider:
         selected_tariffs: list[Any] | None = None,
     ) -> dict[str, Any]:
         """Cache fare-quote + pax under ``citytravel_pre_book_*`` (no AeroBook)."""
-        quote = cache_get(token)
+        quote = await cache_get(token)
         if not isinstance(quote, dict):
             return {"status": False, "data": [], "message": "Invalid or expired token"}
         offer_code = str(quote.get("OfferCode") or "").strip()
@@ -692,7 +721,7 @@ class CityTravelFlightProvider:
         )
 
         pre_book_key = f"citytravel_pre_book_{FlightCommon.generate_uuid()}"
-        cache_put(
+        await cache_put(
             pre_book_key,
             {
                 **quote,
@@ -722,7 +751,7 @@ class CityTravelFlightProvider:
         if not decoded:
             return {"status": False, "data": [], "message": "Invalid ResultToken"}
 
-        pre = cache_get(str(decoded["token"]))
+        pre = await cache_get(str(decoded["token"]))
         if not isinstance(pre, dict):
             return {"status": False, "data": [], "message": "Invalid or expired pre-book token"}
 
@@ -829,7 +858,7 @@ class CityTravelFlightProvider:
         supplier_ccy = str(
             result.get("Currency") or pre.get("supplier_currency") or self.supplier_currency()
         ).upper()[:3]
-        rate = AdminCurrency.rate_to_admin_or_one(supplier_ccy)
+        rate = await AdminCurrency.require_rate_to_admin_async(supplier_ccy)
         if full_price > 0:
             price = ct_norm.build_price_block_from_total(
                 full_price,
@@ -870,7 +899,7 @@ class CityTravelFlightProvider:
             "ResultToken": token,
         }
 
-        cache_put(
+        await cache_put(
             f"citytravel_booking_{book_id}",
             {
                 **hold_data,
@@ -888,14 +917,14 @@ class CityTravelFlightProvider:
         if not book_id:
             return {"status": False, "data": [], "message": "BookId is required"}
 
-        cached = cache_get(f"citytravel_booking_{book_id}")
+        cached = await cache_get(f"citytravel_booking_{book_id}")
         cached = cached if isinstance(cached, dict) else {}
         book_guid = str(cached.get("book_guid") or cached.get("BookGuid") or "").strip()
         attr = cached.get("Attr") if isinstance(cached.get("Attr"), dict) else {}
         price = ct_norm._as_float(attr.get("book_price"))
         if price <= 0:
             price = ct_norm._as_float((cached.get("Price") or {}).get("TotalDisplayFare"))
-            rate = AdminCurrency.rate_to_admin_or_one(
+            rate = await AdminCurrency.require_rate_to_admin_async(
                 str(attr.get("supplier_currency") or self.supplier_currency())
             )
             if price > 0 and rate > 0:
@@ -963,7 +992,7 @@ class CityTravelFlightProvider:
         if pending:
             data["confirmationPending"] = True
 
-        cache_put(
+        await cache_put(
             f"citytravel_booking_{book_id}",
             {**cached, "ticketing": data, "RawConfirm": order, "gdspnr": gdspnr},
             CACHE_TTL_TOKEN,
@@ -980,7 +1009,7 @@ class CityTravelFlightProvider:
         """OrderInfo poll for WaitToBooking / status refresh."""
         book_id = str(locator or "").strip()
         context = context or {}
-        cached = cache_get(f"citytravel_booking_{book_id}") if book_id else None
+        cached = await cache_get(f"citytravel_booking_{book_id}") if book_id else None
         cached = cached if isinstance(cached, dict) else {}
         book_guid = str(
             context.get("book_guid") or cached.get("book_guid") or cached.get("BookGuid") or ""
@@ -1077,7 +1106,7 @@ class CityTravelFlightProvider:
             "Price": cached.get("Price") or {},
         }
         if book_id_out:
-            cache_put(
+            await cache_put(
                 f"citytravel_booking_{book_id_out}",
                 {**cached, **data},
                 CACHE_TTL_TOKEN,
@@ -1243,9 +1272,9 @@ class CityTravelFlightProvider:
             "RawAnnulate": result,
         }
         if book_id_out:
-            cached = cache_get(f"citytravel_booking_{book_id_out}")
+            cached = await cache_get(f"citytravel_booking_{book_id_out}")
             cached = cached if isinstance(cached, dict) else {}
-            cache_put(
+            await cache_put(
                 f"citytravel_booking_{book_id_out}",
                 {**cached, **data, "cancelled": True},
                 CACHE_TTL_TOKEN,
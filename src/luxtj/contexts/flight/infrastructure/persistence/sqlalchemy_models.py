@@ -50,6 +50,8 @@ class FlightBookingDetailsRow(FlightBase):
         Index("ix_flight_booking_details_booking_source", "booking_source"),
         Index("ix_flight_booking_details_status", "status"),
         Index("ix_flight_booking_details_created_by_id", "created_by_id"),
+        Index("ix_flight_booking_details_created_at_id", "created_at", "id"),
+        Index("ix_flight_booking_details_updated_at", "updated_at"),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
@@ -78,7 +80,10 @@ class FlightBookingTransactionDetailsRow(FlightBase):
     """Money ledger for a flight booking (admin currency amounts)."""
 
     __tablename__ = "flight_booking_transaction_details"
-    __table_args__ = (Index("ix_flight_booking_txn_app_reference", "app_reference"),)
+    __table_args__ = (
+        Index("ix_flight_booking_txn_app_reference", "app_reference"),
+        Index("ix_flight_booking_txn_updated_at", "updated_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     app_reference: Mapped[str] = mapped_column(
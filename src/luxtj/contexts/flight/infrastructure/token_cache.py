@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 from luxtj.shared_kernel.infrastructure.redis_cache import (
     redis_cache_delete,
     redis_cache_get,
+    redis_cache_get_many,
     redis_cache_put,
+    redis_cache_put_many,
 )
 
 _NAMESPACE = "flight_token"
@@ -16,13 +19,53 @@ _NAMESPACE = "flight_token"
 DEFAULT_TOKEN_TTL_SECONDS = 45 * 60
 
 
-def cache_put(key: str, value: Any, ttl_seconds: int = DEFAULT_TOKEN_TTL_SECONDS) -> None:
-    redis_cache_put(_NAMESPACE, key, value, ttl_seconds)
+async def cache_put(key: str, value: Any, ttl_seconds: int = DEFAULT_TOKEN_TTL_SECONDS) -> None:
+    await redis_cache_put(_NAMESPACE, key, value, ttl_seconds)
 
 
-def cache_get(key: str) -> Any | None:
-    return redis_cache_get(_NAMESPACE, key)
+async def cache_put_many(
+    items: Mapping[str, Any], ttl_seconds: int = DEFAULT_TOKEN_TTL_SECONDS
+) -> int:
+    return await redis_cache_put_many(_NAMESPACE, items, ttl_seconds)
 
 
-def cache_delete(key: str) -> None:
-    redis_cache_delete(_NAMESPACE, key)
+async def cache_get(key: str) -> Any | None:
+    return await redis_cache_get(_NAMESPACE, key)
+
+
+async def cache_get_many(keys: Sequence[str]) -> dict[str, Any]:
+    return await redis_cache_get_many(_NAMESPACE, keys)
+
+
+async def cache_delete(key: str) -> None:
+    await redis_cache_delete(_NAMESPACE, key)
+
+
+class TokenCacheBatch:
+    """Write-behind token buffer: ``put`` collects payloads, ``flush`` writes them in one
+    pipelined round trip. Keys are final at ``put`` time, so ResultTokens can be
+    encoded before the flush — callers must flush before handing tokens to clients.
+    """
+
+    def __init__(self, ttl_seconds: int = DEFAULT_TOKEN_TTL_SECONDS) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._items: dict[str, Any] = {}
+        self.tokens_written = 0
+        self.bytes_written = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, key: str, value: Any) -> None:
+        self._items[key] = value
+
+    async def flush(self) -> int:
+        """Write pending payloads; returns bytes written by this flush."""
+        if not self._items:
+            return 0
+        items, self._items = self._items, {}
+        written = await cache_put_many(items, self._ttl_seconds)
+        if written:
+            self.tokens_written += len(items)
+            self.bytes_written += written
+        return written
@@ -10,6 +10,10 @@ from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from luxtj.contexts.flight.application.blender import FlightBlender
+from luxtj.contexts.flight.application.search_results import (
+    FlightResultQuery,
+    query_flight_results,
+)
 from luxtj.contexts.flight.domain.common import FlightCommon
 from luxtj.contexts.integration.infrastructure.registry_cache import get_integration_registry
 from luxtj.shared_kernel.presentation.http.dependencies import (
@@ -66,6 +70,7 @@ async def flight_service(
         "PreSearch": _pre_search,
         "GetSearch": _get_search,
         "Search": _search,
+        "SearchResults": _search_results,
         "UpSell": _upsell,
         "UpdateFareQuote": _update_fare_quote,
         "ValidateFlightPromo": _validate_promo,
@@ -150,6 +155,22 @@ async def _search(
     )
 
 
+async def _search_results(
+    body: dict[str, Any],
+    session: AsyncSession,
+    blender: FlightBlender,
+    request: Request,
+) -> JSONResponse:
+    """Filter / sort / page the cards a ``Search`` stream stored for ``search_id``."""
+    search_id = str(body.get("search_id") or "")
+    if not search_id:
+        return _err("search_id is required")
+    data = await query_flight_results(search_id, FlightResultQuery.from_body(body))
+    if data is None:
+        return _err("Search results not found; run the search again", status_code=404)
+    return _ok(data, "Success")
+
+
 async def _upsell(
     body: dict[str, Any],
     session: AsyncSession,
@@ -12,6 +12,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from luxtj.contexts.flight.application.markup_index import invalidate_flight_markup_rules
 from luxtj.contexts.flight.application.markup_rule_resolver import FlightMarkupRuleResolver
 from luxtj.contexts.flight.infrastructure.airport_catalog import search_airports
 from luxtj.contexts.flight.infrastructure.persistence.sqlalchemy_models import FlightMarkupRuleRow
@@ -158,7 +159,9 @@ async def create_rule(
         updated_at=now,
     )
     session.add(row)
-    await session.flush()
+    # Commit before bumping the rule version so a concurrent reload cannot cache old rules.
+    await session.commit()
+    await invalidate_flight_markup_rules()
     return ApiSuccessResponse(output=FlightMarkupRuleSerializer.from_row(row))
 
 
@@ -175,7 +178,8 @@ async def update_rule(
     if row is None:
         raise HTTPException(status_code=404, detail="Markup rule not found")
     _apply_body(row, body)
-    await session.flush()
+    await session.commit()
+    await invalidate_flight_markup_rules()
     return ApiSuccessResponse(output=FlightMarkupRuleSerializer.from_row(row))
 
 
@@ -191,7 +195,8 @@ async def delete_rule(
     if row is None:
         raise HTTPException(status_code=404, detail="Markup rule not found")
     await session.delete(row)
-    await session.flush()
+    await session.commit()
+    await invalidate_flight_markup_rules()
     return ApiSuccessResponse(output={"deleted": True, "id": rule_id})
 
 
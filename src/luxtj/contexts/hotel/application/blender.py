@@ -18,6 +18,8 @@ from luxtj.contexts.currency.domain.booking_money_for_client import BookingMoney
 from luxtj.contexts.hotel.application.markup import HotelMarkup
 from luxtj.contexts.hotel.application.prebook_quote import HotelPreBookQuote
 from luxtj.contexts.hotel.application.promo import HotelPromo
+from luxtj.contexts.hotel.application.search_results import SEARCH_RESULT_KIND
+from luxtj.contexts.hotel.application.search_timing import HotelSearchTimings
 from luxtj.contexts.hotel.domain.common import HotelCommon
 from luxtj.contexts.hotel.domain.provider import HotelProvider
 from luxtj.contexts.hotel.infrastructure.block_cache import cache_get
@@ -31,12 +33,16 @@ from luxtj.contexts.hotel.infrastructure.persistence.sqlalchemy_models import (
 )
 from luxtj.contexts.hotel.infrastructure.ratehawk.provider import RateHawkHotelProvider
 from luxtj.contexts.integration.infrastructure.registry_cache import get_integration_registry
-from luxtj.shared_kernel.infrastructure.http import MultiHttpClient
+from luxtj.shared_kernel.infrastructure.http import MultiHttpClient, SupplierResponse
+from luxtj.shared_kernel.infrastructure.search_result_store import get_search_result_store
 from luxtj.utils import timeutils
 
 logger = logging.getLogger(__name__)
 
 _SEARCH_DONE = object()
+# Bounded hand-off between supplier reads, enrichment and the client stream (backpressure).
+_RAW_QUEUE_SIZE = 2
+_OUT_QUEUE_SIZE = 4
 
 
 class HotelBlender:
@@ -52,7 +58,7 @@ class HotelBlender:
         self._session = session
         self._crs_session = crs_session or session
         self._http = http_client
-        self._curl = multi_http or MultiHttpClient(http_client, session=session)
+        self._curl = multi_http or MultiHttpClient(session=session)
         self._markup = hotel_markup or HotelMarkup(session, crs_session=self._crs_session)
 
     async def create_search_session(
@@ -143,7 +149,16 @@ class HotelBlender:
             return None
         return self.resolve_provider_by_source(str(decoded["booking_source"]))
 
-    async def search(self, search_id: str) -> AsyncIterator[dict[str, Any]]:
+    async def search(
+        self, search_id: str, timings: HotelSearchTimings | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream search cards: each CRS window is marked up and yielded as soon as it is ready.
+
+        Queues are bounded, so a slow client pauses enrichment (and, behind it, the hand-off
+        of further supplier responses) instead of buffering every card in memory. Stage timings
+        are logged per search; pass ``timings`` to add caller stages (serialization) and
+        log them yourself.
+        """
         session = await self.get_search_session(search_id)
         if not session:
             yield {"status": False, "message": "Invalid search session"}
@@ -205,11 +220,24 @@ class HotelBlender:
             }
             return
 
-        raw_q: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue()
-        out_q: asyncio.Queue[dict[str, Any] | object] = asyncio.Queue()
-
-        async def _on_response(provider_code: str, raw: str) -> None:
-            await raw_q.put((provider_code, raw))
+        owns_timings = timings is None
+        stage_timings = timings or HotelSearchTimings(search_id)
+        results = get_search_result_store(SEARCH_RESULT_KIND)
+        run = await results.reset(search_id)
+        raw_q: asyncio.Queue[SupplierResponse | None] = asyncio.Queue(maxsize=_RAW_QUEUE_SIZE)
+        out_q: asyncio.Queue[dict[str, Any] | object] = asyncio.Queue(maxsize=_OUT_QUEUE_SIZE)
+
+        async def _on_response(response: SupplierResponse) -> None:
+            stage_timings.supplier_response(response.decode_seconds)
+            logger.info(
+                "Hotel search response search_id=%s provider=%s bytes=%d decode_ms=%.1f cached=%s",
+                search_id,
+                response.provider,
+                response.size,
+                response.decode_seconds * 1000,
+                response.from_cache,
+            )
+            await raw_q.put(response)
 
         async def _run_http() -> None:
             try:
@@ -219,44 +247,56 @@ class HotelBlender:
             finally:
                 await raw_q.put(None)
 
+        async def _emit(batch: list[Any], provider_code: str) -> None:
+            with stage_timings.measure("markup"):
+                marked = await self._apply_markup_to_search_hotels(
+                    batch,
+                    search_data,
+                    provider_code.lower(),
+                )
+            stage_timings.chunk_ready(len(marked))
+            await results.append(search_id, run, marked)
+            await out_q.put(
+                {
+                    "status": True,
+                    "message": "Inprogress",
+                    "data": {"hotels": marked, "moreResults": True},
+                    "errors": None,
+                }
+            )
+
         async def _process_raw() -> None:
             try:
                 while True:
                     item = await raw_q.get()
                     if item is None:
                         break
-                    provider_code, raw = item
+                    provider_code = item.provider
+                    # Parsed JSON / XML dict when the transport could parse it, else text.
+                    raw = item.payload()
                     provider = provider_by_code.get(provider_code)
                     search_for_provider = search_by_code.get(provider_code) or search_data
                     if provider is None:
                         continue
 
-                    batches: list[list[dict[str, Any]]] = []
                     iter_batches = getattr(provider, "iter_search_hotel_batches", None)
                     if callable(iter_batches):
-                        async for batch in iter_batches(raw, search_for_provider):
+                        windows = aiter(iter_batches(raw, search_for_provider))
+                        while True:
+                            with stage_timings.measure("enrich"):
+                                batch = await anext(windows, None)
+                            if batch is None:
+                                break
                             if isinstance(batch, list) and batch:
-                                batches.append(batch)
+                                await _emit(batch, provider_code)
                     else:
-                        formatted = await provider.format_search_response(raw, search_for_provider)
+                        with stage_timings.measure("parse"):
+                            formatted = await provider.format_search_response(
+                                raw, search_for_provider
+                            )
                         data = formatted.get("data") if isinstance(formatted, dict) else None
                         if isinstance(data, list) and data:
-                            batches.append(data)
-
-                    for batch in batches:
-                        marked = await self._apply_markup_to_search_hotels(
-                            batch,
-                            search_data,
-                            provider_code.lower(),
-                        )
-                        await out_q.put(
-                            {
-                                "status": True,
-                                "message": "Inprogress",
-                                "data": {"hotels": marked, "moreResults": True},
-                                "errors": None,
-                            }
-                        )
+                            await _emit(data, provider_code)
             except Exception:
                 logger.exception("Hotel search format/enrich failed search_id=%s", search_id)
             finally:
@@ -273,8 +313,15 @@ class HotelBlender:
                 if isinstance(chunk, dict):
                     yield chunk
         finally:
+            # Client went away or enrichment failed: stop producers blocked on full queues.
+            for task in (http_task, proc_task):
+                if not task.done():
+                    task.cancel()
             await asyncio.gather(http_task, proc_task, return_exceptions=True)
+            if owns_timings:
+                stage_timings.log()
 
+        await results.complete(search_id, run)
         yield {
             "status": True,
             "message": "Completed",
@@ -374,7 +421,7 @@ class HotelBlender:
         if not decoded:
             return {"status": False, "message": "Invalid ResultToken", "data": {}}
         inner = decoded.get("data") if isinstance(decoded.get("data"), dict) else {}
-        snapshot = cache_get(HotelCommon.hotel_block_snapshot_cache_key(list_token))
+        snapshot = await cache_get(HotelCommon.hotel_block_snapshot_cache_key(list_token))
         if not isinstance(snapshot, dict):
             return {
                 "status": False,
@@ -393,9 +440,7 @@ class HotelBlender:
             float(b["room_rate_exclusive_supplier"]) + float(b["taxes_incl_markup"]),
         )
         currency = str(b["currency"])
-        rate = float(AdminCurrency.rate_to_admin_or_one(currency))
-        if rate <= 0:
-            rate = 1.0
+        rate = float(await AdminCurrency.require_rate_to_admin_async(currency))
         promo_base_admin = round(promo_base * rate, 2)
         eval_result = await HotelPromo.evaluate(self._session, promo_code, promo_base_admin)
         discount_admin = float(eval_result.get("discount_amount_admin") or 0)
@@ -966,10 +1011,9 @@ class HotelBlender:
             str(search_data.get("checkin_date") or ""),
             str(search_data.get("checkout_date") or ""),
         )
-        out: list[Any] = []
+        items: list[tuple[dict[str, Any], float]] = []
         for hotel in hotels:
             if not isinstance(hotel, dict):
-                out.append(hotel)
                 continue
             basis = float(hotel.get("price") or 0)
             params = {
@@ -982,7 +1026,16 @@ class HotelBlender:
             }
             if params["star_rating"] is not None and params["star_rating"] <= 0:
                 params["star_rating"] = None
-            mk = await self._markup.get_markup_amount_for_hotel(params, basis)
+            items.append((params, basis))
+        markups = iter(await self._markup.get_markup_amounts_for_hotels(items))
+
+        out: list[Any] = []
+        for hotel in hotels:
+            if not isinstance(hotel, dict):
+                out.append(hotel)
+                continue
+            basis = float(hotel.get("price") or 0)
+            mk = next(markups)
             if mk["amount"] > 0:
                 hotel = dict(hotel)
                 hotel["price"] = round(basis + mk["amount"], 2)
@@ -995,13 +1048,22 @@ class HotelBlender:
     async def _apply_markup_to_room_list(
         self, rooms: list[Any], base_params: dict[str, Any]
     ) -> list[Any]:
+        items: list[tuple[dict[str, Any], float]] = []
+        for room in rooms:
+            if not isinstance(room, dict) or not isinstance(room.get("roomVariations"), list):
+                continue
+            star = int(room.get("hotelStarRating") or 0)
+            params = {**base_params, "star_rating": star if star > 0 else None}
+            for v in room["roomVariations"]:
+                if isinstance(v, dict):
+                    items.append((params, float(v.get("amount") or 0)))
+        markups = iter(await self._markup.get_markup_amounts_for_hotels(items))
+
         out: list[Any] = []
         for room in rooms:
             if not isinstance(room, dict):
                 out.append(room)
                 continue
-            star = int(room.get("hotelStarRating") or 0)
-            params = {**base_params, "star_rating": star if star > 0 else None}
             variations = room.get("roomVariations")
             if not isinstance(variations, list):
                 out.append(room)
@@ -1013,7 +1075,7 @@ class HotelBlender:
                     continue
                 v = dict(v)
                 basis = float(v.get("amount") or 0)
-                mk = await self._markup.get_markup_amount_for_hotel(params, basis)
+                mk = next(markups)
                 if mk["amount"] > 0:
                     v["taxes"] = round(float(v.get("taxes") or 0) + mk["amount"], 2)
                     v["TotalTax"] = v["taxes"]
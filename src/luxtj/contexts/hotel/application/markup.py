@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from luxtj.contexts.crs.infrastructure.persistence.sqlalchemy_models import NewCitiesNRegionRow
+from luxtj.contexts.hotel.application.markup_index import (
+    HotelMarkupRuleEntry,
+    HotelMarkupRuleIndex,
+    get_hotel_markup_rule_index,
+)
 from luxtj.contexts.hotel.application.markup_rule_resolver import HotelMarkupRuleResolver
-from luxtj.contexts.hotel.infrastructure.persistence.sqlalchemy_models import HotelMarkupRuleRow
 
 
 class HotelMarkup:
@@ -23,16 +27,14 @@ class HotelMarkup:
         self._session = session
         self._crs_session = crs_session or session
         self._resolver = resolver or HotelMarkupRuleResolver()
-        self._cached_rules: list[HotelMarkupRuleRow] | None = None
         self._region_country_cache: dict[str, str | None] = {}
 
-    async def active_rules(self) -> list[HotelMarkupRuleRow]:
-        if self._cached_rules is None:
-            stmt = select(HotelMarkupRuleRow).where(
-                HotelMarkupRuleRow.status.in_(["active", "ACTIVE", "1"])
-            )
-            self._cached_rules = list((await self._session.execute(stmt)).scalars().all())
-        return self._cached_rules
+    async def rule_index(self) -> HotelMarkupRuleIndex:
+        """Process-wide compiled index (reloaded only after admin edits / max age)."""
+        return await get_hotel_markup_rule_index(self._session)
+
+    async def active_rules(self) -> list[HotelMarkupRuleEntry]:
+        return (await self.rule_index()).rules
 
     async def country_code_for_region_id(self, region_id: str) -> str | None:
         if not region_id:
@@ -79,13 +81,25 @@ class HotelMarkup:
     async def get_markup_amount_for_hotel(
         self, hotel_params: dict[str, Any], amount: float
     ) -> dict[str, Any]:
-        basis = max(0.0, round(float(amount), 2))
-        context = await self.build_context(hotel_params)
-        rules = await self.active_rules()
-        if not rules:
-            return {"amount": 0.0, "value": 0.0, "isPercentage": False, "rule_id": None}
-        matching = self._resolver.matching_rules(rules, context)
-        best = self._resolver.select_best(matching)
+        return (await self.get_markup_amounts_for_hotels([(hotel_params, amount)]))[0]
+
+    async def get_markup_amounts_for_hotels(
+        self, items: Sequence[tuple[dict[str, Any], float]]
+    ) -> list[dict[str, Any]]:
+        """Price a whole search chunk with one index lookup per distinct hotel context."""
+        if not items:
+            return []
+        index = await self.rule_index()
+        if not len(index):
+            return [self._markup_result(None, 0.0) for _ in items]
+        contexts = [await self.build_context(params) for params, _ in items]
+        rules = index.best_rules(contexts)
+        return [
+            self._markup_result(best, max(0.0, round(float(amount), 2)))
+            for best, (_, amount) in zip(rules, items, strict=True)
+        ]
+
+    def _markup_result(self, best: HotelMarkupRuleEntry | None, basis: float) -> dict[str, Any]:
         markup_total = self._resolver.compute_markup_value(best, basis)
         return {
             "amount": float(markup_total),
@@ -0,0 +1,193 @@
+"""Compiled, process-wide hotel markup rule index.
+
+Active rules are bucketed by their exact-match filters (supplier, country, region,
+hotel code, star rating); an unset filter is stored under ``None``. A lookup probes only
+the buckets a context can hit (at most 32 wildcard combinations), and every bucket is
+pre-sorted by ``(-priority_score, str(id))`` so its first rule inside the check-in window
+is that bucket's best. The winner is the same rule ``HotelMarkupRuleResolver.matching_rules``
++ ``select_best`` would pick, without scanning every rule per hotel card.
+
+The index is shared through a :class:`VersionedSnapshot`; admin edits call
+:func:`invalidate_hotel_markup_rules`.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from itertools import product
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from luxtj.bootstrap import config
+from luxtj.contexts.hotel.application.markup_rule_resolver import HotelMarkupRuleResolver
+from luxtj.contexts.hotel.infrastructure.persistence.sqlalchemy_models import HotelMarkupRuleRow
+from luxtj.shared_kernel.infrastructure.versioned_snapshot import VersionedSnapshot
+
+logger = logging.getLogger(__name__)
+
+type HotelRuleKey = tuple[str | None, str | None, str | None, str | None, int | None]
+
+
+@dataclass(frozen=True, slots=True)
+class HotelMarkupRuleEntry:
+    """Detached, normalized copy of an active ``HotelMarkupRuleRow``."""
+
+    id: str
+    supplier_code: str | None
+    country_code: str | None
+    region_id: str | None
+    hotel_code: str | None
+    star_rating: int | None
+    check_in_date_from: date | None
+    check_in_date_to: date | None
+    markup_amount: Decimal
+    is_percentage: bool
+    priority: int
+    status: str = "active"
+
+    @property
+    def sort_key(self) -> tuple[int, str]:
+        return -self.priority, self.id
+
+    @property
+    def key(self) -> HotelRuleKey:
+        return (
+            self.supplier_code,
+            self.country_code,
+            self.region_id,
+            self.hotel_code,
+            self.star_rating,
+        )
+
+    def in_window(self, check_in: date | None) -> bool:
+        if self.check_in_date_from is None and self.check_in_date_to is None:
+            return True
+        if check_in is None:
+            return False
+        if self.check_in_date_from and check_in < self.check_in_date_from:
+            return False
+        if self.check_in_date_to and check_in > self.check_in_date_to:
+            return False
+        return True
+
+
+class HotelMarkupRuleIndex:
+    def __init__(
+        self,
+        rules: Iterable[Any],
+        resolver: HotelMarkupRuleResolver | None = None,
+    ) -> None:
+        self._resolver = resolver or HotelMarkupRuleResolver()
+        self.rules: list[HotelMarkupRuleEntry] = []
+        for rule in rules:
+            if not self._resolver._is_active(rule):
+                continue
+            try:
+                self.rules.append(self._compile(rule))
+            except TypeError, ValueError:
+                logger.warning(
+                    "Skipping hotel markup rule with invalid filters id=%s",
+                    getattr(rule, "id", None),
+                )
+        buckets: dict[HotelRuleKey, list[HotelMarkupRuleEntry]] = {}
+        for entry in self.rules:
+            buckets.setdefault(entry.key, []).append(entry)
+        for bucket in buckets.values():
+            bucket.sort(key=lambda e: e.sort_key)
+        self._buckets = buckets
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _compile(self, rule: Any) -> HotelMarkupRuleEntry:
+        r = self._resolver
+        region = getattr(rule, "region_id", None)
+        star = getattr(rule, "star_rating", None)
+        return HotelMarkupRuleEntry(
+            id=str(getattr(rule, "id", "")),
+            supplier_code=r.normalize_supplier_code(getattr(rule, "supplier_code", None)),
+            country_code=r.normalize_country_code(getattr(rule, "country_code", None)),
+            region_id=str(region) if region is not None and str(region).strip() else None,
+            hotel_code=r.normalize_filter(getattr(rule, "hotel_code", None)),
+            star_rating=int(star) if star is not None else None,
+            check_in_date_from=getattr(rule, "check_in_date_from", None),
+            check_in_date_to=getattr(rule, "check_in_date_to", None),
+            markup_amount=Decimal(str(getattr(rule, "markup_amount", 0) or 0)),
+            is_percentage=bool(getattr(rule, "is_percentage", False)),
+            priority=r.priority_score(rule),
+        )
+
+    def context_key(self, context: dict[str, Any]) -> HotelRuleKey:
+        r = self._resolver
+        region = context.get("region_id")
+        star = context.get("star_rating")
+        return (
+            r.normalize_supplier_code(context.get("supplier_code")),
+            r.normalize_country_code(context.get("country_code")),
+            str(region) if region is not None else None,
+            r.normalize_filter(context.get("hotel_code")),
+            int(star) if star is not None else None,
+        )
+
+    def best_rule(self, context: dict[str, Any]) -> HotelMarkupRuleEntry | None:
+        return self._best_for(
+            self.context_key(context), self._resolver._context_check_in_date(context)
+        )
+
+    def best_rules(self, contexts: Sequence[dict[str, Any]]) -> list[HotelMarkupRuleEntry | None]:
+        """One lookup per distinct (filters, check-in) across a search chunk."""
+        seen: dict[tuple[HotelRuleKey, date | None], HotelMarkupRuleEntry | None] = {}
+        out: list[HotelMarkupRuleEntry | None] = []
+        for context in contexts:
+            memo_key = (
+                self.context_key(context),
+                self._resolver._context_check_in_date(context),
+            )
+            if memo_key not in seen:
+                seen[memo_key] = self._best_for(*memo_key)
+            out.append(seen[memo_key])
+        return out
+
+    def _best_for(self, key: HotelRuleKey, check_in: date | None) -> HotelMarkupRuleEntry | None:
+        if not self._buckets:
+            return None
+        best: HotelMarkupRuleEntry | None = None
+        for probe in product(*((value, None) if value is not None else (None,) for value in key)):
+            for entry in self._buckets.get(probe, ()):
+                if entry.in_window(check_in):
+                    if best is None or entry.sort_key < best.sort_key:
+                        best = entry
+                    break
+        return best
+
+
+async def load_active_hotel_markup_rules(session: AsyncSession) -> list[HotelMarkupRuleRow]:
+    stmt = select(HotelMarkupRuleRow).where(
+        HotelMarkupRuleRow.status.in_(["active", "ACTIVE", "1"])
+    )
+    return list((await session.execute(stmt)).scalars().all())
+
+
+_SNAPSHOT: VersionedSnapshot[HotelMarkupRuleIndex] = VersionedSnapshot(
+    "hotel_markup_rules",
+    check_interval=config.MARKUP_RULES_VERSION_CHECK_SECONDS,
+    max_age=config.MARKUP_RULES_MAX_AGE_SECONDS,
+)
+
+
+async def get_hotel_markup_rule_index(session: AsyncSession) -> HotelMarkupRuleIndex:
+    async def load() -> HotelMarkupRuleIndex:
+        return HotelMarkupRuleIndex(await load_active_hotel_markup_rules(session))
+
+    return await _SNAPSHOT.get(load)
+
+
+async def invalidate_hotel_markup_rules() -> None:
+    """Call after committing an admin rule change."""
+    await _SNAPSHOT.invalidate()
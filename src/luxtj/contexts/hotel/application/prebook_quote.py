@@ -86,7 +86,7 @@ class HotelPreBookQuote:
         promo_rule_amount = None
         promo_message = None
         trim_promo = (promo_code or "").strip()
-        rate = float(AdminCurrency.rate_to_admin_or_one(currency))
+        rate = float(await AdminCurrency.require_rate_to_admin_async(currency))
         if trim_promo:
             promo_base_admin = round(promo_base * rate, 2)
             eval_result = await HotelPromo.evaluate(session, trim_promo, promo_base_admin)
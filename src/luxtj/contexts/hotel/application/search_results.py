@@ -0,0 +1,167 @@
+"""Filter / sort / paginate stored hotel search cards (``SearchResults`` service).
+
+Map filters (``radiusKm`` around ``center``, viewport ``bounds``) run on a
+:class:`~luxtj.contexts.hotel.domain.geo_index.HotelGeoIndex` of the cards' ``geoPoint``,
+built once per stored search until more cards arrive.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from luxtj.contexts.hotel.domain.geo_index import HotelGeoIndex
+from luxtj.shared_kernel.application.search_results import (
+    DEFAULT_PAGE_SIZE,
+    SortKey,
+    body_bool,
+    body_float,
+    body_int,
+    body_list,
+    page_params,
+    paginate,
+    sorted_positions,
+)
+from luxtj.shared_kernel.infrastructure.search_result_store import (
+    StoredSearch,
+    get_search_result_store,
+)
+
+SEARCH_RESULT_KIND = "hotel"
+
+_SORTS: dict[str, SortKey] = {
+    "price": lambda card: float(card.get("price") or 0),
+    "distance": lambda card: card.get("distance_city_km"),
+    "stars": lambda card: int(card.get("star") or 0),
+    "name": lambda card: str(card.get("name") or "").lower(),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class HotelResultQuery:
+    price_min: float | None = None
+    price_max: float | None = None
+    stars: frozenset[int] = frozenset()
+    meal_included: bool | None = None
+    refundable: bool | None = None
+    serp_filters: frozenset[str] = frozenset()
+    # ``radius_km`` alone is measured from the search point (``distance_city_km``).
+    radius_km: float | None = None
+    center: tuple[float, float] | None = None
+    bounds: tuple[float, float, float, float] | None = None
+    sort: str = "price"
+    descending: bool = False
+    page: int = 1
+    page_size: int = DEFAULT_PAGE_SIZE
+
+    @classmethod
+    def from_body(cls, body: dict[str, Any]) -> HotelResultQuery:
+        filters = body.get("filters") if isinstance(body.get("filters"), dict) else body
+        sort = str(body.get("sort") or "price").lower()
+        page, page_size = page_params(body)
+        stars = (body_int(v) for v in body_list(filters.get("stars")))
+        radius_km = body_float(filters.get("radiusKm"))
+        return cls(
+            price_min=body_float(filters.get("priceMin")),
+            price_max=body_float(filters.get("priceMax")),
+            stars=frozenset(s for s in stars if s is not None),
+            meal_included=body_bool(filters.get("mealIncluded")),
+            refundable=body_bool(filters.get("refundable")),
+            serp_filters=frozenset(str(v) for v in body_list(filters.get("serpFilters")) if v),
+            radius_km=radius_km if radius_km is not None and radius_km > 0 else None,
+            center=_body_point(filters.get("center")),
+            bounds=_body_bounds(filters.get("bounds")),
+            sort=sort if sort in _SORTS else "price",
+            descending=str(body.get("order") or "asc").lower() == "desc",
+            page=page,
+            page_size=page_size,
+        )
+
+    def matches(self, card: dict[str, Any]) -> bool:
+        price = float(card.get("price") or 0)
+        if self.price_min is not None and price < self.price_min:
+            return False
+        if self.price_max is not None and price > self.price_max:
+            return False
+        if self.stars and int(card.get("star") or 0) not in self.stars:
+            return False
+        if self.meal_included is not None and bool(card.get("meal_included")) != (
+            self.meal_included
+        ):
+            return False
+        if self.refundable is not None and bool(card.get("refundable")) != self.refundable:
+            return False
+        if self.serp_filters and not self.serp_filters.issubset(card.get("serp_filters") or ()):
+            return False
+        if self.radius_km is not None and self.center is None:
+            km = card.get("distance_city_km")
+            if km is None or km > self.radius_km:
+                return False
+        return True
+
+
+async def query_hotel_results(search_id: str, query: HotelResultQuery) -> dict[str, Any] | None:
+    """One page of stored cards, or ``None`` when the search has no stored results."""
+    stored = await get_search_result_store(SEARCH_RESULT_KIND).load(search_id)
+    if stored is None:
+        return None
+    order = sorted_positions(stored, query.sort, _SORTS[query.sort], query.descending)
+    inside = _geo_positions(stored, query)
+    if inside is not None:
+        order = [i for i in order if i in inside]
+    positions = [i for i in order if query.matches(stored.cards[i])]
+    return {
+        "hotels": paginate(stored, positions, page=query.page, page_size=query.page_size),
+        "total": len(positions),
+        "available": len(stored.cards),
+        "page": query.page,
+        "pageSize": query.page_size,
+        "complete": stored.complete,
+        "priceRange": stored.memo("price_range", lambda: _price_range(stored)),
+    }
+
+
+def _geo_positions(stored: StoredSearch, query: HotelResultQuery) -> set[int] | None:
+    """Card positions inside the query's circle and box; ``None`` when neither is set."""
+    if (query.center is None or query.radius_km is None) and query.bounds is None:
+        return None
+    index = stored.memo("geo_index", lambda: HotelGeoIndex(_card_points(stored)))
+    inside: set[int] | None = None
+    if query.center is not None and query.radius_km is not None:
+        inside = {int(code) for code, _ in index.within(*query.center, query.radius_km)}
+    if query.bounds is not None:
+        boxed = {int(code) for code in index.in_bbox(*query.bounds)}
+        inside = boxed if inside is None else inside & boxed
+    return inside
+
+
+def _card_points(stored: StoredSearch) -> Iterator[tuple[str, float, float]]:
+    for position, card in enumerate(stored.cards):
+        point = _body_point(card.get("geoPoint"))
+        if point is not None:
+            yield str(position), *point
+
+
+def _body_point(value: Any) -> tuple[float, float] | None:
+    if not isinstance(value, dict):
+        return None
+    lat, lng = body_float(value.get("lat")), body_float(value.get("lng"))
+    return (lat, lng) if lat is not None and lng is not None else None
+
+
+def _body_bounds(value: Any) -> tuple[float, float, float, float] | None:
+    """``(south, west, north, east)``; ``west > east`` crosses the antimeridian."""
+    if not isinstance(value, dict):
+        return None
+    south, west, north, east = (
+        body_float(value.get(k)) for k in ("south", "west", "north", "east")
+    )
+    if south is None or west is None or north is None or east is None or south > north:
+        return None
+    return south, west, north, east
+
+
+def _price_range(stored: StoredSearch) -> dict[str, float] | None:
+    prices = [float(c.get("price") or 0) for c in stored.cards]
+    return {"min": min(prices), "max": max(prices)} if prices else None
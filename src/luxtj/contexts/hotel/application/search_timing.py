@@ -0,0 +1,71 @@
+"""Per-search stage timings for the streamed hotel search pipeline."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("supplier_wait", "parse", "enrich", "markup", "serialize")
+
+
+@dataclass
+class HotelSearchTimings:
+    """Seconds spent per stage, summed over every supplier response / window of one search.
+
+    ``supplier_wait`` is the time from search start to the last supplier response;
+    ``parse`` is transport body parsing; ``enrich`` is CRS windowing + card building;
+    ``markup`` is admin markup; ``serialize`` is NDJSON encoding in the router.
+    """
+
+    search_id: str
+    started_at: float = field(default_factory=perf_counter)
+    stages: dict[str, float] = field(default_factory=lambda: dict.fromkeys(STAGES, 0.0))
+    first_result_at: float | None = None
+    responses: int = 0
+    chunks: int = 0
+    hotels: int = 0
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + max(0.0, seconds)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, perf_counter() - started)
+
+    def supplier_response(self, parse_seconds: float) -> None:
+        self.responses += 1
+        self.stages["supplier_wait"] = perf_counter() - self.started_at
+        self.add("parse", parse_seconds)
+
+    def chunk_ready(self, hotel_count: int) -> None:
+        self.chunks += 1
+        self.hotels += hotel_count
+        if self.first_result_at is None:
+            self.first_result_at = perf_counter()
+
+    def log(self) -> None:
+        first_ms = (
+            (self.first_result_at - self.started_at) * 1000
+            if self.first_result_at is not None
+            else -1.0
+        )
+        logger.info(
+            "Hotel search timings search_id=%s total_ms=%.1f first_result_ms=%.1f "
+            "responses=%d chunks=%d hotels=%d %s",
+            self.search_id,
+            (perf_counter() - self.started_at) * 1000,
+            first_ms,
+            self.responses,
+            self.chunks,
+            self.hotels,
+            " ".join(f"{stage}_ms={seconds * 1000:.1f}" for stage, seconds in self.stages.items()),
+        )
@@ -9,6 +9,7 @@ import re
 import secrets
 import time
 import uuid
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
 
@@ -133,53 +134,64 @@ class HotelCommon:
         codes = list({str(c) for c in supplier_hotel_codes if c})
         if not codes:
             return {}
+        return await _search_static_details(
+            session,
+            booking_api_id,
+            HotelCrsSupplierHotelMapRow.supplier_hotel_code.in_(codes),
+        )
 
+    @staticmethod
+    async def get_search_static_details_by_region(
+        session: AsyncSession,
+        region_id: str,
+        booking_api_id: str,
+        *,
+        limit: int,
+    ) -> dict[str, dict[str, Any]]:
+        """Same shape as the by-code lookup for up to ``limit`` mapped hotels of a region."""
+        if not booking_api_id or not region_id:
+            return {}
+        return await _search_static_details(
+            session,
+            booking_api_id,
+            HotelCrsHotelRow.region_id == region_id,
+            limit=limit,
+        )
+
+    @staticmethod
+    async def get_crs_booking_source_ids(session: AsyncSession) -> list[str]:
+        """Booking sources that have a CRS supplier (and so may have mapped hotels)."""
+        stmt = select(HotelCrsSupplierRow.booking_source_id).distinct()
+        return [str(v) for v in (await session.execute(stmt)).scalars().all() if v]
+
+    @staticmethod
+    async def iter_crs_hotel_coordinates(
+        session: AsyncSession,
+        booking_api_id: str,
+        *,
+        batch_size: int = 10_000,
+    ) -> AsyncIterator[list[tuple[str, float, float]]]:
+        """``(supplier_hotel_code, lat, lng)`` batches for every active mapped hotel."""
         stmt = (
-            select(HotelCrsSupplierHotelMapRow, HotelCrsHotelRow)
+            select(
+                HotelCrsSupplierHotelMapRow.supplier_hotel_code,
+                HotelCrsHotelRow.latitude,
+                HotelCrsHotelRow.longitude,
+            )
             .join(HotelCrsHotelRow, HotelCrsHotelRow.id == HotelCrsSupplierHotelMapRow.hotel_id)
             .join(
                 HotelCrsSupplierRow,
                 HotelCrsSupplierRow.id == HotelCrsSupplierHotelMapRow.supplier_id,
             )
             .where(HotelCrsSupplierRow.booking_source_id == booking_api_id)
-            .where(HotelCrsSupplierHotelMapRow.supplier_hotel_code.in_(codes))
             .where(HotelCrsHotelRow.status.is_(True))
+            .where(HotelCrsHotelRow.latitude.is_not(None))
+            .where(HotelCrsHotelRow.longitude.is_not(None))
+            .execution_options(yield_per=batch_size)
         )
-        rows = (await session.execute(stmt)).all()
-        out: dict[str, dict[str, Any]] = {}
-        hotel_ids: list[str] = []
-        for map_row, hotel in rows:
-            code = str(map_row.supplier_hotel_code)
-            hotel_dict = _hotel_row_to_dict(hotel)
-            out[code] = {"hotel": hotel_dict, "other_amenities": []}
-            hotel_ids.append(hotel.id)
-        hotel_ids = list({h for h in hotel_ids if h})
-
-        if hotel_ids:
-            amenity_stmt = (
-                select(
-                    HotelCrsHotelAmenityMapRow.hotel_id,
-                    HotelCrsAmenityRow.name,
-                    HotelCrsHotelAmenityMapRow.group_name,
-                )
-                .join(
-                    HotelCrsAmenityRow,
-                    HotelCrsAmenityRow.id == HotelCrsHotelAmenityMapRow.amenity_id,
-                )
-                .where(HotelCrsHotelAmenityMapRow.hotel_id.in_(hotel_ids))
-                .order_by(HotelCrsAmenityRow.name)
-            )
-            by_hotel: dict[str, list[dict[str, Any]]] = {}
-            for hid, name, group_name in (await session.execute(amenity_stmt)).all():
-                cat = (group_name or "").strip() or "General"
-                by_hotel.setdefault(str(hid), []).append(
-                    {"name": str(name), "category": cat, "image": None}
-                )
-            for map_row, hotel in rows:
-                code = str(map_row.supplier_hotel_code)
-                if code in out:
-                    out[code]["other_amenities"] = by_hotel.get(hotel.id, [])
-        return out
+        result = await session.stream(stmt)
+        async for rows in result.partitions():
+            yield [(str(code), float(lat), float(lng)) for code, lat, lng in rows]
 
     @staticmethod
     def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float | None:
@@ -681,6 +693,64 @@ class HotelCommon:
             )
 
 
+async def _search_static_details(
+    session: AsyncSession,
+    booking_api_id: str,
+    condition: Any,
+    *,
+    limit: int | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Supplier hotel code → ``{"hotel": ..., "other_amenities": [...]}`` for active hotels."""
+    stmt = (
+        select(HotelCrsSupplierHotelMapRow, HotelCrsHotelRow)
+        .join(HotelCrsHotelRow, HotelCrsHotelRow.id == HotelCrsSupplierHotelMapRow.hotel_id)
+        .join(
+            HotelCrsSupplierRow,
+            HotelCrsSupplierRow.id == HotelCrsSupplierHotelMapRow.supplier_id,
+        )
+        .where(HotelCrsSupplierRow.booking_source_id == booking_api_id)
+        .where(condition)
+        .where(HotelCrsHotelRow.status.is_(True))
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    rows = (await session.execute(stmt)).all()
+    out: dict[str, dict[str, Any]] = {}
+    hotel_ids: list[str] = []
+    for map_row, hotel in rows:
+        code = str(map_row.supplier_hotel_code)
+        hotel_dict = _hotel_row_to_dict(hotel)
+        out[code] = {"hotel": hotel_dict, "other_amenities": []}
+        hotel_ids.append(hotel.id)
+    hotel_ids = list({h for h in hotel_ids if h})
+
+    if hotel_ids:
+        amenity_stmt = (
+            select(
+                HotelCrsHotelAmenityMapRow.hotel_id,
+                HotelCrsAmenityRow.name,
+                HotelCrsHotelAmenityMapRow.group_name,
+            )
+            .join(
+                HotelCrsAmenityRow,
+                HotelCrsAmenityRow.id == HotelCrsHotelAmenityMapRow.amenity_id,
+            )
+            .where(HotelCrsHotelAmenityMapRow.hotel_id.in_(hotel_ids))
+            .order_by(HotelCrsAmenityRow.name)
+        )
+        by_hotel: dict[str, list[dict[str, Any]]] = {}
+        for hid, name, group_name in (await session.execute(amenity_stmt)).all():
+            cat = (group_name or "").strip() or "General"
+            by_hotel.setdefault(str(hid), []).append(
+                {"name": str(name), "category": cat, "image": None}
+            )
+        for map_row, hotel in rows:
+            code = str(map_row.supplier_hotel_code)
+            if code in out:
+                out[code]["other_amenities"] = by_hotel.get(hotel.id, [])
+    return out
+
+
 def _hotel_row_to_dict(hotel: HotelCrsHotelRow) -> dict[str, Any]:
     return {
         "id": hotel.id,
@@ -0,0 +1,148 @@
+"""Packed, grid-bucketed coordinates of CRS hotels for distance work off the database.
+
+Coordinates are stored once in radians next to their cosine (``array('d')`` columns), so a
+SERP window's distances are one tight loop with no per-hotel conversions or row lookups,
+and radius / bounding-box queries only visit the ``CELL_DEGREES`` grid cells they overlap.
+Distances are great-circle kilometres rounded like ``HotelCommon.haversine_km`` so cards
+built from either source are identical. Hotels at ``(0, 0)`` count as unknown.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from math import asin, cos, degrees, floor, radians, sin, sqrt
+
+CELL_DEGREES = 0.1
+_EARTH_RADIUS_KM = 6371.0
+_KM_PER_DEGREE_LAT = 111.32
+
+
+class HotelGeoIndex:
+    def __init__(self, points: Iterable[tuple[str, float, float]] = ()) -> None:
+        self.codes: list[str] = []
+        self._lat = array("d")
+        self._lng = array("d")
+        self._cos_lat = array("d")
+        self._positions: dict[str, int] = {}
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self.add(points)
+
+    def add(self, points: Iterable[tuple[str, float, float]]) -> None:
+        """Append points (first code wins); lets loaders build the index batch by batch."""
+        cells = self._cells
+        for code, lat, lng in points:
+            if code in self._positions or not _valid(lat, lng):
+                continue
+            position = len(self.codes)
+            self._positions[code] = position
+            self.codes.append(code)
+            lat_rad = radians(lat)
+            self._lat.append(lat_rad)
+            self._lng.append(radians(lng))
+            self._cos_lat.append(cos(lat_rad))
+            cells.setdefault(_cell(lat, lng), []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._positions
+
+    def distances_km(
+        self, latitude: float, longitude: float, codes: Sequence[str]
+    ) -> list[float | None]:
+        """Distance from the point to each code (``None`` for codes without coordinates)."""
+        if not _valid(latitude, longitude):
+            return [None] * len(codes)
+        lat0 = radians(latitude)
+        lng0 = radians(longitude)
+        cos0 = cos(lat0)
+        positions = self._positions
+        lats, lngs, coss = self._lat, self._lng, self._cos_lat
+        out: list[float | None] = []
+        for code in codes:
+            i = positions.get(code)
+            if i is None:
+                out.append(None)
+                continue
+            a = sin((lats[i] - lat0) / 2) ** 2 + cos0 * coss[i] * sin((lngs[i] - lng0) / 2) ** 2
+            out.append(round(2 * _EARTH_RADIUS_KM * asin(min(1.0, sqrt(a))), 1))
+        return out
+
+    def within(
+        self, latitude: float, longitude: float, radius_km: float, *, limit: int | None = None
+    ) -> list[tuple[str, float]]:
+        """``(code, km)`` of hotels within ``radius_km``, nearest first."""
+        if not _valid(latitude, longitude) or radius_km <= 0:
+            return []
+        lat_pad = radius_km / _KM_PER_DEGREE_LAT
+        lng_pad = radius_km / (_KM_PER_DEGREE_LAT * max(cos(radians(latitude)), 0.01))
+        west, east = longitude - lng_pad, longitude + lng_pad
+        if lng_pad >= 180.0:
+            west, east = -180.0, 180.0
+        elif west < -180.0:
+            west += 360.0
+        elif east > 180.0:
+            east -= 360.0
+        candidates = [
+            self.codes[i]
+            for i in self._positions_in(latitude - lat_pad, west, latitude + lat_pad, east)
+        ]
+        hits = [
+            (code, km)
+            for code, km in zip(
+                candidates, self.distances_km(latitude, longitude, candidates), strict=True
+            )
+            if km is not None and km <= radius_km
+        ]
+        hits.sort(key=lambda hit: hit[1])
+        return hits[:limit] if limit is not None else hits
+
+    def in_bbox(self, south: float, west: float, north: float, east: float) -> list[str]:
+        """Codes inside the box; ``west > east`` crosses the antimeridian."""
+        out: list[str] = []
+        for i in self._positions_in(south, west, north, east):
+            lat = degrees(self._lat[i])
+            lng = degrees(self._lng[i])
+            in_lng = west <= lng <= east if west <= east else (lng >= west or lng <= east)
+            if south <= lat <= north and in_lng:
+                out.append(self.codes[i])
+        return out
+
+    def _positions_in(self, south: float, west: float, north: float, east: float) -> list[int]:
+        if west > east:
+            return self._positions_in(south, west, north, 180.0) + self._positions_in(
+                south, -180.0, north, east
+            )
+        south, north = max(south, -90.0), min(north, 90.0)
+        west, east = max(west, -180.0), min(east, 180.0)
+        row0, col0 = _cell(south, west)
+        row1, col1 = _cell(north, east)
+        if (row1 - row0 + 1) * (col1 - col0 + 1) > len(self._cells):
+            # Wider than the populated grid: walk occupied cells instead of empty ones.
+            return [
+                i
+                for (row, col), positions in self._cells.items()
+                if row0 <= row <= row1 and col0 <= col <= col1
+                for i in positions
+            ]
+        out: list[int] = []
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                positions = self._cells.get((row, col))
+                if positions is not None:
+                    out.extend(positions)
+        return out
+
+
+def _cell(lat: float, lng: float) -> tuple[int, int]:
+    return floor(lat / CELL_DEGREES), floor(lng / CELL_DEGREES)
+
+
+def _valid(lat: float, lng: float) -> bool:
+    return (
+        -90.0 <= lat <= 90.0
+        and -180.0 <= lng <= 180.0
+        and not (abs(lat) < 1e-9 and abs(lng) < 1e-9)
+    )
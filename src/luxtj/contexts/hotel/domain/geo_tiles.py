@@ -0,0 +1,80 @@
+"""Quantized geo-search tiles for sharing supplier SERP responses between nearby searches.
+
+A geo search ``(lat, lng, radius)`` is answered from a *tile*: a fixed grid cell whose
+center and radius step come from a small ladder, so searches a few hundred metres apart
+produce the same supplier request (and the same HTTP cache key). For step ``s`` the grid
+edge is ``s / 4`` metres on a latitude/longitude degree grid; the tile is only used when
+the user's circle fits inside the tile circle::
+
+    radius + half_diagonal(cell) <= s
+
+Any tile that satisfies this is a superset of the user's search, so callers can drop the
+extra hotels by distance and return exactly what an exact query would have returned.
+Searches too wide for the largest step (or at the poles) are not tiled.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import asin, cos, floor, radians, sin, sqrt
+
+# Supplier radius ladder (metres); RateHawk accepts up to 70 km.
+RADIUS_STEPS_M: tuple[int, ...] = (2_000, 5_000, 10_000, 15_000, 25_000, 35_000, 50_000, 70_000)
+_CELLS_PER_STEP = 4
+_METRES_PER_DEGREE_LAT = 111_320.0
+_EARTH_RADIUS_M = 6_371_000.0
+_MAX_TILED_LATITUDE = 85.0
+
+
+@dataclass(frozen=True, slots=True)
+class GeoTile:
+    latitude: float
+    longitude: float
+    radius_m: int
+
+
+def distance_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    dlat = radians(lat2 - lat1)
+    dlng = radians(lng2 - lng1)
+    a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlng / 2) ** 2
+    return 2 * _EARTH_RADIUS_M * asin(min(1.0, sqrt(a)))
+
+
+def tile_for(latitude: float, longitude: float, radius_m: int, step_m: int) -> GeoTile | None:
+    """Grid tile of ``step_m`` containing the point, or ``None`` if it cannot cover the circle."""
+    if step_m < radius_m:
+        return None
+    edge_deg = step_m / _CELLS_PER_STEP / _METRES_PER_DEGREE_LAT
+    row = floor(latitude / edge_deg)
+    col = floor(longitude / edge_deg)
+    south, north = row * edge_deg, (row + 1) * edge_deg
+    west, east = col * edge_deg, (col + 1) * edge_deg
+    if max(abs(south), abs(north)) > _MAX_TILED_LATITUDE:
+        return None
+    center_lat = (south + north) / 2
+    center_lng = (west + east) / 2
+    half_diagonal = max(
+        distance_m(center_lat, center_lng, lat, lng)
+        for lat in (south, north)
+        for lng in (west, east)
+    )
+    if radius_m + half_diagonal > step_m:
+        return None
+    if center_lng > 180.0:
+        center_lng -= 360.0
+    return GeoTile(round(center_lat, 6), round(center_lng, 6), step_m)
+
+
+def covering_tiles(
+    latitude: float, longitude: float, radius_m: int, *, limit: int = 3
+) -> list[GeoTile]:
+    """Up to ``limit`` tiles covering the search circle, smallest radius step first."""
+    tiles: list[GeoTile] = []
+    for step in RADIUS_STEPS_M:
+        tile = tile_for(latitude, longitude, radius_m, step)
+        if tile is None:
+            continue
+        tiles.append(tile)
+        if len(tiles) >= limit:
+            break
+    return tiles
@@ -13,13 +13,13 @@ from luxtj.shared_kernel.infrastructure.redis_cache import (
 _NAMESPACE = "hotel_block"
 
 
-def cache_put(key: str, value: Any, ttl_seconds: int) -> None:
-    redis_cache_put(_NAMESPACE, key, value, ttl_seconds)
+async def cache_put(key: str, value: Any, ttl_seconds: int) -> None:
+    await redis_cache_put(_NAMESPACE, key, value, ttl_seconds)
 
 
-def cache_get(key: str) -> Any | None:
-    return redis_cache_get(_NAMESPACE, key)
+async def cache_get(key: str) -> Any | None:
+    return await redis_cache_get(_NAMESPACE, key)
 
 
-def cache_delete(key: str) -> None:
-    redis_cache_delete(_NAMESPACE, key)
+async def cache_delete(key: str) -> None:
+    await redis_cache_delete(_NAMESPACE, key)
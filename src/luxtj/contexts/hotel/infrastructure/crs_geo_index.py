@@ -0,0 +1,140 @@
+"""Process-resident :class:`HotelGeoIndex` per booking source.
+
+Every booking source with a CRS supplier gets an index of its active mapped hotels, built
+in the background at startup and rebuilt when its CRS static generation changes (i.e.
+after a mapping run / CRS wipe, see :mod:`crs.infrastructure.static_content_version`), at
+most once per ``min_rebuild_seconds`` so a burst of bumps costs one full rescan.
+Lookups never wait for a build: until a source's first index is ready :meth:`get` returns
+``None`` and callers fall back to per-hotel distances. A rebuilt index replaces the old
+one atomically.
+
+Created in the FastAPI lifespan and installed with :func:`set_crs_geo_index`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from time import monotonic, perf_counter
+
+from luxtj.contexts.crs.infrastructure.static_content_version import get_crs_static_generation
+from luxtj.contexts.hotel.domain.common import HotelCommon
+from luxtj.contexts.hotel.domain.geo_index import HotelGeoIndex
+from luxtj.shared_kernel.infrastructure.persistence.sqlalchemy import (
+    AsyncSessionFactory,
+    session_scope,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CrsGeoIndexSettings:
+    refresh_check_seconds: float = 30.0
+    min_rebuild_seconds: float = 300.0
+    load_batch_size: int = 10_000
+
+
+class CrsGeoIndexRegistry:
+    def __init__(
+        self,
+        session_factory: AsyncSessionFactory,
+        settings: CrsGeoIndexSettings | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._settings = settings or CrsGeoIndexSettings()
+        # booking_api_id -> (generation, index, monotonic time the build started)
+        self._indexes: dict[str, tuple[str, HotelGeoIndex, float]] = {}
+        self._wakeup = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def get(self, booking_api_id: str) -> HotelGeoIndex | None:
+        built = self._indexes.get(booking_api_id)
+        return built[1] if built is not None else None
+
+    async def start(self) -> None:
+        """Begin loading in the background; startup does not wait for the first build."""
+        if self._task is not None:
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop_event.set()
+        self._wakeup.set()
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def request_refresh(self) -> None:
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._wakeup.clear()
+            try:
+                await self.refresh()
+            except Exception as ex:
+                logger.exception("CRS geo index refresh failed: %s", ex)
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self._settings.refresh_check_seconds
+                )
+            except TimeoutError:
+                pass
+
+    async def refresh(self) -> None:
+        """Rebuild every booking source whose CRS generation moved since its last build.
+
+        A source rebuilt less than ``min_rebuild_seconds`` ago keeps serving its index; the
+        first check after the interval picks up the latest generation.
+        """
+        async with session_scope(self._session_factory) as session:
+            booking_api_ids = await HotelCommon.get_crs_booking_source_ids(session)
+        for booking_api_id in booking_api_ids:
+            generation = await get_crs_static_generation(booking_api_id)
+            built = self._indexes.get(booking_api_id)
+            if built is not None:
+                if built[0] == generation:
+                    continue
+                if monotonic() - built[2] < self._settings.min_rebuild_seconds:
+                    continue
+            started = monotonic()
+            index = await self._build(booking_api_id)
+            self._indexes[booking_api_id] = (generation, index, started)
+        for stale in set(self._indexes) - set(booking_api_ids):
+            del self._indexes[stale]
+
+    async def _build(self, booking_api_id: str) -> HotelGeoIndex:
+        started = perf_counter()
+        index = HotelGeoIndex()
+        async with session_scope(self._session_factory) as session:
+            async for batch in HotelCommon.iter_crs_hotel_coordinates(
+                session, booking_api_id, batch_size=self._settings.load_batch_size
+            ):
+                index.add(batch)
+                # Large sources take many batches; let requests run in between.
+                await asyncio.sleep(0)
+        logger.info(
+            "CRS geo index built booking_api_id=%s hotels=%d ms=%.1f",
+            booking_api_id,
+            len(index),
+            (perf_counter() - started) * 1000,
+        )
+        return index
+
+
+_REGISTRY: CrsGeoIndexRegistry | None = None
+
+
+def get_crs_geo_index() -> CrsGeoIndexRegistry | None:
+    return _REGISTRY
+
+
+def set_crs_geo_index(registry: CrsGeoIndexRegistry | None) -> None:
+    global _REGISTRY
+    _REGISTRY = registry
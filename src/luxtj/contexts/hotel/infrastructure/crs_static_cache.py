@@ -0,0 +1,267 @@
+"""Read-through cache of CRS static hotel details for search enrichment.
+
+Search cards need the CRS hotel row + amenity list for every supplier hid in a SERP
+window. Lookups go: in-process LRU → Redis (``luxtj:crs_static:…``) → the two joined CRS
+queries, keyed by ``(booking_api_id, generation, supplier_hotel_code)``. Hids without an
+active CRS mapping are cached as misses too, so they stop reaching the database.
+
+The generation comes from :mod:`crs.infrastructure.static_content_version` and is
+re-read at most every ``generation_check_seconds``; ``crs_promote``, CRS wipes and admin
+edits bump it, which invalidates every worker's entries for that booking source.
+Regions are preloaded in the background on their first search so later windows are
+memory lookups.
+
+Created in the FastAPI lifespan and installed with :func:`set_crs_static_cache`; without
+it providers query the CRS directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from luxtj.contexts.crs.infrastructure.static_content_version import (
+    bump_crs_static_generation,
+    get_crs_static_generation,
+)
+from luxtj.contexts.hotel.domain.common import HotelCommon
+from luxtj.shared_kernel.infrastructure.persistence.sqlalchemy import (
+    AsyncSessionFactory,
+    session_scope,
+)
+from luxtj.shared_kernel.infrastructure.redis_cache import (
+    redis_cache_get_many,
+    redis_cache_put_many,
+)
+
+logger = logging.getLogger(__name__)
+
+_NAMESPACE = "crs_static"
+# Cached "no active CRS hotel for this hid" marker (Redis cannot store a bare miss).
+_MISSING: dict[str, Any] = {}
+
+type StaticDetails = dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class CrsStaticCacheSettings:
+    max_entries: int = 50_000
+    ttl_seconds: int = 6 * 60 * 60
+    generation_check_seconds: float = 5.0
+    preload_max_hotels: int = 5_000
+
+
+@dataclass(slots=True)
+class CrsStaticCacheStats:
+    entries: int
+    capacity: int
+    memory_hits: int
+    redis_hits: int
+    db_loads: int
+    regions_preloaded: int
+
+
+class CrsStaticDetailsCache:
+    def __init__(
+        self,
+        session_factory: AsyncSessionFactory | None = None,
+        settings: CrsStaticCacheSettings | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._settings = settings or CrsStaticCacheSettings()
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, StaticDetails]] = (
+            OrderedDict()
+        )
+        self._generations: dict[str, tuple[str, float]] = {}
+        self._preloaded: set[tuple[str, str, str]] = set()
+        self._preload_tasks: dict[tuple[str, str], asyncio.Task[None]] = {}
+        self._memory_hits = 0
+        self._redis_hits = 0
+        self._db_loads = 0
+
+    async def get_many(
+        self,
+        session: AsyncSession,
+        booking_api_id: str,
+        supplier_hotel_codes: list[str],
+    ) -> dict[str, StaticDetails]:
+        """Drop-in for ``HotelCommon.get_search_static_details_by_supplier_hotel_codes``."""
+        if not booking_api_id:
+            return {}
+        codes = list(dict.fromkeys(str(c) for c in supplier_hotel_codes if c))
+        if not codes:
+            return {}
+        generation = await self._generation(booking_api_id)
+        found: dict[str, StaticDetails] = {}
+
+        missing: list[str] = []
+        for code in codes:
+            value = self._memory_get((booking_api_id, generation, code))
+            if value is None:
+                missing.append(code)
+            else:
+                self._memory_hits += 1
+                if value:
+                    found[code] = value
+        if not missing:
+            return found
+
+        redis_keys = {_redis_key(booking_api_id, generation, code): code for code in missing}
+        cached = await redis_cache_get_many(_NAMESPACE, list(redis_keys))
+        still_missing: list[str] = []
+        for redis_key, code in redis_keys.items():
+            value = cached.get(redis_key)
+            if not isinstance(value, dict):
+                still_missing.append(code)
+                continue
+            self._redis_hits += 1
+            self._memory_put((booking_api_id, generation, code), value)
+            if value:
+                found[code] = value
+        if not still_missing:
+            return found
+
+        loaded = await HotelCommon.get_search_static_details_by_supplier_hotel_codes(
+            session, still_missing, booking_api_id
+        )
+        self._db_loads += len(still_missing)
+        await self._store(
+            booking_api_id,
+            generation,
+            {code: loaded.get(code) or _MISSING for code in still_missing},
+        )
+        found.update(loaded)
+        return found
+
+    def schedule_region_preload(self, booking_api_id: str, region_id: str) -> None:
+        """Warm every mapped hotel of ``region_id`` in the background (once per generation)."""
+        if self._session_factory is None or not booking_api_id or not region_id:
+            return
+        task_key = (booking_api_id, region_id)
+        if task_key in self._preload_tasks:
+            return
+        task = asyncio.create_task(self._preload_region(booking_api_id, region_id))
+        self._preload_tasks[task_key] = task
+        task.add_done_callback(lambda _t: self._preload_tasks.pop(task_key, None))
+
+    async def _preload_region(self, booking_api_id: str, region_id: str) -> None:
+        assert self._session_factory is not None
+        generation = await self._generation(booking_api_id)
+        marker = (booking_api_id, generation, region_id)
+        if marker in self._preloaded:
+            return
+        try:
+            async with session_scope(self._session_factory) as session:
+                loaded = await HotelCommon.get_search_static_details_by_region(
+                    session,
+                    region_id,
+                    booking_api_id,
+                    limit=self._settings.preload_max_hotels,
+                )
+        except Exception as ex:
+            logger.warning("CRS static preload failed region_id=%s: %s", region_id, ex)
+            return
+        self._preloaded.add(marker)
+        self._db_loads += len(loaded)
+        await self._store(booking_api_id, generation, loaded)
+        logger.info(
+            "CRS static details preloaded region_id=%s booking_api_id=%s hotels=%d",
+            region_id,
+            booking_api_id,
+            len(loaded),
+        )
+
+    async def invalidate(self, booking_api_id: str) -> None:
+        """Bump the shared generation after CRS hotels of ``booking_api_id`` changed."""
+        await bump_crs_static_generation(booking_api_id)
+        self._generations.pop(booking_api_id, None)
+
+    def stats(self) -> CrsStaticCacheStats:
+        return CrsStaticCacheStats(
+            entries=len(self._entries),
+            capacity=self._settings.max_entries,
+            memory_hits=self._memory_hits,
+            redis_hits=self._redis_hits,
+            db_loads=self._db_loads,
+            regions_preloaded=len(self._preloaded),
+        )
+
+    async def close(self) -> None:
+        tasks = list(self._preload_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _generation(self, booking_api_id: str) -> str:
+        now = monotonic()
+        known = self._generations.get(booking_api_id)
+        if known is not None and now - known[1] < self._settings.generation_check_seconds:
+            return known[0]
+        generation = await get_crs_static_generation(booking_api_id)
+        if known is not None and known[0] != generation:
+            # Entries of the old generation can never be read again; free them now.
+            self._drop_generation(booking_api_id, known[0])
+        self._generations[booking_api_id] = (generation, now)
+        return generation
+
+    def _drop_generation(self, booking_api_id: str, generation: str) -> None:
+        for key in [k for k in self._entries if k[0] == booking_api_id and k[1] == generation]:
+            del self._entries[key]
+        self._preloaded = {
+            m for m in self._preloaded if not (m[0] == booking_api_id and m[1] == generation)
+        }
+
+    def _memory_get(self, key: tuple[str, str, str]) -> StaticDetails | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _memory_put(self, key: tuple[str, str, str], value: StaticDetails) -> None:
+        self._entries[key] = (monotonic() + self._settings.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._settings.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _store(
+        self,
+        booking_api_id: str,
+        generation: str,
+        values: dict[str, StaticDetails],
+    ) -> None:
+        if not values:
+            return
+        for code, value in values.items():
+            self._memory_put((booking_api_id, generation, code), value)
+        await redis_cache_put_many(
+            _NAMESPACE,
+            {_redis_key(booking_api_id, generation, code): value for code, value in values.items()},
+            self._settings.ttl_seconds,
+        )
+
+
+def _redis_key(booking_api_id: str, generation: str, code: str) -> str:
+    return f"{booking_api_id}:{generation}:{code}"
+
+
+_CACHE: CrsStaticDetailsCache | None = None
+
+
+def get_crs_static_cache() -> CrsStaticDetailsCache | None:
+    return _CACHE
+
+
+def set_crs_static_cache(cache: CrsStaticDetailsCache | None) -> None:
+    global _CACHE
+    _CACHE = cache
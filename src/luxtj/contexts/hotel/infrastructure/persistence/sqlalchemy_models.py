@@ -88,7 +88,9 @@ class HotelBookingDetailsRow(HotelBase):
         Index("ix_hotel_booking_details_booking_source", "booking_source"),
         Index("ix_hotel_booking_details_status", "status"),
         Index("ix_hotel_booking_details_created_by_id", "created_by_id"),
+        Index("ix_hotel_booking_details_created_at_id", "created_at", "id"),
         Index("ix_hotel_booking_details_hotel_crs_hotel_code", "hotel_crs_hotel_code"),
+        Index("ix_hotel_booking_details_updated_at", "updated_at"),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
@@ -121,6 +123,7 @@ class HotelBookingDetailsRow(HotelBase):
 
 class HotelBookingTransactionDetailsRow(HotelBase):
     __tablename__ = "hotel_booking_transaction_details"
+    __table_args__ = (Index("ix_hotel_booking_transaction_details_updated_at", "updated_at"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     app_reference: Mapped[str] = mapped_column(String(60), nullable=False, unique=True)
@@ -17,8 +17,12 @@ import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from luxtj.contexts.currency.domain.admin_currency import AdminCurrency
+from luxtj.bootstrap import config
+from luxtj.contexts.currency.domain.admin_currency import AdminCurrency, FxRateUnavailableError
 from luxtj.contexts.hotel.domain.common import HotelCommon
+from luxtj.contexts.hotel.domain.geo_tiles import covering_tiles
+from luxtj.contexts.hotel.infrastructure.crs_geo_index import get_crs_geo_index
+from luxtj.contexts.hotel.infrastructure.crs_static_cache import get_crs_static_cache
 from luxtj.contexts.hotel.infrastructure.persistence.sqlalchemy_models import (
     HotelBookingDetailsRow,
     HotelBookingPaxDetailsRow,
@@ -27,6 +31,7 @@ from luxtj.contexts.hotel.infrastructure.persistence.sqlalchemy_models import (
 from luxtj.contexts.integration.domain.catalog import credential_value
 from luxtj.shared_kernel.infrastructure.http import (
     BookingApiRequestResponseRow,
+    InMemoryResponseCache,
     compress_audit_body,
 )
 from luxtj.utils import timeutils
@@ -276,11 +281,13 @@ class RateHawkHotelProvider(HotelCommon):
                 lng_f = float(lng)
             except TypeError, ValueError:
                 return []
-            try:
-                radius = int(search_data.get("radius") or 25000)
-            except TypeError, ValueError:
-                radius = 25000
-            radius = max(1, min(70000, radius))
+            radius = self._serp_geo_radius(search_data)
+            tile = search_data.get("_serp_geo")
+            if isinstance(tile, dict):
+                # Snapped tile from prepare_search_request (see geo_tiles).
+                lat_f = float(tile["latitude"])
+                lng_f = float(tile["longitude"])
+                radius = int(tile["radius"])
             payload = {
                 "checkin": checkin,
                 "checkout": checkout,
@@ -329,6 +336,7 @@ class RateHawkHotelProvider(HotelCommon):
         lat = search_data.get("lat")
         lng = search_data.get("lng")
         if lat is not None and lng is not None:
+            await self._snap_geo_search(search_data)
             return self.get_search_request(search_data)
         catalogue_region_id = str(search_data.get("region_id") or "")
         region_code = await self._resolve_region_id(catalogue_region_id)
@@ -337,6 +345,54 @@ class RateHawkHotelProvider(HotelCommon):
         search_data["_region_id"] = region_code
         return self.get_search_request(search_data)
 
+    @staticmethod
+    def _serp_geo_radius(search_data: dict[str, Any]) -> int:
+        try:
+            radius = int(search_data.get("radius") or 25000)
+        except TypeError, ValueError:
+            radius = 25000
+        return max(1, min(70000, radius))
+
+    async def _snap_geo_search(self, search_data: dict[str, Any]) -> None:
+        """Point a geo search at a covering grid tile so nearby searches share one SERP call.
+
+        Prefers a covering tile whose response is already cached (smallest first), else
+        the smallest covering tile. ``iter_search_hotel_batches`` drops hotels outside the
+        user's own circle, so results match the exact query.
+        """
+        search_data.pop("_serp_geo", None)
+        if not config.HOTEL_GEO_TILE_CACHE_ENABLED:
+            return
+        try:
+            lat_f = float(search_data["lat"])
+            lng_f = float(search_data["lng"])
+        except TypeError, ValueError:
+            return
+        tiles = covering_tiles(
+            lat_f,
+            lng_f,
+            self._serp_geo_radius(search_data),
+            limit=max(1, config.HOTEL_GEO_TILE_CANDIDATES),
+        )
+        if not tiles:
+            return
+        keyed: list[tuple[str, dict[str, Any]]] = []
+        for tile in tiles:
+            override = {
+                "latitude": tile.latitude,
+                "longitude": tile.longitude,
+                "radius": tile.radius_m,
+            }
+            handles = self.get_search_request({**search_data, "_serp_geo": override})
+            if not handles:
+                return
+            keyed.append((str(handles[0]["cacheKey"]), override))
+        chosen = keyed[0][1]
+        if len(keyed) > 1:
+            cached = await InMemoryResponseCache().existing([key for key, _ in keyed])
+            chosen = next((override for key, override in keyed if key in cached), chosen)
+        search_data["_serp_geo"] = chosen
+
     def _parse_serp_hotels(self, raw_response: Any) -> tuple[list[dict[str, Any]], str | None]:
         response = raw_response[0] if isinstance(raw_response, list) else raw_response
         if not response:
@@ -380,21 +436,62 @@ class RateHawkHotelProvider(HotelCommon):
             hotels_by_hid[hid] = api_hotel
             ordered_hids.append(hid)
 
+        search_lat = search_data.get("lat")
+        search_lng = search_data.get("lng")
+        try:
+            search_lat_f = float(search_lat) if search_lat is not None else None
+            search_lng_f = float(search_lng) if search_lng is not None else None
+        except TypeError, ValueError:
+            search_lat_f = search_lng_f = None
+        max_distance_km = (
+            self._serp_geo_radius(search_data) / 1000
+            if "_serp_geo" in search_data and search_lat_f is not None
+            else None
+        )
+        # The snapped tile can be wider than the user's circle; a hotel whose distance stays
+        # unknown cannot be shown to lie inside it, so it is dropped rather than leaked.
+        drop_unknown_distance = (
+            max_distance_km is not None
+            and int(search_data["_serp_geo"].get("radius") or 0) / 1000 > max_distance_km
+        )
+
+        # Distances for the whole SERP from the resident geo index; hotels it does not know
+        # fall back to per-card haversine below.
+        distance_by_hid: dict[str, float | None] = {}
+        geo_registry = get_crs_geo_index()
+        geo_index = geo_registry.get(booking_api_id) if geo_registry is not None else None
+        if geo_index is not None and search_lat_f is not None and search_lng_f is not None:
+            distance_by_hid = dict(
+                zip(
+                    ordered_hids,
+                    geo_index.distances_km(search_lat_f, search_lng_f, ordered_hids),
+                    strict=True,
+                )
+            )
+            if max_distance_km is not None:
+                # Drop hotels outside the user's circle before any CRS lookup.
+                ordered_hids = [
+                    hid
+                    for hid in ordered_hids
+                    if (km := distance_by_hid[hid]) is None or km <= max_distance_km
+                ]
+
+        static_cache = get_crs_static_cache()
+        if static_cache is not None and booking_api_id:
+            static_cache.schedule_region_preload(booking_api_id, str(region_id or ""))
+
         for offset in range(0, len(ordered_hids), CRS_SEARCH_CODE_WINDOW):
             window_hids = ordered_hids[offset : offset + CRS_SEARCH_CODE_WINDOW]
             static_by_hid: dict[str, Any] = {}
             if self._crs_session is not None and booking_api_id:
-                static_by_hid = await self.get_search_static_details_by_supplier_hotel_codes(
-                    self._crs_session, window_hids, booking_api_id
-                )
-
-            search_lat = search_data.get("lat")
-            search_lng = search_data.get("lng")
-            try:
-                search_lat_f = float(search_lat) if search_lat is not None else None
-                search_lng_f = float(search_lng) if search_lng is not None else None
-            except TypeError, ValueError:
-                search_lat_f = search_lng_f = None
+                if static_cache is not None:
+                    static_by_hid = await static_cache.get_many(
+                        self._crs_session, booking_api_id, window_hids
+                    )
+                else:
+                    static_by_hid = await self.get_search_static_details_by_supplier_hotel_codes(
+                        self._crs_session, window_hids, booking_api_id
+                    )
 
             batch: list[dict[str, Any]] = []
             for hid in window_hids:
@@ -415,7 +512,10 @@ class RateHawkHotelProvider(HotelCommon):
                     ).upper()[:3]
                     or request_currency
                 )
-                converted = AdminCurrency.convert_amount_to_admin(supplier_price, show_currency)
+                try:
+                    converted = AdminCurrency.convert_amount_to_admin(supplier_price, show_currency)
+                except FxRateUnavailableError:
+                    continue  # not priceable in admin currency; never shown at 1:1
                 price = float(converted["amount"])
                 conversion_rate = float(converted["rate"])
 
@@ -465,11 +565,23 @@ class RateHawkHotelProvider(HotelCommon):
 
                 hotel_lat = float(crs.get("latitude") or 0)
                 hotel_lng = float(crs.get("longitude") or 0)
-                distance_city_km = None
-                if search_lat_f is not None and search_lng_f is not None:
+                distance_city_km = distance_by_hid.get(hid)
+                if (
+                    distance_city_km is None
+                    and search_lat_f is not None
+                    and search_lng_f is not None
+                ):
                     distance_city_km = self.haversine_km(
                         search_lat_f, search_lng_f, hotel_lat, hotel_lng
                     )
+                if max_distance_km is not None and (
+                    distance_city_km > max_distance_km
+                    if distance_city_km is not None
+                    else drop_unknown_distance
+                ):
+                    # Outside (or not provably inside) the user's circle: came from the wider
+                    # shared tile.
+                    continue
 
                 meals: list[dict[str, str]] = []
                 if meal_included or (meal_code and meal_code.lower() != "nomeal"):
@@ -725,6 +837,9 @@ class RateHawkHotelProvider(HotelCommon):
             crs_room_map = await self.get_crs_room_static_by_exact_room_names(
                 self._crs_session, hotel_crs_id, room_names
             )
+        # Await cold FX pairs here; the formatter below only reads the rate cache.
+        for currency in {self._hp_rate_show_currency(r) for r in rates if isinstance(r, dict)}:
+            await AdminCurrency.require_rate_to_admin_async(currency)
         rooms = self._format_room_list_grouped(rates, result_token, crs_room_map, star)
         return {"status": True, "data": rooms}
 
@@ -801,18 +916,21 @@ class RateHawkHotelProvider(HotelCommon):
         rooms_out.sort(key=lambda r: float(r.get("TotalFare") or 0))
         return rooms_out
 
-    def _map_hp_rate_to_room_variation(
-        self, rate: dict[str, Any], base_inner: dict[str, Any], booking_source_key: str
-    ) -> dict[str, Any]:
-        norm = self.ratehawk_normalize_hp_rate_row(rate)
+    def _hp_rate_show_currency(self, rate: dict[str, Any]) -> str:
         pt = self.ratehawk_first_payment_type(rate)
-        show_currency = str(
+        return str(
             (pt or {}).get("show_currency_code")
             or (pt or {}).get("currency_code")
             or self.currency
             or AdminCurrency.code()
             or "USD"
         ).upper()[:3]
+
+    def _map_hp_rate_to_room_variation(
+        self, rate: dict[str, Any], base_inner: dict[str, Any], booking_source_key: str
+    ) -> dict[str, Any]:
+        norm = self.ratehawk_normalize_hp_rate_row(rate)
+        show_currency = self._hp_rate_show_currency(rate)
         converted = AdminCurrency.convert_amount_to_admin(float(norm["amount"] or 0), show_currency)
         taxes_converted = AdminCurrency.convert_amount_to_admin(
             float(norm["taxes"] or 0), show_currency
@@ -906,6 +1024,8 @@ class RateHawkHotelProvider(HotelCommon):
             or AdminCurrency.code()
             or "USD"
         ).upper()[:3]
+        # Await a cold FX pair here; the conversions below only read the rate cache.
+        await AdminCurrency.require_rate_to_admin_async(show_currency)
         amount_admin = AdminCurrency.convert_amount_to_admin(
             float(norm["amount"] or 0), show_currency
         )
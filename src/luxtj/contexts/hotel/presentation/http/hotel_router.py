@@ -17,6 +17,11 @@ from luxtj.contexts.currency.domain.admin_currency import AdminCurrency
 from luxtj.contexts.currency.domain.booking_money_for_client import BookingMoneyForClient
 from luxtj.contexts.hotel.application.blender import HotelBlender
 from luxtj.contexts.hotel.application.prebook_quote import HotelPreBookQuote
+from luxtj.contexts.hotel.application.search_results import (
+    HotelResultQuery,
+    query_hotel_results,
+)
+from luxtj.contexts.hotel.application.search_timing import HotelSearchTimings
 from luxtj.contexts.hotel.domain.common import HotelCommon
 from luxtj.contexts.hotel.infrastructure.block_cache import cache_put
 from luxtj.contexts.hotel.infrastructure.persistence.sqlalchemy_models import (
@@ -120,6 +125,7 @@ async def hotel_service(
         "PreSearch": _pre_search,
         "GetSearch": _get_search,
         "Search": _search,
+        "SearchResults": _search_results,
         "Details": _details,
         "RoomList": _room_list,
         "BlockRoom": _block_room,
@@ -242,8 +248,14 @@ async def _search(
     search_id = str(body.get("search_id") or "")
 
     async def generate():
-        async for chunk in blender.search(search_id):
-            yield json.dumps(chunk) + "\n"
+        timings = HotelSearchTimings(search_id)
+        try:
+            async for chunk in blender.search(search_id, timings):
+                with timings.measure("serialize"):
+                    line = json.dumps(chunk) + "\n"
+                yield line
+        finally:
+            timings.log()
 
     return StreamingResponse(
         generate(),
@@ -252,6 +264,19 @@ async def _search(
     )
 
 
+async def _search_results(
+    body: dict[str, Any], session: AsyncSession, blender: HotelBlender, request: Request
+) -> JSONResponse:
+    """Filter / sort / page the cards a ``Search`` stream stored for ``search_id``."""
+    search_id = str(body.get("search_id") or "")
+    if not search_id:
+        return _err("search_id is required")
+    data = await query_hotel_results(search_id, HotelResultQuery.from_body(body))
+    if data is None:
+        return _err("Search results not found; run the search again", status_code=404)
+    return _ok(data, "Success")
+
+
 async def _details(
     body: dict[str, Any], session: AsyncSession, blender: HotelBlender, request: Request
 ) -> JSONResponse:
@@ -303,7 +328,7 @@ async def _block_room(
     list_token = str((data.get("room") or {}).get("BookingCode") or "")
     if list_token:
         # Deep-copy so stripping client keys does not drop markup from the cache snapshot.
-        cache_put(
+        await cache_put(
             HotelCommon.hotel_block_snapshot_cache_key(list_token),
             json.loads(json.dumps(data, default=str)),
             45 * 60,
@@ -349,7 +374,7 @@ async def _pre_book(
         return _err("Invalid resultToken")
     inner = decoded.get("data") or {}
     booking_source = str(decoded.get("booking_source") or "ratehawk")
-    snapshot = cache_get(HotelCommon.hotel_block_snapshot_cache_key(list_token))
+    snapshot = await cache_get(HotelCommon.hotel_block_snapshot_cache_key(list_token))
     if not isinstance(snapshot, dict):
         return _err("Booking session expired. Please select your room again.")
     room = snapshot.get("room")
@@ -13,6 +13,7 @@ from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from luxtj.contexts.crs.infrastructure.persistence.sqlalchemy_models import NewCitiesNRegionRow
+from luxtj.contexts.hotel.application.markup_index import invalidate_hotel_markup_rules
 from luxtj.contexts.hotel.application.markup_rule_resolver import HotelMarkupRuleResolver
 from luxtj.contexts.hotel.infrastructure.persistence.sqlalchemy_models import HotelMarkupRuleRow
 from luxtj.contexts.identity.presentation.http.dependencies import (
@@ -173,7 +174,9 @@ async def create_rule(
         updated_at=now,
     )
     session.add(row)
-    await session.flush()
+    # Commit before bumping the rule version so a concurrent reload cannot cache old rules.
+    await session.commit()
+    await invalidate_hotel_markup_rules()
     names = await _region_names(crs_session, [row.region_id or ""])
     return ApiSuccessResponse(
         output=MarkupRuleSerializer.from_row(row, region_name=names.get(row.region_id or ""))
@@ -192,7 +195,8 @@ async def update_rule(
     if row is None:
         raise HTTPException(status_code=404, detail="Markup rule not found")
     _apply_body(row, body)
-    await session.flush()
+    await session.commit()
+    await invalidate_hotel_markup_rules()
     names = await _region_names(crs_session, [row.region_id or ""])
     return ApiSuccessResponse(
         output=MarkupRuleSerializer.from_row(row, region_name=names.get(row.region_id or ""))
@@ -209,7 +213,8 @@ async def delete_rule(
     if row is None:
         raise HTTPException(status_code=404, detail="Markup rule not found")
     await session.delete(row)
-    await session.flush()
+    await session.commit()
+    await invalidate_hotel_markup_rules()
     return ApiSuccessResponse(output={"deleted": True, "id": rule_id})
 
 
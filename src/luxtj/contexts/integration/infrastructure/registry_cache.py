@@ -68,6 +68,10 @@ class IntegrationRegistryCache:
                 return self.active_booking_apis.get(f"{sub_module}:{code}")
             return self.active_booking_apis.get(code)
 
+    def list_active_booking_apis(self) -> list[BookingApi]:
+        with self._lock:
+            return list({api.id: api for api in self.active_booking_apis.values()}.values())
+
     def resolve_payment_gateway(self, code: str) -> PaymentGateway | None:
         with self._lock:
             return self.active_payment_gateways.get(code)
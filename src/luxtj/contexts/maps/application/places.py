@@ -1,14 +1,33 @@
-"""Google Places proxy — credentials from admin Integrations `googlemap` other_api."""
+"""Google Places proxy — credentials from admin Integrations `googlemap` other_api.
+
+Answers are cached by normalized request (input / place id, language, components): first
+in a per-worker LRU, then in Redis, so repeated keystrokes and popular cities stop reaching
+Google. Concurrent misses for the same key share one upstream call. The session token is
+forwarded to Google on a miss but is not part of the key. Only successful answers are
+cached; place details are stable and keep a much longer TTL than autocomplete.
+
+Upstream calls go through the shared supplier :class:`HttpClientPool` (keep-alive, per-host
+concurrency), or a lazily created module client when no pool is installed.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import monotonic
 from typing import Any
 
 import httpx
 
+from luxtj.bootstrap import config
 from luxtj.contexts.integration.domain.catalog import credential_value
 from luxtj.contexts.integration.infrastructure.registry_cache import get_integration_registry
+from luxtj.shared_kernel.infrastructure.http.client_pool import get_http_client_pool
 from luxtj.shared_kernel.infrastructure.logging import get_logger_handle
+from luxtj.shared_kernel.infrastructure.redis_cache import redis_cache_get, redis_cache_put
 
 logger = get_logger_handle(__name__)
 
@@ -16,6 +35,10 @@ GOOGLEMAP_CODE = "googlemap"
 PLACES_AUTOCOMPLETE_URL = "https://maps.googleapis.com/maps/api/place/autocomplete/json"
 PLACES_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
 
+_AUTOCOMPLETE_NAMESPACE = "places_autocomplete"
+_DETAILS_NAMESPACE = "place_details"
+_TIMEOUT_SECONDS = 15.0
+
 
 class MapsConfigError(Exception):
     """Google Maps other_api inactive or API Key missing."""
@@ -35,6 +58,157 @@ def _google_maps_api_key() -> str:
     return key
 
 
+@dataclass(slots=True)
+class PlacesCacheStats:
+    entries: int
+    capacity: int
+    memory_hits: int
+    redis_hits: int
+    upstream_calls: int
+    coalesced: int
+
+
+class _PlacesCache:
+    """Per-worker LRU in front of Redis, with single-flight loads per key."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max(0, max_entries)
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self._memory_hits = 0
+        self._redis_hits = 0
+        self._upstream_calls = 0
+        self._coalesced = 0
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: str,
+        ttl_seconds: int,
+        load: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        local_key = f"{namespace}:{key}"
+        value = self._memory_get(local_key)
+        if value is not None:
+            self._memory_hits += 1
+            return value
+        task = self._inflight.get(local_key)
+        if task is None:
+            task = asyncio.create_task(self._load(namespace, key, ttl_seconds, load))
+            self._inflight[local_key] = task
+            task.add_done_callback(lambda done: self._forget(local_key, done))
+        else:
+            self._coalesced += 1
+        # Shielded so one cancelled request does not cancel the load its peers wait on.
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        namespace: str,
+        key: str,
+        ttl_seconds: int,
+        load: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        local_key = f"{namespace}:{key}"
+        cached = await redis_cache_get(namespace, key)
+        if isinstance(cached, dict):
+            self._redis_hits += 1
+            self._memory_put(local_key, cached, ttl_seconds)
+            return cached
+        self._upstream_calls += 1
+        value = await load()
+        self._memory_put(local_key, value, ttl_seconds)
+        await redis_cache_put(namespace, key, value, ttl_seconds)
+        return value
+
+    def _forget(self, local_key: str, task: asyncio.Task[dict[str, Any]]) -> None:
+        if self._inflight.get(local_key) is task:
+            del self._inflight[local_key]
+        if not task.cancelled():
+            task.exception()  # retrieved here so an error nobody awaited is not logged
+
+    def _memory_get(self, local_key: str) -> dict[str, Any] | None:
+        item = self._entries.get(local_key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if monotonic() >= expires_at:
+            del self._entries[local_key]
+            return None
+        self._entries.move_to_end(local_key)
+        return value
+
+    def _memory_put(self, local_key: str, value: dict[str, Any], ttl_seconds: int) -> None:
+        if self._max_entries <= 0:
+            return
+        self._entries[local_key] = (monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(local_key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> PlacesCacheStats:
+        return PlacesCacheStats(
+            entries=len(self._entries),
+            capacity=self._max_entries,
+            memory_hits=self._memory_hits,
+            redis_hits=self._redis_hits,
+            upstream_calls=self._upstream_calls,
+            coalesced=self._coalesced,
+        )
+
+
+_CACHE: _PlacesCache | None = None
+_SHARED_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_places_cache() -> _PlacesCache:
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = _PlacesCache(config.PLACES_LOCAL_CACHE_MAX_ENTRIES)
+    return _CACHE
+
+
+async def close_places_http_client() -> None:
+    global _SHARED_CLIENT
+    client, _SHARED_CLIENT = _SHARED_CLIENT, None
+    if client is not None:
+        await client.aclose()
+
+
+def _cache_key(*parts: str | None) -> str:
+    normalized = "\x1f".join(" ".join((part or "").split()).lower() for part in parts)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _normalize_components(components: str | None) -> str:
+    """``country:in|country:ae`` and ``country:AE|country:IN`` share one cache entry."""
+    values = {c.strip().lower() for c in (components or "").split("|") if c.strip()}
+    return "|".join(sorted(values))
+
+
+async def _get_json(
+    url: str,
+    params: dict[str, str],
+    http_client: httpx.AsyncClient | None,
+) -> Any:
+    if http_client is not None:
+        resp = await http_client.get(url, params=params)
+        return resp.json()
+    pool = get_http_client_pool()
+    if pool is not None:
+        async with pool.request_slot(url) as client:
+            resp = await client.get(url, params=params, timeout=_TIMEOUT_SECONDS)
+            return resp.json()
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        _SHARED_CLIENT = httpx.AsyncClient(timeout=_TIMEOUT_SECONDS)
+    resp = await _SHARED_CLIENT.get(url, params=params)
+    return resp.json()
+
+
 async def places_autocomplete(
     *,
     input_text: str,
@@ -44,14 +218,46 @@ async def places_autocomplete(
     http_client: httpx.AsyncClient | None = None,
 ) -> list[dict[str, Any]]:
     """Proxy Google Place Autocomplete (cities). Key never leaves the backend."""
-    query = (input_text or "").strip()
+    query = " ".join((input_text or "").split())
     if len(query) < 2:
         return []
+    api_key = _google_maps_api_key()
+    components = _normalize_components(components) or None
+
+    async def load() -> dict[str, Any]:
+        return {
+            "predictions": await _fetch_autocomplete(
+                query=query,
+                api_key=api_key,
+                session_token=session_token,
+                language=language,
+                components=components,
+                http_client=http_client,
+            )
+        }
+
+    cached = await get_places_cache().get_or_load(
+        _AUTOCOMPLETE_NAMESPACE,
+        _cache_key(query, language, components),
+        config.PLACES_AUTOCOMPLETE_TTL_SECONDS,
+        load,
+    )
+    return list(cached.get("predictions") or [])
 
+
+async def _fetch_autocomplete(
+    *,
+    query: str,
+    api_key: str,
+    session_token: str | None,
+    language: str | None,
+    components: str | None,
+    http_client: httpx.AsyncClient | None,
+) -> list[dict[str, Any]]:
     params: dict[str, str] = {
         "input": query,
         "types": "(cities)",
-        "key": _google_maps_api_key(),
+        "key": api_key,
     }
     if session_token:
         params["sessiontoken"] = session_token
@@ -60,17 +266,11 @@ async def places_autocomplete(
     if components:
         params["components"] = components
 
-    owns = http_client is None
-    client = http_client or httpx.AsyncClient(timeout=15.0)
     try:
-        resp = await client.get(PLACES_AUTOCOMPLETE_URL, params=params)
-        data = resp.json()
+        data = await _get_json(PLACES_AUTOCOMPLETE_URL, params, http_client)
     except Exception as exc:
         logger.warning("Google Places autocomplete failed: %s", exc)
         raise RuntimeError("Google Places autocomplete request failed") from exc
-    finally:
-        if owns:
-            await client.aclose()
 
     status = str(data.get("status") or "")
     if status not in ("OK", "ZERO_RESULTS"):
@@ -114,28 +314,50 @@ async def place_details(
     pid = (place_id or "").strip()
     if not pid:
         raise ValueError("placeId is required")
+    api_key = _google_maps_api_key()
+
+    async def load() -> dict[str, Any]:
+        return await _fetch_place_details(
+            pid=pid,
+            api_key=api_key,
+            session_token=session_token,
+            language=language,
+            http_client=http_client,
+        )
 
+    # Place ids are case-sensitive, so they are hashed as given rather than normalized.
+    key = hashlib.sha256(f"{pid}\x1f{(language or '').strip().lower()}".encode()).hexdigest()
+    return await get_places_cache().get_or_load(
+        _DETAILS_NAMESPACE,
+        key,
+        config.PLACES_DETAILS_TTL_SECONDS,
+        load,
+    )
+
+
+async def _fetch_place_details(
+    *,
+    pid: str,
+    api_key: str,
+    session_token: str | None,
+    language: str | None,
+    http_client: httpx.AsyncClient | None,
+) -> dict[str, Any]:
     params: dict[str, str] = {
         "place_id": pid,
         "fields": "place_id,name,formatted_address,geometry,address_component,types",
-        "key": _google_maps_api_key(),
+        "key": api_key,
     }
     if session_token:
         params["sessiontoken"] = session_token
     if language:
         params["language"] = language
 
-    owns = http_client is None
-    client = http_client or httpx.AsyncClient(timeout=15.0)
     try:
-        resp = await client.get(PLACES_DETAILS_URL, params=params)
-        data = resp.json()
+        data = await _get_json(PLACES_DETAILS_URL, params, http_client)
     except Exception as exc:
         logger.warning("Google Places details failed: %s", exc)
         raise RuntimeError("Google Places details request failed") from exc
-    finally:
-        if owns:
-            await client.aclose()
 
     status = str(data.get("status") or "")
     if status != "OK":
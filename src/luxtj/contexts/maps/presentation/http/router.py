@@ -4,8 +4,7 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-import httpx
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, HTTPException
 from pydantic import Field
 
 from luxtj.contexts.maps.application.places import (
@@ -13,7 +12,6 @@ from luxtj.contexts.maps.application.places import (
     place_details,
     places_autocomplete,
 )
-from luxtj.shared_kernel.presentation.http.dependencies import http_client_handle
 from luxtj.shared_kernel.presentation.http.schemas import (
     ApiSerializerBaseModel,
     ApiSuccessResponse,
@@ -44,7 +42,6 @@ class PlaceDetailsBody(ApiSerializerBaseModel):
 )
 async def autocomplete_places(
     body: Annotated[PlacesAutocompleteBody, Body(...)],
-    http_client: Annotated[httpx.AsyncClient, Depends(http_client_handle)],
 ) -> ApiSuccessResponse[dict[str, Any]]:
     try:
         predictions = await places_autocomplete(
@@ -52,7 +49,6 @@ async def autocomplete_places(
             session_token=body.session_token,
             language=body.language,
             components=body.components,
-            http_client=http_client,
         )
     except MapsConfigError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
@@ -67,14 +63,12 @@ async def autocomplete_places(
 )
 async def get_place_details(
     body: Annotated[PlaceDetailsBody, Body(...)],
-    http_client: Annotated[httpx.AsyncClient, Depends(http_client_handle)],
 ) -> ApiSuccessResponse[dict[str, Any]]:
     try:
         details = await place_details(
             place_id=body.place_id,
             session_token=body.session_token,
             language=body.language,
-            http_client=http_client,
         )
     except MapsConfigError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
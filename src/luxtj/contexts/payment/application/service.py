@@ -126,7 +126,7 @@ class PaymentGatewayService:
         amount_dec = Decimal(str(amount))
         fx = Decimal("1")
         if cur_in != admin:
-            fx = Decimal(str(AdminCurrency.rate_to_admin_or_one(cur_in)))
+            fx = Decimal(str(await AdminCurrency.require_rate_to_admin_async(cur_in)))
             booking_dec = (booking_dec * fx).quantize(Decimal("0.01"))
             amount_dec = (amount_dec * fx).quantize(Decimal("0.01"))
 
@@ -23,6 +23,9 @@ class PaymentGatewayTransactionRow(PaymentBase):
             "flight_booking_details_id",
         ),
         Index("ix_payment_gateway_transactions_status", "status"),
+        Index("ix_payment_gateway_transactions_updated_at", "updated_at"),
+        Index("ix_payment_gateway_transactions_created_at", "created_at"),
+        Index("ix_payment_gateway_transactions_refunded_at", "refunded_at"),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
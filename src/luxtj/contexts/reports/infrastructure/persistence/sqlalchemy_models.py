@@ -0,0 +1,48 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Date, DateTime, Index, Integer, Numeric, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class ReportsBase(DeclarativeBase):
+    pass
+
+
+class SalesDailyRollupRow(ReportsBase):
+    """Per-day (UTC) totals: sales of bookings created that day, payments captured and refunds
+    issued that day. One row per product x booking source x destination x property x currency.
+    Rebuilt a day at a time by :class:`SalesRollupProjector`; empty ids mean "unknown"
+    (flights have no property)."""
+
+    __tablename__ = "report_sales_daily_rollups"
+    __table_args__ = (
+        Index("ix_report_sales_daily_rollups_destination_day", "destination_id", "day"),
+        Index("ix_report_sales_daily_rollups_property_day", "property_id", "day"),
+    )
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    product: Mapped[str] = mapped_column(String(16), primary_key=True)
+    booking_source: Mapped[str] = mapped_column(String(50), primary_key=True)
+    destination_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    property_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    currency: Mapped[str] = mapped_column(String(3), primary_key=True)
+    destination_name: Mapped[str] = mapped_column(String(255), nullable=False, default="")
+    property_name: Mapped[str] = mapped_column(String(255), nullable=False, default="")
+    booking_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    units_sold: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sales_amount: Mapped[Decimal] = mapped_column(Numeric(16, 2), nullable=False, default=0)
+    margin_amount: Mapped[Decimal] = mapped_column(Numeric(16, 2), nullable=False, default=0)
+    payment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    payments_amount: Mapped[Decimal] = mapped_column(Numeric(16, 2), nullable=False, default=0)
+    refund_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    refunds_amount: Mapped[Decimal] = mapped_column(Numeric(16, 2), nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class ReportRollupCursorRow(ReportsBase):
+    __tablename__ = "report_rollup_cursors"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    watermark: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
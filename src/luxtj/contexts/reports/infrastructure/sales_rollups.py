@@ -0,0 +1,308 @@
+"""Incrementally maintained daily sales rollups for the admin sales / finance dashboards.
+
+Sales and margin are bucketed by the booking's UTC ``created_at`` date, captured payments by
+the payment row's ``created_at`` and refunds by its ``refunded_at``. The payment ledger keeps
+one cumulative ``refunded_amount`` per payment, so a payment refunded in several steps counts
+its whole refunded amount on the day of the latest refund.
+
+Each tick finds the days touched since the last watermark — by any hotel/flight booking,
+transaction ledger or payment row with a newer ``updated_at`` — and rebuilds exactly those
+days of ``report_sales_daily_rollups`` with one ``DELETE`` + ``INSERT … SELECT … GROUP BY``
+per batch of days. A changed payment dirties every day from its capture to its latest
+refund, which covers the day an earlier refund was counted on. Rebuilding a whole day is
+idempotent, so status flips (confirmed → cancelled), refunds and late ledger edits need no
+per-event bookkeeping. The first tick (no watermark yet) backfills every day.
+
+The watermark is the database clock at tick start; rows are re-checked ``lag_seconds``
+behind it so transactions that commit late with an earlier ``updated_at`` are not missed.
+Rebuilds take a transaction-level advisory lock, so several projector processes are safe.
+"""
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, time, timedelta
+
+from sqlalchemy import Date, bindparam, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from luxtj.contexts.currency.domain.admin_currency import AdminCurrency
+from luxtj.contexts.reports.infrastructure.persistence.sqlalchemy_models import (
+    ReportRollupCursorRow,
+)
+from luxtj.shared_kernel.infrastructure.persistence.sqlalchemy import (
+    AsyncSessionFactory,
+    session_scope,
+)
+
+logger = logging.getLogger(__name__)
+
+CURSOR_NAME = "sales_daily"
+CONFIRMED_STATUS = "BOOKING_CONFIRMED"
+CAPTURED_PAYMENT_STATUSES = ("accepted", "partially_refunded", "refunded")
+
+_LOCK_KEY = 0x53414C4553  # "SALES"
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+_CAPTURED = ", ".join(f"'{s}'" for s in CAPTURED_PAYMENT_STATUSES)
+
+_DIRTY_DAYS_SQL = text(
+    """
+    SELECT DISTINCT day FROM (
+        SELECT (b.created_at AT TIME ZONE 'UTC')::date AS day
+        FROM hotel_booking_details b
+        WHERE b.updated_at > :since
+        UNION ALL
+        SELECT (b.created_at AT TIME ZONE 'UTC')::date
+        FROM hotel_booking_transaction_details t
+        JOIN hotel_booking_details b ON b.app_reference = t.app_reference
+        WHERE t.updated_at > :since
+        UNION ALL
+        SELECT (b.created_at AT TIME ZONE 'UTC')::date
+        FROM flight_booking_details b
+        WHERE b.updated_at > :since
+        UNION ALL
+        SELECT (b.created_at AT TIME ZONE 'UTC')::date
+        FROM flight_booking_transaction_details t
+        JOIN flight_booking_details b ON b.app_reference = t.app_reference
+        WHERE t.updated_at > :since
+        UNION ALL
+        -- Payments of a changed booking carry its destination / property.
+        SELECT unnest(ARRAY[
+            (p.created_at AT TIME ZONE 'UTC')::date, (p.refunded_at AT TIME ZONE 'UTC')::date
+        ])
+        FROM payment_gateway_transactions p
+        WHERE p.app_reference IN (
+            SELECT app_reference FROM hotel_booking_details WHERE updated_at > :since
+            UNION ALL
+            SELECT app_reference FROM flight_booking_details WHERE updated_at > :since
+        )
+        UNION ALL
+        SELECT generate_series(
+            (p.created_at AT TIME ZONE 'UTC')::date::timestamp,
+            (greatest(p.created_at, p.refunded_at) AT TIME ZONE 'UTC')::date::timestamp,
+            interval '1 day'
+        )::date
+        FROM payment_gateway_transactions p
+        WHERE p.updated_at > :since
+    ) touched
+    WHERE day IS NOT NULL
+    ORDER BY day
+    """
+)
+
+_DAYS_FILTER = """
+        {column} >= :lo AND {column} < :hi
+        AND ({column} AT TIME ZONE 'UTC')::date = ANY(:days)
+"""
+
+
+def _days_filter(column: str) -> str:
+    return _DAYS_FILTER.format(column=column)
+
+
+def _booking_dims(hotel_filter: str, flight_filter: str) -> str:
+    """Hotel and flight bookings (with their ledger totals) matching the two filters."""
+    return f"""
+        SELECT b.app_reference,
+               (b.created_at AT TIME ZONE 'UTC')::date AS day,
+               'hotel' AS product,
+               b.booking_source,
+               b.status,
+               coalesce(lower(nullif(trim(b.hotel_location), '')), '') AS destination_id,
+               coalesce(nullif(trim(b.hotel_location), ''), '') AS destination_name,
+               coalesce(nullif(b.hotel_crs_hotel_code, ''), nullif(b.hotel_code, ''), '')
+                   AS property_id,
+               b.hotel_name AS property_name,
+               b.rooms::int AS units,
+               t.currency::varchar AS currency,
+               t.total AS sales_amount,
+               t.admin_markup + t.convenience_amount - t.admin_discount AS margin_amount
+        FROM hotel_booking_details b
+        LEFT JOIN hotel_booking_transaction_details t ON t.app_reference = b.app_reference
+        WHERE b.deleted_at IS NULL AND {hotel_filter}
+        UNION ALL
+        SELECT b.app_reference,
+               (b.created_at AT TIME ZONE 'UTC')::date,
+               'flight',
+               b.booking_source,
+               b.status,
+               coalesce(upper(nullif(trim(b.destination), '')), ''),
+               coalesce(upper(nullif(trim(b.destination), '')), ''),
+               '',
+               '',
+               (
+                   SELECT count(*)::int FROM flight_booking_passenger_details x
+                   WHERE x.app_reference = b.app_reference
+               ),
+               NULL,
+               t.total_fare,
+               t.admin_markup + t.convenience_fee - t.admin_discount
+        FROM flight_booking_details b
+        LEFT JOIN flight_booking_transaction_details t ON t.app_reference = b.app_reference
+        WHERE {flight_filter}
+    """
+
+
+_PAID_BOOKINGS_FILTER = "b.app_reference IN (SELECT app_reference FROM payments)"
+
+_DELETE_DAYS_SQL = text("DELETE FROM report_sales_daily_rollups WHERE day = ANY(:days)").bindparams(
+    bindparam("days", type_=ARRAY(Date))
+)
+
+_REBUILD_DAYS_SQL = text(
+    f"""
+    WITH bookings AS (
+        {_booking_dims(_days_filter("b.created_at"), _days_filter("b.created_at"))}
+    ),
+    payments AS (
+        SELECT p.app_reference, p.currency, p.amount, p.refunded_amount,
+               (p.created_at AT TIME ZONE 'UTC')::date AS paid_day,
+               (p.refunded_at AT TIME ZONE 'UTC')::date AS refund_day
+        FROM payment_gateway_transactions p
+        WHERE p.status IN ({_CAPTURED})
+          AND (({_days_filter("p.created_at")}) OR ({_days_filter("p.refunded_at")}))
+    ),
+    paid_bookings AS (
+        {_booking_dims(_PAID_BOOKINGS_FILTER, _PAID_BOOKINGS_FILTER)}
+    ),
+    facts AS (
+        SELECT day, product, booking_source, destination_id, destination_name, property_id,
+               property_name, coalesce(currency, CAST(:admin_currency AS varchar)) AS currency,
+               1 AS booking_count, units AS units_sold,
+               coalesce(sales_amount, 0) AS sales_amount,
+               coalesce(margin_amount, 0) AS margin_amount,
+               0 AS payment_count, 0 AS payments_amount, 0 AS refund_count, 0 AS refunds_amount
+        FROM bookings
+        WHERE status = '{CONFIRMED_STATUS}'
+        UNION ALL
+        SELECT p.paid_day, b.product, b.booking_source, b.destination_id, b.destination_name,
+               b.property_id, b.property_name, p.currency,
+               0, 0, 0, 0,
+               1, p.amount,
+               0, 0
+        FROM payments p
+        JOIN paid_bookings b ON b.app_reference = p.app_reference
+        WHERE p.paid_day = ANY(:days)
+        UNION ALL
+        SELECT p.refund_day, b.product, b.booking_source, b.destination_id, b.destination_name,
+               b.property_id, b.property_name, p.currency,
+               0, 0, 0, 0,
+               0, 0,
+               1, p.refunded_amount
+        FROM payments p
+        JOIN paid_bookings b ON b.app_reference = p.app_reference
+        WHERE p.refund_day = ANY(:days) AND p.refunded_amount > 0
+    )
+    INSERT INTO report_sales_daily_rollups (
+        day, product, booking_source, destination_id, property_id, currency,
+        destination_name, property_name, booking_count, units_sold, sales_amount,
+        margin_amount, payment_count, payments_amount, refund_count, refunds_amount, updated_at
+    )
+    SELECT day, product, booking_source, destination_id, property_id, currency,
+           max(destination_name), max(property_name), sum(booking_count), sum(units_sold),
+           sum(sales_amount), sum(margin_amount), sum(payment_count), sum(payments_amount),
+           sum(refund_count), sum(refunds_amount), now()
+    FROM facts
+    GROUP BY day, product, booking_source, destination_id, property_id, currency
+    """
+).bindparams(bindparam("days", type_=ARRAY(Date)))
+
+
+class SalesRollupProjector:
+    """Keeps ``report_sales_daily_rollups`` in step with booking / payment state."""
+
+    def __init__(
+        self,
+        session_factory: AsyncSessionFactory,
+        *,
+        poll_interval_seconds: float = 60.0,
+        lag_seconds: float = 300.0,
+        days_per_batch: int = 31,
+    ):
+        self._session_factory = session_factory
+        self._poll_interval_seconds = poll_interval_seconds
+        self._lag = timedelta(seconds=max(0.0, lag_seconds))
+        self._days_per_batch = max(1, days_per_batch)
+        self._stop_event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop_event.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                rebuilt = await self.tick()
+                if rebuilt:
+                    logger.info("Sales rollups rebuilt for %d day(s)", rebuilt)
+            except Exception as ex:
+                logger.exception("SalesRollupProjector tick failed: %s", ex)
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(),
+                    timeout=self._poll_interval_seconds,
+                )
+            except TimeoutError:
+                continue
+
+    async def tick(self) -> int:
+        """Rebuild every day touched since the watermark. Returns the number of days."""
+        async with session_scope(self._session_factory) as session:
+            started_at = (await session.execute(text("SELECT now()"))).scalar_one()
+            watermark = await session.scalar(
+                select(ReportRollupCursorRow.watermark).where(
+                    ReportRollupCursorRow.name == CURSOR_NAME
+                )
+            )
+            since = watermark - self._lag if watermark is not None else _EPOCH
+            days = list((await session.execute(_DIRTY_DAYS_SQL, {"since": since})).scalars())
+
+        for start in range(0, len(days), self._days_per_batch):
+            async with session_scope(self._session_factory) as session:
+                await rebuild_days(session, days[start : start + self._days_per_batch])
+
+        async with session_scope(self._session_factory) as session:
+            await _advance_watermark(session, started_at)
+        return len(days)
+
+
+async def rebuild_days(session: AsyncSession, days: Sequence[date]) -> None:
+    """Recompute the rollup rows of ``days`` inside the caller's transaction."""
+    if not days:
+        return
+    await session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _LOCK_KEY})
+    params = {
+        "days": list(days),
+        "lo": datetime.combine(min(days), time.min, tzinfo=UTC),
+        "hi": datetime.combine(max(days) + timedelta(days=1), time.min, tzinfo=UTC),
+        "admin_currency": AdminCurrency.code(),
+    }
+    await session.execute(_DELETE_DAYS_SQL, {"days": params["days"]})
+    await session.execute(_REBUILD_DAYS_SQL, params)
+
+
+async def _advance_watermark(session: AsyncSession, watermark: datetime) -> None:
+    stmt = insert(ReportRollupCursorRow).values(
+        name=CURSOR_NAME, watermark=watermark, updated_at=watermark
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ReportRollupCursorRow.name],
+            set_={
+                "watermark": text("GREATEST(report_rollup_cursors.watermark, excluded.watermark)"),
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    )
@@ -0,0 +1,71 @@
+"""Query helpers shared by the hotel / flight ``SearchResults`` services."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from luxtj.shared_kernel.infrastructure.search_result_store import StoredSearch
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+type SortKey = Callable[[dict[str, Any]], Any]
+
+
+def page_params(body: dict[str, Any]) -> tuple[int, int]:
+    """1-based ``page`` and ``pageSize`` (capped at ``MAX_PAGE_SIZE``) from a request body."""
+    page = max(1, body_int(body.get("page")) or 1)
+    size = body_int(body.get("pageSize")) or DEFAULT_PAGE_SIZE
+    return page, max(1, min(MAX_PAGE_SIZE, size))
+
+
+def sorted_positions(stored: StoredSearch, name: str, key: SortKey, descending: bool) -> list[int]:
+    """Card positions ordered by ``key``, memoized on the stored search until it grows.
+
+    The sort is stable, so supplier order is kept among ties; cards whose key is ``None``
+    go last in either direction.
+    """
+
+    def build() -> list[int]:
+        values = [key(card) for card in stored.cards]
+        known = [i for i, v in enumerate(values) if v is not None]
+        known.sort(key=values.__getitem__, reverse=descending)
+        return known + [i for i, v in enumerate(values) if v is None]
+
+    return stored.memo(("sort", name, descending), build)
+
+
+def paginate(
+    stored: StoredSearch, positions: list[int], *, page: int, page_size: int
+) -> list[dict[str, Any]]:
+    start = (page - 1) * page_size
+    return [stored.cards[i] for i in positions[start : start + page_size]]
+
+
+def body_list(value: Any) -> list[Any]:
+    if value is None or value == "":
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def body_float(value: Any) -> float | None:
+    try:
+        return float(value) if value not in (None, "") else None
+    except TypeError, ValueError:
+        return None
+
+
+def body_int(value: Any) -> int | None:
+    try:
+        return int(value) if value not in (None, "") else None
+    except TypeError, ValueError:
+        return None
+
+
+def body_bool(value: Any) -> bool | None:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes"}
+    return bool(value)
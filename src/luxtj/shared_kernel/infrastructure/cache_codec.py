@@ -0,0 +1,156 @@
+"""Versioned value codecs for the shared Redis TTL cache.
+
+Values written by :mod:`redis_cache` are framed as ``[version byte][payload]`` so readers
+can decode entries written by any codec still in the registry. The pickle codec is the
+exception: it writes the legacy unframed layout (raw pickle, first byte ``0x80``), which
+every reader — including workers from before this module — decodes.
+
+Rollout: the default ``LTJBE_CACHE_CODEC=pickle`` ships the readers without changing what
+is written; set ``zstd`` only once every worker runs them.
+
+Optional trained dictionary (``LTJBE_CACHE_ZSTD_DICT``) — build one from sample
+payloads (e.g. cached offers + hotel block snapshots) and ship it with every worker::
+
+    from luxtj.shared_kernel.infrastructure.cache_codec import train_cache_dictionary
+    Path("cache.zdict").write_bytes(train_cache_dictionary(samples))
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Protocol
+
+import zstandard
+
+_LEGACY_PICKLE_PREFIX = 0x80
+
+
+class CacheCodec(Protocol):
+    version: int
+
+    def encode(self, value: Any) -> bytes: ...
+
+    def decode(self, payload: bytes) -> Any: ...
+
+
+class PickleCodec:
+    """Plain pickle (protocol 5), written unframed. Default and rollback codec."""
+
+    version = 1
+
+    def encode(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, payload: bytes) -> Any:
+        return pickle.loads(payload)
+
+
+class ZstdPickleCodec:
+    """Pickle + zstd, optionally with a trained dictionary.
+
+    Pickle keeps zeep-parsed ``Decimal`` / ``datetime`` values intact; zstd (plus a
+    dictionary for the many small, similar token payloads) removes the repetition of
+    keys and airport/airline names. The dictionary ID lives in the zstd frame header,
+    so frames written without a dictionary still decode after one is configured.
+    """
+
+    version = 2
+
+    def __init__(self, *, level: int = 3, dictionary: bytes | None = None) -> None:
+        self._dict = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+        self._compressor = zstandard.ZstdCompressor(level=level, dict_data=self._dict)
+        self._decompressors: dict[int, zstandard.ZstdDecompressor] = {
+            0: zstandard.ZstdDecompressor()
+        }
+        if self._dict is not None:
+            self._decompressors[self._dict.dict_id()] = zstandard.ZstdDecompressor(
+                dict_data=self._dict
+            )
+
+    def encode(self, value: Any) -> bytes:
+        return self._compressor.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def decode(self, payload: bytes) -> Any:
+        dict_id = zstandard.get_frame_parameters(payload).dict_id
+        decompressor = self._decompressors.get(dict_id)
+        if decompressor is None:
+            raise ValueError(f"zstd dictionary {dict_id} is not loaded")
+        return pickle.loads(decompressor.decompress(payload))
+
+
+def train_cache_dictionary(samples: Iterable[Any], *, dict_size: int = 112_640) -> bytes:
+    """Train a zstd dictionary from representative cached values."""
+    encoded = [pickle.dumps(sample, protocol=pickle.HIGHEST_PROTOCOL) for sample in samples]
+    return zstandard.train_dictionary(dict_size, encoded).as_bytes()
+
+
+def _codec_from_env() -> ZstdPickleCodec:
+    level = int(os.environ.get("LTJBE_CACHE_ZSTD_LEVEL") or 3)
+    dict_path = (os.environ.get("LTJBE_CACHE_ZSTD_DICT") or "").strip()
+    dictionary = Path(dict_path).read_bytes() if dict_path else None
+    return ZstdPickleCodec(level=level, dictionary=dictionary)
+
+
+_CODECS_BY_VERSION: dict[int, CacheCodec] = {}
+_NAMESPACE_CODECS: dict[str, CacheCodec] = {}
+_default_codec: CacheCodec | None = None
+_defaults_loaded = False
+
+
+def register_cache_codec(
+    codec: CacheCodec,
+    *,
+    namespaces: Iterable[str] = (),
+    default: bool = False,
+) -> None:
+    """Make ``codec`` decodable; optionally use it for writes (per namespace or default)."""
+    global _default_codec
+    if codec.version in (0, _LEGACY_PICKLE_PREFIX) or not 0 < codec.version < 256:
+        raise ValueError(f"Invalid cache codec version {codec.version}")
+    _CODECS_BY_VERSION[codec.version] = codec
+    for namespace in namespaces:
+        _NAMESPACE_CODECS[namespace] = codec
+    if default:
+        _default_codec = codec
+
+
+def _ensure_defaults() -> CacheCodec:
+    global _default_codec, _defaults_loaded
+    if not _defaults_loaded:
+        _defaults_loaded = True
+        pickle_codec = PickleCodec()
+        zstd_codec = _codec_from_env()
+        _CODECS_BY_VERSION.setdefault(pickle_codec.version, pickle_codec)
+        _CODECS_BY_VERSION.setdefault(zstd_codec.version, zstd_codec)
+        if _default_codec is None:
+            choice = (os.environ.get("LTJBE_CACHE_CODEC") or "pickle").strip().lower()
+            _default_codec = _CODECS_BY_VERSION[
+                zstd_codec.version if choice == "zstd" else pickle_codec.version
+            ]
+    assert _default_codec is not None
+    return _default_codec
+
+
+def encode_cache_value(namespace: str, value: Any) -> bytes:
+    default = _ensure_defaults()
+    codec = _NAMESPACE_CODECS.get(namespace, default)
+    if codec.version == PickleCodec.version:
+        # Legacy layout: readers without the codec registry can still decode it.
+        return codec.encode(value)
+    return bytes((codec.version,)) + codec.encode(value)
+
+
+def decode_cache_value(raw: bytes) -> Any:
+    _ensure_defaults()
+    if not raw:
+        raise ValueError("Empty cache payload")
+    version = raw[0]
+    if version == _LEGACY_PICKLE_PREFIX:
+        return pickle.loads(raw)
+    codec = _CODECS_BY_VERSION.get(version)
+    if codec is None:
+        raise ValueError(f"Unknown cache codec version {version}")
+    return codec.decode(raw[1:])
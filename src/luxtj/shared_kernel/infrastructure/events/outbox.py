@@ -1,8 +1,14 @@
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from luxtj.shared_kernel.domain.events import BaseDomainEvent
 from luxtj.shared_kernel.infrastructure.persistence.outbox_model import DomainEventOutboxRow
 
+# Postgres NOTIFY channel the outbox dispatcher LISTENs on.
+OUTBOX_NOTIFY_CHANNEL = "domain_event_outbox"
+
+_NOTIFY = text("SELECT pg_notify(:channel, '')")
+
 
 class OutboxEventPublisher:
     """Writes domain events to the outbox table within the caller's DB transaction."""
@@ -12,3 +18,6 @@ class OutboxEventPublisher:
 
     async def publish(self, event: BaseDomainEvent) -> None:
         self._session.add(DomainEventOutboxRow.from_event(event))
+        # Delivered on commit (and collapsed to one per transaction), so listeners only
+        # wake for events they can already read.
+        await self._session.execute(_NOTIFY, {"channel": OUTBOX_NOTIFY_CHANNEL})
@@ -0,0 +1,322 @@
+"""Push-based dispatch of ``domain_event_outbox`` rows to named subscribers.
+
+:class:`OutboxDispatcher` keeps one dedicated connection ``LISTEN``-ing on
+:data:`OUTBOX_NOTIFY_CHANNEL` (the publisher ``NOTIFY``-s on commit), so it wakes as soon as
+events land; polling every ``fallback_poll_seconds`` only covers a lost listener connection.
+
+Every :class:`OutboxSubscriber` has its own cursor row in ``domain_event_outbox_cursors``.
+A batch is split into ``partitions`` by the subscriber's :meth:`~OutboxSubscriber.partition_key`
+and the partitions are handled concurrently, each in its own transaction and in outbox
+order, so events of one entity stay ordered. The cursor moves only once every partition of
+the batch has committed: delivery is at-least-once and handlers must be idempotent.
+"""
+
+import asyncio
+import logging
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from luxtj.shared_kernel.infrastructure.events.outbox import OUTBOX_NOTIFY_CHANNEL
+from luxtj.shared_kernel.infrastructure.persistence.outbox_model import (
+    DomainEventOutboxCursorRow,
+    DomainEventOutboxRow,
+)
+from luxtj.shared_kernel.infrastructure.persistence.sqlalchemy import (
+    AsyncSessionFactory,
+    session_scope,
+)
+from luxtj.utils import timeutils
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxEvent:
+    id: str
+    type: str
+    subject: str | None
+    time: datetime | None
+    payload: dict[str, Any]
+    created_at: datetime
+
+    @classmethod
+    def from_row(cls, row: DomainEventOutboxRow) -> OutboxEvent:
+        return cls(
+            id=row.id,
+            type=row.type,
+            subject=row.subject,
+            time=row.time,
+            payload=row.payload,
+            created_at=row.created_at,
+        )
+
+
+class OutboxSubscriber(ABC):
+    """A named outbox consumer: the event types it wants and how to apply a partition."""
+
+    name: str
+    event_types: Sequence[str]
+
+    def partition_key(self, event: OutboxEvent) -> str:
+        """Events with equal keys are handled in order; others may run in parallel."""
+        return event.subject or event.id
+
+    @abstractmethod
+    async def handle_batch(self, session: AsyncSession, events: Sequence[OutboxEvent]) -> None:
+        """Apply ``events`` (one partition, outbox order) in ``session``'s transaction."""
+
+
+@dataclass(slots=True)
+class OutboxSubscriberStats:
+    name: str
+    last_processed_id: str | None
+    events: int
+    batches: int
+    failures: int
+    last_batch_size: int
+    last_batch_seconds: float
+    events_per_second: float
+    # created_at → handled delay of the newest event in the last batch.
+    lag_seconds: float
+
+
+@dataclass(slots=True)
+class _Counters:
+    last_processed_id: str | None = None
+    events: int = 0
+    batches: int = 0
+    failures: int = 0
+    last_batch_size: int = 0
+    last_batch_seconds: float = 0.0
+    lag_seconds: float = 0.0
+
+
+class OutboxDispatcher:
+    def __init__(
+        self,
+        session_factory: AsyncSessionFactory,
+        subscribers: Sequence[OutboxSubscriber],
+        *,
+        engine: AsyncEngine | None = None,
+        partitions: int = 4,
+        batch_size: int = 500,
+        fallback_poll_seconds: float = 30.0,
+        channel: str = OUTBOX_NOTIFY_CHANNEL,
+    ):
+        names = [subscriber.name for subscriber in subscribers]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Outbox subscriber names must be unique: {names}")
+        self._session_factory = session_factory
+        self._subscribers = list(subscribers)
+        self._engine = engine
+        self._partitions = max(1, partitions)
+        self._batch_size = max(1, batch_size)
+        self._fallback_poll_seconds = fallback_poll_seconds
+        self._channel = channel
+        self._counters = {name: _Counters() for name in names}
+        self._wake = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._listen_conn: AsyncConnection | None = None
+        self._listen_driver: Any = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop_event.set()
+        self._wake.set()
+        await self._task
+        self._task = None
+
+    def stats(self) -> list[OutboxSubscriberStats]:
+        stats = []
+        for name, counters in self._counters.items():
+            seconds = counters.last_batch_seconds
+            stats.append(
+                OutboxSubscriberStats(
+                    name=name,
+                    last_processed_id=counters.last_processed_id,
+                    events=counters.events,
+                    batches=counters.batches,
+                    failures=counters.failures,
+                    last_batch_size=counters.last_batch_size,
+                    last_batch_seconds=round(seconds, 6),
+                    events_per_second=(
+                        round(counters.last_batch_size / seconds, 1) if seconds > 0 else 0.0
+                    ),
+                    lag_seconds=round(counters.lag_seconds, 3),
+                )
+            )
+        return stats
+
+    async def _run(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                # Cleared before reading, so a NOTIFY during the tick triggers another one.
+                self._wake.clear()
+                await self._ensure_listener()
+                try:
+                    handled = await self.tick()
+                except Exception as ex:
+                    logger.exception("OutboxDispatcher tick failed: %s", ex)
+                    handled = 0
+                if handled:
+                    continue
+                try:
+                    await asyncio.wait_for(
+                        self._wake.wait(),
+                        timeout=self._fallback_poll_seconds,
+                    )
+                except TimeoutError:
+                    continue
+        finally:
+            await self._close_listener()
+
+    async def tick(self) -> int:
+        """Dispatch one batch per subscriber. Returns the number of events handled."""
+        results = await asyncio.gather(
+            *(self._dispatch(subscriber) for subscriber in self._subscribers),
+            return_exceptions=True,
+        )
+        handled = 0
+        for subscriber, result in zip(self._subscribers, results, strict=True):
+            if isinstance(result, BaseException):
+                self._counters[subscriber.name].failures += 1
+                logger.error(
+                    "Outbox subscriber %s failed: %s",
+                    subscriber.name,
+                    result,
+                    exc_info=result,
+                )
+            else:
+                handled += result
+        return handled
+
+    async def _dispatch(self, subscriber: OutboxSubscriber) -> int:
+        async with session_scope(self._session_factory) as session:
+            cursor = await session.get(DomainEventOutboxCursorRow, subscriber.name)
+            query = select(DomainEventOutboxRow).where(
+                DomainEventOutboxRow.type.in_(list(subscriber.event_types))
+            )
+            if cursor is not None:
+                query = query.where(DomainEventOutboxRow.id > cursor.last_processed_outbox_id)
+            rows = await session.scalars(
+                query.order_by(DomainEventOutboxRow.id).limit(self._batch_size)
+            )
+            events = [OutboxEvent.from_row(row) for row in rows]
+        if not events:
+            return 0
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                self._handle_partition(subscriber, partition)
+                for partition in self._partition(subscriber, events)
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        async with session_scope(self._session_factory) as session:
+            await _save_cursor(session, subscriber.name, events[-1].id)
+
+        counters = self._counters[subscriber.name]
+        counters.last_processed_id = events[-1].id
+        counters.events += len(events)
+        counters.batches += 1
+        counters.last_batch_size = len(events)
+        counters.last_batch_seconds = time.perf_counter() - started
+        counters.lag_seconds = max(
+            0.0, (timeutils.datetime_now() - events[-1].created_at).total_seconds()
+        )
+        return len(events)
+
+    def _partition(
+        self, subscriber: OutboxSubscriber, events: list[OutboxEvent]
+    ) -> list[list[OutboxEvent]]:
+        partitions: list[list[OutboxEvent]] = [[] for _ in range(self._partitions)]
+        for event in events:
+            key = subscriber.partition_key(event).encode()
+            partitions[zlib.crc32(key) % self._partitions].append(event)
+        return [partition for partition in partitions if partition]
+
+    async def _handle_partition(
+        self, subscriber: OutboxSubscriber, events: list[OutboxEvent]
+    ) -> None:
+        async with session_scope(self._session_factory) as session:
+            await subscriber.handle_batch(session, events)
+
+    async def _ensure_listener(self) -> None:
+        if self._engine is None:
+            return
+        if self._listen_driver is not None and not self._listen_driver.is_closed():
+            return
+        await self._close_listener()
+        conn: AsyncConnection | None = None
+        try:
+            conn = await self._engine.connect()
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            await driver.add_listener(self._channel, self._on_notify)
+        except Exception as ex:
+            logger.warning(
+                "Outbox LISTEN %s unavailable, polling every %ss: %s",
+                self._channel,
+                self._fallback_poll_seconds,
+                ex,
+            )
+            if conn is not None:
+                await conn.close()
+            return
+        self._listen_conn = conn
+        self._listen_driver = driver
+
+    def _on_notify(self, *_: Any) -> None:
+        self._wake.set()
+
+    async def _close_listener(self) -> None:
+        conn, driver = self._listen_conn, self._listen_driver
+        self._listen_conn = self._listen_driver = None
+        if conn is None:
+            return
+        try:
+            if driver is not None and not driver.is_closed():
+                await driver.remove_listener(self._channel, self._on_notify)
+        except Exception as ex:
+            logger.debug("Outbox UNLISTEN failed: %s", ex)
+        try:
+            await conn.close()
+        except Exception as ex:
+            logger.debug("Outbox listener connection close failed: %s", ex)
+
+
+async def _save_cursor(session: AsyncSession, name: str, outbox_id: str) -> None:
+    row = await session.get(DomainEventOutboxCursorRow, name)
+    now = timeutils.datetime_now()
+    if row is None:
+        session.add(
+            DomainEventOutboxCursorRow(
+                name=name,
+                last_processed_outbox_id=outbox_id,
+                updated_at=now,
+            )
+        )
+        return
+    row.last_processed_outbox_id = outbox_id
+    row.updated_at = now
@@ -20,6 +20,22 @@ from luxtj.shared_kernel.infrastructure.http.audit_repository import (
     RequestResponseAuditRepository,
     SqlAlchemyRequestResponseAuditRepository,
 )
+from luxtj.shared_kernel.infrastructure.http.audit_sink import (
+    AuditOverflowPolicy,
+    AuditRecord,
+    AuditSinkSettings,
+    AuditSinkStats,
+    BatchedAuditSink,
+    get_audit_sink,
+    set_audit_sink,
+)
+from luxtj.shared_kernel.infrastructure.http.client_pool import (
+    HttpClientPool,
+    HttpPoolSettings,
+    HttpPoolStats,
+    get_http_client_pool,
+    set_http_client_pool,
+)
 from luxtj.shared_kernel.infrastructure.http.multi_http import (
     HandleDescriptor,
     InMemoryResponseCache,
@@ -33,22 +49,36 @@ from luxtj.shared_kernel.infrastructure.http.multi_http import (
     parse_response_body,
     serialize_request_body,
 )
+from luxtj.shared_kernel.infrastructure.http.response_body import SupplierResponse
 
 __all__ = [
+    "AuditOverflowPolicy",
+    "AuditRecord",
+    "AuditSinkSettings",
+    "AuditSinkStats",
+    "BatchedAuditSink",
     "BookingApiRequestResponseRow",
     "HandleDescriptor",
+    "HttpClientPool",
+    "HttpPoolSettings",
+    "HttpPoolStats",
     "InMemoryResponseCache",
     "MultiHttpClient",
     "RequestResponseAuditRepository",
     "SqlAlchemyRequestResponseAuditRepository",
+    "SupplierResponse",
     "compress_audit_body",
     "decode_basic_auth_header",
     "detect_response_format",
     "dict_handle_to_descriptor",
     "ensure_format_headers",
+    "get_audit_sink",
+    "get_http_client_pool",
     "normalize_request_format",
     "normalize_response_text",
     "parse_response_body",
     "prettify_audit_body",
     "serialize_request_body",
+    "set_audit_sink",
+    "set_http_client_pool",
 ]
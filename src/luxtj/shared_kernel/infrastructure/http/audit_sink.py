@@ -0,0 +1,288 @@
+"""Batched, off-request-path writer for ``booking_api_request_responses``.
+
+:class:`~luxtj.shared_kernel.infrastructure.http.multi_http_client.MultiHttpTransport`
+hands each completed supplier request/response pair to the installed sink instead of
+inserting a pending row and committing before and after every call. A background
+task drains the bounded queue, compresses bodies in a worker thread and bulk-inserts
+one batch per transaction.
+
+Created in the FastAPI lifespan and installed with :func:`set_audit_sink`. Processes
+without the lifespan (mapping workers, scripts) keep the synchronous repository path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+from time import perf_counter
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import insert
+
+from luxtj.shared_kernel.infrastructure.http.audit_body import compress_audit_body
+from luxtj.shared_kernel.infrastructure.http.audit_models import BookingApiRequestResponseRow
+from luxtj.shared_kernel.infrastructure.http.response_body import decode_response_bytes
+from luxtj.shared_kernel.infrastructure.persistence.sqlalchemy import (
+    AsyncSessionFactory,
+    session_scope,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AuditOverflowPolicy(StrEnum):
+    # Reject the incoming record; supplier calls never wait on the audit DB.
+    DROP_NEWEST = "drop_newest"
+    # Evict the oldest queued record to make room for the incoming one.
+    DROP_OLDEST = "drop_oldest"
+    # Wait up to ``block_timeout`` for space, then drop the incoming record.
+    BLOCK = "block"
+
+
+@dataclass(frozen=True, slots=True)
+class AuditSinkSettings:
+    max_queue_size: int = 10_000
+    batch_size: int = 200
+    flush_interval: float = 1.0
+    overflow_policy: AuditOverflowPolicy = AuditOverflowPolicy.DROP_NEWEST
+    block_timeout: float = 0.5
+
+
+@dataclass(slots=True)
+class AuditRecord:
+    """One completed supplier call, bodies still uncompressed (response as raw bytes)."""
+
+    booking_api_id: str
+    request_type: str
+    request_format: str
+    request_url: str
+    request_headers: str | None
+    request_body: str | None
+    response: str | bytes
+    response_status_code: int
+    created_at: datetime
+    updated_at: datetime
+    response_encoding: str | None = None
+
+
+@dataclass(slots=True)
+class AuditSinkStats:
+    queue_depth: int
+    queue_capacity: int
+    overflow_policy: str
+    enqueued: int
+    dropped: int
+    written: int
+    failed: int
+    batches: int
+    last_batch_size: int
+    last_flush_seconds: float
+    max_flush_seconds: float
+    flush_seconds_total: float
+
+
+@dataclass(slots=True)
+class _Counters:
+    enqueued: int = 0
+    dropped: int = 0
+    written: int = 0
+    failed: int = 0
+    batches: int = 0
+    last_batch_size: int = 0
+    last_flush_seconds: float = 0.0
+    max_flush_seconds: float = 0.0
+    flush_seconds_total: float = 0.0
+
+
+@dataclass
+class BatchedAuditSink:
+    """Bounded queue + background bulk inserter for supplier audit rows."""
+
+    session_factory: AsyncSessionFactory
+    settings: AuditSinkSettings = field(default_factory=AuditSinkSettings)
+    _queue: asyncio.Queue[AuditRecord] = field(init=False)
+    _counters: _Counters = field(default_factory=_Counters, init=False)
+    _stop_event: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+    _task: asyncio.Task[None] | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self._queue = asyncio.Queue(maxsize=max(1, self.settings.max_queue_size))
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush everything still queued, then stop the background task."""
+        if self._task is None:
+            return
+        self._stop_event.set()
+        await self._task
+        self._task = None
+
+    async def submit(self, record: AuditRecord) -> bool:
+        """Queue ``record`` for the next batch. Returns False when it was dropped."""
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            if not await self._handle_overflow(record):
+                self._record_drop()
+                return False
+        self._counters.enqueued += 1
+        return True
+
+    async def _handle_overflow(self, record: AuditRecord) -> bool:
+        policy = self.settings.overflow_policy
+        if policy is AuditOverflowPolicy.DROP_OLDEST:
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+            except asyncio.QueueEmpty:
+                pass
+            else:
+                self._record_drop()
+            try:
+                self._queue.put_nowait(record)
+                return True
+            except asyncio.QueueFull:
+                return False
+        if policy is AuditOverflowPolicy.BLOCK:
+            try:
+                await asyncio.wait_for(self._queue.put(record), timeout=self.settings.block_timeout)
+                return True
+            except TimeoutError:
+                return False
+        return False
+
+    def _record_drop(self) -> None:
+        counters = self._counters
+        counters.dropped += 1
+        # First drop and then every 1000th, so a DB outage cannot flood the logs.
+        if counters.dropped % 1000 == 1:
+            logger.warning(
+                "Supplier audit queue full (%d) — dropped %d record(s) so far (policy=%s)",
+                self._queue.maxsize,
+                counters.dropped,
+                self.settings.overflow_policy,
+            )
+
+    def stats(self) -> AuditSinkStats:
+        counters = self._counters
+        return AuditSinkStats(
+            queue_depth=self._queue.qsize(),
+            queue_capacity=self._queue.maxsize,
+            overflow_policy=str(self.settings.overflow_policy),
+            enqueued=counters.enqueued,
+            dropped=counters.dropped,
+            written=counters.written,
+            failed=counters.failed,
+            batches=counters.batches,
+            last_batch_size=counters.last_batch_size,
+            last_flush_seconds=round(counters.last_flush_seconds, 6),
+            max_flush_seconds=round(counters.max_flush_seconds, 6),
+            flush_seconds_total=round(counters.flush_seconds_total, 6),
+        )
+
+    async def _run(self) -> None:
+        while not (self._stop_event.is_set() and self._queue.empty()):
+            batch = await self._next_batch()
+            if not batch:
+                continue
+            try:
+                await self._flush(batch)
+            except Exception as ex:
+                self._counters.failed += len(batch)
+                logger.exception("Supplier audit flush failed (%d rows): %s", len(batch), ex)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _next_batch(self) -> list[AuditRecord]:
+        if self._queue.empty():
+            if self._stop_event.is_set():
+                return []
+            try:
+                first = await asyncio.wait_for(
+                    self._queue.get(),
+                    timeout=self.settings.flush_interval,
+                )
+            except TimeoutError:
+                return []
+        else:
+            first = self._queue.get_nowait()
+        batch = [first]
+        limit = max(1, self.settings.batch_size)
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _flush(self, batch: list[AuditRecord]) -> None:
+        started = perf_counter()
+        rows = await asyncio.to_thread(_build_rows, batch)
+        async with session_scope(self.session_factory) as session:
+            await session.execute(insert(BookingApiRequestResponseRow), rows)
+        elapsed = perf_counter() - started
+
+        counters = self._counters
+        counters.written += len(rows)
+        counters.batches += 1
+        counters.last_batch_size = len(rows)
+        counters.last_flush_seconds = elapsed
+        counters.max_flush_seconds = max(counters.max_flush_seconds, elapsed)
+        counters.flush_seconds_total += elapsed
+        logger.debug(
+            "Supplier audit batch written rows=%d seconds=%.4f queue_depth=%d",
+            len(rows),
+            elapsed,
+            self._queue.qsize(),
+        )
+
+
+def _build_rows(batch: list[AuditRecord]) -> list[dict[str, Any]]:
+    """Decode + compress bodies (lxml / json re-serialization) — runs in a worker thread."""
+    rows: list[dict[str, Any]] = []
+    for record in batch:
+        response = (
+            decode_response_bytes(record.response, record.response_encoding)
+            if isinstance(record.response, bytes)
+            else record.response
+        )
+        rows.append(
+            {
+                "id": str(uuid4()),
+                "booking_api_id": record.booking_api_id,
+                "request_type": record.request_type,
+                "request_format": record.request_format,
+                "request_url": record.request_url,
+                "request_headers": record.request_headers,
+                "request_body": compress_audit_body(
+                    record.request_body, request_format=record.request_format
+                ),
+                "response": compress_audit_body(response, request_format=record.request_format),
+                "response_status_code": record.response_status_code,
+                "created_at": record.created_at,
+                "updated_at": record.updated_at,
+            }
+        )
+    return rows
+
+
+_SINK: BatchedAuditSink | None = None
+
+
+def get_audit_sink() -> BatchedAuditSink | None:
+    return _SINK
+
+
+def set_audit_sink(sink: BatchedAuditSink | None) -> None:
+    global _SINK
+    _SINK = sink
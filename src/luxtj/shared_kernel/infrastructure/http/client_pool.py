@@ -0,0 +1,195 @@
+"""App-lifetime, per-supplier-host ``httpx.AsyncClient`` pools for the multi-HTTP transport.
+
+Created in the FastAPI lifespan and installed with :func:`set_http_client_pool`;
+:class:`~luxtj.shared_kernel.infrastructure.http.multi_http_client.MultiHttpTransport`
+then reuses one keep-alive client per supplier host (RateHawk, City Travel, …)
+instead of opening a fresh TCP+TLS connection on every ``execute``.
+
+Processes without the lifespan (mapping workers, scripts) never install a pool and
+keep the per-call client behaviour.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class HttpPoolSettings:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    # Max concurrent in-flight requests per host; 0 disables the cap.
+    per_host_concurrency: int = 0
+    default_timeout: float = 60.0
+
+
+@dataclass(slots=True)
+class _HostPool:
+    client: httpx.AsyncClient
+    semaphore: asyncio.Semaphore | None
+    in_flight: int = 0
+    waiting: int = 0
+    total_requests: int = 0
+    total_waits: int = 0
+    wait_seconds_total: float = 0.0
+
+
+@dataclass(slots=True)
+class HttpPoolStats:
+    host: str
+    connections_in_use: int
+    connections_idle: int
+    in_flight: int
+    waiting: int
+    total_requests: int
+    total_waits: int
+    wait_seconds_total: float
+    max_connections: int
+    concurrency_limit: int | None = None
+    http2: bool = False
+
+
+@dataclass
+class HttpClientPool:
+    """Registry of long-lived clients keyed by supplier host."""
+
+    settings: HttpPoolSettings = field(default_factory=HttpPoolSettings)
+    _pools: dict[str, _HostPool] = field(default_factory=dict)
+    _http2_available: bool | None = None
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        parsed = httpx.URL(url)
+        return f"{parsed.scheme}://{parsed.host}:{parsed.port or ''}".rstrip(":")
+
+    def _use_http2(self) -> bool:
+        if not self.settings.http2:
+            return False
+        if self._http2_available is None:
+            try:
+                import h2  # noqa: F401
+
+                self._http2_available = True
+            except ImportError:
+                logger.warning("HTTP/2 requested but the 'h2' package is missing — using HTTP/1.1")
+                self._http2_available = False
+        return self._http2_available
+
+    def _pool_for(self, url: str) -> _HostPool:
+        key = self.host_key(url)
+        pool = self._pools.get(key)
+        if pool is None:
+            settings = self.settings
+            client = httpx.AsyncClient(
+                timeout=settings.default_timeout,
+                http2=self._use_http2(),
+                limits=httpx.Limits(
+                    max_connections=settings.max_connections,
+                    max_keepalive_connections=settings.max_keepalive_connections,
+                    keepalive_expiry=settings.keepalive_expiry,
+                ),
+            )
+            semaphore = (
+                asyncio.Semaphore(settings.per_host_concurrency)
+                if settings.per_host_concurrency > 0
+                else None
+            )
+            pool = _HostPool(client=client, semaphore=semaphore)
+            self._pools[key] = pool
+        return pool
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        return self._pool_for(url).client
+
+    @asynccontextmanager
+    async def request_slot(self, url: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the host client while holding a per-host concurrency slot."""
+        pool = self._pool_for(url)
+        pool.total_requests += 1
+        if pool.semaphore is not None:
+            if pool.semaphore.locked():
+                pool.total_waits += 1
+                pool.waiting += 1
+                started = perf_counter()
+                try:
+                    await pool.semaphore.acquire()
+                finally:
+                    pool.waiting -= 1
+                    pool.wait_seconds_total += perf_counter() - started
+            else:
+                await pool.semaphore.acquire()
+        pool.in_flight += 1
+        try:
+            yield pool.client
+        finally:
+            pool.in_flight -= 1
+            if pool.semaphore is not None:
+                pool.semaphore.release()
+
+    def stats(self) -> list[HttpPoolStats]:
+        out: list[HttpPoolStats] = []
+        for host, pool in sorted(self._pools.items()):
+            in_use, idle = _connection_counts(pool.client)
+            out.append(
+                HttpPoolStats(
+                    host=host,
+                    connections_in_use=in_use,
+                    connections_idle=idle,
+                    in_flight=pool.in_flight,
+                    waiting=pool.waiting,
+                    total_requests=pool.total_requests,
+                    total_waits=pool.total_waits,
+                    wait_seconds_total=round(pool.wait_seconds_total, 6),
+                    max_connections=self.settings.max_connections,
+                    concurrency_limit=self.settings.per_host_concurrency or None,
+                    http2=bool(self._http2_available and self.settings.http2),
+                )
+            )
+        return out
+
+    async def aclose(self) -> None:
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            try:
+                await pool.client.aclose()
+            except Exception:
+                logger.exception("Failed to close pooled HTTP client")
+
+
+def _connection_counts(client: httpx.AsyncClient) -> tuple[int, int]:
+    """(in-use, idle) connections from the underlying httpcore pool, best effort."""
+    transport: Any = getattr(client, "_transport", None)
+    core_pool: Any = getattr(transport, "_pool", None)
+    connections = getattr(core_pool, "connections", None) or []
+    idle = 0
+    for conn in connections:
+        try:
+            if conn.is_idle():
+                idle += 1
+        except Exception:
+            continue
+    return len(connections) - idle, idle
+
+
+_POOL: HttpClientPool | None = None
+
+
+def get_http_client_pool() -> HttpClientPool | None:
+    return _POOL
+
+
+def set_http_client_pool(pool: HttpClientPool | None) -> None:
+    global _POOL
+    _POOL = pool
@@ -36,6 +36,7 @@ from luxtj.shared_kernel.infrastructure.http.multi_http_client import (
     InMemoryResponseCache,
     MultiHttpTransport,
 )
+from luxtj.shared_kernel.infrastructure.http.response_body import SupplierResponse
 
 _SHARED_CACHE = InMemoryResponseCache()
 
@@ -354,14 +355,19 @@ class MultiHttpClient:
     async def stream_execute(
         self,
         named_handles: dict[str, Any],
-        on_complete: Callable[[str, str], Awaitable[None] | None],
+        on_complete: Callable[[SupplierResponse], Awaitable[None] | None],
     ) -> None:
+        """Run handles in parallel; ``on_complete`` gets each response as it lands.
+
+        Bodies stay bytes end to end: JSON / XML responses arrive already parsed in
+        :attr:`SupplierResponse.parsed` (see :meth:`SupplierResponse.payload`).
+        """
         converted: dict[str, list[HandleDescriptor]] = {}
         for provider, handles in named_handles.items():
             converted[provider] = _normalize_provider_handles(handles)
 
-        async def _on_response(provider: str, body: str) -> None:
-            await _maybe_await(on_complete(provider, normalize_response_text(body)))
+        async def _on_response(response: SupplierResponse) -> None:
+            await _maybe_await(on_complete(response))
 
         await self._core.stream_execute(converted, _on_response)
 
@@ -7,8 +7,10 @@ Public API (TeenvaCurlMultiHandler equivalent)::
     from luxtj.shared_kernel.infrastructure.http import MultiHttpClient, HandleDescriptor
 
 This module owns low-level I/O, optional response cache, and
-``booking_api_request_responses`` audit writes. The facade in ``multi_http``
-adds dict-handle conversion and JSON/XML format handling for all sub-modules.
+``booking_api_request_responses`` audit writes (queued to the batched
+:mod:`audit_sink` when one is installed, else written through the repository).
+The facade in ``multi_http`` adds dict-handle conversion and JSON/XML format
+handling for all sub-modules.
 """
 
 from __future__ import annotations
@@ -16,9 +18,12 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
-from collections.abc import Awaitable, Callable, Mapping, Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
+from datetime import datetime
 from inspect import isawaitable
+from time import perf_counter
 from typing import Any
 
 import httpx
@@ -26,6 +31,22 @@ import httpx
 from luxtj.shared_kernel.infrastructure.http.audit_repository import (
     RequestResponseAuditRepository,
 )
+from luxtj.shared_kernel.infrastructure.http.audit_sink import (
+    AuditRecord,
+    BatchedAuditSink,
+    get_audit_sink,
+)
+from luxtj.shared_kernel.infrastructure.http.client_pool import (
+    HttpClientPool,
+    get_http_client_pool,
+)
+from luxtj.shared_kernel.infrastructure.http.response_body import (
+    BodyParser,
+    SupplierResponse,
+    body_parser_for,
+    decode_response_bytes,
+)
+from luxtj.utils import timeutils
 
 _SENSITIVE_HEADER_NAMES = frozenset(
     {
@@ -64,7 +85,7 @@ class HandleDescriptor:
         return self.remarks
 
 
-type OnResponse = Callable[[str, str], Awaitable[None] | None]
+type OnResponse = Callable[[SupplierResponse], Awaitable[None] | None]
 type ProviderHandles = HandleDescriptor | Sequence[HandleDescriptor]
 type HandlesInput = Mapping[str, ProviderHandles]
 type ResponseMap = dict[str, str | list[str]]
@@ -94,36 +115,40 @@ def default_cache_key(url: str, body: str = "") -> str:
 
 
 class RedisResponseCache:
-    """Redis TTL cache for outbound HTTP bodies (search SOAP etc.)."""
+    """Redis TTL cache for outbound HTTP bodies (search SOAP etc.), stored as raw bytes."""
 
     _NAMESPACE = "http_response"
 
-    def get(self, key: str) -> str | None:
+    async def get(self, key: str) -> bytes | None:
         from luxtj.shared_kernel.infrastructure.redis_cache import redis_cache_get
 
-        value = redis_cache_get(self._NAMESPACE, key)
-        if value is None or value == "":
+        value = await redis_cache_get(self._NAMESPACE, key)
+        if not value:
             return None
         if isinstance(value, bytes):
-            try:
-                return value.decode("utf-8")
-            except Exception:
-                return None
-        return str(value)
+            return value
+        # Entries written before bytes-first caching hold decoded text.
+        return str(value).encode("utf-8")
 
-    def set(self, key: str, value: str, ttl: int) -> None:
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
         from luxtj.shared_kernel.infrastructure.redis_cache import redis_cache_put
 
-        if value is None or value == "":
+        if not value:
             return
         if ttl <= 0:
             return
-        redis_cache_put(self._NAMESPACE, key, value, ttl)
+        await redis_cache_put(self._NAMESPACE, key, value, ttl)
+
+    async def existing(self, keys: list[str]) -> set[str]:
+        """Subset of ``keys`` that currently hold a cached body."""
+        from luxtj.shared_kernel.infrastructure.redis_cache import redis_cache_existing
+
+        return await redis_cache_existing(self._NAMESPACE, keys)
 
-    def clear(self) -> None:
+    async def clear(self) -> None:
         from luxtj.shared_kernel.infrastructure.redis_cache import redis_cache_clear_namespace
 
-        redis_cache_clear_namespace(self._NAMESPACE)
+        await redis_cache_clear_namespace(self._NAMESPACE)
 
 
 # Back-compat alias used by MultiHttpTransport constructor defaults.
@@ -136,7 +161,11 @@ class _PreparedCall:
     index: int | None
     descriptor: HandleDescriptor
     insert_id: str | None
-    cached_body: str | None = None
+    # Raw body once known (cache hit or completed send).
+    cached_body: bytes | None = None
+    encoding: str | None = None
+    # Set when the call is audited through the batched sink (send start time).
+    audit_started_at: datetime | None = None
 
 
 class MultiHttpTransport:
@@ -150,6 +179,7 @@ class MultiHttpTransport:
         *,
         client: httpx.AsyncClient | None = None,
         audit: RequestResponseAuditRepository | None = None,
+        audit_sink: BatchedAuditSink | None = None,
         cache: RedisResponseCache | None = None,
         default_timeout: float = 60.0,
         max_retries: int = 2,
@@ -157,6 +187,7 @@ class MultiHttpTransport:
     ) -> None:
         self._client = client
         self._audit = audit
+        self._audit_sink = audit_sink
         self._cache = cache if cache is not None else RedisResponseCache()
         self._default_timeout = default_timeout
         self._max_retries = max(0, max_retries)
@@ -164,28 +195,28 @@ class MultiHttpTransport:
         self._audit_lock = asyncio.Lock()
 
     async def execute(self, handles: HandlesInput) -> ResponseMap:
-        async with self._client_scope() as client:
+        async with self._client_scope() as scope:
             prepared = await self._prepare(handles)
             live = [item for item in prepared if item.cached_body is None]
             if live:
-                await asyncio.gather(*(self._send_and_finalize(client, item) for item in live))
+                await asyncio.gather(*(self._send_and_finalize(scope, item) for item in live))
             return self._collect_responses(prepared)
 
     async def stream_execute(self, handles: HandlesInput, on_response: OnResponse) -> None:
-        async with self._client_scope() as client:
+        async with self._client_scope() as scope:
             prepared = await self._prepare(handles)
 
             for item in prepared:
                 if item.cached_body is not None:
-                    await _invoke_on_response(on_response, item.provider, item.cached_body)
+                    await _invoke_on_response(on_response, _cached_response(item))
 
             live = [item for item in prepared if item.cached_body is None]
             if not live:
                 return
 
             async def _run(item: _PreparedCall) -> None:
-                body = await self._send_and_finalize(client, item)
-                await _invoke_on_response(on_response, item.provider, body)
+                response = await self._send_and_finalize(scope, item, parse=True)
+                await _invoke_on_response(on_response, response)
 
             await asyncio.gather(*(_run(item) for item in live))
 
@@ -199,7 +230,7 @@ class MultiHttpTransport:
             multi = _is_list_handles(value)
             for index, descriptor in enumerate(descriptors):
                 item_index = index if multi else None
-                cached = self._lookup_cache(descriptor)
+                cached = await self._lookup_cache(descriptor)
                 if cached is not None:
                     prepared.append(
                         _PreparedCall(
@@ -212,6 +243,18 @@ class MultiHttpTransport:
                     )
                     continue
 
+                if self._queues_audit(descriptor):
+                    prepared.append(
+                        _PreparedCall(
+                            provider=provider,
+                            index=item_index,
+                            descriptor=descriptor,
+                            insert_id=None,
+                            audit_started_at=timeutils.datetime_now(),
+                        )
+                    )
+                    continue
+
                 insert_id = await self._insert_pending(descriptor)
                 prepared.append(
                     _PreparedCall(
@@ -224,11 +267,22 @@ class MultiHttpTransport:
                 )
         return prepared
 
-    def _lookup_cache(self, descriptor: HandleDescriptor) -> str | None:
+    async def _lookup_cache(self, descriptor: HandleDescriptor) -> bytes | None:
         if not descriptor.set_cache or not descriptor.cache_ttl:
             return None
         key = descriptor.cache_key or default_cache_key(descriptor.url, descriptor.body or "")
-        return self._cache.get(key)
+        return await self._cache.get(key)
+
+    def _sink(self) -> BatchedAuditSink | None:
+        return self._audit_sink if self._audit_sink is not None else get_audit_sink()
+
+    def _queues_audit(self, descriptor: HandleDescriptor) -> bool:
+        """Audited calls go to the batched sink (no per-call commits) when one is installed."""
+        return (
+            bool(descriptor.booking_api_id)
+            and (self._audit is not None or self._audit_sink is not None)
+            and self._sink() is not None
+        )
 
     async def _insert_pending(self, descriptor: HandleDescriptor) -> str | None:
         if self._audit is None or not descriptor.booking_api_id:
@@ -247,31 +301,68 @@ class MultiHttpTransport:
                 await commit()
             return insert_id
 
-    async def _send_and_finalize(self, client: httpx.AsyncClient, item: _PreparedCall) -> str:
-        body, status_code = await self._send(client, item.descriptor)
+    async def _send_and_finalize(
+        self,
+        scope: _ClientScope,
+        item: _PreparedCall,
+        *,
+        parse: bool = False,
+    ) -> SupplierResponse:
+        descriptor = item.descriptor
+        response = await self._send(scope, item.provider, descriptor, parse=parse)
+        body = response.raw
 
-        if item.insert_id is not None and self._audit is not None:
+        if item.audit_started_at is not None:
+            await self._submit_audit(item, response)
+        elif item.insert_id is not None and self._audit is not None:
             async with self._audit_lock:
                 await self._audit.update_response(
                     item.insert_id,
-                    response=body,
-                    response_status_code=status_code,
+                    response=response.text,
+                    response_status_code=response.status_code,
                 )
                 commit = getattr(self._audit, "commit", None)
                 if callable(commit):
                     await commit()
 
-        descriptor = item.descriptor
         if descriptor.set_cache and descriptor.cache_ttl:
             key = descriptor.cache_key or default_cache_key(descriptor.url, descriptor.body or "")
-            self._cache.set(key, body, descriptor.cache_ttl)
+            await self._cache.set(key, body, descriptor.cache_ttl)
 
         item.cached_body = body
-        return body
+        item.encoding = response.encoding
+        return response
+
+    async def _submit_audit(self, item: _PreparedCall, response: SupplierResponse) -> None:
+        sink = self._sink()
+        if sink is None or item.audit_started_at is None:
+            return
+        descriptor = item.descriptor
+        await sink.submit(
+            AuditRecord(
+                booking_api_id=str(descriptor.booking_api_id),
+                request_type=descriptor.request_type,
+                request_format=descriptor.request_format or "",
+                request_url=descriptor.url,
+                request_headers=serialize_headers_for_audit(descriptor.headers),
+                request_body=descriptor.body or "",
+                response=response.raw,
+                response_status_code=response.status_code,
+                created_at=item.audit_started_at,
+                updated_at=timeutils.datetime_now(),
+                response_encoding=response.encoding,
+            )
+        )
 
     async def _send(
-        self, client: httpx.AsyncClient, descriptor: HandleDescriptor
-    ) -> tuple[str, int]:
+        self,
+        scope: _ClientScope,
+        provider: str,
+        descriptor: HandleDescriptor,
+        *,
+        parse: bool = False,
+    ) -> SupplierResponse:
+        """Stream the body as bytes; with ``parse`` the body parser is fed chunk by chunk."""
         timeout = descriptor.timeout if descriptor.timeout is not None else self._default_timeout
         headers = _ensure_request_format_headers(
             dict(descriptor.headers or {}),
@@ -282,35 +373,39 @@ class MultiHttpTransport:
         if descriptor.body:
             content = descriptor.body.encode("utf-8")
         attempts = self._max_retries + 1
-        last_status = 0
         for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            # Each attempt parses from scratch; a failed attempt's parser is discarded.
+            parser = _parser_for(descriptor) if parse else None
             try:
-                response = await client.request(
-                    method=descriptor.method.upper(),
-                    url=descriptor.url,
-                    headers=headers,
-                    content=content,
-                    timeout=timeout,
-                )
-                status = int(response.status_code)
-                if status >= 500 and attempt < attempts - 1:
-                    await asyncio.sleep(self._retry_backoff_seconds * (attempt + 1))
-                    last_status = status
-                    continue
-                return _decode_response_text(response), status
+                async with (
+                    scope.slot(descriptor.url) as client,
+                    client.stream(
+                        method=descriptor.method.upper(),
+                        url=descriptor.url,
+                        headers=headers,
+                        content=content,
+                        timeout=timeout,
+                    ) as response,
+                ):
+                    status = int(response.status_code)
+                    if status < 500 or last_attempt:
+                        return await _read_response(provider, response, parser)
             except httpx.HTTPError:
-                last_status = 0
-                if attempt < attempts - 1:
-                    await asyncio.sleep(self._retry_backoff_seconds * (attempt + 1))
-                    continue
-                return "", last_status
-        return "", last_status
+                if last_attempt:
+                    return _complete_response(provider, b"", 0, parser)
+            await asyncio.sleep(self._retry_backoff_seconds * (attempt + 1))
+        return _complete_response(provider, b"", 0, None)
 
     @staticmethod
     def _collect_responses(prepared: list[_PreparedCall]) -> ResponseMap:
         responses: ResponseMap = {}
         for item in prepared:
-            body = item.cached_body if item.cached_body is not None else ""
+            body = (
+                decode_response_bytes(item.cached_body, item.encoding)
+                if item.cached_body is not None
+                else ""
+            )
             if item.index is None:
                 responses[item.provider] = body
             else:
@@ -325,16 +420,30 @@ class MultiHttpTransport:
 
 
 class _ClientScope:
+    """Per-call client resolution: injected client > app-lifetime pool > owned client."""
+
     def __init__(self, client: httpx.AsyncClient | None, default_timeout: float) -> None:
         self._external = client
         self._default_timeout = default_timeout
+        self._pool: HttpClientPool | None = None
         self._owned: httpx.AsyncClient | None = None
 
-    async def __aenter__(self) -> httpx.AsyncClient:
+    async def __aenter__(self) -> _ClientScope:
+        if self._external is None:
+            self._pool = get_http_client_pool()
+        return self
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[httpx.AsyncClient]:
         if self._external is not None:
-            return self._external
-        self._owned = httpx.AsyncClient(timeout=self._default_timeout)
-        return self._owned
+            yield self._external
+        elif self._pool is not None:
+            async with self._pool.request_slot(url) as client:
+                yield client
+        else:
+            if self._owned is None:
+                self._owned = httpx.AsyncClient(timeout=self._default_timeout)
+            yield self._owned
 
     async def __aexit__(self, *args: object) -> None:
         if self._owned is not None:
@@ -388,18 +497,85 @@ def _ensure_request_format_headers(
     return headers
 
 
-def _decode_response_text(response: httpx.Response) -> str:
-    """Decode JSON or XML response bodies as text (charset-aware, BOM-safe)."""
-    try:
-        text = response.text
-    except Exception:
-        text = response.content.decode("utf-8", errors="replace")
-    if text.startswith("\ufeff"):
-        text = text.lstrip("\ufeff")
-    return text
-
-
-async def _invoke_on_response(on_response: OnResponse, provider: str, body: str) -> None:
-    result = on_response(provider, body)
+def _parser_for(descriptor: HandleDescriptor) -> BodyParser | None:
+    response_format = str(descriptor.meta.get("response_format") or "") or descriptor.request_format
+    return body_parser_for(response_format)
+
+
+async def _read_response(
+    provider: str,
+    response: httpx.Response,
+    parser: BodyParser | None,
+) -> SupplierResponse:
+    chunks: list[bytes] = []
+    decode_seconds = 0.0
+    async for chunk in response.aiter_bytes():
+        chunks.append(chunk)
+        if parser is not None:
+            started = perf_counter()
+            parser.feed(chunk)
+            decode_seconds += perf_counter() - started
+    raw = b"".join(chunks)
+    del chunks
+    return _complete_response(
+        provider,
+        raw,
+        int(response.status_code),
+        parser,
+        encoding=response.charset_encoding,
+        decode_seconds=decode_seconds,
+    )
+
+
+def _complete_response(
+    provider: str,
+    raw: bytes,
+    status_code: int,
+    parser: BodyParser | None,
+    *,
+    encoding: str | None = None,
+    from_cache: bool = False,
+    decode_seconds: float = 0.0,
+) -> SupplierResponse:
+    parsed = None
+    if parser is not None:
+        started = perf_counter()
+        try:
+            parsed = parser.finish(raw)
+        except Exception:
+            parsed = None
+        decode_seconds += perf_counter() - started
+    return SupplierResponse(
+        provider=provider,
+        raw=raw,
+        status_code=status_code,
+        parsed=parsed,
+        encoding=encoding,
+        from_cache=from_cache,
+        decode_seconds=decode_seconds,
+    )
+
+
+def _cached_response(item: _PreparedCall) -> SupplierResponse:
+    raw = item.cached_body or b""
+    parser = _parser_for(item.descriptor)
+    if parser is not None:
+        started = perf_counter()
+        parser.feed(raw)
+        fed_seconds = perf_counter() - started
+    else:
+        fed_seconds = 0.0
+    return _complete_response(
+        item.provider,
+        raw,
+        200,
+        parser,
+        from_cache=True,
+        decode_seconds=fed_seconds,
+    )
+
+
+async def _invoke_on_response(on_response: OnResponse, response: SupplierResponse) -> None:
+    result = on_response(response)
     if isawaitable(result):
         await result
@@ -0,0 +1,120 @@
+"""Bytes-first supplier response bodies for ``MultiHttpClient.stream_execute``.
+
+The transport streams each response as raw bytes: the same bytes go to the
+response cache and the audit sink, and are fed chunk-by-chunk to a body parser
+chosen from the handle's response/request format. Providers receive the parsed
+object (:meth:`SupplierResponse.payload`) instead of a decoded ``str`` copy of a
+multi-megabyte SERP / SOAP body.
+
+- XML / SOAP → ``lxml`` feed parser (incremental), then the same dict shape as
+  :meth:`XmlSoapClient.parse_soap_response`
+- JSON → ``json.loads`` on the joined bytes (stdlib has no incremental mode, but
+  this skips the intermediate ``str`` of the whole body)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+
+class BodyParser(Protocol):
+    def feed(self, chunk: bytes) -> None:
+        """Consume one network chunk."""
+        ...
+
+    def finish(self, raw: bytes) -> Any:
+        """Return the parsed body (``raw`` is the complete joined body), or None."""
+        ...
+
+
+class JsonBodyParser:
+    def feed(self, chunk: bytes) -> None:
+        return None
+
+    def finish(self, raw: bytes) -> Any:
+        if not raw.strip():
+            return {}
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+
+class XmlBodyParser:
+    """Incremental lxml parse; falls back to the prefix-stripping parser on errors."""
+
+    def __init__(self) -> None:
+        self._parser = etree.XMLParser(huge_tree=True, resolve_entities=False, no_network=True)
+        self._failed = False
+
+    def feed(self, chunk: bytes) -> None:
+        if self._failed:
+            return
+        try:
+            self._parser.feed(chunk)
+        except etree.XMLSyntaxError:
+            self._failed = True
+
+    def finish(self, raw: bytes) -> Any:
+        from luxtj.shared_kernel.infrastructure.xml.soap_client import XmlSoapClient
+
+        if not self._failed:
+            try:
+                return XmlSoapClient.parse_soap_element(self._parser.close())
+            except etree.XMLSyntaxError:
+                pass
+        return XmlSoapClient.parse_soap_response(raw)
+
+
+def body_parser_for(response_format: str | None) -> BodyParser | None:
+    fmt = (response_format or "").strip().lower()
+    if fmt == "json":
+        return JsonBodyParser()
+    if fmt in {"xml", "soap"}:
+        return XmlBodyParser()
+    return None
+
+
+def decode_response_bytes(raw: bytes, encoding: str | None = None) -> str:
+    """Decode a response body as text (charset-aware, BOM-safe)."""
+    if not raw:
+        return ""
+    try:
+        text = raw.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        text = raw.decode("utf-8", errors="replace")
+    if text.startswith("\ufeff"):
+        text = text.lstrip("\ufeff")
+    return text
+
+
+@dataclass(slots=True)
+class SupplierResponse:
+    """One completed supplier call as delivered to ``stream_execute`` callbacks."""
+
+    provider: str
+    raw: bytes
+    status_code: int
+    parsed: Any = None
+    encoding: str | None = None
+    from_cache: bool = False
+    decode_seconds: float = 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self.raw)
+
+    @property
+    def text(self) -> str:
+        return decode_response_bytes(self.raw, self.encoding)
+
+    def payload(self) -> Any:
+        """Parsed object when a body parser applied and succeeded, else decoded text."""
+        return self.parsed if self.parsed is not None else self.text
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, String
+from sqlalchemy import JSON, DateTime, Index, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from luxtj.shared_kernel.domain.events import BaseDomainEvent
@@ -14,6 +14,7 @@ class SharedKernelBase(DeclarativeBase):
 
 class DomainEventOutboxRow(SharedKernelBase):
     __tablename__ = "domain_event_outbox"
+    __table_args__ = (Index("ix_domain_event_outbox_type_id", "type", "id"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     source: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -36,3 +37,13 @@ class DomainEventOutboxRow(SharedKernelBase):
             created_at=timeutils.datetime_now(),
             published_at=None,
         )
+
+
+class DomainEventOutboxCursorRow(SharedKernelBase):
+    """Last outbox id handled by one named dispatcher subscriber."""
+
+    __tablename__ = "domain_event_outbox_cursors"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    last_processed_outbox_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -1,69 +1,145 @@
-"""Shared Redis-backed TTL cache for LuxTJ (flight tokens, hotel blocks, HTTP)."""
+"""Shared Redis-backed TTL cache for LuxTJ (flight tokens, hotel blocks, HTTP).
+
+Asyncio-native: every call goes through one pooled ``redis.asyncio`` client per
+event loop, so a slow round trip only suspends the awaiting coroutine instead of
+the whole worker. When Redis is unreachable the client is dropped and re-probed
+after ``LTJBE_REDIS_RETRY_SECONDS`` rather than staying disabled until restart.
+Values are serialized through the versioned codecs in :mod:`cache_codec`.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-import pickle
-import threading
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from time import monotonic
 from typing import Any
 
+from luxtj.shared_kernel.infrastructure.cache_codec import decode_cache_value, encode_cache_value
+
 logger = logging.getLogger(__name__)
 
-_client_lock = threading.Lock()
-_client: Any | None = None
-_client_failed = False
+
+@dataclass
+class _RedisState:
+    loop: asyncio.AbstractEventLoop | None = None
+    client: Any | None = None
+    connect_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    retry_at: float = 0.0
+
+
+_state = _RedisState()
 
 
 def redis_url() -> str:
     return (os.environ.get("LTJBE_REDIS_URL") or "redis://127.0.0.1:6379/0").strip()
 
 
-def get_redis_client() -> Any | None:
-    """Lazy Redis client. Returns None if Redis is unreachable (after first failure until reset)."""
-    global _client, _client_failed
-    if _client is not None:
-        return _client
-    if _client_failed:
+def redis_max_connections() -> int:
+    return max(1, int(os.environ.get("LTJBE_REDIS_MAX_CONNECTIONS") or 64))
+
+
+def redis_retry_seconds() -> float:
+    return max(0.0, float(os.environ.get("LTJBE_REDIS_RETRY_SECONDS") or 5))
+
+
+def _current_state() -> _RedisState:
+    """Connections are bound to the loop that opened them; start fresh on a new loop."""
+    global _state
+    loop = asyncio.get_running_loop()
+    if _state.loop is not loop:
+        _state = _RedisState(loop=loop)
+    return _state
+
+
+async def get_redis_client() -> Any | None:
+    """Pooled async Redis client. Returns None while Redis is marked unhealthy."""
+    state = _current_state()
+    if state.client is not None:
+        return state.client
+    if monotonic() < state.retry_at:
         return None
-    with _client_lock:
-        if _client is not None:
-            return _client
-        if _client_failed:
+    async with state.connect_lock:
+        if state.client is not None:
+            return state.client
+        if monotonic() < state.retry_at:
             return None
+        client = None
         try:
-            import redis
+            import redis.asyncio as aioredis
 
-            client = redis.Redis.from_url(
+            pool = aioredis.BlockingConnectionPool.from_url(
                 redis_url(),
                 decode_responses=False,
                 socket_connect_timeout=1.5,
                 socket_timeout=2.0,
+                max_connections=redis_max_connections(),
+                timeout=2.0,
+                health_check_interval=30,
             )
-            client.ping()
-            _client = client
-            logger.info("Redis cache connected (%s)", redis_url())
-            return _client
-        except Exception:
-            _client_failed = True
-            logger.exception(
-                "Redis unavailable at %s — TTL caches will miss until process restart",
+            client = aioredis.Redis(connection_pool=pool)
+            await client.ping()
+        except Exception as exc:
+            state.retry_at = monotonic() + redis_retry_seconds()
+            logger.warning(
+                "Redis unavailable at %s (%s) — TTL caches will miss, retrying in %.0fs",
                 redis_url(),
+                exc,
+                redis_retry_seconds(),
             )
+            if client is not None:
+                await _close_quietly(client)
             return None
+        state.client = client
+        state.retry_at = 0.0
+        logger.info("Redis cache connected (%s)", redis_url())
+        return client
+
+
+async def close_redis_client() -> None:
+    """Close the pooled client (app shutdown)."""
+    global _state
+    state = _state
+    _state = _RedisState()
+    if state.client is not None:
+        await _close_quietly(state.client)
 
 
 def reset_redis_client() -> None:
-    """Test helper: drop cached client / failure latch."""
-    global _client, _client_failed
-    with _client_lock:
-        if _client is not None:
-            try:
-                _client.close()
-            except Exception:
-                pass
-        _client = None
-        _client_failed = False
+    """Test helper: drop cached client / unhealthy backoff without closing sockets."""
+    global _state
+    _state = _RedisState()
+
+
+async def _close_quietly(client: Any) -> None:
+    try:
+        await client.aclose()
+    except Exception:
+        pass
+
+
+def _is_connection_error(exc: BaseException) -> bool:
+    try:
+        from redis.exceptions import ConnectionError as RedisConnectionError
+        from redis.exceptions import TimeoutError as RedisTimeoutError
+    except ImportError:
+        return isinstance(exc, OSError)
+    return isinstance(exc, (RedisConnectionError, RedisTimeoutError, OSError))
+
+
+async def _on_failure(client: Any, exc: BaseException) -> None:
+    """Mark Redis unhealthy on transport errors so callers stop waiting on timeouts."""
+    if not _is_connection_error(exc):
+        return
+    state = _state
+    if state.client is not client:
+        return
+    state.client = None
+    state.retry_at = monotonic() + redis_retry_seconds()
+    logger.warning("Redis connection lost (%s) — retrying in %.0fs", exc, redis_retry_seconds())
+    await _close_quietly(client)
 
 
 def namespaced_key(namespace: str, key: str) -> str:
@@ -71,68 +147,219 @@ def namespaced_key(namespace: str, key: str) -> str:
     return f"luxtj:{ns}:{key}"
 
 
-def redis_cache_put(namespace: str, key: str, value: Any, ttl_seconds: int) -> bool:
-    """Serialize ``value`` with pickle and SETEX. Returns True on success."""
-    client = get_redis_client()
+async def redis_cache_put(namespace: str, key: str, value: Any, ttl_seconds: int) -> bool:
+    """Serialize ``value`` with the namespace codec and SETEX. Returns True on success."""
+    client = await get_redis_client()
     if client is None:
         return False
     ttl = max(1, int(ttl_seconds))
     try:
-        client.setex(
-            namespaced_key(namespace, key),
-            ttl,
-            pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
-        )
+        payload = encode_cache_value(namespace, value)
+        await client.setex(namespaced_key(namespace, key), ttl, payload)
         return True
-    except Exception:
+    except Exception as exc:
         logger.exception("redis_cache_put failed ns=%s key=%s", namespace, key)
+        await _on_failure(client, exc)
         return False
 
 
-def redis_cache_get(namespace: str, key: str) -> Any | None:
-    client = get_redis_client()
+async def redis_cache_add(namespace: str, key: str, value: Any, ttl_seconds: int) -> bool:
+    """SET NX with TTL — True only when this call created the key (e.g. a short lease)."""
+    client = await get_redis_client()
+    if client is None:
+        return False
+    ttl = max(1, int(ttl_seconds))
+    try:
+        payload = encode_cache_value(namespace, value)
+        return bool(await client.set(namespaced_key(namespace, key), payload, ex=ttl, nx=True))
+    except Exception as exc:
+        logger.exception("redis_cache_add failed ns=%s key=%s", namespace, key)
+        await _on_failure(client, exc)
+        return False
+
+
+def redis_cache_put_sync(namespace: str, key: str, value: Any, ttl_seconds: int) -> bool:
+    """Blocking SETEX for sync worker processes (mapping jobs) that run no event loop.
+
+    Opens a short-lived connection per call — meant for rare writes such as version bumps.
+    """
+    try:
+        import redis
+
+        client = redis.Redis.from_url(
+            redis_url(),
+            socket_connect_timeout=1.5,
+            socket_timeout=2.0,
+        )
+        try:
+            payload = encode_cache_value(namespace, value)
+            client.setex(namespaced_key(namespace, key), max(1, int(ttl_seconds)), payload)
+        finally:
+            client.close()
+        return True
+    except Exception as exc:
+        logger.warning("redis_cache_put_sync failed ns=%s key=%s (%s)", namespace, key, exc)
+        return False
+
+
+async def redis_cache_put_many(
+    namespace: str,
+    items: Mapping[str, Any],
+    ttl_seconds: int,
+) -> int:
+    """SETEX every ``key → value`` in one non-transactional pipeline (single round trip).
+
+    ``MSET`` cannot carry a TTL, so the batch is pipelined ``SETEX`` instead.
+    Returns the number of serialized value bytes written (0 when nothing was written).
+    """
+    if not items:
+        return 0
+    client = await get_redis_client()
+    if client is None:
+        return 0
+    ttl = max(1, int(ttl_seconds))
+    written = 0
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                payload = encode_cache_value(namespace, value)
+                written += len(payload)
+                pipe.setex(namespaced_key(namespace, key), ttl, payload)
+            await pipe.execute()
+        return written
+    except Exception as exc:
+        logger.exception("redis_cache_put_many failed ns=%s keys=%d", namespace, len(items))
+        await _on_failure(client, exc)
+        return 0
+
+
+async def redis_cache_append(namespace: str, key: str, value: Any, ttl_seconds: int) -> bool:
+    """RPUSH ``value`` onto the list at ``key`` and (re)arm its TTL in one round trip."""
+    client = await get_redis_client()
+    if client is None:
+        return False
+    full_key = namespaced_key(namespace, key)
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.rpush(full_key, encode_cache_value(namespace, value))
+            pipe.expire(full_key, max(1, int(ttl_seconds)))
+            await pipe.execute()
+        return True
+    except Exception as exc:
+        logger.exception("redis_cache_append failed ns=%s key=%s", namespace, key)
+        await _on_failure(client, exc)
+        return False
+
+
+async def redis_cache_list(namespace: str, key: str, start: int = 0) -> list[Any] | None:
+    """Items ``start..`` of the list at ``key``; ``None`` when Redis is unavailable."""
+    client = await get_redis_client()
     if client is None:
         return None
     try:
-        raw = client.get(namespaced_key(namespace, key))
-    except Exception:
+        raws = await client.lrange(namespaced_key(namespace, key), start, -1)
+    except Exception as exc:
+        logger.exception("redis_cache_list failed ns=%s key=%s", namespace, key)
+        await _on_failure(client, exc)
+        return None
+    items: list[Any] = []
+    for raw in raws:
+        try:
+            items.append(decode_cache_value(raw))
+        except Exception:
+            logger.exception("redis_cache_list decode failed ns=%s key=%s", namespace, key)
+            items.append(None)
+    return items
+
+
+async def redis_cache_get(namespace: str, key: str) -> Any | None:
+    client = await get_redis_client()
+    if client is None:
+        return None
+    try:
+        raw = await client.get(namespaced_key(namespace, key))
+    except Exception as exc:
         logger.exception("redis_cache_get failed ns=%s key=%s", namespace, key)
+        await _on_failure(client, exc)
         return None
     if raw is None:
         return None
     try:
-        return pickle.loads(raw)
+        return decode_cache_value(raw)
     except Exception:
-        logger.exception("redis_cache_get unpickle failed ns=%s key=%s", namespace, key)
+        logger.exception("redis_cache_get decode failed ns=%s key=%s", namespace, key)
+        await redis_cache_delete(namespace, key)
+        return None
+
+
+async def redis_cache_get_many(namespace: str, keys: Sequence[str]) -> dict[str, Any]:
+    """MGET ``keys``; returns only the hits (``key → value``)."""
+    if not keys:
+        return {}
+    client = await get_redis_client()
+    if client is None:
+        return {}
+    try:
+        raws = await client.mget([namespaced_key(namespace, key) for key in keys])
+    except Exception as exc:
+        logger.exception("redis_cache_get_many failed ns=%s keys=%d", namespace, len(keys))
+        await _on_failure(client, exc)
+        return {}
+    found: dict[str, Any] = {}
+    for key, raw in zip(keys, raws, strict=False):
+        if raw is None:
+            continue
         try:
-            client.delete(namespaced_key(namespace, key))
+            found[key] = decode_cache_value(raw)
         except Exception:
-            pass
-        return None
+            logger.exception("redis_cache_get_many decode failed ns=%s key=%s", namespace, key)
+            await redis_cache_delete(namespace, key)
+    return found
 
 
-def redis_cache_delete(namespace: str, key: str) -> None:
-    client = get_redis_client()
+async def redis_cache_existing(namespace: str, keys: Sequence[str]) -> set[str]:
+    """Which of ``keys`` are present, via pipelined ``EXISTS`` (values are not transferred)."""
+    if not keys:
+        return set()
+    client = await get_redis_client()
+    if client is None:
+        return set()
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.exists(namespaced_key(namespace, key))
+            flags = await pipe.execute()
+    except Exception as exc:
+        logger.exception("redis_cache_existing failed ns=%s keys=%d", namespace, len(keys))
+        await _on_failure(client, exc)
+        return set()
+    return {key for key, flag in zip(keys, flags, strict=False) if flag}
+
+
+async def redis_cache_delete(namespace: str, key: str) -> None:
+    client = await get_redis_client()
     if client is None:
         return
     try:
-        client.delete(namespaced_key(namespace, key))
-    except Exception:
+        await client.delete(namespaced_key(namespace, key))
+    except Exception as exc:
         logger.exception("redis_cache_delete failed ns=%s key=%s", namespace, key)
+        await _on_failure(client, exc)
 
 
-def redis_cache_clear_namespace(namespace: str) -> None:
-    client = get_redis_client()
+async def redis_cache_clear_namespace(namespace: str) -> None:
+    client = await get_redis_client()
     if client is None:
         return
     pattern = namespaced_key(namespace, "*")
     try:
         cursor = 0
         while True:
-            cursor, keys = client.scan(cursor=cursor, match=pattern, count=200)
+            cursor, keys = await client.scan(cursor=cursor, match=pattern, count=200)
             if keys:
-                client.delete(*keys)
+                await client.unlink(*keys)
             if cursor == 0:
                 break
-    except Exception:
+    except Exception as exc:
         logger.exception("redis_cache_clear_namespace failed ns=%s", namespace)
+        await _on_failure(client, exc)
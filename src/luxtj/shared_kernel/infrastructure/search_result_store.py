@@ -0,0 +1,192 @@
+"""Per-search store of priced result cards for server-side filter / sort / paginate.
+
+Each run of a search gets a fresh run id, published at
+``luxtj:search_results:{kind}:{search_id}:run``. Every chunk the run streams is appended
+to the Redis list ``luxtj:search_results:{kind}:{search_id}:{run}`` in columnar form — one
+key list plus value rows — so card keys are written once per chunk before the namespace
+codec compresses it. Readers keep a per-worker LRU of decoded searches tagged with their
+run id; every read checks the published run id first, drops a local copy of an earlier
+run, and only fetches chunks appended since the last read (nothing once the run's
+completion marker is seen). The writing worker mirrors its appends locally, so it can
+serve its own search even while Redis is down.
+
+Cards are stored exactly as streamed (already marked up and client-stripped), so queries
+never recompute markup or touch supplier payloads.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+from luxtj.bootstrap import config
+from luxtj.shared_kernel.infrastructure.redis_cache import (
+    redis_cache_append,
+    redis_cache_get,
+    redis_cache_list,
+    redis_cache_put,
+)
+
+_NAMESPACE = "search_results"
+_DONE = {"done": True}
+
+
+@dataclass(slots=True)
+class StoredSearch:
+    run: str = ""
+    cards: list[dict[str, Any]] = field(default_factory=list)
+    complete: bool = False
+    # Chunks of the run's Redis list already applied: the offset the next read starts at.
+    chunks: int = 0
+    # Derived views (sort orders, facets) of the current cards; reset when chunks arrive.
+    _memo: dict[Any, Any] = field(default_factory=dict)
+
+    def memo[T](self, key: Any, build: Callable[[], T]) -> T:
+        if key not in self._memo:
+            self._memo[key] = build()
+        return self._memo[key]
+
+    def _extend(self, chunk: Any) -> None:
+        self.chunks += 1
+        if not isinstance(chunk, dict):
+            return
+        if chunk.get("done"):
+            self.complete = True
+            return
+        self.cards.extend(_unpack(chunk))
+        self._memo.clear()
+
+
+class SearchResultStore:
+    def __init__(self, kind: str, *, ttl_seconds: int, local_max_searches: int) -> None:
+        self._kind = kind
+        self._ttl_seconds = ttl_seconds
+        self._local_max = max(1, local_max_searches)
+        self._local: OrderedDict[str, StoredSearch] = OrderedDict()
+
+    async def reset(self, search_id: str) -> str:
+        """Start a new run of ``search_id``; returns the run id to append under.
+
+        Earlier runs stop being served on every worker as soon as the new run id is
+        published; their lists expire with the TTL.
+        """
+        run = uuid4().hex
+        await redis_cache_put(_NAMESPACE, self._run_key(search_id), run, self._ttl_seconds)
+        self._local.pop(search_id, None)
+        self._local_entry(search_id, run)
+        return run
+
+    async def append(self, search_id: str, run: str, cards: list[dict[str, Any]]) -> None:
+        if not search_id or not cards:
+            return
+        await self._append(search_id, run, _pack(cards))
+
+    async def complete(self, search_id: str, run: str) -> None:
+        if not search_id:
+            return
+        await self._append(search_id, run, _DONE)
+        # Keep the run id alive as long as the list it points at.
+        await redis_cache_put(_NAMESPACE, self._run_key(search_id), run, self._ttl_seconds)
+
+    async def load(self, search_id: str) -> StoredSearch | None:
+        """Cards stored so far for ``search_id``; ``None`` if the search was never stored."""
+        run = await redis_cache_get(_NAMESPACE, self._run_key(search_id))
+        entry = self._local.get(search_id)
+        if entry is not None:
+            self._local.move_to_end(search_id)
+        if not isinstance(run, str) or not run:
+            # Redis down or the run expired: only this worker's own copy can answer.
+            return entry
+        if entry is not None and entry.run != run:
+            # The search was re-run since this copy was read.
+            del self._local[search_id]
+            entry = None
+        if entry is not None and entry.complete:
+            return entry
+        start = entry.chunks if entry is not None else 0
+        chunks = await redis_cache_list(_NAMESPACE, self._list_key(search_id, run), start)
+        if not chunks:
+            return entry
+        if entry is None:
+            entry = self._local_entry(search_id, run)
+        for chunk in chunks:
+            entry._extend(chunk)
+        return entry
+
+    async def _append(self, search_id: str, run: str, chunk: dict[str, Any]) -> None:
+        # Mirror locally only onto this run's copy; an evicted copy is rebuilt from Redis.
+        entry = self._local.get(search_id)
+        if entry is not None and entry.run != run:
+            entry = None
+        # Local first: a concurrent load here then reads Redis past this chunk, not twice.
+        if entry is not None:
+            entry._extend(chunk)
+        key = self._list_key(search_id, run)
+        if not await redis_cache_append(_NAMESPACE, key, chunk, self._ttl_seconds):
+            if entry is not None:
+                # The chunk never reached the list: keep the read offset in step with Redis.
+                entry.chunks -= 1
+
+    def _local_entry(self, search_id: str, run: str) -> StoredSearch:
+        entry = self._local.get(search_id)
+        if entry is None:
+            entry = self._local[search_id] = StoredSearch(run=run)
+            while len(self._local) > self._local_max:
+                self._local.popitem(last=False)
+        self._local.move_to_end(search_id)
+        return entry
+
+    def _run_key(self, search_id: str) -> str:
+        return f"{self._kind}:{search_id}:run"
+
+    def _list_key(self, search_id: str, run: str) -> str:
+        return f"{self._kind}:{search_id}:{run}"
+
+
+def _pack(cards: list[dict[str, Any]]) -> dict[str, Any]:
+    keys = list(dict.fromkeys(key for card in cards for key in card))
+    rows: list[list[Any]] = []
+    absent: list[list[int] | None] = []
+    for card in cards:
+        if len(card) == len(keys):
+            rows.append([card[key] for key in keys])
+            absent.append(None)
+        else:
+            # Rare ragged card: keep its values and list the column indexes it lacks.
+            rows.append([card[key] for key in keys if key in card])
+            absent.append([i for i, key in enumerate(keys) if key not in card])
+    chunk: dict[str, Any] = {"keys": keys, "rows": rows}
+    if any(absent):
+        chunk["absent"] = absent
+    return chunk
+
+
+def _unpack(chunk: dict[str, Any]) -> list[dict[str, Any]]:
+    keys = chunk.get("keys") or []
+    absent = chunk.get("absent") or []
+    cards: list[dict[str, Any]] = []
+    for n, row in enumerate(chunk.get("rows") or []):
+        skip = set(absent[n]) if n < len(absent) and absent[n] else None
+        if skip is None:
+            cards.append(dict(zip(keys, row, strict=False)))
+        else:
+            present = [key for i, key in enumerate(keys) if i not in skip]
+            cards.append(dict(zip(present, row, strict=False)))
+    return cards
+
+
+_STORES: dict[str, SearchResultStore] = {}
+
+
+def get_search_result_store(kind: str) -> SearchResultStore:
+    store = _STORES.get(kind)
+    if store is None:
+        store = _STORES[kind] = SearchResultStore(
+            kind,
+            ttl_seconds=config.SEARCH_RESULTS_TTL_SECONDS,
+            local_max_searches=config.SEARCH_RESULTS_LOCAL_MAX_SEARCHES,
+        )
+    return store
@@ -0,0 +1,76 @@
+"""Process-wide compiled snapshot of a small admin table, reloaded when its version moves.
+
+Each worker loads the value once and serves it from memory. :meth:`VersionedSnapshot.invalidate`
+drops the local copy and writes a fresh version token to Redis
+(``luxtj:snapshot_versions:{name}``); other workers compare that token at most every
+``check_interval`` seconds and reload when it changed. ``max_age`` bounds how long a copy
+is served when Redis is unavailable and tokens cannot be compared.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from uuid import uuid4
+
+from luxtj.shared_kernel.infrastructure.redis_cache import redis_cache_get, redis_cache_put
+
+VERSION_NAMESPACE = "snapshot_versions"
+_VERSION_TTL_SECONDS = 30 * 24 * 60 * 60
+
+
+class VersionedSnapshot[T]:
+    """Lazily loaded value shared by every request in the process."""
+
+    def __init__(self, name: str, *, check_interval: float = 5.0, max_age: float = 300.0) -> None:
+        self.name = name
+        self._check_interval = max(0.0, check_interval)
+        self._max_age = max(0.0, max_age)
+        self._lock = asyncio.Lock()
+        self._value: T | None = None
+        self._loaded = False
+        self._token: str | None = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        # Bumped by local invalidation so a load racing an admin edit is not kept.
+        self._generation = 0
+        self.reloads = 0
+
+    def _is_current(self, now: float) -> bool:
+        return (
+            self._loaded
+            and now - self._checked_at < self._check_interval
+            and now - self._loaded_at < self._max_age
+        )
+
+    async def get(self, loader: Callable[[], Awaitable[T]]) -> T:
+        """Cached value, or ``await loader()`` when missing / invalidated / expired."""
+        if self._is_current(monotonic()):
+            return self._value  # type: ignore[return-value]
+        async with self._lock:
+            now = monotonic()
+            if self._is_current(now):
+                return self._value  # type: ignore[return-value]
+            token = await redis_cache_get(VERSION_NAMESPACE, self.name)
+            token = str(token) if token is not None else None
+            if self._loaded and token == self._token and now - self._loaded_at < self._max_age:
+                self._checked_at = now
+                return self._value  # type: ignore[return-value]
+
+            generation = self._generation
+            value = await loader()
+            if generation == self._generation:
+                self._value = value
+                self._loaded = True
+                self._token = token
+                self._loaded_at = self._checked_at = monotonic()
+                self.reloads += 1
+            return value
+
+    async def invalidate(self) -> None:
+        """Drop the local copy and publish a new version so other workers reload too."""
+        self._generation += 1
+        self._loaded = False
+        self._value = None
+        await redis_cache_put(VERSION_NAMESPACE, self.name, uuid4().hex, _VERSION_TTL_SECONDS)
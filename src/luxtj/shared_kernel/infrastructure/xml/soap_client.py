@@ -124,6 +124,11 @@ class XmlSoapClient:
             return {}
         return cls._element_to_dict(root)
 
+    @classmethod
+    def parse_soap_element(cls, root: etree._Element) -> dict[str, Any]:
+        """Same dict shape as :meth:`parse_soap_response` for an already-parsed root."""
+        return cls._element_to_dict(root)
+
     @classmethod
     def _resolve_service(
         cls,
@@ -59,6 +59,39 @@ class HealthStatusResult(ApiSerializerBaseModel):
     )
 
 
+class HttpPoolStatusItem(ApiSerializerBaseModel):
+    host: str = Field(..., description="Supplier scheme://host[:port] the pool serves")
+    connections_in_use: int = Field(..., description="Open connections carrying a request")
+    connections_idle: int = Field(..., description="Open keep-alive connections waiting for reuse")
+    in_flight: int = Field(..., description="Requests currently holding a concurrency slot")
+    waiting: int = Field(..., description="Requests queued behind the per-host concurrency cap")
+    total_requests: int = Field(..., description="Requests sent through this pool")
+    total_waits: int = Field(..., description="Requests that had to wait for a slot")
+    wait_seconds_total: float = Field(..., description="Cumulative time spent waiting for slots")
+    max_connections: int = Field(..., description="Configured connection limit")
+    concurrency_limit: int | None = Field(None, description="Per-host concurrency cap, if any")
+    http2: bool = Field(False, description="Whether HTTP/2 is negotiated for this pool")
+
+
+class HttpPoolStatusResult(ApiSerializerBaseModel):
+    pools: list[HttpPoolStatusItem] = Field(..., description="One entry per supplier host")
+
+
+class HttpAuditSinkStatusResult(ApiSerializerBaseModel):
+    queue_depth: int = Field(..., description="Audit records waiting to be written")
+    queue_capacity: int = Field(..., description="Bounded queue size")
+    overflow_policy: str = Field(..., description="drop_newest, drop_oldest or block")
+    enqueued: int = Field(..., description="Records accepted into the queue")
+    dropped: int = Field(..., description="Records discarded because the queue was full")
+    written: int = Field(..., description="Rows bulk-inserted")
+    failed: int = Field(..., description="Rows lost to failed batch inserts")
+    batches: int = Field(..., description="Batches written")
+    last_batch_size: int = Field(..., description="Rows in the most recent batch")
+    last_flush_seconds: float = Field(..., description="Latency of the most recent batch")
+    max_flush_seconds: float = Field(..., description="Slowest batch so far")
+    flush_seconds_total: float = Field(..., description="Cumulative batch write time")
+
+
 class PaginatedResult[GenericResponseModel](ApiSerializerBaseModel):
     total: int = Field(..., description="Total number of items available")
     page: int = Field(..., description="Current page number")